@@ -7,7 +7,7 @@ from drf_yasg.views import get_schema_view
 from rest_framework import authentication, permissions, routers
 
 from environments.identities.traits.views import SDKTraits
-from environments.identities.views import SDKIdentities
+from environments.identities.views import SDKIdentities, SDKIdentitiesBulk
 from environments.sdk.views import SDKEnvironmentAPIView
 from features.views import SDKFeatureStates
 from integrations.github.views import github_webhook
@@ -50,6 +50,11 @@ urlpatterns = [
     # Client SDK urls
     url(r"^flags/$", SDKFeatureStates.as_view(), name="flags"),
     url(r"^identities/$", SDKIdentities.as_view(), name="sdk-identities"),
+    url(
+        r"^bulk-identify/$",
+        SDKIdentitiesBulk.as_view(),
+        name="sdk-identities-bulk",
+    ),
     url(r"^traits/", include(traits_router.urls), name="traits"),
     url(r"^analytics/flags/$", SDKAnalyticsFlags.as_view(), name="analytics-flags"),
     url(
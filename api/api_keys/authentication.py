@@ -1,5 +1,8 @@
+import hashlib
 from contextlib import suppress
 
+from django.conf import settings
+from django.core.cache import caches
 from rest_framework import authentication, exceptions
 from rest_framework_api_key.permissions import KeyParser
 
@@ -8,6 +11,8 @@ from api_keys.user import APIKeyUser
 
 key_parser = KeyParser()
 
+master_api_keys_cache = caches[settings.MASTER_API_KEYS_CACHE_NAME]
+
 
 class MasterAPIKeyAuthentication(authentication.BaseAuthentication):
     def authenticate(self, request):
@@ -16,8 +21,34 @@ class MasterAPIKeyAuthentication(authentication.BaseAuthentication):
             return None
 
         with suppress(MasterAPIKey.DoesNotExist):
-            key = MasterAPIKey.objects.get_from_key(key)
+            key = _get_master_api_key(key)
             if not key.has_expired:
                 return APIKeyUser(key), None
 
         raise exceptions.AuthenticationFailed("Valid Master API Key not found.")
+
+
+def _get_master_api_key(key: str) -> MasterAPIKey:
+    """
+    Get the usable master API key for the given key, only checking the key against
+    its hash if it hasn't been verified in the last CACHE_MASTER_API_KEYS_SECONDS.
+    Verified keys are still read from the database by id, so that keys which have
+    since been revoked or deleted are rejected.
+    """
+    if not settings.CACHE_MASTER_API_KEYS_SECONDS:
+        return MasterAPIKey.objects.get_from_key(key)
+
+    digest = hashlib.sha256(key.encode()).hexdigest()
+
+    if (master_api_key_id := master_api_keys_cache.get(digest)) is not None:
+        try:
+            return MasterAPIKey.objects.get_usable_keys().get(pk=master_api_key_id)
+        except MasterAPIKey.DoesNotExist:
+            master_api_keys_cache.delete(digest)
+            raise
+
+    master_api_key = MasterAPIKey.objects.get_from_key(key)
+    master_api_keys_cache.set(
+        digest, master_api_key.pk, timeout=settings.CACHE_MASTER_API_KEYS_SECONDS
+    )
+    return master_api_key
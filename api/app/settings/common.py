@@ -28,6 +28,7 @@ from environs import Env
 
 from app.routers import ReplicaReadStrategy
 from task_processor.task_run_method import TaskRunMethod
+from util.executor import QueueFullPolicy
 
 env = Env()
 
@@ -325,10 +326,20 @@ INFLUXDB_TOKEN = env.str("INFLUXDB_TOKEN", default="")
 INFLUXDB_BUCKET = env.str("INFLUXDB_BUCKET", default="")
 INFLUXDB_URL = env.str("INFLUXDB_URL", default="")
 INFLUXDB_ORG = env.str("INFLUXDB_ORG", default="")
+# Records are written to Influx in batches of up to INFLUXDB_WRITE_BATCH_SIZE,
+# at least every INFLUXDB_WRITE_FLUSH_INTERVAL_MS. Set the batch size to 0 to
+# write records synchronously instead.
+INFLUXDB_WRITE_BATCH_SIZE = env.int("INFLUXDB_WRITE_BATCH_SIZE", default=1000)
+INFLUXDB_WRITE_FLUSH_INTERVAL_MS = env.int(
+    "INFLUXDB_WRITE_FLUSH_INTERVAL_MS", default=1000
+)
 
 USE_POSTGRES_FOR_ANALYTICS = env.bool("USE_POSTGRES_FOR_ANALYTICS", default=False)
 
 ENABLE_API_USAGE_TRACKING = env.bool("ENABLE_API_USAGE_TRACKING", default=True)
+# Number of seconds to aggregate API usage in memory before writing it to the
+# analytics database. Defaults to 0, which writes a record for every request.
+API_USAGE_CACHE_SECONDS = env.int("API_USAGE_CACHE_SECONDS", default=0)
 
 if ENABLE_API_USAGE_TRACKING:
     # NOTE: Because we use Postgres for analytics data in staging and Influx for tracking SSE data,
@@ -338,6 +349,25 @@ if ENABLE_API_USAGE_TRACKING:
     elif INFLUXDB_TOKEN:
         MIDDLEWARE.append("app_analytics.middleware.InfluxDBMiddleware")
 
+# Fire-and-forget work (e.g. sending analytics and identities to integrations)
+# is run by a shared, bounded pool of threads in each process. When its queue is
+# full, POSTPONE_QUEUE_FULL_POLICY decides whether new work is dropped (DROP),
+# waits up to POSTPONE_BLOCK_TIMEOUT_SECONDS for space (BLOCK) or is run by the
+# calling thread (CALLER_RUNS). The queue depth and number of dropped items are
+# logged every POSTPONE_METRICS_LOG_INTERVAL_SECONDS (0 disables this).
+POSTPONE_MAX_WORKERS = env.int("POSTPONE_MAX_WORKERS", default=10)
+POSTPONE_MAX_QUEUE_SIZE = env.int("POSTPONE_MAX_QUEUE_SIZE", default=1000)
+POSTPONE_QUEUE_FULL_POLICY = env.enum(
+    "POSTPONE_QUEUE_FULL_POLICY",
+    type=QueueFullPolicy,
+    default=QueueFullPolicy.DROP.value,
+)
+POSTPONE_BLOCK_TIMEOUT_SECONDS = env.float(
+    "POSTPONE_BLOCK_TIMEOUT_SECONDS", default=1.0
+)
+POSTPONE_METRICS_LOG_INTERVAL_SECONDS = env.int(
+    "POSTPONE_METRICS_LOG_INTERVAL_SECONDS", default=60
+)
 
 ALLOWED_ADMIN_IP_ADDRESSES = env.list("ALLOWED_ADMIN_IP_ADDRESSES", default=list())
 if len(ALLOWED_ADMIN_IP_ADDRESSES) > 0:
@@ -419,6 +449,7 @@ CORS_ALLOW_HEADERS = [
     *FLAGSMITH_CORS_EXTRA_ALLOW_HEADERS,
     "X-Environment-Key",
     "X-E2E-Test-Auth-Token",
+    "If-None-Match",
 ]
 
 DEFAULT_FROM_EMAIL = env("SENDER_EMAIL", default="noreply@flagsmith.com")
@@ -608,8 +639,48 @@ if ENABLE_DB_LOGGING:
         "handlers": ["console"],
     }
 
+# Concurrent rebuilds of the same cache entry (e.g. an environment, its flags or
+# its document) are coalesced so that only one rebuild happens at a time per
+# process, or across all processes if a distributed lock is enabled. The lock is
+# held in the cache being rebuilt, so it only coordinates processes for caches
+# with a shared backend which supports atomic `add`, e.g. redis.
+CACHE_COALESCING_LOCK_TIMEOUT_SECONDS = env.float(
+    "CACHE_COALESCING_LOCK_TIMEOUT_SECONDS", default=5
+)
+CACHE_COALESCING_USE_DISTRIBUTED_LOCK = env.bool(
+    "CACHE_COALESCING_USE_DISTRIBUTED_LOCK", default=False
+)
+# Number of seconds after expiry during which cached entries are still served
+# while a single caller rebuilds them.
+CACHE_STALE_WHILE_REVALIDATE_SECONDS = env.int(
+    "CACHE_STALE_WHILE_REVALIDATE_SECONDS", default=0
+)
+
 CACHE_FLAGS_SECONDS = env.int("CACHE_FLAGS_SECONDS", default=0)
 FLAGS_CACHE_LOCATION = "environment-flags"
+
+# Caches the rendered JSON response of the flags endpoint, keyed on the
+# environment's updated_at so that it can be rebuilt eagerly on each change.
+CACHE_FLAGS_RESPONSE_SECONDS = env.int("CACHE_FLAGS_RESPONSE_SECONDS", default=0)
+FLAGS_RESPONSE_CACHE_NAME = "environment-flags-response"
+FLAGS_RESPONSE_CACHE_BACKEND = env.str(
+    "FLAGS_RESPONSE_CACHE_BACKEND",
+    default="django.core.cache.backends.locmem.LocMemCache",
+)
+FLAGS_RESPONSE_CACHE_LOCATION = env.str(
+    "FLAGS_RESPONSE_CACHE_LOCATION", default=FLAGS_RESPONSE_CACHE_NAME
+)
+if (
+    CACHE_FLAGS_RESPONSE_SECONDS
+    and FLAGS_RESPONSE_CACHE_BACKEND == "django.core.cache.backends.locmem.LocMemCache"
+):
+    # The responses are rebuilt eagerly by the task processor, so they must be
+    # written to a cache which the API processes can read.
+    raise ImproperlyConfigured(
+        "FLAGS_RESPONSE_CACHE_BACKEND must be a cache shared between processes "
+        "when CACHE_FLAGS_RESPONSE_SECONDS is set."
+    )
+
 CHARGEBEE_CACHE_LOCATION = "chargebee-objects"
 
 ENVIRONMENT_CACHE_SECONDS = env.int("ENVIRONMENT_CACHE_SECONDS", default=60)
@@ -667,8 +738,124 @@ ENVIRONMENT_SEGMENTS_CACHE_BACKEND = env(
     "django.core.cache.backends.locmem.LocMemCache",
 )
 
+# Keep the flag engine models of the segments evaluated for identities in each
+# process, until the environment is next updated.
+CACHE_ENGINE_SEGMENTS = env.bool("CACHE_ENGINE_SEGMENTS", default=False)
+ENGINE_SEGMENTS_CACHE_MAX_ENTRIES = env.int(
+    "ENGINE_SEGMENTS_CACHE_MAX_ENTRIES", default=200
+)
+
+# Add ETags to the SDK endpoints and respond with a 304 to conditional requests
+# for which the environment (and identity) state has not changed.
+ENABLE_SDK_ETAGS = env.bool("ENABLE_SDK_ETAGS", default=False)
+
+# Evaluate the flags returned by the SDK identities endpoint in memory, against
+# the environment document, rather than querying the environment's feature
+# states. The engine models of the most recently used environments are kept in
+# each process.
+USE_IN_MEMORY_IDENTITY_EVALUATION = env.bool(
+    "USE_IN_MEMORY_IDENTITY_EVALUATION", default=False
+)
+IN_MEMORY_IDENTITY_EVALUATION_MAX_ENVIRONMENTS = env.int(
+    "IN_MEMORY_IDENTITY_EVALUATION_MAX_ENVIRONMENTS", default=100
+)
+
+# Read the live versions of environments' feature states from the live feature
+# states table, maintained when feature states are published, rather than working
+# them out from the versions of every feature state on each read. The table must be
+# populated with the `refreshlivefeaturestates` management command after enabling.
+USE_LIVE_FEATURE_STATES = env.bool("USE_LIVE_FEATURE_STATES", default=False)
+LIVE_FEATURE_STATES_ACTIVATION_RUN_EVERY = env.timedelta(
+    "LIVE_FEATURE_STATES_ACTIVATION_RUN_EVERY", default=60
+)
+
+# Maximum number of identities in a single request to the bulk identify endpoint.
+BULK_IDENTIFY_MAX_IDENTITIES = env.int("BULK_IDENTIFY_MAX_IDENTITIES", default=500)
+
 CACHE_ENVIRONMENT_DOCUMENT_SECONDS = env.int("CACHE_ENVIRONMENT_DOCUMENT_SECONDS", 0)
 ENVIRONMENT_DOCUMENT_CACHE_LOCATION = "environment-documents"
+# The environment document cache is made up of a bounded in-process LRU cache
+# in front of a shared cache, which defaults to the database cache.
+ENVIRONMENT_DOCUMENT_SHARED_CACHE_NAME = "environment-documents-shared"
+ENVIRONMENT_DOCUMENT_CACHE_BACKEND = env.str(
+    "ENVIRONMENT_DOCUMENT_CACHE_BACKEND",
+    default="django.core.cache.backends.db.DatabaseCache",
+)
+ENVIRONMENT_DOCUMENT_SHARED_CACHE_LOCATION = env.str(
+    "ENVIRONMENT_DOCUMENT_SHARED_CACHE_LOCATION",
+    default=ENVIRONMENT_DOCUMENT_CACHE_LOCATION,
+)
+ENVIRONMENT_DOCUMENT_CACHE_OPTIONS = env.dict(
+    "ENVIRONMENT_DOCUMENT_CACHE_OPTIONS", default={}
+)
+ENVIRONMENT_DOCUMENT_CACHE_LOCAL_MAX_ENTRIES = env.int(
+    "ENVIRONMENT_DOCUMENT_CACHE_LOCAL_MAX_ENTRIES", default=100
+)
+ENVIRONMENT_DOCUMENT_CACHE_LOCAL_SECONDS = env.int(
+    "ENVIRONMENT_DOCUMENT_CACHE_LOCAL_SECONDS", default=10
+)
+ENVIRONMENT_DOCUMENT_CACHE_COMPRESS = env.bool(
+    "ENVIRONMENT_DOCUMENT_CACHE_COMPRESS", default=False
+)
+
+# Keeps the last environment model built by the task processor so that the
+# environment document can be patched from the objects referenced by an audit
+# log, rather than being rebuilt in full on every change.
+CACHE_ENVIRONMENT_MODEL_SECONDS = env.int("CACHE_ENVIRONMENT_MODEL_SECONDS", default=0)
+ENVIRONMENT_MODEL_CACHE_NAME = "environment-models"
+ENVIRONMENT_MODEL_CACHE_BACKEND = env.str(
+    "ENVIRONMENT_MODEL_CACHE_BACKEND",
+    default="django.core.cache.backends.locmem.LocMemCache",
+)
+ENVIRONMENT_MODEL_CACHE_LOCATION = env.str(
+    "ENVIRONMENT_MODEL_CACHE_LOCATION", default=ENVIRONMENT_MODEL_CACHE_NAME
+)
+
+# Caches the identity migration metadata of projects, read from dynamodb by the
+# edge request forwarder and others. The cache is invalidated when the migration
+# state of a project changes, but only in the process making the change.
+CACHE_PROJECT_METADATA_SECONDS = env.int("CACHE_PROJECT_METADATA_SECONDS", default=0)
+PROJECT_METADATA_CACHE_NAME = "project-metadata"
+PROJECT_METADATA_CACHE_BACKEND = env.str(
+    "PROJECT_METADATA_CACHE_BACKEND",
+    default="django.core.cache.backends.locmem.LocMemCache",
+)
+PROJECT_METADATA_CACHE_LOCATION = env.str(
+    "PROJECT_METADATA_CACHE_LOCATION", default=PROJECT_METADATA_CACHE_NAME
+)
+
+# Caches the results of resolving users' permissions for the admin API. Entries
+# are invalidated by changing a version stamp, kept in the same cache, whenever
+# user, group or organisation permissions change, so the cache must be shared
+# between processes (e.g. redis) for revoked permissions to take effect in all
+# of them.
+CACHE_PERMISSIONS_SECONDS = env.int("CACHE_PERMISSIONS_SECONDS", default=0)
+PERMISSIONS_CACHE_NAME = "permissions"
+PERMISSIONS_CACHE_BACKEND = env.str(
+    "PERMISSIONS_CACHE_BACKEND",
+    default="django.core.cache.backends.locmem.LocMemCache",
+)
+PERMISSIONS_CACHE_LOCATION = env.str(
+    "PERMISSIONS_CACHE_LOCATION", default=PERMISSIONS_CACHE_NAME
+)
+if (
+    CACHE_PERMISSIONS_SECONDS
+    and PERMISSIONS_CACHE_BACKEND == "django.core.cache.backends.locmem.LocMemCache"
+):
+    raise ImproperlyConfigured(
+        "PERMISSIONS_CACHE_BACKEND must be a cache shared between processes "
+        "when CACHE_PERMISSIONS_SECONDS is set."
+    )
+
+# Caches which master API keys have been verified, keyed on a digest of the key,
+# so that the (deliberately slow) hash of each key is only checked once in a
+# while by each process. The key is still read from the database on each request,
+# so revoked, deleted and expired keys are rejected straight away.
+CACHE_MASTER_API_KEYS_SECONDS = env.int("CACHE_MASTER_API_KEYS_SECONDS", default=30)
+MASTER_API_KEYS_CACHE_NAME = "master-api-keys"
+MASTER_API_KEYS_CACHE_MAX_ENTRIES = env.int(
+    "MASTER_API_KEYS_CACHE_MAX_ENTRIES", default=1000
+)
 
 USER_THROTTLE_CACHE_NAME = "user-throttle"
 USER_THROTTLE_CACHE_BACKEND = env.str(
@@ -709,6 +896,11 @@ CACHES = {
         "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
         "LOCATION": FLAGS_CACHE_LOCATION,
     },
+    FLAGS_RESPONSE_CACHE_NAME: {
+        "BACKEND": FLAGS_RESPONSE_CACHE_BACKEND,
+        "LOCATION": FLAGS_RESPONSE_CACHE_LOCATION,
+        "TIMEOUT": CACHE_FLAGS_RESPONSE_SECONDS,
+    },
     PROJECT_SEGMENTS_CACHE_LOCATION: {
         "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
         "LOCATION": PROJECT_SEGMENTS_CACHE_LOCATION,
@@ -724,9 +916,42 @@ CACHES = {
         "TIMEOUT": 12 * 60 * 60,  # 12 hours
     },
     ENVIRONMENT_DOCUMENT_CACHE_LOCATION: {
-        "BACKEND": "django.core.cache.backends.db.DatabaseCache",
+        "BACKEND": "core.cache.TieredCache",
         "LOCATION": ENVIRONMENT_DOCUMENT_CACHE_LOCATION,
-        "timeout": CACHE_ENVIRONMENT_DOCUMENT_SECONDS,
+        "TIMEOUT": CACHE_ENVIRONMENT_DOCUMENT_SECONDS,
+        "OPTIONS": {
+            "SHARED_CACHE": ENVIRONMENT_DOCUMENT_SHARED_CACHE_NAME,
+            "LOCAL_MAX_ENTRIES": ENVIRONMENT_DOCUMENT_CACHE_LOCAL_MAX_ENTRIES,
+            "LOCAL_TIMEOUT": ENVIRONMENT_DOCUMENT_CACHE_LOCAL_SECONDS,
+            "COMPRESS": ENVIRONMENT_DOCUMENT_CACHE_COMPRESS,
+        },
+    },
+    ENVIRONMENT_DOCUMENT_SHARED_CACHE_NAME: {
+        "BACKEND": ENVIRONMENT_DOCUMENT_CACHE_BACKEND,
+        "LOCATION": ENVIRONMENT_DOCUMENT_SHARED_CACHE_LOCATION,
+        "TIMEOUT": CACHE_ENVIRONMENT_DOCUMENT_SECONDS,
+        "OPTIONS": ENVIRONMENT_DOCUMENT_CACHE_OPTIONS,
+    },
+    ENVIRONMENT_MODEL_CACHE_NAME: {
+        "BACKEND": ENVIRONMENT_MODEL_CACHE_BACKEND,
+        "LOCATION": ENVIRONMENT_MODEL_CACHE_LOCATION,
+        "TIMEOUT": CACHE_ENVIRONMENT_MODEL_SECONDS,
+    },
+    PROJECT_METADATA_CACHE_NAME: {
+        "BACKEND": PROJECT_METADATA_CACHE_BACKEND,
+        "LOCATION": PROJECT_METADATA_CACHE_LOCATION,
+        "TIMEOUT": CACHE_PROJECT_METADATA_SECONDS,
+    },
+    PERMISSIONS_CACHE_NAME: {
+        "BACKEND": PERMISSIONS_CACHE_BACKEND,
+        "LOCATION": PERMISSIONS_CACHE_LOCATION,
+        "TIMEOUT": CACHE_PERMISSIONS_SECONDS,
+    },
+    MASTER_API_KEYS_CACHE_NAME: {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": MASTER_API_KEYS_CACHE_NAME,
+        "TIMEOUT": CACHE_MASTER_API_KEYS_SECONDS,
+        "OPTIONS": {"MAX_ENTRIES": MASTER_API_KEYS_CACHE_MAX_ENTRIES},
     },
     GET_FLAGS_ENDPOINT_CACHE_NAME: {
         "BACKEND": GET_FLAGS_ENDPOINT_CACHE_BACKEND,
@@ -854,6 +1079,16 @@ ENVIRONMENTS_V2_TABLE_NAME_DYNAMO = env.str("ENVIRONMENTS_V2_TABLE_NAME_DYNAMO",
 # DynamoDB table name for storing identities
 IDENTITIES_TABLE_NAME_DYNAMO = env.str("IDENTITIES_TABLE_NAME_DYNAMO", None)
 
+# When deleting all the identities of an environment from dynamodb, they are
+# deleted by up to DYNAMO_IDENTITIES_DELETION_MAX_WORKERS threads, at a rate of up
+# to DYNAMO_IDENTITIES_DELETION_MAX_ITEMS_PER_SECOND (0 for no limit).
+DYNAMO_IDENTITIES_DELETION_MAX_WORKERS = env.int(
+    "DYNAMO_IDENTITIES_DELETION_MAX_WORKERS", default=4
+)
+DYNAMO_IDENTITIES_DELETION_MAX_ITEMS_PER_SECOND = env.float(
+    "DYNAMO_IDENTITIES_DELETION_MAX_ITEMS_PER_SECOND", default=0
+)
+
 # DynamoDB table name for storing environment api keys
 ENVIRONMENTS_API_KEY_TABLE_NAME_DYNAMO = env.str(
     "ENVIRONMENTS_API_KEY_TABLE_NAME_DYNAMO", None
@@ -944,9 +1179,30 @@ EDGE_API_URL = env.str("EDGE_API_URL", None)
 # Used for signing forwarded request to edge
 EDGE_REQUEST_SIGNING_KEY = env.str("EDGE_REQUEST_SIGNING_KEY", None)
 
+# Requests forwarded to the edge API are buffered in memory, by project, for up
+# to EDGE_REQUEST_FORWARDING_BUFFER_SECONDS or until there are
+# EDGE_REQUEST_FORWARDING_BATCH_SIZE of them, and then forwarded by a single task
+# using up to EDGE_REQUEST_FORWARDING_MAX_WORKERS concurrent requests. Set the
+# buffer seconds to 0 to create a task for each request.
+EDGE_REQUEST_FORWARDING_BUFFER_SECONDS = env.float(
+    "EDGE_REQUEST_FORWARDING_BUFFER_SECONDS", default=0
+)
+EDGE_REQUEST_FORWARDING_BATCH_SIZE = env.int(
+    "EDGE_REQUEST_FORWARDING_BATCH_SIZE", default=100
+)
+EDGE_REQUEST_FORWARDING_MAX_WORKERS = env.int(
+    "EDGE_REQUEST_FORWARDING_MAX_WORKERS", default=10
+)
+
 # Aws Event bus used for sending identity migration events
 IDENTITY_MIGRATION_EVENT_BUS_NAME = env.str("IDENTITY_MIGRATION_EVENT_BUS_NAME", None)
 
+# Identities are migrated to dynamodb in chunks of IDENTITY_MIGRATION_CHUNK_SIZE,
+# written by up to IDENTITY_MIGRATION_MAX_WORKERS threads. Progress is saved after
+# each chunk so that an interrupted migration can be resumed.
+IDENTITY_MIGRATION_CHUNK_SIZE = env.int("IDENTITY_MIGRATION_CHUNK_SIZE", default=2000)
+IDENTITY_MIGRATION_MAX_WORKERS = env.int("IDENTITY_MIGRATION_MAX_WORKERS", default=4)
+
 # Should be a string representing a timezone aware datetime, e.g. 2022-03-31T12:35:00Z
 EDGE_RELEASE_DATETIME = env.datetime("EDGE_RELEASE_DATETIME", None)
 # Note: using django.utils.timezone.now doesn't work reliably in settings so we use
@@ -984,6 +1240,11 @@ TASK_RUN_METHOD = env.enum(
 ENABLE_TASK_PROCESSOR_HEALTH_CHECK = env.bool(
     "ENABLE_TASK_PROCESSOR_HEALTH_CHECK", default=False
 )
+# When using Postgres, notify the task processor as soon as a task is created
+# rather than relying on it polling for tasks (which it still does, as a fallback).
+TASK_PROCESSOR_ENABLE_LISTEN_NOTIFY = env.bool(
+    "TASK_PROCESSOR_ENABLE_LISTEN_NOTIFY", default=True
+)
 
 ENABLE_CLEAN_UP_OLD_TASKS = env.bool("ENABLE_CLEAN_UP_OLD_TASKS", default=True)
 TASK_DELETE_RETENTION_DAYS = env.int("TASK_DELETE_RETENTION_DAYS", default=30)
@@ -0,0 +1,87 @@
+import atexit
+import threading
+from datetime import datetime
+
+from django.conf import settings
+from django.utils import timezone
+
+from .tasks import track_requests
+
+
+class APIUsageCache:
+    """
+    Aggregates API usage in memory by environment, resource, host and minute,
+    and periodically writes it to the analytics database using a single task,
+    rather than one task (and one row) per request.
+
+    The usage is written once API_USAGE_CACHE_SECONDS have passed, either by the
+    next tracked request or by a timer, so that idle processes still write it,
+    and when the process exits.
+    """
+
+    def __init__(self) -> None:
+        self._cache: dict[tuple[str, int, str, datetime], int] = {}
+        self._last_flushed_at = timezone.now()
+        self._timer: threading.Timer | None = None
+        self._lock = threading.Lock()
+        atexit.register(self.flush)
+
+    def track_request(self, resource: int, host: str, environment_key: str) -> None:
+        now = timezone.now()
+        key = (environment_key, resource, host, now.replace(second=0, microsecond=0))
+
+        with self._lock:
+            self._cache[key] = self._cache.get(key, 0) + 1
+
+            if (
+                now - self._last_flushed_at
+            ).total_seconds() < settings.API_USAGE_CACHE_SECONDS:
+                if self._timer is None:
+                    self._timer = threading.Timer(
+                        settings.API_USAGE_CACHE_SECONDS, self.flush
+                    )
+                    self._timer.daemon = True
+                    self._timer.start()
+                return
+
+            cache = self._pop_cache(now)
+
+        self._flush(cache)
+
+    def flush(self) -> None:
+        with self._lock:
+            cache = self._pop_cache(timezone.now())
+
+        self._flush(cache)
+
+    def _pop_cache(self, now: datetime) -> dict[tuple[str, int, str, datetime], int]:
+        cache, self._cache = self._cache, {}
+        self._last_flushed_at = now
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        return cache
+
+    def _flush(self, cache: dict[tuple[str, int, str, datetime], int]) -> None:
+        if not cache:
+            return
+
+        track_requests.delay(
+            kwargs={
+                "api_usage": [
+                    {
+                        "environment_key": environment_key,
+                        "resource": resource,
+                        "host": host,
+                        "count": count,
+                        "created_at": created_at.isoformat(),
+                    }
+                    for (
+                        environment_key,
+                        resource,
+                        host,
+                        created_at,
+                    ), count in cache.items()
+                ]
+            }
+        )
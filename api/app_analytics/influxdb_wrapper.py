@@ -1,11 +1,18 @@
+import atexit
 import logging
+import os
+import threading
 import typing
 from collections import defaultdict
 
 from django.conf import settings
 from influxdb_client import InfluxDBClient, Point
 from influxdb_client.client.exceptions import InfluxDBError
-from influxdb_client.client.write_api import SYNCHRONOUS
+from influxdb_client.client.write_api import (
+    SYNCHRONOUS,
+    WriteApi,
+    WriteOptions,
+)
 from sentry_sdk import capture_exception
 from urllib3 import Retry
 from urllib3.exceptions import HTTPError
@@ -42,12 +49,71 @@ DEFAULT_DROP_COLUMNS = (
     "host",
 )
 
+_write_api: WriteApi | None = None
+_write_api_pid: int | None = None
+_write_api_lock = threading.Lock()
+
+
+def get_write_api() -> WriteApi:
+    """
+    Get the write API shared by the current process.
+
+    Unless INFLUXDB_WRITE_BATCH_SIZE is 0, records are buffered and written to
+    Influx in batches from a background thread, every
+    INFLUXDB_WRITE_FLUSH_INTERVAL_MS or as soon as a batch is full. Any
+    buffered records are written when the process exits.
+    """
+    global _write_api, _write_api_pid
+
+    with _write_api_lock:
+        if _write_api is None or _write_api_pid != os.getpid():
+            # Note that, after a fork, the batching thread of the parent
+            # process doesn't exist so a new write API is needed.
+            if settings.INFLUXDB_WRITE_BATCH_SIZE > 0:
+                _write_api = influxdb_client.write_api(
+                    write_options=WriteOptions(
+                        batch_size=settings.INFLUXDB_WRITE_BATCH_SIZE,
+                        flush_interval=settings.INFLUXDB_WRITE_FLUSH_INTERVAL_MS,
+                    ),
+                    error_callback=_log_batch_write_error,
+                )
+            else:
+                _write_api = influxdb_client.write_api(write_options=SYNCHRONOUS)
+            _write_api_pid = os.getpid()
+
+        return _write_api
+
+
+@atexit.register
+def close_write_api() -> None:
+    """
+    Write any buffered records to Influx and close the shared write API.
+    """
+    global _write_api
+
+    with _write_api_lock:
+        if _write_api is not None and _write_api_pid == os.getpid():
+            _write_api.close()
+        _write_api = None
+
+
+def _log_batch_write_error(
+    batch: tuple[str, str, str], data: str, exception: Exception
+) -> None:
+    bucket, *_ = batch
+    logger.warning(
+        "Failed to write records to Influx: %s",
+        str(exception),
+        exc_info=exception,
+    )
+    logger.debug("Records: %s. Bucket: %s", data, bucket)
+
 
 class InfluxDBWrapper:
     def __init__(self, name):
         self.name = name
         self.records = []
-        self.write_api = influxdb_client.write_api(write_options=SYNCHRONOUS)
+        self.write_api = get_write_api()
 
     def add_data_point(self, field_name, field_value, tags=None):
         point = Point(self.name)
@@ -1,3 +1,6 @@
+from django.conf import settings
+
+from .cache import APIUsageCache
 from .models import Resource
 from .tasks import track_request
 from .track import (
@@ -37,17 +40,20 @@ class InfluxDBMiddleware:
 class APIUsageMiddleware:
     def __init__(self, get_response):
         self.get_response = get_response
+        self.api_usage_cache = APIUsageCache()
 
     def __call__(self, request):
         resource = get_resource_from_uri(request.path)
         if resource in TRACKED_RESOURCE_ACTIONS:
-            track_request.delay(
-                kwargs={
-                    "resource": Resource.get_from_resource_name(resource),
-                    "host": request.get_host(),
-                    "environment_key": request.headers.get("X-Environment-Key"),
-                }
-            )
+            kwargs = {
+                "resource": Resource.get_from_resource_name(resource),
+                "host": request.get_host(),
+                "environment_key": request.headers.get("X-Environment-Key"),
+            }
+            if settings.API_USAGE_CACHE_SECONDS > 0:
+                self.api_usage_cache.track_request(**kwargs)
+            else:
+                track_request.delay(kwargs=kwargs)
 
         response = self.get_response(request)
 
@@ -0,0 +1,24 @@
+# Generated by Django 3.2.25 on 2024-06-10 11:02
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("app_analytics", "0003_add_feature_name_index"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="apiusageraw",
+            name="count",
+            field=models.PositiveIntegerField(default=1),
+        ),
+        migrations.AlterField(
+            model_name="apiusageraw",
+            name="created_at",
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+    ]
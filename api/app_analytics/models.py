@@ -2,6 +2,7 @@ from datetime import timedelta
 
 from django.core.exceptions import ValidationError
 from django.db import models
+from django.utils import timezone
 from django_lifecycle import BEFORE_CREATE, LifecycleModelMixin, hook
 
 
@@ -29,9 +30,10 @@ class Resource(models.IntegerChoices):
 
 class APIUsageRaw(models.Model):
     environment_id = models.PositiveIntegerField()
-    created_at = models.DateTimeField(auto_now_add=True)
+    created_at = models.DateTimeField(default=timezone.now)
     host = models.CharField(max_length=255)
     resource = models.IntegerField(choices=Resource.choices)
+    count = models.PositiveIntegerField(default=1)
 
     class Meta:
         index_together = (("environment_id", "created_at"),)
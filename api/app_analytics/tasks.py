@@ -3,7 +3,7 @@ from typing import List, Tuple
 
 from app_analytics.analytics_db_service import ANALYTICS_READ_BUCKET_SIZE
 from django.conf import settings
-from django.db.models import Count, Q, Sum
+from django.db.models import Q, Sum
 from django.utils import timezone
 
 from environments.models import Environment
@@ -108,6 +108,35 @@ def track_request(resource: int, host: str, environment_key: str):
     )
 
 
+@register_task_handler()
+def track_requests(api_usage: list[dict[str, int | str]]) -> None:
+    """
+    Write the API usage aggregated by `app_analytics.cache.APIUsageCache`
+    using a single insert.
+    """
+    environment_ids: dict[str, int | None] = {}
+    api_usage_objects = []
+    for usage in api_usage:
+        environment_key = usage["environment_key"]
+        if environment_key not in environment_ids:
+            environment = Environment.get_from_cache(environment_key)
+            environment_ids[environment_key] = environment and environment.id
+
+        if not (environment_id := environment_ids[environment_key]):
+            continue
+
+        api_usage_objects.append(
+            APIUsageRaw(
+                environment_id=environment_id,
+                resource=usage["resource"],
+                host=usage["host"],
+                count=usage["count"],
+                created_at=datetime.fromisoformat(usage["created_at"]),
+            )
+        )
+    APIUsageRaw.objects.bulk_create(api_usage_objects)
+
+
 def get_start_of_current_bucket(bucket_size: int) -> datetime:
     if bucket_size > 60:
         raise ValueError("Bucket size cannot be greater than 60 minutes")
@@ -187,7 +216,7 @@ def _get_api_usage_source_data(
     return (
         APIUsageRaw.objects.filter(filters)
         .values("environment_id", "resource")
-        .annotate(count=Count("id"))
+        .annotate(count=Sum("count"))
     )
 
 
@@ -1,8 +1,8 @@
 import typing
-from functools import cached_property
+from functools import cached_property, partial
 from importlib import import_module
 
-from django.db import models
+from django.db import models, transaction
 from django.db.models import Model, Q
 from django.utils import timezone
 from django_lifecycle import (
@@ -130,9 +130,11 @@ class AuditLog(LifecycleModel):
         if self.environment_id:
             environments_filter = Q(id=self.environment_id)
 
-        environment_ids = self.project.environments.filter(
-            environments_filter
-        ).values_list("id", flat=True)
+        environment_ids = list(
+            self.project.environments.filter(environments_filter).values_list(
+                "id", flat=True
+            )
+        )
 
         # Update environment individually to avoid deadlock
         for environment_id in environment_ids:
@@ -140,4 +142,13 @@ class AuditLog(LifecycleModel):
                 updated_at=self.created_date
             )
 
+        # The cached environments' `updated_at` is used to version the cached
+        # flags responses and the ETags of the SDK endpoints, so they are removed
+        # from the cache now, and again once the update is committed in case they
+        # are cached by another request in the meantime.
+        Environment.clear_environment_caches(environment_ids)
+        transaction.on_commit(
+            partial(Environment.clear_environment_caches, environment_ids)
+        )
+
         process_environment_update.delay(args=(self.id,))
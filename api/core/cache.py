@@ -0,0 +1,176 @@
+"""
+Two tier django cache backend which keeps a bounded, in-process LRU cache in
+front of a shared cache (e.g. redis, memcached or the database cache).
+
+Usage:
+------
+Include the following configuration in Django project's settings.py file:
+
+```python
+# settings.py
+
+CACHES = {
+    "shared-cache": {
+        "BACKEND": "django_redis.cache.RedisCache",
+        "LOCATION": "redis://redis:6379/1",
+    },
+    "tiered-cache": {
+        "BACKEND": "core.cache.TieredCache",
+        "LOCATION": "tiered-cache",
+        "TIMEOUT": 60,
+        "OPTIONS": {
+            "SHARED_CACHE": "shared-cache",
+            "LOCAL_MAX_ENTRIES": 100,
+            "LOCAL_TIMEOUT": 10,
+            "COMPRESS": True,
+        },
+    },
+}
+```
+
+Note that entries in the local tier are only invalidated in the process that
+modifies them. Other processes will continue to serve their local copy for up
+to `LOCAL_TIMEOUT` seconds, so callers that require stronger guarantees should
+version their keys (e.g. using a last updated timestamp).
+"""
+
+import pickle
+import threading
+import time
+import typing
+import zlib
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from django.core.cache import BaseCache, caches
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
+
+DEFAULT_LOCAL_MAX_ENTRIES = 100
+DEFAULT_LOCAL_TIMEOUT = 10
+
+# Django instantiates a cache backend per thread, so (as with django's own
+# LocMemCache) the local tier is stored globally, keyed by the cache location.
+_local_caches: dict[str, OrderedDict[str, tuple[float, typing.Any]]] = {}
+_locks: dict[str, threading.Lock] = {}
+
+
+@dataclass
+class CompressedValue:
+    data: bytes
+
+
+class TieredCache(BaseCache):
+    def __init__(self, location: str, params: dict[str, typing.Any]) -> None:
+        super().__init__(params)
+        options = params.get("OPTIONS", {})
+
+        self._shared_cache_name = options["SHARED_CACHE"]
+        self._local_max_entries = options.get(
+            "LOCAL_MAX_ENTRIES", DEFAULT_LOCAL_MAX_ENTRIES
+        )
+        self._local_timeout = options.get("LOCAL_TIMEOUT", DEFAULT_LOCAL_TIMEOUT)
+        self._compress = options.get("COMPRESS", False)
+
+        self._local_cache = _local_caches.setdefault(location, OrderedDict())
+        self._lock = _locks.setdefault(location, threading.Lock())
+
+    @property
+    def shared_cache(self) -> BaseCache:
+        return caches[self._shared_cache_name]
+
+    def get(self, key, default=None, version=None):
+        local_key = self.make_key(key, version=version)
+
+        value = self._get_local(local_key)
+        if value is not None:
+            return value
+
+        value = self.shared_cache.get(key, version=version)
+        if value is None:
+            return default
+
+        value = self._decode(value)
+        self._set_local(local_key, value)
+        return value
+
+    def set(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        self.shared_cache.set(
+            key,
+            self._encode(value),
+            timeout=self.get_backend_timeout(timeout),
+            version=version,
+        )
+        self._set_local(self.make_key(key, version=version), value)
+
+    def add(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        added = self.shared_cache.add(
+            key,
+            self._encode(value),
+            timeout=self.get_backend_timeout(timeout),
+            version=version,
+        )
+        if added:
+            self._set_local(self.make_key(key, version=version), value)
+        return added
+
+    def touch(self, key, timeout=DEFAULT_TIMEOUT, version=None):
+        return self.shared_cache.touch(
+            key, timeout=self.get_backend_timeout(timeout), version=version
+        )
+
+    def delete(self, key, version=None):
+        self._delete_local(self.make_key(key, version=version))
+        return self.shared_cache.delete(key, version=version)
+
+    def clear(self):
+        with self._lock:
+            self._local_cache.clear()
+        self.shared_cache.clear()
+
+    def get_backend_timeout(self, timeout=DEFAULT_TIMEOUT):
+        # Django's cache backends return an absolute expiry time here, but since
+        # we pass the timeout on to the shared cache, we need to keep it relative.
+        return self.default_timeout if timeout is DEFAULT_TIMEOUT else timeout
+
+    def _get_local(self, local_key: str) -> typing.Any:
+        with self._lock:
+            entry = self._local_cache.get(local_key)
+            if entry is None:
+                return None
+
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._local_cache[local_key]
+                return None
+
+            self._local_cache.move_to_end(local_key)
+            return value
+
+    def _set_local(self, local_key: str, value: typing.Any) -> None:
+        if not (self._local_max_entries and self._local_timeout):
+            return
+
+        with self._lock:
+            self._local_cache[local_key] = (
+                time.monotonic() + self._local_timeout,
+                value,
+            )
+            self._local_cache.move_to_end(local_key)
+            while len(self._local_cache) > self._local_max_entries:
+                self._local_cache.popitem(last=False)
+
+    def _delete_local(self, local_key: str) -> None:
+        with self._lock:
+            self._local_cache.pop(local_key, None)
+
+    def _encode(self, value: typing.Any) -> typing.Any:
+        if not self._compress:
+            return value
+        return CompressedValue(
+            data=zlib.compress(pickle.dumps(value, pickle.HIGHEST_PROTOCOL))
+        )
+
+    def _decode(self, value: typing.Any) -> typing.Any:
+        if isinstance(value, CompressedValue):
+            return pickle.loads(zlib.decompress(value.data))
+        return value
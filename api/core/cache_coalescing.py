@@ -0,0 +1,212 @@
+"""
+Request coalescing ("singleflight") for cache misses.
+
+When a popular cache entry expires, every thread which requests it at the same
+time would otherwise rebuild it, causing a spike in database load. Using
+`get_or_set_coalesced`, only one thread per process (or, optionally, one
+thread across all processes sharing the cache) rebuilds the entry while the
+others wait for the result.
+
+Optionally, entries can also be served stale for a short period after they
+expire, while a single thread revalidates them (see
+`CACHE_STALE_WHILE_REVALIDATE_SECONDS`).
+
+Note that the distributed lock (see `CACHE_COALESCING_USE_DISTRIBUTED_LOCK`) is
+held in the cache being read, so it only coordinates processes if that cache is
+shared between them. For caches local to each process (e.g. `LocMemCache`), it
+is no different to the per-process lock.
+"""
+
+import logging
+import threading
+import time
+import typing
+import weakref
+
+from django.conf import settings
+from django.core.cache import BaseCache
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
+
+logger = logging.getLogger(__name__)
+
+T = typing.TypeVar("T")
+
+DISTRIBUTED_LOCK_POLL_INTERVAL_SECONDS = 0.05
+
+_locks: "weakref.WeakValueDictionary[str, threading.Lock]" = (
+    weakref.WeakValueDictionary()
+)
+_locks_lock = threading.Lock()
+
+
+def get_or_set_coalesced(
+    cache: BaseCache,
+    key: str,
+    default: typing.Callable[[], T],
+    timeout: float | None = DEFAULT_TIMEOUT,
+) -> T:
+    """
+    Get the value for the given key from the cache, or build it using `default`
+    and write it to the cache, making sure that concurrent callers don't build
+    the same value at the same time.
+
+    Note that, as with the code this replaces, None values are never cached.
+    """
+    if timeout is DEFAULT_TIMEOUT:
+        timeout = cache.default_timeout
+    if timeout is not None and timeout <= 0:
+        # Caching is disabled so there is nothing to coalesce.
+        return default()
+
+    stale_seconds = _get_stale_seconds(timeout)
+    if stale_seconds > 0:
+        value = _get_or_revalidate(cache, key, default, timeout, stale_seconds)
+    else:
+        value = cache.get(key)
+    if value is not None:
+        return value
+
+    lock = _get_lock(cache, key)
+    if not lock.acquire(blocking=False):
+        # Another thread is already building the value, wait for it to finish
+        # and return the value that it built.
+        if lock.acquire(timeout=settings.CACHE_COALESCING_LOCK_TIMEOUT_SECONDS):
+            lock.release()
+            if (value := cache.get(key)) is not None:
+                return value
+        return default()
+
+    try:
+        return _build_and_set(cache, key, default, timeout, stale_seconds)
+    finally:
+        lock.release()
+
+
+def set_coalesced(
+    cache: BaseCache,
+    key: str,
+    value: typing.Any,
+    timeout: float | None = DEFAULT_TIMEOUT,
+) -> None:
+    """
+    Write a value which has been built ahead of time (e.g. by a task) to the
+    cache, so that it is read as fresh by `get_or_set_coalesced`.
+    """
+    if timeout is DEFAULT_TIMEOUT:
+        timeout = cache.default_timeout
+    if timeout is not None and timeout <= 0:
+        return
+
+    _set(cache, key, value, timeout, _get_stale_seconds(timeout))
+
+
+def _get_or_revalidate(
+    cache: BaseCache,
+    key: str,
+    default: typing.Callable[[], T],
+    timeout: float,
+    stale_seconds: int,
+) -> T | None:
+    """
+    Values are stored for `timeout + stale_seconds`, alongside a marker which is
+    stored for `timeout` only. Once the marker expires, the first caller to
+    recreate it revalidates the value, while everyone else is served the stale
+    value.
+    """
+    fresh_key = _get_fresh_key(key)
+    values = cache.get_many([key, fresh_key])
+    value = values.get(key)
+    if value is None or fresh_key in values:
+        return value
+
+    if not cache.add(fresh_key, True, timeout=timeout):
+        return value
+
+    try:
+        return _build_and_set(cache, key, default, timeout, stale_seconds)
+    except Exception:
+        logger.warning(
+            "Failed to revalidate cache key %s, serving stale value.",
+            key,
+            exc_info=True,
+        )
+        cache.delete(fresh_key)
+        return value
+
+
+def _build_and_set(
+    cache: BaseCache,
+    key: str,
+    default: typing.Callable[[], T],
+    timeout: float | None,
+    stale_seconds: int,
+) -> T:
+    distributed_lock_key = None
+    if settings.CACHE_COALESCING_USE_DISTRIBUTED_LOCK:
+        distributed_lock_key = _get_lock_key(key)
+        if not cache.add(
+            distributed_lock_key,
+            True,
+            timeout=settings.CACHE_COALESCING_LOCK_TIMEOUT_SECONDS,
+        ):
+            # Another process is already building the value.
+            if (value := _wait_for_value(cache, key)) is not None:
+                return value
+            distributed_lock_key = None
+
+    try:
+        value = default()
+        if value is not None:
+            _set(cache, key, value, timeout, stale_seconds)
+        return value
+    finally:
+        if distributed_lock_key:
+            cache.delete(distributed_lock_key)
+
+
+def _set(
+    cache: BaseCache,
+    key: str,
+    value: typing.Any,
+    timeout: float | None,
+    stale_seconds: int,
+) -> None:
+    if stale_seconds > 0:
+        cache.set(key, value, timeout=timeout + stale_seconds)
+        cache.set(_get_fresh_key(key), True, timeout=timeout)
+    else:
+        cache.set(key, value, timeout=timeout)
+
+
+def _wait_for_value(cache: BaseCache, key: str) -> typing.Any:
+    deadline = time.monotonic() + settings.CACHE_COALESCING_LOCK_TIMEOUT_SECONDS
+    while time.monotonic() < deadline:
+        time.sleep(DISTRIBUTED_LOCK_POLL_INTERVAL_SECONDS)
+        if (value := cache.get(key)) is not None:
+            return value
+    return None
+
+
+def _get_stale_seconds(timeout: float | None) -> int:
+    if timeout is None:
+        return 0
+    return settings.CACHE_STALE_WHILE_REVALIDATE_SECONDS
+
+
+def _get_lock(cache: BaseCache, key: str) -> threading.Lock:
+    # Locks are only kept for as long as they are referenced by a caller
+    # so that we don't keep a lock for every key ever requested.
+    lock_id = f"{id(cache)}:{key}"
+    with _locks_lock:
+        lock = _locks.get(lock_id)
+        if lock is None:
+            lock = _locks[lock_id] = threading.Lock()
+        return lock
+
+
+def _get_fresh_key(key: str) -> str:
+    return f"{key}:fresh"
+
+
+def _get_lock_key(key: str) -> str:
+    return f"{key}:lock"
@@ -0,0 +1,59 @@
+"""
+A bounded, in-process LRU cache for objects which are expensive to build, such
+as flag engine models.
+
+Each entry is stored along with a version (e.g. the last updated timestamp of
+the object it was built from) and is rebuilt whenever it's requested with a
+different version, so callers never need to invalidate it. Unlike django's
+`LocMemCache`, values aren't pickled, so reading an entry is free.
+"""
+
+import threading
+import typing
+from collections import OrderedDict
+
+T = typing.TypeVar("T")
+
+
+class VersionedLocalCache(typing.Generic[T]):
+    def __init__(self, get_max_entries: typing.Callable[[], int]) -> None:
+        # The maximum number of entries is read on every write so that it can
+        # be given by a setting.
+        self._get_max_entries = get_max_entries
+        self._entries: OrderedDict[typing.Hashable, tuple[typing.Any, T]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def get_or_build(
+        self,
+        key: typing.Hashable,
+        version: typing.Any,
+        build: typing.Callable[[], T],
+    ) -> T:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and entry[0] == version:
+                self._entries.move_to_end(key)
+                return entry[1]
+
+        # Note that the lock isn't held while building the value, so concurrent
+        # callers may build it more than once.
+        value = build()
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and entry[0] > version:
+                # a more recent version was built meanwhile
+                return value
+
+            self._entries[key] = (version, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._get_max_entries():
+                self._entries.popitem(last=False)
+
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
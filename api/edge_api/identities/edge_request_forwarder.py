@@ -1,18 +1,192 @@
+import atexit
 import json
+import logging
+import os
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 
 import requests
 from core.constants import FLAGSMITH_SIGNATURE_HEADER
 from core.signing import sign_payload
 from django.conf import settings
+from requests.adapters import HTTPAdapter
 
 from environments.dynamodb.migrator import IdentityMigrator
 from task_processor.decorators import register_task_handler
 from task_processor.models import TaskPriority
 
+logger = logging.getLogger(__name__)
+
+# A project's identities are only ever migrated to edge once, so a completed
+# migration is remembered for the lifetime of the process.
+_migrated_project_ids: set[int] = set()
+
+_session: requests.Session | None = None
+_session_pid: int | None = None
+_session_lock = threading.Lock()
+
+
+def get_session() -> requests.Session:
+    """
+    Get the HTTP session shared by the current process, so that connections to
+    the edge API are reused between forwarded requests.
+    """
+    global _session, _session_pid
+
+    with _session_lock:
+        if _session is None or _session_pid != os.getpid():
+            adapter = HTTPAdapter(
+                pool_maxsize=settings.EDGE_REQUEST_FORWARDING_MAX_WORKERS
+            )
+            _session = requests.Session()
+            _session.mount("http://", adapter)
+            _session.mount("https://", adapter)
+            _session_pid = os.getpid()
+
+        return _session
+
 
 def _should_forward(project_id: int) -> bool:
+    if project_id in _migrated_project_ids:
+        return True
+
     migrator = IdentityMigrator(project_id)
-    return bool(migrator.is_migration_done)
+    if migrator.is_migration_done:
+        _migrated_project_ids.add(project_id)
+        return True
+
+    return False
+
+
+class EdgeRequestBuffer:
+    """
+    Buffers the requests to forward to the edge API in memory, by project, and
+    hands each project's requests to a single `forward_requests` task, rather
+    than creating a task per request.
+
+    The buffer is flushed EDGE_REQUEST_FORWARDING_BUFFER_SECONDS after the first
+    request is added to it, or as soon as a project has
+    EDGE_REQUEST_FORWARDING_BATCH_SIZE requests.
+    """
+
+    def __init__(self) -> None:
+        self._requests: dict[int, list[dict]] = defaultdict(list)
+        self._timer: threading.Timer | None = None
+        self._lock = threading.Lock()
+
+    def add(self, project_id: int, request: dict) -> None:
+        with self._lock:
+            project_requests = self._requests[project_id]
+            project_requests.append(request)
+
+            if len(project_requests) >= settings.EDGE_REQUEST_FORWARDING_BATCH_SIZE:
+                requests_to_flush = {project_id: self._requests.pop(project_id)}
+            else:
+                requests_to_flush = {}
+                if self._timer is None:
+                    self._timer = threading.Timer(
+                        settings.EDGE_REQUEST_FORWARDING_BUFFER_SECONDS, self.flush
+                    )
+                    self._timer.daemon = True
+                    self._timer.start()
+
+        self._flush(requests_to_flush)
+
+    def flush(self) -> None:
+        with self._lock:
+            requests_to_flush, self._requests = self._requests, defaultdict(list)
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+
+        self._flush(requests_to_flush)
+
+    def _flush(self, requests_by_project: dict[int, list[dict]]) -> None:
+        for project_id, project_requests in requests_by_project.items():
+            if project_requests:
+                forward_requests.delay(args=(project_id, project_requests))
+
+
+edge_request_buffer = EdgeRequestBuffer()
+atexit.register(edge_request_buffer.flush)
+
+
+def forward_identity_request_async(
+    request_method: str,
+    headers: dict,
+    project_id: int,
+    query_params: dict = None,
+    request_data: dict = None,
+) -> None:
+    if settings.EDGE_REQUEST_FORWARDING_BUFFER_SECONDS > 0:
+        edge_request_buffer.add(
+            project_id,
+            _build_identity_request(
+                request_method, headers, query_params, request_data
+            ),
+        )
+        return
+
+    forward_identity_request.delay(
+        args=(request_method, headers, project_id),
+        kwargs={"query_params": query_params, "request_data": request_data},
+    )
+
+
+def forward_trait_request_async(
+    request_method: str,
+    headers: dict,
+    project_id: int,
+    payload: dict,
+) -> None:
+    if settings.EDGE_REQUEST_FORWARDING_BUFFER_SECONDS > 0:
+        edge_request_buffer.add(project_id, _build_trait_request(headers, payload))
+        return
+
+    forward_trait_request.delay(args=(request_method, headers, project_id, payload))
+
+
+def forward_trait_requests_async(
+    request_method: str,
+    headers: dict,
+    project_id: int,
+    payload: list[dict],
+) -> None:
+    if settings.EDGE_REQUEST_FORWARDING_BUFFER_SECONDS > 0:
+        for trait_data in payload:
+            edge_request_buffer.add(
+                project_id, _build_trait_request(headers, trait_data)
+            )
+        return
+
+    forward_trait_requests.delay(args=(request_method, headers, project_id, payload))
+
+
+@register_task_handler(queue_size=2000, priority=TaskPriority.LOW)
+def forward_requests(project_id: int, requests_to_forward: list[dict]) -> None:
+    """
+    Forward a batch of identity and trait requests, as buffered by
+    `EdgeRequestBuffer`, using up to EDGE_REQUEST_FORWARDING_MAX_WORKERS
+    concurrent requests. Failed requests are logged rather than retried.
+    """
+    if not _should_forward(project_id):
+        return
+
+    with ThreadPoolExecutor(
+        max_workers=settings.EDGE_REQUEST_FORWARDING_MAX_WORKERS
+    ) as executor:
+        for request, error in zip(
+            requests_to_forward,
+            executor.map(_send_request_safely, requests_to_forward),
+        ):
+            if error:
+                logger.warning(
+                    "Failed to forward %s request to edge API for project %d: %s",
+                    request["path"],
+                    project_id,
+                    error,
+                )
 
 
 @register_task_handler(queue_size=2000, priority=TaskPriority.LOW)
@@ -26,14 +200,9 @@ def forward_identity_request(
     if not _should_forward(project_id):
         return
 
-    url = settings.EDGE_API_URL + "identities/"
-    headers = _get_headers(
-        request_method, headers, json.dumps(request_data) if request_data else ""
+    _send_request(
+        **_build_identity_request(request_method, headers, query_params, request_data)
     )
-    if request_method == "POST":
-        requests.post(url, data=json.dumps(request_data), headers=headers, timeout=5)
-        return
-    requests.get(url, params=query_params, headers=headers, timeout=5)
 
 
 @register_task_handler(queue_size=2000, priority=TaskPriority.LOW)
@@ -52,14 +221,7 @@ def forward_trait_request_sync(
     if not _should_forward(project_id):
         return
 
-    url = settings.EDGE_API_URL + "traits/"
-    payload = json.dumps(payload)
-    requests.post(
-        url,
-        data=payload,
-        headers=_get_headers(request_method, headers, payload),
-        timeout=5,
-    )
+    _send_request(**_build_trait_request(headers, payload))
 
 
 @register_task_handler(queue_size=1000, priority=TaskPriority.LOW)
@@ -73,6 +235,59 @@ def forward_trait_requests(
         forward_trait_request_sync(request_method, headers, project_id, trait_data)
 
 
+def _build_identity_request(
+    request_method: str,
+    headers: dict,
+    query_params: dict = None,
+    request_data: dict = None,
+) -> dict:
+    if request_method == "POST":
+        return {
+            "path": "identities/",
+            "method": "POST",
+            "headers": headers,
+            "data": json.dumps(request_data),
+        }
+    return {
+        "path": "identities/",
+        "method": "GET",
+        "headers": headers,
+        "query_params": query_params,
+    }
+
+
+def _build_trait_request(headers: dict, payload: dict) -> dict:
+    # trait requests are always forwarded to the edge API as a POST
+    return {
+        "path": "traits/",
+        "method": "POST",
+        "headers": headers,
+        "data": json.dumps(payload),
+    }
+
+
+def _send_request(
+    path: str,
+    method: str,
+    headers: dict,
+    query_params: dict = None,
+    data: str = "",
+) -> None:
+    url = settings.EDGE_API_URL + path
+    headers = _get_headers(method, headers, data)
+    if method == "POST":
+        get_session().post(url, data=data, headers=headers, timeout=5)
+        return
+    get_session().get(url, params=query_params, headers=headers, timeout=5)
+
+
+def _send_request_safely(request: dict) -> Exception | None:
+    try:
+        _send_request(**request)
+    except requests.RequestException as e:
+        return e
+
+
 def _get_headers(request_method: str, headers: dict, payload: str = "") -> dict:
     headers = {k: v for k, v in headers.items()}
     # Django by default sets the content-length to "", which in the case of get request(lack of content body)
@@ -0,0 +1,372 @@
+"""
+Incremental builder for environment documents.
+
+Rebuilding an environment document requires reading every feature state,
+segment and override in the environment (see `map_environment_to_engine`).
+Since most changes only affect a single feature or segment, this module keeps
+the last `EnvironmentModel` built for each environment and patches it using
+the objects referenced by the `AuditLog` which triggered the rebuild, falling
+back to a full rebuild whenever it can't be sure that the patched model would
+match a freshly built one.
+"""
+
+import logging
+import typing
+from dataclasses import dataclass
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db.models import Prefetch, Q
+from flag_engine.environments.models import EnvironmentModel
+from flag_engine.segments.models import SegmentModel
+
+from audit.models import AuditLog
+from audit.related_object_type import RelatedObjectType
+from features.models import FeatureSegment, FeatureState
+from features.multivariate.models import MultivariateFeatureStateValue
+from util.mappers.engine import (
+    map_environment_feature_states_to_engine,
+    map_environment_integrations_to_engine,
+    map_environment_segment_to_engine,
+    map_environment_to_engine,
+    map_organisation_to_engine,
+)
+
+if typing.TYPE_CHECKING:
+    from environments.models import Environment
+
+logger = logging.getLogger(__name__)
+
+environment_model_cache = caches[settings.ENVIRONMENT_MODEL_CACHE_NAME]
+
+
+@dataclass
+class CachedEnvironmentModel:
+    # id of the most recent audit log that the environment model reflects
+    audit_log_id: int
+    environment_model: EnvironmentModel
+
+
+def build_environment_model(
+    environment: "Environment",
+    audit_log: AuditLog,
+) -> EnvironmentModel:
+    """
+    Build the engine model for the given environment after the change recorded
+    by the given audit log, patching the previously built model if possible.
+
+    Note that the environment is not expected to have been retrieved using
+    `Environment.objects.filter_for_document_builder`, since its relationships
+    are only read in full when falling back to a full rebuild.
+    """
+    cache_key = str(environment.id)
+
+    environment_model = None
+    cached_environment_model: CachedEnvironmentModel | None = (
+        environment_model_cache.get(cache_key)
+    )
+    if cached_environment_model and _can_patch_environment_model(
+        cached_environment_model, environment, audit_log
+    ):
+        environment_model = _patch_environment_model(
+            cached_environment_model.environment_model, environment, audit_log
+        )
+
+    if environment_model is None:
+        logger.debug(
+            "Rebuilding document for environment %d in full for audit log %d.",
+            environment.id,
+            audit_log.id,
+        )
+        environment_model = _build_full_environment_model(environment)
+
+    environment_model_cache.set(
+        cache_key,
+        CachedEnvironmentModel(
+            audit_log_id=audit_log.id, environment_model=environment_model
+        ),
+        timeout=settings.CACHE_ENVIRONMENT_MODEL_SECONDS,
+    )
+    return environment_model
+
+
+def _build_full_environment_model(environment: "Environment") -> EnvironmentModel:
+    from environments.models import Environment
+
+    return map_environment_to_engine(
+        Environment.objects.filter_for_document_builder(id=environment.id).get()
+    )
+
+
+def _can_patch_environment_model(
+    cached_environment_model: CachedEnvironmentModel,
+    environment: "Environment",
+    audit_log: AuditLog,
+) -> bool:
+    """
+    The cached model can only be patched if the given audit log is the only
+    change to the environment document since the cached model was built. Any
+    other change (whether processed out of order, concurrently, or not at all)
+    requires a full rebuild to guarantee that it's reflected in the document.
+    """
+    if cached_environment_model.audit_log_id >= audit_log.id:
+        return False
+
+    return not (
+        AuditLog.objects.filter(
+            Q(environment_id=environment.id)
+            | Q(environment__isnull=True, project_id=environment.project_id),
+            id__gt=cached_environment_model.audit_log_id,
+        )
+        .exclude(id=audit_log.id)
+        .exclude(related_object_type=RelatedObjectType.CHANGE_REQUEST.name)
+        .exclude(skip_signals_and_hooks__contains="send_environments_to_dynamodb")
+        .exists()
+    )
+
+
+def _patch_environment_model(
+    environment_model: EnvironmentModel,
+    environment: "Environment",
+    audit_log: AuditLog,
+) -> EnvironmentModel | None:
+    """
+    Patch the given environment model with the change recorded by the audit
+    log. Returns None if the change cannot be applied incrementally.
+    """
+    related_object_type = audit_log.related_object_type
+    related_object_id = audit_log.related_object_id
+
+    if related_object_type == RelatedObjectType.FEATURE_STATE.name:
+        feature_state_data = _get_changed_feature_state_data(audit_log)
+        if feature_state_data is None:
+            return None
+        feature_id, identity_id = feature_state_data
+        if identity_id is None:
+            environment_model = _patch_feature(
+                environment_model, environment, feature_id
+            )
+
+    elif related_object_type == RelatedObjectType.FEATURE.name and related_object_id:
+        # Covers changes to the feature itself, its multivariate options
+        # and its feature segments (e.g. segment override priorities).
+        environment_model = _patch_feature(
+            environment_model, environment, related_object_id
+        )
+
+    elif related_object_type == RelatedObjectType.SEGMENT.name and related_object_id:
+        environment_model = _patch_segments(
+            environment_model, environment, {related_object_id}
+        )
+
+    else:
+        return None
+
+    return _patch_environment_attributes(environment_model, environment)
+
+
+def _get_changed_feature_state_data(
+    audit_log: AuditLog,
+) -> tuple[int, int | None] | None:
+    """
+    Get the feature id and identity id of the feature state referenced by an
+    audit log of type FEATURE_STATE. Depending on the model which created the
+    audit log, the related object id can refer to the feature state, its value
+    or its feature, so we use the history record instead where available.
+    """
+    if (history_record := audit_log.history_record) is not None:
+        if hasattr(history_record, "feature_id"):
+            # historical feature state
+            return history_record.feature_id, history_record.identity_id
+        feature_state_id = getattr(history_record, "feature_state_id", None)
+    elif not audit_log.history_record_class_path:
+        # audit logs created for change requests refer to the feature state
+        feature_state_id = audit_log.related_object_id
+    else:
+        return None
+
+    return (
+        FeatureState.objects.filter(id=feature_state_id)
+        .values_list("feature_id", "identity_id")
+        .first()
+    )
+
+
+def _patch_feature(
+    environment_model: EnvironmentModel,
+    environment: "Environment",
+    feature_id: int,
+) -> EnvironmentModel:
+    feature_states = list(
+        FeatureState.objects.filter(
+            environment=environment, feature_id=feature_id, identity__isnull=True
+        )
+        .select_related(
+            "environment",
+            "environment_feature_version",
+            "feature",
+            "feature_segment",
+            "feature_state_value",
+        )
+        .prefetch_related(
+            Prefetch(
+                "multivariate_feature_state_values",
+                queryset=MultivariateFeatureStateValue.objects.select_related(
+                    "multivariate_feature_option"
+                ),
+            )
+        )
+    )
+    feature_state_models = map_environment_feature_states_to_engine(feature_states)
+    is_server_key_only = bool(
+        feature_state_models and feature_states[0].feature.is_server_key_only
+    )
+
+    # No reading from ORM past this point!
+
+    feature_state_models_to_write = []
+    feature_state_models_added = False
+    for feature_state_model in environment_model.feature_states:
+        if feature_state_model.feature.id != feature_id:
+            feature_state_models_to_write.append(feature_state_model)
+        elif not feature_state_models_added:
+            # Keep the position of the feature in the document.
+            feature_state_models_to_write += feature_state_models
+            feature_state_models_added = True
+    if not feature_state_models_added:
+        feature_state_models_to_write += feature_state_models
+
+    server_key_only_feature_ids = [
+        server_key_only_feature_id
+        for server_key_only_feature_id in (
+            environment_model.project.server_key_only_feature_ids
+        )
+        if server_key_only_feature_id != feature_id
+    ]
+    if is_server_key_only:
+        server_key_only_feature_ids.append(feature_id)
+
+    # Segment overrides for the feature may have been created, updated or
+    # removed so any segment which has (or had) an override for it needs
+    # to be rebuilt.
+    segment_ids = {
+        segment_model.id
+        for segment_model in environment_model.project.segments
+        if any(
+            feature_state_model.feature.id == feature_id
+            for feature_state_model in segment_model.feature_states
+        )
+    }
+    segment_ids.update(
+        FeatureSegment.objects.filter(
+            environment=environment, feature_id=feature_id
+        ).values_list("segment_id", flat=True)
+    )
+
+    environment_model = environment_model.model_copy(
+        update={
+            "feature_states": feature_state_models_to_write,
+            "project": environment_model.project.model_copy(
+                update={"server_key_only_feature_ids": server_key_only_feature_ids}
+            ),
+        }
+    )
+    return _patch_segments(environment_model, environment, segment_ids)
+
+
+def _patch_segments(
+    environment_model: EnvironmentModel,
+    environment: "Environment",
+    segment_ids: set[int],
+) -> EnvironmentModel:
+    if not segment_ids:
+        return environment_model
+
+    segments = environment.project.segments.filter(id__in=segment_ids).prefetch_related(
+        "rules",
+        "rules__rules",
+        "rules__conditions",
+        "rules__rules__conditions",
+        "rules__rules__rules",
+        Prefetch(
+            "feature_segments",
+            queryset=FeatureSegment.objects.filter(environment=environment),
+        ),
+        Prefetch(
+            "feature_segments__feature_states",
+            queryset=FeatureState.objects.select_related(
+                "environment",
+                "environment_feature_version",
+                "feature",
+                "feature_segment",
+                "feature_state_value",
+            ),
+        ),
+        Prefetch(
+            "feature_segments__feature_states__multivariate_feature_state_values",
+            queryset=MultivariateFeatureStateValue.objects.select_related(
+                "multivariate_feature_option"
+            ),
+        ),
+    )
+    segment_models_by_id = {
+        segment.id: map_environment_segment_to_engine(segment, environment.id)
+        for segment in segments
+    }
+
+    # No reading from ORM past this point!
+
+    # Segments which no longer exist are removed from the document, and new
+    # segments are added in the same (id) order as a full rebuild would.
+    segment_models: list[SegmentModel] = [
+        segment_models_by_id.pop(segment_model.id, segment_model)
+        for segment_model in environment_model.project.segments
+        if segment_model.id not in segment_ids
+        or segment_model.id in segment_models_by_id
+    ]
+    segment_models = sorted(
+        [*segment_models, *segment_models_by_id.values()],
+        key=lambda segment_model: segment_model.id,
+    )
+
+    return environment_model.model_copy(
+        update={
+            "project": environment_model.project.model_copy(
+                update={"segments": segment_models}
+            ),
+        }
+    )
+
+
+def _patch_environment_attributes(
+    environment_model: EnvironmentModel,
+    environment: "Environment",
+) -> EnvironmentModel:
+    """
+    Refresh the attributes of the environment, its project and organisation,
+    and its integrations. These don't necessarily result in an audit log when
+    changed but are cheap to read since they only require a single query.
+    """
+    project = environment.project
+
+    return environment_model.model_copy(
+        update={
+            "name": environment.name,
+            "allow_client_traits": environment.allow_client_traits,
+            "updated_at": environment.updated_at,
+            "use_identity_composite_key_for_hashing": (
+                environment.use_identity_composite_key_for_hashing
+            ),
+            "hide_sensitive_data": environment.hide_sensitive_data,
+            "hide_disabled_flags": environment.hide_disabled_flags,
+            "project": environment_model.project.model_copy(
+                update={
+                    "name": project.name,
+                    "hide_disabled_flags": project.hide_disabled_flags,
+                    "enable_realtime_updates": project.enable_realtime_updates,
+                    "organisation": map_organisation_to_engine(project.organisation),
+                }
+            ),
+            **map_environment_integrations_to_engine(environment),
+        }
+    )
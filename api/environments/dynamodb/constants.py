@@ -7,4 +7,7 @@ ENVIRONMENTS_V2_SECONDARY_INDEX = "environment_api_key-index"
 ENVIRONMENTS_V2_SECONDARY_INDEX_PARTITION_KEY = "environment_api_key"
 
 DYNAMODB_MAX_BATCH_WRITE_ITEM_COUNT = 25
+DYNAMODB_MAX_BATCH_WRITE_ATTEMPTS = 8
+DYNAMODB_BATCH_WRITE_RETRY_BASE_DELAY_SECONDS = 0.05
+DYNAMODB_BATCH_WRITE_RETRY_MAX_DELAY_SECONDS = 5
 IDENTITIES_PAGINATION_LIMIT = 1000
@@ -0,0 +1,5 @@
+class UnprocessedItemsError(Exception):
+    """
+    Raised when DynamoDB keeps returning unprocessed items for a batch write,
+    e.g. because the table's throughput is exceeded.
+    """
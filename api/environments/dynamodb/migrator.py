@@ -1,4 +1,11 @@
-from django.db.models import Prefetch
+import logging
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from django.conf import settings
+from django.db import connection
+from django.db.models import Prefetch, QuerySet
 
 from edge_api.identities.events import send_migration_event
 from environments.identities.models import Identity
@@ -6,7 +13,7 @@ from environments.models import Environment, EnvironmentAPIKey
 from features.models import FeatureState
 from features.multivariate.models import MultivariateFeatureStateValue
 from projects.models import Project
-from util.queryset import iterator_with_prefetch
+from util.queryset import iter_pk_chunks
 
 from .types import DynamoProjectMetadata, ProjectIdentityMigrationStatus
 from .wrappers import (
@@ -15,11 +22,18 @@ from .wrappers import (
     DynamoIdentityWrapper,
 )
 
+logger = logging.getLogger(__name__)
+
 
 class IdentityMigrator:
     def __init__(self, project_id):
         self.project_metadata = DynamoProjectMetadata.get_or_new(project_id)
 
+        # boto3 resources can't be shared between threads, so each thread
+        # writing identities gets its own wrapper.
+        self._identity_wrappers = threading.local()
+        self._identity_wrappers_lock = threading.Lock()
+
     @property
     def migration_status(self) -> ProjectIdentityMigrationStatus:
         return self.project_metadata.identity_migration_status
@@ -36,6 +50,13 @@ class IdentityMigrator:
             ProjectIdentityMigrationStatus.MIGRATION_SCHEDULED,
         )
 
+    @property
+    def can_resume(self) -> bool:
+        return (
+            self.migration_status
+            == ProjectIdentityMigrationStatus.MIGRATION_IN_PROGRESS
+        )
+
     def trigger_migration(self):
         # Note: since we mark the project as `migration in progress` before we start the migration,
         # there is a small chance for the project of being stuck in `migration in progress`
@@ -45,7 +66,12 @@ class IdentityMigrator:
         self.project_metadata.trigger_identity_migration()
 
     def migrate(self):
-        self.project_metadata.start_identity_migration()
+        """
+        Migrate the project to dynamodb. If a previous migration of the project
+        was interrupted, resume it from its last checkpoint.
+        """
+        if not self.can_resume:
+            self.project_metadata.start_identity_migration()
 
         project_id = self.project_metadata.id
 
@@ -60,9 +86,106 @@ class IdentityMigrator:
         api_keys = EnvironmentAPIKey.objects.filter(environment__project_id=project_id)
         api_key_wrapper.write_api_keys(api_keys)
 
-        identity_wrapper = DynamoIdentityWrapper()
-        identities = (
-            Identity.objects.filter(environment__project__id=project_id)
+        self._migrate_identities()
+        self.project_metadata.finish_identity_migration()
+
+    def _migrate_identities(self) -> None:
+        """
+        Write the project's identities to dynamodb in chunks of
+        IDENTITY_MIGRATION_CHUNK_SIZE, using IDENTITY_MIGRATION_MAX_WORKERS
+        parallel writers, starting after the last checkpoint (if any).
+
+        A checkpoint is saved to the project metadata whenever a chunk, and every
+        chunk before it, has been written.
+        """
+        project_id = self.project_metadata.id
+        migrated_until_identity_id = int(
+            self.project_metadata.migrated_until_identity_id or 0
+        )
+        migrated_identities_count = int(
+            self.project_metadata.migrated_identities_count or 0
+        )
+        total_identities_count = migrated_identities_count + (
+            self._get_identities_queryset()
+            .filter(id__gt=migrated_until_identity_id)
+            .count()
+        )
+        logger.info(
+            "Migrating %d identities for project %d, of which %d were migrated before.",
+            total_identities_count,
+            project_id,
+            migrated_identities_count,
+        )
+
+        max_workers = settings.IDENTITY_MIGRATION_MAX_WORKERS
+        pending_chunks: deque[tuple[list[int], Future | None]] = deque()
+        executor = ThreadPoolExecutor(max_workers) if max_workers > 1 else None
+
+        def checkpoint_oldest_chunk() -> None:
+            nonlocal migrated_identities_count
+
+            identity_ids, future = pending_chunks.popleft()
+            if future:
+                future.result()
+            migrated_identities_count += len(identity_ids)
+            self.project_metadata.checkpoint_identity_migration(
+                migrated_until_identity_id=identity_ids[-1],
+                migrated_identities_count=migrated_identities_count,
+            )
+            logger.info(
+                "Migrated %d of %d identities for project %d.",
+                migrated_identities_count,
+                total_identities_count,
+                project_id,
+            )
+
+        try:
+            for identity_ids in iter_pk_chunks(
+                Identity.objects.filter(environment__project_id=project_id),
+                chunk_size=settings.IDENTITY_MIGRATION_CHUNK_SIZE,
+                after_pk=migrated_until_identity_id,
+            ):
+                if executor:
+                    # keep a bounded number of chunks in flight
+                    if len(pending_chunks) >= max_workers * 2:
+                        checkpoint_oldest_chunk()
+                    future = executor.submit(self._write_identities, identity_ids)
+                    pending_chunks.append((identity_ids, future))
+                else:
+                    self._write_identities(identity_ids)
+                    pending_chunks.append((identity_ids, None))
+                    checkpoint_oldest_chunk()
+
+            while pending_chunks:
+                checkpoint_oldest_chunk()
+        finally:
+            if executor:
+                executor.shutdown(cancel_futures=True)
+
+    def _write_identities(self, identity_ids: list[int]) -> None:
+        identities = self._get_identities_queryset().filter(
+            id__gte=identity_ids[0], id__lte=identity_ids[-1]
+        )
+        in_worker_thread = threading.current_thread() is not threading.main_thread()
+        try:
+            self._get_identity_wrapper().write_identities(identities)
+        finally:
+            if in_worker_thread:
+                # worker threads have their own database connection
+                connection.close()
+
+    def _get_identity_wrapper(self) -> DynamoIdentityWrapper:
+        if not hasattr(self._identity_wrappers, "wrapper"):
+            # creating boto3 resources isn't thread safe either
+            with self._identity_wrappers_lock:
+                wrapper = DynamoIdentityWrapper()
+                wrapper.table
+                self._identity_wrappers.wrapper = wrapper
+        return self._identity_wrappers.wrapper
+
+    def _get_identities_queryset(self) -> QuerySet[Identity]:
+        return (
+            Identity.objects.filter(environment__project__id=self.project_metadata.id)
             .select_related("environment")
             .prefetch_related(
                 "identity_traits",
@@ -79,6 +202,5 @@ class IdentityMigrator:
                     ),
                 ),
             )
+            .order_by("id")
         )
-        identity_wrapper.write_identities(iterator_with_prefetch(identities))
-        self.project_metadata.finish_identity_migration()
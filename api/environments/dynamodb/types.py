@@ -4,6 +4,7 @@ from datetime import datetime
 
 import boto3
 from django.conf import settings
+from django.core.cache import caches
 from flag_engine.features.models import FeatureStateModel
 from pydantic import BaseModel
 
@@ -14,6 +15,8 @@ if settings.PROJECT_METADATA_TABLE_NAME_DYNAMO:
         settings.PROJECT_METADATA_TABLE_NAME_DYNAMO
     )
 
+project_metadata_cache = caches[settings.PROJECT_METADATA_CACHE_NAME]
+
 
 class ProjectIdentityMigrationStatus(enum.Enum):
     MIGRATION_SCHEDULED = "MIGRATION_SCHEDULED"
@@ -31,13 +34,23 @@ class DynamoProjectMetadata:
     migration_start_time: str = None
     migration_end_time: str = None
     triggered_at: str = None
+    # Checkpoint of an identity migration in progress: all identities with an id
+    # up to `migrated_until_identity_id` have been written to dynamodb.
+    migrated_until_identity_id: int = None
+    migrated_identities_count: int = 0
 
     @classmethod
     def get_or_new(cls, project_id: int) -> "DynamoProjectMetadata":
-        document = project_metadata_table.get_item(Key={"id": project_id}).get("Item")
-        if document:
-            return cls(**document)
-        return cls(id=project_id)
+        # The document is cached for CACHE_PROJECT_METADATA_SECONDS, and
+        # invalidated whenever the migration state of the project changes.
+        document = project_metadata_cache.get(project_id)
+        if document is None:
+            item = project_metadata_table.get_item(Key={"id": project_id}).get("Item")
+            document = item or {"id": project_id}
+            project_metadata_cache.set(
+                project_id, document, timeout=settings.CACHE_PROJECT_METADATA_SECONDS
+            )
+        return cls(**document)
 
     @property
     def identity_migration_status(self) -> ProjectIdentityMigrationStatus:
@@ -63,6 +76,15 @@ class DynamoProjectMetadata:
         self.migration_start_time = datetime.now().isoformat()
         self._save()
 
+    def checkpoint_identity_migration(
+        self, migrated_until_identity_id: int, migrated_identities_count: int
+    ):
+        if not self.migration_start_time or self.migration_end_time:
+            raise AttributeError("Migration is not in progress.")
+        self.migrated_until_identity_id = migrated_until_identity_id
+        self.migrated_identities_count = migrated_identities_count
+        self._save()
+
     def finish_identity_migration(self):
         if self.migration_end_time:
             raise AttributeError("Migration has already been finished.")
@@ -70,11 +92,16 @@ class DynamoProjectMetadata:
         self._save()
 
     def _save(self):
-        return project_metadata_table.put_item(Item=asdict(self))
+        # The cached document is removed after it's written so that a concurrent
+        # read can't cache the previous document again.
+        response = project_metadata_table.put_item(Item=asdict(self))
+        project_metadata_cache.delete(self.id)
+        return response
 
     def delete(self):
         if project_metadata_table:
             project_metadata_table.delete_item(Key={"id": self.id})
+        project_metadata_cache.delete(self.id)
 
 
 class IdentityOverrideV2(BaseModel):
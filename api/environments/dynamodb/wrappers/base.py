@@ -1,9 +1,23 @@
+import threading
+import time
 import typing
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 
 import boto3
 from botocore.config import Config
 
+from environments.dynamodb.constants import (
+    DYNAMODB_BATCH_WRITE_RETRY_BASE_DELAY_SECONDS,
+    DYNAMODB_BATCH_WRITE_RETRY_MAX_DELAY_SECONDS,
+    DYNAMODB_MAX_BATCH_WRITE_ATTEMPTS,
+    DYNAMODB_MAX_BATCH_WRITE_ITEM_COUNT,
+)
+from environments.dynamodb.exceptions import UnprocessedItemsError
+from util.util import iter_chunks
+
 if typing.TYPE_CHECKING:
+    from mypy_boto3_dynamodb.client import DynamoDBClient
     from mypy_boto3_dynamodb.service_resource import Table
 
 
@@ -43,3 +57,94 @@ class BaseDynamoWrapper:
                 break
 
             kwargs["ExclusiveStartKey"] = last_evaluated_key
+
+    def batch_delete_items(
+        self,
+        keys: typing.Iterable[dict],
+        max_workers: int = 1,
+        max_items_per_second: float = 0,
+    ) -> int:
+        """
+        Delete the items with the given keys, in batches written by up to
+        `max_workers` threads. Unprocessed items are retried with an exponential
+        backoff.
+
+        :param max_items_per_second: limit the rate of deletes, e.g. to leave
+            some of the table's write capacity to other clients. 0 for no limit.
+        :return: the number of deleted items
+        """
+        # Unlike boto3 resources, boto3 clients can be shared between threads.
+        client = self.table.meta.client
+        table_name = self.table.name
+        rate_limiter = _RateLimiter(max_items_per_second)
+
+        def delete_batch(batch_keys: list[dict]) -> int:
+            rate_limiter.acquire(len(batch_keys))
+            _batch_write_item(
+                client,
+                table_name,
+                [{"DeleteRequest": {"Key": key}} for key in batch_keys],
+            )
+            return len(batch_keys)
+
+        batches = iter_chunks(keys, chunk_size=DYNAMODB_MAX_BATCH_WRITE_ITEM_COUNT)
+        if max_workers <= 1:
+            return sum(delete_batch(batch_keys) for batch_keys in batches)
+
+        deleted_count = 0
+        pending_batches: deque[Future] = deque()
+        with ThreadPoolExecutor(max_workers) as executor:
+            for batch_keys in batches:
+                # keep a bounded number of batches in flight, so that keys
+                # are only read as fast as they can be deleted
+                if len(pending_batches) >= max_workers * 2:
+                    deleted_count += pending_batches.popleft().result()
+                pending_batches.append(executor.submit(delete_batch, batch_keys))
+
+            while pending_batches:
+                deleted_count += pending_batches.popleft().result()
+
+        return deleted_count
+
+
+def _batch_write_item(
+    client: "DynamoDBClient",
+    table_name: str,
+    write_requests: list[dict],
+) -> None:
+    request_items = {table_name: write_requests}
+    for attempt in range(DYNAMODB_MAX_BATCH_WRITE_ATTEMPTS):
+        if attempt:
+            time.sleep(
+                min(
+                    DYNAMODB_BATCH_WRITE_RETRY_BASE_DELAY_SECONDS * 2 ** (attempt - 1),
+                    DYNAMODB_BATCH_WRITE_RETRY_MAX_DELAY_SECONDS,
+                )
+            )
+        response = client.batch_write_item(RequestItems=request_items)
+        if not (request_items := response.get("UnprocessedItems")):
+            return
+
+    raise UnprocessedItemsError(
+        f"{len(request_items[table_name])} items were not processed after "
+        f"{DYNAMODB_MAX_BATCH_WRITE_ATTEMPTS} attempts."
+    )
+
+
+class _RateLimiter:
+    def __init__(self, max_items_per_second: float) -> None:
+        self._seconds_per_item = 1 / max_items_per_second if max_items_per_second else 0
+        self._next_time = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, items_count: int) -> None:
+        if not self._seconds_per_item:
+            return
+
+        with self._lock:
+            now = time.monotonic()
+            start_time = max(self._next_time, now)
+            self._next_time = start_time + items_count * self._seconds_per_item
+
+        if start_time > now:
+            time.sleep(start_time - now)
@@ -15,6 +15,8 @@ from environments.dynamodb.utils import (
     get_environments_v2_identity_override_document_key,
 )
 from util.mappers import (
+    map_engine_environment_to_environment_document,
+    map_engine_environment_to_environment_v2_document,
     map_environment_to_environment_document,
     map_environment_to_environment_v2_document,
     map_identity_override_to_identity_override_document,
@@ -24,6 +26,7 @@ from util.util import iter_paired_chunks
 from .base import BaseDynamoWrapper
 
 if typing.TYPE_CHECKING:
+    from flag_engine.environments.models import EnvironmentModel
     from mypy_boto3_dynamodb.type_defs import QueryInputRequestTypeDef
 
     from environments.models import Environment
@@ -36,6 +39,11 @@ class BaseDynamoEnvironmentWrapper(BaseDynamoWrapper):
     def write_environments(self, environments: Iterable["Environment"]) -> None:
         raise NotImplementedError()
 
+    def write_engine_environments(
+        self, engine_environments: Iterable["EnvironmentModel"]
+    ) -> None:
+        raise NotImplementedError()
+
 
 class DynamoEnvironmentWrapper(BaseDynamoEnvironmentWrapper):
     def get_table_name(self) -> str | None:
@@ -48,6 +56,17 @@ class DynamoEnvironmentWrapper(BaseDynamoEnvironmentWrapper):
                     Item=map_environment_to_environment_document(environment),
                 )
 
+    def write_engine_environments(
+        self, engine_environments: Iterable["EnvironmentModel"]
+    ) -> None:
+        with self.table.batch_writer() as writer:
+            for engine_environment in engine_environments:
+                writer.put_item(
+                    Item=map_engine_environment_to_environment_document(
+                        engine_environment
+                    ),
+                )
+
     def get_item(self, api_key: str) -> dict:
         try:
             return self.table.get_item(Key={"api_key": api_key})["Item"]
@@ -114,6 +133,17 @@ class DynamoEnvironmentV2Wrapper(BaseDynamoEnvironmentWrapper):
                     Item=map_environment_to_environment_v2_document(environment),
                 )
 
+    def write_engine_environments(
+        self, engine_environments: Iterable["EnvironmentModel"]
+    ) -> None:
+        with self.table.batch_writer() as writer:
+            for engine_environment in engine_environments:
+                writer.put_item(
+                    Item=map_engine_environment_to_environment_v2_document(
+                        engine_environment
+                    ),
+                )
+
     def delete_environment(self, environment_id: int):
         environment_id = str(environment_id)
         filter_expression = Key(ENVIRONMENTS_V2_PARTITION_KEY).eq(environment_id)
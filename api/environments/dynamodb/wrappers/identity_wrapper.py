@@ -58,13 +58,23 @@ class DynamoIdentityWrapper(BaseDynamoWrapper):
     def delete_item(self, composite_key: str):
         self.table.delete_item(Key={"composite_key": composite_key})
 
-    def delete_all_identities(self, environment_api_key: str):
-        with self.table.batch_writer() as writer:
-            for item in self.iter_all_items_paginated(
-                environment_api_key=environment_api_key,
-                projection_expression="composite_key",
-            ):
-                writer.delete_item(Key={"composite_key": item["composite_key"]})
+    def delete_all_identities(self, environment_api_key: str) -> None:
+        deleted_count = self.batch_delete_items(
+            (
+                {"composite_key": item["composite_key"]}
+                for item in self.iter_all_items_paginated(
+                    environment_api_key=environment_api_key,
+                    projection_expression="composite_key",
+                )
+            ),
+            max_workers=settings.DYNAMO_IDENTITIES_DELETION_MAX_WORKERS,
+            max_items_per_second=settings.DYNAMO_IDENTITIES_DELETION_MAX_ITEMS_PER_SECOND,
+        )
+        logger.info(
+            "Deleted %d identities of environment %s from dynamodb.",
+            deleted_count,
+            environment_api_key,
+        )
 
     def get_item_from_uuid(self, uuid: str) -> dict:
         filter_expression = Key("identity_uuid").eq(uuid)
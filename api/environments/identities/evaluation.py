@@ -0,0 +1,277 @@
+"""
+In-memory evaluation of identity flags.
+
+Rather than querying every feature state which could apply to an identity (see
+`Identity.get_all_feature_states`), the identity's overrides and traits are
+evaluated by the flag engine against the environment's engine model. The model
+is built from the (cached) environment document and kept in memory by each
+process until the environment is next updated, so identifying only requires
+reading the identity, its traits and its overrides from the database.
+"""
+
+import typing
+from collections import defaultdict
+from dataclasses import dataclass
+
+from core.local_cache import VersionedLocalCache
+from core.request_origin import RequestOrigin
+from django.conf import settings
+from django.db.models import Prefetch
+from django.utils import timezone
+from flag_engine.engine import get_identity_feature_states
+from flag_engine.environments.models import EnvironmentModel
+from flag_engine.identities.models import IdentityModel
+
+from environments.models import Environment
+from features.models import Feature, FeatureState
+from features.multivariate.models import MultivariateFeatureStateValue
+from features.priority import get_highest_priority_feature_states
+from integrations.integration import IDENTITY_INTEGRATIONS
+from util.mappers.engine import (
+    map_feature_state_to_engine,
+    map_traits_to_engine,
+)
+
+if typing.TYPE_CHECKING:
+    from environments.identities.models import Identity
+    from environments.identities.traits.models import Trait
+
+
+@dataclass
+class EvaluatedFeatureState:
+    """
+    A feature state evaluated by the flag engine, with the attributes needed to
+    serialize it in the same way as a `FeatureState`.
+    """
+
+    id: int
+    feature: Feature
+    feature_state_value: typing.Any
+    environment: int
+    identity: int | None
+    feature_segment: int | None
+    enabled: bool
+
+
+@dataclass
+class EnvironmentEvaluationContext:
+    environment_model: EnvironmentModel
+    # The engine models don't include everything returned by the SDK, so the
+    # remaining data is read once when the context is built.
+    features_by_id: dict[int, Feature]
+    feature_segment_ids_by_feature_state_id: dict[int, int]
+
+
+environment_evaluation_contexts: VersionedLocalCache[EnvironmentEvaluationContext] = (
+    VersionedLocalCache(
+        lambda: settings.IN_MEMORY_IDENTITY_EVALUATION_MAX_ENVIRONMENTS,
+    )
+)
+
+
+def can_evaluate_identities_in_memory(environment: Environment) -> bool:
+    """
+    Identity integrations are sent the identity's `FeatureState` objects, so
+    flags are only evaluated in memory for environments without any.
+    """
+    if not settings.USE_IN_MEMORY_IDENTITY_EVALUATION:
+        return False
+
+    environment_model = get_environment_evaluation_context(
+        environment
+    ).environment_model
+    return not any(
+        getattr(environment_model, integration["relation_name"])
+        for integration in IDENTITY_INTEGRATIONS
+    )
+
+
+def get_environment_evaluation_context(
+    environment: Environment,
+) -> EnvironmentEvaluationContext:
+    return environment_evaluation_contexts.get_or_build(
+        environment.api_key,
+        version=environment.updated_at,
+        build=lambda: _build_environment_evaluation_context(environment),
+    )
+
+
+def get_identity_evaluated_feature_states(
+    identity: "Identity",
+    environment: Environment,
+    origin: RequestOrigin,
+    traits: typing.Iterable["Trait"] | None = None,
+) -> list[EvaluatedFeatureState]:
+    """
+    Get all feature states for an identity, evaluated in memory. The result
+    matches `Identity.get_all_feature_states`, filtered for the given origin.
+
+    :param traits: override the identity's traits when evaluating segments
+    """
+    context = get_environment_evaluation_context(environment)
+    identity_overrides = _get_identity_overrides([identity], environment)
+
+    return _evaluate_identity(
+        context,
+        identity,
+        environment,
+        origin,
+        traits=traits,
+        identity_overrides=identity_overrides.get(identity.id, []),
+    )
+
+
+def iter_identities_evaluated_feature_states(
+    identities_traits: typing.Sequence[
+        tuple["Identity", typing.Iterable["Trait"] | None]
+    ],
+    environment: Environment,
+    origin: RequestOrigin,
+) -> typing.Iterator[list[EvaluatedFeatureState]]:
+    """
+    Evaluate the feature states of many identities (along with their traits)
+    in memory, in the same way as `get_identity_evaluated_feature_states`,
+    reading the overrides of all of the identities at once.
+    """
+    context = get_environment_evaluation_context(environment)
+    identity_overrides = _get_identity_overrides(
+        [identity for identity, _ in identities_traits], environment
+    )
+
+    for identity, traits in identities_traits:
+        yield _evaluate_identity(
+            context,
+            identity,
+            environment,
+            origin,
+            traits=traits,
+            identity_overrides=identity_overrides.get(identity.id, []),
+        )
+
+
+def _evaluate_identity(
+    context: EnvironmentEvaluationContext,
+    identity: "Identity",
+    environment: Environment,
+    origin: RequestOrigin,
+    traits: typing.Iterable["Trait"] | None,
+    identity_overrides: list[FeatureState],
+) -> list[EvaluatedFeatureState]:
+    identity_model = IdentityModel(
+        identifier=identity.identifier,
+        environment_api_key=environment.api_key,
+        created_date=identity.created_date,
+        django_id=identity.pk,
+        identity_features=[
+            map_feature_state_to_engine(
+                feature_state,
+                mv_fs_values=feature_state.multivariate_feature_state_values.all(),
+            )
+            for feature_state in identity_overrides
+        ],
+    )
+    identity_override_ids = {feature_state.id for feature_state in identity_overrides}
+
+    traits = identity.identity_traits.all() if traits is None else traits
+    feature_state_models = get_identity_feature_states(
+        context.environment_model,
+        identity_model,
+        override_traits=map_traits_to_engine(traits),
+    )
+
+    identity_hash_key = identity.get_hash_key(
+        environment.use_identity_composite_key_for_hashing
+    )
+
+    evaluated_feature_states = []
+    for feature_state_model in feature_state_models:
+        feature = context.features_by_id.get(feature_state_model.feature.id)
+        if feature is None:
+            # The feature has been deleted since the environment document was built.
+            continue
+        if origin is RequestOrigin.CLIENT and feature.is_server_key_only:
+            continue
+
+        feature_state_id = feature_state_model.django_id
+        evaluated_feature_states.append(
+            EvaluatedFeatureState(
+                id=feature_state_id,
+                feature=feature,
+                feature_state_value=feature_state_model.get_value(identity_hash_key),
+                environment=environment.id,
+                identity=(
+                    identity.id if feature_state_id in identity_override_ids else None
+                ),
+                feature_segment=context.feature_segment_ids_by_feature_state_id.get(
+                    feature_state_id
+                ),
+                enabled=feature_state_model.enabled,
+            )
+        )
+
+    return evaluated_feature_states
+
+
+def _build_environment_evaluation_context(
+    environment: Environment,
+) -> EnvironmentEvaluationContext:
+    environment_model = EnvironmentModel.model_validate(
+        Environment.get_environment_document(
+            environment.api_key, environment.updated_at
+        )
+    )
+
+    segment_feature_state_ids = [
+        feature_state.django_id
+        for segment in environment_model.project.segments
+        for feature_state in segment.feature_states
+    ]
+
+    return EnvironmentEvaluationContext(
+        environment_model=environment_model,
+        features_by_id=Feature.objects.filter(
+            project_id=environment_model.project.id
+        ).in_bulk(),
+        feature_segment_ids_by_feature_state_id=dict(
+            FeatureState.objects.filter(id__in=segment_feature_state_ids).values_list(
+                "id", "feature_segment_id"
+            )
+        ),
+    )
+
+
+def _get_identity_overrides(
+    identities: typing.Iterable["Identity"],
+    environment: Environment,
+) -> dict[int, list[FeatureState]]:
+    """
+    Get the highest priority override of each feature for each of the given
+    identities, keyed by identity id, in the same way as
+    `Identity.get_all_feature_states`.
+    """
+    queryset = (
+        FeatureState.objects.filter(identity__in=identities)
+        .select_related("feature", "feature_state_value")
+        .prefetch_related(
+            Prefetch(
+                "multivariate_feature_state_values",
+                queryset=MultivariateFeatureStateValue.objects.select_related(
+                    "multivariate_feature_option"
+                ),
+            )
+        )
+    )
+    # Note that identity overrides are not versioned when an environment uses
+    # v2 feature versioning.
+    if not environment.use_v2_feature_versioning:
+        queryset = queryset.filter(live_from__lte=timezone.now(), version__isnull=False)
+
+    identity_overrides: dict[int, list[FeatureState]] = defaultdict(list)
+    for (identity_id, _), feature_state in get_highest_priority_feature_states(
+        queryset,
+        key_function=lambda fs: (fs.identity_id, fs.feature_id),
+        use_v2_feature_versioning=environment.use_v2_feature_versioning,
+    ).items():
+        identity_overrides[identity_id].append(feature_state)
+
+    return dict(identity_overrides)
@@ -1,6 +1,6 @@
 from typing import TYPE_CHECKING, Iterable
 
-from django.db.models import Manager
+from django.db.models import Manager, QuerySet
 
 if TYPE_CHECKING:
     from environments.identities.models import Identity
@@ -19,14 +19,66 @@ class IdentityManager(Manager["Identity"]):
         integrations: Iterable["IntegrationConfig"],
     ) -> tuple["Identity", bool]:
         return (
-            self.select_related(
-                "environment",
-                "environment__project",
-                *[
-                    f"environment__{integration['relation_name']}"
-                    for integration in integrations
-                ],
-            )
+            self._for_sdk(integrations)
             .prefetch_related("identity_traits")
             .get_or_create(identifier=identifier, environment=environment)
         )
+
+    def get_or_create_many_for_sdk(
+        self,
+        identifiers: list[str],
+        environment: "Environment",
+        integrations: Iterable["IntegrationConfig"],
+    ) -> list[tuple["Identity", bool]]:
+        """
+        Get or create the identities with the given identifiers in bulk. The
+        result is in the same order as the identifiers.
+
+        Note that identities created by a concurrent request, between reading the
+        existing identities and inserting the missing ones, are also reported as
+        created.
+        """
+        queryset = self._for_sdk(integrations).filter(environment=environment)
+
+        identities = {
+            identity.identifier: identity
+            for identity in queryset.filter(identifier__in=identifiers)
+        }
+        missing_identifiers = [
+            identifier
+            for identifier in dict.fromkeys(identifiers)
+            if identifier not in identities
+        ]
+
+        if missing_identifiers:
+            # Ignore conflicts with identities created by concurrent requests,
+            # which are then read along with the rest of the new identities.
+            self.bulk_create(
+                [
+                    self.model(identifier=identifier, environment=environment)
+                    for identifier in missing_identifiers
+                ],
+                ignore_conflicts=True,
+            )
+            identities.update(
+                (identity.identifier, identity)
+                for identity in queryset.filter(identifier__in=missing_identifiers)
+            )
+
+        created_identifiers = set(missing_identifiers)
+        return [
+            (identities[identifier], identifier in created_identifiers)
+            for identifier in identifiers
+        ]
+
+    def _for_sdk(
+        self, integrations: Iterable["IntegrationConfig"]
+    ) -> QuerySet["Identity"]:
+        return self.select_related(
+            "environment",
+            "environment__project",
+            *[
+                f"environment__{integration['relation_name']}"
+                for integration in integrations
+            ],
+        )
@@ -1,4 +1,5 @@
 import typing
+from collections import defaultdict
 
 from django.db import models
 from django.db.models import Prefetch, Q
@@ -10,12 +11,10 @@ from environments.identities.traits.models import Trait
 from environments.models import Environment
 from features.models import FeatureState
 from features.multivariate.models import MultivariateFeatureStateValue
+from features.priority import get_highest_priority_feature_states
 from segments.models import Segment
-from util.mappers.engine import (
-    map_identity_to_engine,
-    map_segment_to_engine,
-    map_traits_to_engine,
-)
+from segments.services import get_engine_segments
+from util.mappers.engine import map_identity_to_engine, map_traits_to_engine
 
 
 class Identity(models.Model):
@@ -109,6 +108,8 @@ class Identity(models.Model):
             "feature_segment",
             "feature_segment__segment",
             "identity",
+            # used to prioritise the feature states in v2 versioned environments
+            "environment_feature_version",
         ]
 
         all_flags = (
@@ -126,14 +127,11 @@ class Identity(models.Model):
 
         # iterate over all the flags and build a dictionary keyed on feature with the highest priority flag
         # for the given identity as the value.
-        identity_flags = {}
-        for flag in all_flags:
-            if flag.feature_id not in identity_flags:
-                identity_flags[flag.feature_id] = flag
-            else:
-                current_flag = identity_flags[flag.feature_id]
-                if flag > current_flag:
-                    identity_flags[flag.feature_id] = flag
+        identity_flags = get_highest_priority_feature_states(
+            all_flags,
+            key_function=lambda flag: flag.feature_id,
+            use_v2_feature_versioning=self.environment.use_v2_feature_versioning,
+        )
 
         if self.environment.get_hide_disabled_flags() is True:
             # filter out any flags that are disabled
@@ -160,14 +158,8 @@ class Identity(models.Model):
         :param overrides_only: only retrieve the segments which have a valid override in the environment
         :return: List of matching segments
         """
-        matching_segments = []
         traits = self.identity_traits.all() if traits is None else traits
 
-        if overrides_only:
-            all_segments = self.environment.get_segments_from_cache()
-        else:
-            all_segments = self.environment.project.get_segments_from_cache()
-
         engine_identity = map_identity_to_engine(
             self,
             with_overrides=False,
@@ -175,17 +167,17 @@ class Identity(models.Model):
         )
         engine_traits = map_traits_to_engine(traits)
 
-        for segment in all_segments:
-            engine_segment = map_segment_to_engine(segment)
-
+        return [
+            segment
+            for segment, engine_segment in get_engine_segments(
+                self.environment, overrides_only=overrides_only
+            )
             if evaluate_identity_in_segment(
                 identity=engine_identity,
                 segment=engine_segment,
                 override_traits=engine_traits,
-            ):
-                matching_segments.append(segment)
-
-        return matching_segments
+            )
+        ]
 
     def get_all_user_traits(self):
         # this is pointless, we should probably replace all uses with the below code
@@ -231,52 +223,86 @@ class Identity(models.Model):
         Return the full list of traits for the given identity after these changes.
 
         :param trait_data_items: list of dictionaries validated by TraitSerializerFull
-        :return: queryset of updated trait models
+        :return: list of updated trait models
         """
-        current_traits = {t.trait_key: t for t in self.identity_traits.all()}
+        return Identity.bulk_update_traits({self: trait_data_items})[self.id]
 
-        keys_to_delete = []
-        new_traits = []
-        updated_traits = []
+    @staticmethod
+    def bulk_update_traits(
+        trait_data_items_by_identity: dict["Identity", list[dict]],
+    ) -> dict[int, list[Trait]]:
+        """
+        Given a list of traits for each identity, update any that already exist,
+        create any new ones and delete any that have been set to null. This uses
+        at most 3 queries, regardless of the number of identities and traits.
 
-        for trait_data_item in trait_data_items:
-            trait_key = trait_data_item["trait_key"]
-            trait_value = trait_data_item["trait_value"]
+        :param trait_data_items_by_identity: lists of dictionaries validated by
+            TraitSerializerFull, keyed by identity
+        :return: the full list of traits for each identity, keyed by identity id
+        """
+        current_traits = Identity._get_traits_by_identity(trait_data_items_by_identity)
+
+        delete_filter_query = Q()
+        traits_to_save = {}
 
-            if trait_value is None:
-                # build a list of trait keys to delete having been nulled by the
-                # input data
-                keys_to_delete.append(trait_key)
-                continue
+        for identity, trait_data_items in trait_data_items_by_identity.items():
+            identity_traits = current_traits[identity.id]
+            keys_to_delete = []
 
-            trait_value_data = Trait.generate_trait_value_data(trait_value)
+            for trait_data_item in trait_data_items:
+                trait_key = trait_data_item["trait_key"]
+                trait_value = trait_data_item["trait_value"]
 
-            if trait_key in current_traits:
-                current_trait = current_traits[trait_key]
-                # Don't update the trait if the value hasn't changed
-                if current_trait.trait_value == trait_value:
+                if trait_value is None:
+                    # build a list of trait keys to delete having been nulled by
+                    # the input data
+                    keys_to_delete.append(trait_key)
+                    identity_traits.pop(trait_key, None)
+                    traits_to_save.pop((identity.id, trait_key), None)
                     continue
 
-                for attr, value in trait_value_data.items():
-                    setattr(current_trait, attr, value)
-                updated_traits.append(current_trait)
-            else:
-                new_traits.append(
-                    Trait(**trait_value_data, trait_key=trait_key, identity=self)
+                trait_value_data = Trait.generate_trait_value_data(trait_value)
+
+                if trait_key in identity_traits:
+                    current_trait = identity_traits[trait_key]
+                    # Don't update the trait if the value hasn't changed
+                    if current_trait.trait_value == trait_value:
+                        continue
+
+                    for attr, value in trait_value_data.items():
+                        setattr(current_trait, attr, value)
+                else:
+                    current_trait = identity_traits[trait_key] = Trait(
+                        **trait_value_data, trait_key=trait_key, identity=identity
+                    )
+
+                traits_to_save[(identity.id, trait_key)] = current_trait
+
+            if keys_to_delete:
+                delete_filter_query |= Q(
+                    identity=identity, trait_key__in=keys_to_delete
                 )
 
         # delete the traits that had their keys set to None
-        if keys_to_delete:
-            self.identity_traits.filter(trait_key__in=keys_to_delete).delete()
-
-        Trait.objects.bulk_update(updated_traits, fields=Trait.BULK_UPDATE_FIELDS)
+        if delete_filter_query:
+            Trait.objects.filter(delete_filter_query).delete()
 
-        # use ignore_conflicts to handle race conditions which result in IntegrityError if another request
-        # has added a particular trait_key for the identity while this method has been determining what to
-        # update or create.
+        # traits are upserted to handle race conditions where another request has
+        # added a particular trait_key for the identity while this method has been
+        # determining what to update or create.
         # See: https://github.com/Flagsmith/flagsmith/issues/370
-        Trait.objects.bulk_create(new_traits, ignore_conflicts=True)
-
-        # return the full list of traits for this identity by refreshing from the db
-        # TODO: handle this in the above logic to avoid a second hit to the DB
-        return self.identity_traits.all()
+        Trait.objects.bulk_upsert(list(traits_to_save.values()))
+
+        return {
+            identity.id: list(current_traits[identity.id].values())
+            for identity in trait_data_items_by_identity
+        }
+
+    @staticmethod
+    def _get_traits_by_identity(
+        identities: typing.Iterable["Identity"],
+    ) -> dict[int, dict[str, Trait]]:
+        traits_by_identity = defaultdict(dict)
+        for trait in Trait.objects.filter(identity__in=list(identities)):
+            traits_by_identity[trait.identity_id][trait.trait_key] = trait
+        return traits_by_identity
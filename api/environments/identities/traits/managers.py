@@ -0,0 +1,80 @@
+import typing
+
+from django.db import connections, router
+from django.db.models import Manager
+from django.utils import timezone
+
+if typing.TYPE_CHECKING:
+    from environments.identities.traits.models import Trait
+
+# Keep the number of parameters in each query well within the limits of the db.
+UPSERT_BATCH_SIZE = 1000
+
+
+class TraitManager(Manager["Trait"]):
+    def bulk_upsert(self, traits: list["Trait"]) -> None:
+        """
+        Create the given traits, or update the value of the traits which already
+        exist for the same identity and key. The primary key of each trait is
+        set accordingly.
+
+        On postgres, this is a single `INSERT ... ON CONFLICT DO UPDATE` query
+        per batch of traits. Each identity / key pair must only appear once.
+        """
+        if not traits:
+            return
+
+        connection = connections[router.db_for_write(self.model)]
+        if connection.vendor != "postgresql":
+            for trait in traits:
+                trait.pk = self.update_or_create(
+                    identity_id=trait.identity_id,
+                    trait_key=trait.trait_key,
+                    defaults={
+                        field: getattr(trait, field)
+                        for field in self.model.BULK_UPDATE_FIELDS
+                    },
+                )[0].pk
+            return
+
+        now = timezone.now()
+        for trait in traits:
+            trait.created_date = trait.created_date or now
+
+        fields = [
+            self.model._meta.get_field(name)
+            for name in (
+                "identity",
+                "trait_key",
+                *self.model.BULK_UPDATE_FIELDS,
+                "created_date",
+            )
+        ]
+        quote_name = connection.ops.quote_name
+        columns = ", ".join(quote_name(field.column) for field in fields)
+        updates = ", ".join(
+            f"{quote_name(name)} = EXCLUDED.{quote_name(name)}"
+            for name in self.model.BULK_UPDATE_FIELDS
+        )
+        row_placeholder = f"({', '.join(['%s'] * len(fields))})"
+
+        with connection.cursor() as cursor:
+            for start in range(0, len(traits), UPSERT_BATCH_SIZE):
+                end = start + UPSERT_BATCH_SIZE
+                batch = traits[start:end]
+                params = [
+                    field.get_db_prep_save(getattr(trait, field.attname), connection)
+                    for trait in batch
+                    for field in fields
+                ]
+                # postgres returns the rows in the same order as the values
+                cursor.execute(
+                    f"INSERT INTO {quote_name(self.model._meta.db_table)} ({columns}) "
+                    f"VALUES {', '.join([row_placeholder] * len(batch))} "
+                    f"ON CONFLICT ({quote_name('identity_id')}, {quote_name('trait_key')}) "
+                    f"DO UPDATE SET {updates} "
+                    f"RETURNING {quote_name(self.model._meta.pk.column)}",
+                    params,
+                )
+                for trait, (pk,) in zip(batch, cursor.fetchall()):
+                    trait.pk = pk
@@ -5,6 +5,7 @@ from django.core.exceptions import ObjectDoesNotExist
 from django.db import models
 
 from environments.identities.traits.exceptions import TraitPersistenceError
+from environments.identities.traits.managers import TraitManager
 
 
 class Trait(models.Model):
@@ -15,7 +16,7 @@ class Trait(models.Model):
         (FLOAT, "Float"),
     )
 
-    # list of fields that should be updated when using bulk update (e.g. in Identity.update_traits())
+    # list of fields that should be updated when using bulk update (e.g. in Identity.bulk_update_traits())
     BULK_UPDATE_FIELDS = [
         "value_type",
         "string_value",
@@ -38,6 +39,8 @@ class Trait(models.Model):
 
     created_date = models.DateTimeField("DateCreated", auto_now_add=True)
 
+    objects = TraitManager()
+
     class Meta:
         verbose_name_plural = "User Traits"
         unique_together = ("trait_key", "identity")
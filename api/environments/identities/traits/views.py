@@ -1,6 +1,5 @@
 from django.conf import settings
 from django.core.exceptions import BadRequest
-from django.db.models import Q
 from drf_yasg import openapi
 from drf_yasg.utils import swagger_auto_schema
 from rest_framework import mixins, status, viewsets
@@ -9,8 +8,8 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 
 from edge_api.identities.edge_request_forwarder import (
-    forward_trait_request,
-    forward_trait_requests,
+    forward_trait_request_async,
+    forward_trait_requests_async,
 )
 from environments.authentication import EnvironmentKeyAuthentication
 from environments.identities.models import Identity
@@ -202,13 +201,11 @@ class SDKTraits(mixins.CreateModelMixin, viewsets.GenericViewSet):
         response = super(SDKTraits, self).create(request, *args, **kwargs)
         response.status_code = status.HTTP_200_OK
         if settings.EDGE_API_URL and request.environment.project.enable_dynamo_db:
-            forward_trait_request.delay(
-                args=(
-                    request.method,
-                    dict(request.headers),
-                    request.environment.project.id,
-                    request.data,
-                )
+            forward_trait_request_async(
+                request.method,
+                dict(request.headers),
+                request.environment.project.id,
+                request.data,
             )
 
         return response
@@ -227,13 +224,11 @@ class SDKTraits(mixins.CreateModelMixin, viewsets.GenericViewSet):
             # Convert the payload to the structure expected by /traits
             payload = serializer.data.copy()
             payload.update({"identity": {"identifier": payload.pop("identifier")}})
-            forward_trait_request.delay(
-                args=(
-                    request.method,
-                    dict(request.headers),
-                    request.environment.project.id,
-                    payload,
-                )
+            forward_trait_request_async(
+                request.method,
+                dict(request.headers),
+                request.environment.project.id,
+                payload,
             )
 
         return Response(serializer.data, status=200)
@@ -246,38 +241,29 @@ class SDKTraits(mixins.CreateModelMixin, viewsets.GenericViewSet):
                 raise BadRequest("Unable to set traits with client key.")
 
             # endpoint allows users to delete existing traits by sending null values
-            # for the trait value so we need to filter those out here
-            traits = []
-            delete_filter_query = Q()
-
-            for trait in request.data:
-                if trait.get("trait_value") is None:
-                    delete_filter_query = delete_filter_query | Q(
-                        trait_key=trait.get("trait_key"),
-                        identity__identifier=trait["identity"]["identifier"],
-                        identity__environment=request.environment,
-                    )
-                else:
-                    traits.append(trait)
-
-            if delete_filter_query:
-                Trait.objects.filter(delete_filter_query).delete()
-
-            serializer = self.get_serializer(data=traits, many=True)
+            # for the trait value, which are handled by the serializer along with
+            # the rest of the traits
+            serializer = self.get_serializer(data=request.data, many=True)
             serializer.is_valid(raise_exception=True)
             serializer.save()
 
             if settings.EDGE_API_URL and request.environment.project.enable_dynamo_db:
-                forward_trait_requests.delay(
-                    args=(
-                        request.method,
-                        dict(request.headers),
-                        request.environment.project.id,
-                        request.data,
-                    )
+                forward_trait_requests_async(
+                    request.method,
+                    dict(request.headers),
+                    request.environment.project.id,
+                    request.data,
                 )
 
-            return Response(serializer.data, status=200)
+            # deleted traits aren't returned
+            return Response(
+                [
+                    trait
+                    for trait in serializer.data
+                    if trait["trait_value"] is not None
+                ],
+                status=200,
+            )
 
         except (TypeError, AttributeError) as excinfo:
             logger.error("Invalid request data: %s" % str(excinfo))
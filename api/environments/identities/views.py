@@ -5,32 +5,54 @@ from core.constants import FLAGSMITH_UPDATED_AT_HEADER
 from core.request_origin import RequestOrigin
 from django.conf import settings
 from django.db.models import Q
+from django.http import StreamingHttpResponse
 from django.utils.decorators import method_decorator
 from django.views.decorators.cache import cache_page
 from drf_yasg.utils import swagger_auto_schema
 from rest_framework import status, viewsets
 from rest_framework.permissions import IsAuthenticated
+from rest_framework.renderers import JSONRenderer
 from rest_framework.response import Response
 
 from app.pagination import CustomPagination
-from edge_api.identities.edge_request_forwarder import forward_identity_request
+from edge_api.identities.edge_request_forwarder import (
+    forward_identity_request_async,
+)
+from environments.identities.evaluation import (
+    EvaluatedFeatureState,
+    can_evaluate_identities_in_memory,
+    get_identity_evaluated_feature_states,
+    iter_identities_evaluated_feature_states,
+)
 from environments.identities.models import Identity
 from environments.identities.serializers import (
     IdentitySerializer,
     SDKIdentitiesQuerySerializer,
     SDKIdentitiesResponseSerializer,
 )
+from environments.identities.traits.models import Trait
 from environments.models import Environment
 from environments.permissions.constants import (
     MANAGE_IDENTITIES,
     VIEW_IDENTITIES,
 )
 from environments.permissions.permissions import NestedEnvironmentPermissions
+from environments.sdk.etags import (
+    get_identity_etag,
+    get_not_modified_response,
+    is_not_modified,
+)
 from environments.sdk.serializers import (
+    BulkIdentifyWithTraitsSerializer,
+    IdentifyWithTraitsEvaluatedSerializer,
     IdentifyWithTraitsSerializer,
     IdentitySerializerWithTraitsAndSegments,
 )
-from features.serializers import SDKFeatureStateSerializer
+from features.models import FeatureState
+from features.serializers import (
+    SDKEvaluatedFeatureStateSerializer,
+    SDKFeatureStateSerializer,
+)
 from integrations.integration import (
     IDENTITY_INTEGRATIONS,
     identify_integrations,
@@ -181,13 +203,11 @@ class SDKIdentities(SDKAPIView):
         self.identity = identity
 
         if settings.EDGE_API_URL and request.environment.project.enable_dynamo_db:
-            forward_identity_request.delay(
-                args=(
-                    request.method,
-                    dict(request.headers),
-                    request.environment.project.id,
-                ),
-                kwargs={"query_params": request.GET.dict()},
+            forward_identity_request_async(
+                request.method,
+                dict(request.headers),
+                request.environment.project.id,
+                query_params=request.GET.dict(),
             )
 
         # Note that we send the environment updated_at value here since it covers most use cases
@@ -198,6 +218,14 @@ class SDKIdentities(SDKAPIView):
             FLAGSMITH_UPDATED_AT_HEADER: request.environment.updated_at.timestamp()
         }
 
+        if settings.ENABLE_SDK_ETAGS:
+            # Unlike the updated_at header, the ETag does take into account the
+            # identity's overrides and traits.
+            etag = get_identity_etag(request, identity, request.originated_from)
+            if is_not_modified(request, etag):
+                return get_not_modified_response(etag, headers=headers)
+            headers["ETag"] = etag
+
         feature_name = request.query_params.get("feature")
         if feature_name:
             response = self._get_single_feature_state_response(
@@ -210,6 +238,11 @@ class SDKIdentities(SDKAPIView):
 
         return response
 
+    def get_serializer_class(self):
+        if self._evaluate_in_memory():
+            return IdentifyWithTraitsEvaluatedSerializer
+        return super().get_serializer_class()
+
     def get_serializer_context(self):
         context = super(SDKIdentities, self).get_serializer_context()
         if hasattr(self.request, "environment"):
@@ -233,18 +266,16 @@ class SDKIdentities(SDKAPIView):
         self.identity = instance.get("identity")
 
         if settings.EDGE_API_URL and request.environment.project.enable_dynamo_db:
-            forward_identity_request.delay(
-                args=(
-                    request.method,
-                    dict(request.headers),
-                    request.environment.project.id,
-                ),
-                kwargs={"request_data": request.data},
+            forward_identity_request_async(
+                request.method,
+                dict(request.headers),
+                request.environment.project.id,
+                request_data=request.data,
             )
 
         # we need to serialize the response again to ensure that the
         # trait values are serialized correctly
-        response_serializer = IdentifyWithTraitsSerializer(
+        response_serializer = self.get_serializer_class()(
             instance=instance,
             context=self.get_serializer_context(),
         )
@@ -255,6 +286,25 @@ class SDKIdentities(SDKAPIView):
             },
         )
 
+    def _evaluate_in_memory(self) -> bool:
+        # the environment isn't set when generating the documentation
+        return hasattr(
+            self.request, "environment"
+        ) and can_evaluate_identities_in_memory(self.request.environment)
+
+    def _get_all_feature_states(
+        self, identity: Identity
+    ) -> list[FeatureState] | list[EvaluatedFeatureState]:
+        if self._evaluate_in_memory():
+            return get_identity_evaluated_feature_states(
+                identity,
+                environment=self.request.environment,
+                origin=self.request.originated_from,
+            )
+        return identity.get_all_feature_states(
+            additional_filters=self._get_additional_filters(),
+        )
+
     def _get_additional_filters(self) -> Q | None:
         if self.request.originated_from is RequestOrigin.CLIENT:
             return Q(feature__is_server_key_only=False)
@@ -267,12 +317,15 @@ class SDKIdentities(SDKAPIView):
         headers: dict[str, typing.Any],
     ) -> Response:
         context = self.get_serializer_context()
+        serializer_class = (
+            SDKEvaluatedFeatureStateSerializer
+            if self._evaluate_in_memory()
+            else SDKFeatureStateSerializer
+        )
 
-        for feature_state in identity.get_all_feature_states(
-            additional_filters=self._get_additional_filters(),
-        ):
+        for feature_state in self._get_all_feature_states(identity):
             if feature_state.feature.name == feature_name:
-                serializer = SDKFeatureStateSerializer(feature_state, context=context)
+                serializer = serializer_class(feature_state, context=context)
                 return Response(
                     data=serializer.data, status=status.HTTP_200_OK, headers=headers
                 )
@@ -294,9 +347,7 @@ class SDKIdentities(SDKAPIView):
         :param identity: Identity model to return feature states for
         :return: Response containing lists of both serialized flags and traits
         """
-        all_feature_states = identity.get_all_feature_states(
-            additional_filters=self._get_additional_filters(),
-        )
+        all_feature_states = self._get_all_feature_states(identity)
         serializer_class = self.get_serializer_class()
         serializer = serializer_class(
             {
@@ -306,8 +357,106 @@ class SDKIdentities(SDKAPIView):
             context=self.get_serializer_context(),
         )
 
-        identify_integrations(identity, all_feature_states)
+        if not self._evaluate_in_memory():
+            identify_integrations(identity, all_feature_states)
 
         return Response(
             data=serializer.data, status=status.HTTP_200_OK, headers=headers
         )
+
+
+class SDKIdentitiesBulk(SDKAPIView):
+    """
+    Identify many identities (with their traits) in a single request, in the
+    same way as `SDKIdentities.post`. The results are streamed in the order of
+    the request.
+    """
+
+    serializer_class = BulkIdentifyWithTraitsSerializer
+    pagination_class = None  # set here to ensure documentation is correct
+    throttle_classes = []
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        if hasattr(self.request, "environment"):
+            # only set it if the request has the attribute to ensure that the
+            # documentation works correctly still
+            context["environment"] = self.request.environment
+        return context
+
+    @swagger_auto_schema(
+        request_body=BulkIdentifyWithTraitsSerializer(many=True),
+        responses={200: SDKIdentitiesResponseSerializer(many=True)},
+        operation_id="bulk_identify_users_with_traits",
+    )
+    def post(self, request):
+        serializer = self.get_serializer(data=request.data, many=True)
+        serializer.is_valid(raise_exception=True)
+        identities_traits = serializer.save()
+
+        if settings.EDGE_API_URL and request.environment.project.enable_dynamo_db:
+            for request_data in request.data:
+                forward_identity_request_async(
+                    request.method,
+                    dict(request.headers),
+                    request.environment.project.id,
+                    request_data=request_data,
+                )
+
+        return StreamingHttpResponse(
+            self._render_identify_results(identities_traits),
+            content_type="application/json",
+            headers={
+                FLAGSMITH_UPDATED_AT_HEADER: request.environment.updated_at.timestamp()
+            },
+        )
+
+    def _render_identify_results(
+        self,
+        identities_traits: list[tuple[Identity, list[Trait]]],
+    ) -> typing.Iterator[bytes]:
+        environment = self.request.environment
+        if can_evaluate_identities_in_memory(environment):
+            serializer_class = IdentifyWithTraitsEvaluatedSerializer
+            all_feature_states = iter_identities_evaluated_feature_states(
+                identities_traits,
+                environment=environment,
+                origin=self.request.originated_from,
+            )
+        else:
+            serializer_class = IdentifyWithTraitsSerializer
+            all_feature_states = self._iter_feature_states(identities_traits)
+
+        renderer = JSONRenderer()
+        context = self.get_serializer_context()
+
+        yield b"["
+        for index, ((identity, trait_models), feature_states) in enumerate(
+            zip(identities_traits, all_feature_states)
+        ):
+            serializer = serializer_class(
+                {"identity": identity, "traits": trait_models, "flags": feature_states},
+                context={**context, "identity": identity},
+            )
+            if index:
+                yield b","
+            yield renderer.render(
+                {"identifier": identity.identifier, **serializer.data}
+            )
+        yield b"]"
+
+    def _iter_feature_states(
+        self,
+        identities_traits: list[tuple[Identity, list[Trait]]],
+    ) -> typing.Iterator[list[FeatureState]]:
+        additional_filters = (
+            Q(feature__is_server_key_only=False)
+            if self.request.originated_from is RequestOrigin.CLIENT
+            else None
+        )
+        for identity, trait_models in identities_traits:
+            all_feature_states = identity.get_all_feature_states(
+                traits=trait_models, additional_filters=additional_filters
+            )
+            identify_integrations(identity, all_feature_states, trait_models)
+            yield all_feature_states
@@ -10,11 +10,21 @@ class Command(BaseCommand):
         parser.add_argument(
             "project", type=int, help="Id of the project being migrated"
         )
+        parser.add_argument(
+            "--resume",
+            action="store_true",
+            help="Resume a migration which is in progress from its last checkpoint",
+        )
 
     def handle(self, *args, **options):
         project_id = options["project"]
         identity_migrator = IdentityMigrator(project_id)
-        if not identity_migrator.can_migrate:
+        if options["resume"]:
+            if not identity_migrator.can_resume:
+                raise CommandError(
+                    "Identities migration for this project is not in progress"
+                )
+        elif not identity_migrator.can_migrate:
             raise CommandError(
                 "Identities migration for this project is either done or is in progress"
             )
@@ -1,4 +1,5 @@
-from django.db.models import Prefetch
+from django.conf import settings
+from django.db.models import Prefetch, Q
 from softdelete.models import SoftDeleteManager
 
 from features.models import FeatureSegment, FeatureState
@@ -7,23 +8,20 @@ from features.multivariate.models import MultivariateFeatureStateValue
 
 class EnvironmentManager(SoftDeleteManager):
     def filter_for_document_builder(self, *args, **kwargs):
-        return (
-            super()
-            .select_related(
-                "project",
-                "project__organisation",
-                "amplitude_config",
-                "dynatrace_config",
-                "heap_config",
-                "mixpanel_config",
-                "rudderstack_config",
-                "segment_config",
-                "webhook_config",
+        feature_states_queryset = FeatureState.objects.all()
+        if settings.USE_LIVE_FEATURE_STATES:
+            # The document builder only needs the live versions of the feature
+            # states, which are still prioritised by `is_live` etc. when mapping.
+            feature_states_queryset = feature_states_queryset.filter(
+                Q(live_feature_state__isnull=False) | Q(identity__isnull=False)
             )
+
+        return (
+            self.filter_for_incremental_document_builder()
             .prefetch_related(
                 Prefetch(
                     "feature_states",
-                    queryset=FeatureState.objects.select_related(
+                    queryset=feature_states_queryset.select_related(
                         "feature", "feature_state_value"
                     ),
                 ),
@@ -45,7 +43,7 @@ class EnvironmentManager(SoftDeleteManager):
                 ),
                 Prefetch(
                     "project__segments__feature_segments__feature_states",
-                    queryset=FeatureState.objects.select_related(
+                    queryset=feature_states_queryset.select_related(
                         "feature", "feature_state_value", "environment"
                     ),
                 ),
@@ -59,6 +57,27 @@ class EnvironmentManager(SoftDeleteManager):
             .filter(*args, **kwargs)
         )
 
+    def filter_for_incremental_document_builder(self, *args, **kwargs):
+        """
+        Only retrieve the data needed to patch a previously built document,
+        see `environments.document_builder`.
+        """
+        return (
+            super()
+            .select_related(
+                "project",
+                "project__organisation",
+                "amplitude_config",
+                "dynatrace_config",
+                "heap_config",
+                "mixpanel_config",
+                "rudderstack_config",
+                "segment_config",
+                "webhook_config",
+            )
+            .filter(*args, **kwargs)
+        )
+
     def get_queryset(self):
         return super().get_queryset().select_related("project", "project__organisation")
 
@@ -4,7 +4,9 @@ from __future__ import unicode_literals
 import logging
 import typing
 from copy import deepcopy
+from datetime import datetime
 
+from core.cache_coalescing import get_or_set_coalesced
 from core.models import abstract_base_auditable_model_factory
 from core.request_origin import RequestOrigin
 from django.conf import settings
@@ -35,6 +37,7 @@ from environments.api_keys import (
     generate_client_api_key,
     generate_server_api_key,
 )
+from environments.document_builder import build_environment_model
 from environments.dynamodb import (
     DynamoEnvironmentAPIKeyWrapper,
     DynamoEnvironmentV2Wrapper,
@@ -49,6 +52,9 @@ from segments.models import Segment
 from util.mappers import map_environment_to_environment_document
 from webhooks.models import AbstractBaseExportableWebhookModel
 
+if typing.TYPE_CHECKING:
+    from audit.models import AuditLog
+
 logger = logging.getLogger(__name__)
 
 environment_cache = caches[settings.ENVIRONMENT_CACHE_NAME]
@@ -148,6 +154,24 @@ class Environment(
         # TODO: this could rebuild the cache itself (using an async task)
         environment_cache.delete(self.initial_value("api_key"))
 
+    @classmethod
+    def clear_environment_caches(cls, environment_ids: typing.Iterable[int]) -> None:
+        """
+        Remove the given environments from the environment cache, under both
+        their client and server side keys.
+        """
+        environment_ids = list(environment_ids)
+        environment_cache.delete_many(
+            [
+                *cls.objects.filter(id__in=environment_ids).values_list(
+                    "api_key", flat=True
+                ),
+                *EnvironmentAPIKey.objects.filter(
+                    environment_id__in=environment_ids
+                ).values_list("key", flat=True),
+            ]
+        )
+
     @hook(AFTER_DELETE)
     def delete_from_dynamo(self):
         if self.project.enable_dynamo_db and environment_wrapper.is_enabled:
@@ -202,43 +226,64 @@ class Environment(
             if cls.is_bad_key(api_key):
                 return None
 
-            environment = environment_cache.get(api_key)
-            if not environment:
-                select_related_args = (
-                    "project",
-                    "project__organisation",
-                    "mixpanel_config",
-                    "segment_config",
-                    "amplitude_config",
-                    "heap_config",
-                    "dynatrace_config",
-                )
-                base_qs = cls.objects.select_related(*select_related_args).defer(
-                    "description"
-                )
-                qs_for_embedded_api_key = base_qs.filter(api_key=api_key)
-                qs_for_fk_api_key = base_qs.filter(api_keys__key=api_key)
-
-                environment = qs_for_embedded_api_key.union(qs_for_fk_api_key).get()
-                environment_cache.set(
-                    api_key, environment, timeout=settings.ENVIRONMENT_CACHE_SECONDS
-                )
-            return environment
+            return get_or_set_coalesced(
+                environment_cache,
+                api_key,
+                lambda: cls._get_environment_from_db(api_key),
+                timeout=settings.ENVIRONMENT_CACHE_SECONDS,
+            )
         except cls.DoesNotExist:
             cls.set_bad_key(api_key)
             logger.info("Environment with api_key %s does not exist" % api_key)
 
+    @classmethod
+    def _get_environment_from_db(cls, api_key: str) -> "Environment":
+        select_related_args = (
+            "project",
+            "project__organisation",
+            "mixpanel_config",
+            "segment_config",
+            "amplitude_config",
+            "heap_config",
+            "dynatrace_config",
+        )
+        base_qs = cls.objects.select_related(*select_related_args).defer("description")
+        qs_for_embedded_api_key = base_qs.filter(api_key=api_key)
+        qs_for_fk_api_key = base_qs.filter(api_keys__key=api_key)
+
+        return qs_for_embedded_api_key.union(qs_for_fk_api_key).get()
+
     @classmethod
     def write_environments_to_dynamodb(
-        cls, environment_id: int = None, project_id: int = None
+        cls,
+        environment_id: int = None,
+        project_id: int = None,
+        audit_log: typing.Optional["AuditLog"] = None,
     ) -> None:
+        """
+        Write the documents for the given environment (or every environment in
+        the given project) to dynamodb.
+
+        If the audit log for the change is provided, and environment model
+        caching is enabled, the documents are patched incrementally rather than
+        rebuilt in full, see `environments.document_builder`.
+        """
+        build_incrementally = (
+            audit_log is not None and settings.CACHE_ENVIRONMENT_MODEL_SECONDS > 0
+        )
+
         # use a list to make sure the entire qs is evaluated up front
         environments_filter = (
             Q(id=environment_id) if environment_id else Q(project_id=project_id)
         )
-        environments = list(
-            cls.objects.filter_for_document_builder(environments_filter)
-        )
+        if build_incrementally:
+            environments = list(
+                cls.objects.filter_for_incremental_document_builder(environments_filter)
+            )
+        else:
+            environments = list(
+                cls.objects.filter_for_document_builder(environments_filter)
+            )
         if not environments:
             return
 
@@ -253,13 +298,25 @@ class Environment(
         if not all([project, project.enable_dynamo_db, environment_wrapper.is_enabled]):
             return
 
-        environment_wrapper.write_environments(environments)
-
-        if (
+        write_v2_environments = (
             project.identity_overrides_v2_migration_status
             == IdentityOverridesV2MigrationStatus.COMPLETE
             and environment_v2_wrapper.is_enabled
-        ):
+        )
+
+        if build_incrementally:
+            engine_environments = [
+                build_environment_model(environment, audit_log)
+                for environment in environments
+            ]
+            environment_wrapper.write_engine_environments(engine_environments)
+            if write_v2_environments:
+                environment_v2_wrapper.write_engine_environments(engine_environments)
+            return
+
+        environment_wrapper.write_environments(environments)
+
+        if write_v2_environments:
             environment_v2_wrapper.write_environments(environments)
 
     def get_feature_state(
@@ -312,27 +369,38 @@ class Environment(
         """
         segments = environment_segments_cache.get(self.id)
         if not segments:
-            segments = list(
-                Segment.objects.filter(
-                    feature_segments__feature_states__environment=self
-                ).prefetch_related(
-                    "rules",
-                    "rules__conditions",
-                    "rules__rules",
-                    "rules__rules__conditions",
-                    "rules__rules__rules",
-                )
-            )
+            segments = self.get_segments_from_db()
             environment_segments_cache.set(self.id, segments)
         return segments
 
+    def get_segments_from_db(self) -> typing.List[Segment]:
+        return list(
+            Segment.objects.filter(
+                feature_segments__feature_states__environment=self
+            ).prefetch_related(
+                "rules",
+                "rules__conditions",
+                "rules__rules",
+                "rules__rules__conditions",
+                "rules__rules__rules",
+            )
+        )
+
     @classmethod
     def get_environment_document(
         cls,
         api_key: str,
+        updated_at: datetime | None = None,
     ) -> dict[str, typing.Any]:
+        """
+        Get the environment document for the given api key.
+
+        If the caller knows when the environment was last updated, it can pass
+        `updated_at` to ensure that a document cached before that point is never
+        returned.
+        """
         if settings.CACHE_ENVIRONMENT_DOCUMENT_SECONDS > 0:
-            return cls._get_environment_document_from_cache(api_key)
+            return cls._get_environment_document_from_cache(api_key, updated_at)
         return cls._get_environment_document_from_db(api_key)
 
     def get_create_log_message(self, history_instance) -> typing.Optional[str]:
@@ -351,12 +419,15 @@ class Environment(
     def _get_environment_document_from_cache(
         cls,
         api_key: str,
+        updated_at: datetime | None = None,
     ) -> dict[str, typing.Any]:
-        environment_document = environment_document_cache.get(api_key)
-        if not environment_document:
-            environment_document = cls._get_environment_document_from_db(api_key)
-            environment_document_cache.set(api_key, environment_document)
-        return environment_document
+        cache_key = f"{api_key}:{updated_at.timestamp()}" if updated_at else api_key
+        return get_or_set_coalesced(
+            environment_document_cache,
+            cache_key,
+            lambda: cls._get_environment_document_from_db(api_key),
+            timeout=settings.CACHE_ENVIRONMENT_DOCUMENT_SECONDS,
+        )
 
     @classmethod
     def _get_environment_document_from_db(
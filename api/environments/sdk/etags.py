@@ -0,0 +1,88 @@
+import hashlib
+import typing
+
+from core.request_origin import RequestOrigin
+from django.db.models import Count, Max
+from django.http import HttpRequest
+from django.utils.cache import parse_etags
+from django.utils.http import quote_etag
+from rest_framework import status
+from rest_framework.response import Response
+
+if typing.TYPE_CHECKING:
+    from environments.identities.models import Identity
+    from environments.models import Environment
+
+
+def generate_etag(*components: typing.Any) -> str:
+    digest = hashlib.sha256(
+        ":".join(str(component) for component in components).encode()
+    ).hexdigest()
+    return quote_etag(digest)
+
+
+def get_environment_etag(
+    request: HttpRequest,
+    environment: "Environment",
+    origin: RequestOrigin,
+) -> str:
+    """
+    Generate a strong ETag for a response which depends only on the state of
+    the environment, e.g. the flags and environment document endpoints.
+
+    Note that this does not require any database queries since the environment
+    is retrieved from the cache by the authentication class. The cached
+    environment is cleared whenever its `updated_at` changes, but if the
+    environment cache is local to each process, other processes may return the
+    previous ETag for up to ENVIRONMENT_CACHE_SECONDS.
+    """
+    return generate_etag(
+        request.path,
+        request.META.get("QUERY_STRING", ""),
+        environment.api_key,
+        environment.updated_at.timestamp(),
+        origin.value,
+    )
+
+
+def get_identity_etag(
+    request: HttpRequest,
+    identity: "Identity",
+    origin: RequestOrigin,
+) -> str:
+    """
+    Generate a strong ETag for a response which depends on the state of both
+    the environment and the identity (i.e. its traits and overrides).
+
+    Note that the identity's traits are expected to have been prefetched.
+    """
+    traits = sorted(
+        (trait.trait_key, trait.value_type, trait.trait_value)
+        for trait in identity.identity_traits.all()
+    )
+    overrides = identity.identity_features.aggregate(
+        count=Count("id"), last_updated_at=Max("updated_at")
+    )
+    return generate_etag(
+        get_environment_etag(request, identity.environment, origin),
+        identity.id,
+        traits,
+        overrides["count"],
+        overrides["last_updated_at"],
+    )
+
+
+def is_not_modified(request: HttpRequest, etag: str) -> bool:
+    if_none_match = parse_etags(request.META.get("HTTP_IF_NONE_MATCH", ""))
+    # Weak comparison is used for If-None-Match, see RFC 7232, section 3.2.
+    return "*" in if_none_match or etag.removeprefix("W/") in {
+        tag.removeprefix("W/") for tag in if_none_match
+    }
+
+
+def get_not_modified_response(
+    etag: str, headers: dict[str, typing.Any] | None = None
+) -> Response:
+    return Response(
+        status=status.HTTP_304_NOT_MODIFIED, headers={**(headers or {}), "ETag": etag}
+    )
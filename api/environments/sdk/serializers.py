@@ -2,8 +2,13 @@ import typing
 from collections import defaultdict
 
 from core.constants import BOOLEAN, FLOAT, INTEGER, STRING
+from django.conf import settings
 from rest_framework import serializers
+from rest_framework.settings import api_settings
 
+from environments.identities.evaluation import (
+    get_identity_evaluated_feature_states,
+)
 from environments.identities.models import Identity
 from environments.identities.serializers import (
     IdentifierOnlyIdentitySerializer,
@@ -13,9 +18,13 @@ from environments.identities.traits.models import Trait
 from environments.identities.traits.serializers import TraitSerializerBasic
 from features.serializers import (
     FeatureStateSerializerFull,
+    SDKEvaluatedFeatureStateSerializer,
     SDKFeatureStateSerializer,
 )
-from integrations.integration import identify_integrations
+from integrations.integration import (
+    IDENTITY_INTEGRATIONS,
+    identify_integrations,
+)
 from segments.serializers import SegmentSerializerBasic
 
 from .serializers_mixins import HideSensitiveFieldsSerializerMixin
@@ -81,14 +90,22 @@ class SDKBulkCreateUpdateTraitSerializer(SDKCreateUpdateTraitSerializer):
 
             def save(self, **kwargs):
                 identity_trait_items = self._build_identifier_trait_items_dictionary()
-                modified_traits = []
-                for identifier, trait_data_items in identity_trait_items.items():
-                    identity, _ = Identity.objects.get_or_create(
-                        identifier=identifier,
-                        environment=self.context["request"].environment,
-                    )
-                    modified_traits.extend(identity.update_traits(trait_data_items))
-                return modified_traits
+                identities = Identity.objects.get_or_create_many_for_sdk(
+                    identifiers=list(identity_trait_items),
+                    environment=self.context["request"].environment,
+                    integrations=[],
+                )
+                traits_by_identity = Identity.bulk_update_traits(
+                    {
+                        identity: identity_trait_items[identity.identifier]
+                        for identity, _ in identities
+                    }
+                )
+                return [
+                    trait
+                    for identity_traits in traits_by_identity.values()
+                    for trait in identity_traits
+                ]
 
             def _build_identifier_trait_items_dictionary(
                 self,
@@ -135,6 +152,29 @@ class IdentifyWithTraitsSerializer(
         Create the identity with the associated traits
         (optionally store traits if flag set on org)
         """
+        identity, trait_models = self._save_identity_and_traits()
+
+        all_feature_states = identity.get_all_feature_states(
+            traits=trait_models,
+            additional_filters=self.context.get("feature_states_additional_filters"),
+        )
+        identify_integrations(identity, all_feature_states, trait_models)
+
+        return {
+            "identity": identity,
+            "traits": trait_models,
+            "flags": all_feature_states,
+        }
+
+    def validate_traits(self, traits: typing.List[dict] = None):
+        request = self.context["request"]
+        if traits and not request.environment.trait_persistence_allowed(request):
+            raise serializers.ValidationError(
+                "Setting traits not allowed with client key."
+            )
+        return traits
+
+    def _save_identity_and_traits(self) -> tuple[Identity, list[Trait]]:
         environment = self.context["environment"]
         identity, created = Identity.objects.get_or_create(
             identifier=self.validated_data["identifier"], environment=environment
@@ -153,22 +193,92 @@ class IdentifyWithTraitsSerializer(
                 persist=environment.project.organisation.persist_trait_data,
             )
 
-        all_feature_states = identity.get_all_feature_states(
-            traits=trait_models,
-            additional_filters=self.context.get("feature_states_additional_filters"),
-        )
-        identify_integrations(identity, all_feature_states, trait_models)
+        return identity, trait_models
+
+
+class IdentifyWithTraitsEvaluatedSerializer(IdentifyWithTraitsSerializer):
+    """
+    Identifies in the same way as `IdentifyWithTraitsSerializer`, but evaluates
+    the identity's flags in memory (see `environments.identities.evaluation`).
+    """
+
+    flags = SDKEvaluatedFeatureStateSerializer(read_only=True, many=True)
+
+    def save(self, **kwargs):
+        identity, trait_models = self._save_identity_and_traits()
 
         return {
             "identity": identity,
             "traits": trait_models,
-            "flags": all_feature_states,
+            "flags": get_identity_evaluated_feature_states(
+                identity,
+                environment=self.context["environment"],
+                origin=self.context["request"].originated_from,
+                traits=trait_models,
+            ),
         }
 
-    def validate_traits(self, traits: typing.List[dict] = None):
-        request = self.context["request"]
-        if traits and not request.environment.trait_persistence_allowed(request):
+
+class BulkIdentifyWithTraitsListSerializer(serializers.ListSerializer):
+    def to_internal_value(self, data):
+        # check the number of identities before validating each of them
+        if isinstance(data, list) and len(data) > settings.BULK_IDENTIFY_MAX_IDENTITIES:
+            message = (
+                "Cannot identify more than %d identities in a single request."
+                % settings.BULK_IDENTIFY_MAX_IDENTITIES
+            )
             raise serializers.ValidationError(
-                "Setting traits not allowed with client key."
+                {api_settings.NON_FIELD_ERRORS_KEY: [message]}
             )
-        return traits
+        return super().to_internal_value(data)
+
+    def validate(self, attrs):
+        identifiers = [item["identifier"] for item in attrs]
+        if len(set(identifiers)) != len(identifiers):
+            raise serializers.ValidationError("Identifiers must be unique.")
+        return attrs
+
+    def save(self, **kwargs) -> list[tuple[Identity, list[Trait]]]:
+        """
+        Create the identities with their associated traits in bulk, in the same
+        way as `IdentifyWithTraitsSerializer`. Flags are evaluated separately, so
+        that they can be streamed.
+        """
+        environment = self.context["environment"]
+        persist_trait_data = environment.project.organisation.persist_trait_data
+
+        identities = Identity.objects.get_or_create_many_for_sdk(
+            identifiers=[item["identifier"] for item in self.validated_data],
+            environment=environment,
+            integrations=IDENTITY_INTEGRATIONS,
+        )
+
+        trait_models_by_identity_id = {}
+        trait_data_items_to_update = {}
+
+        for (identity, _), item in zip(identities, self.validated_data):
+            trait_data_items = item.get("traits", [])
+
+            if persist_trait_data:
+                # The traits of new identities are upserted as well, since they
+                # may have been created by a concurrent request.
+                trait_data_items_to_update[identity] = trait_data_items
+            else:
+                trait_models_by_identity_id[identity.id] = identity.generate_traits(
+                    trait_data_items
+                )
+
+        if trait_data_items_to_update:
+            trait_models_by_identity_id.update(
+                Identity.bulk_update_traits(trait_data_items_to_update)
+            )
+
+        return [
+            (identity, trait_models_by_identity_id[identity.id])
+            for identity, _ in identities
+        ]
+
+
+class BulkIdentifyWithTraitsSerializer(IdentifyWithTraitsSerializer):
+    class Meta:
+        list_serializer_class = BulkIdentifyWithTraitsListSerializer
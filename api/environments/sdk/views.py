@@ -1,4 +1,6 @@
 from core.constants import FLAGSMITH_UPDATED_AT_HEADER
+from core.request_origin import RequestOrigin
+from django.conf import settings
 from django.http import HttpRequest
 from drf_yasg.utils import swagger_auto_schema
 from rest_framework.response import Response
@@ -7,6 +9,11 @@ from rest_framework.views import APIView
 from environments.authentication import EnvironmentKeyAuthentication
 from environments.models import Environment
 from environments.permissions.permissions import EnvironmentKeyPermissions
+from environments.sdk.etags import (
+    get_environment_etag,
+    get_not_modified_response,
+    is_not_modified,
+)
 from environments.sdk.schemas import SDKEnvironmentDocumentModel
 
 
@@ -19,11 +26,18 @@ class SDKEnvironmentAPIView(APIView):
 
     @swagger_auto_schema(responses={200: SDKEnvironmentDocumentModel})
     def get(self, request: HttpRequest) -> Response:
-        environment_document = Environment.get_environment_document(
-            request.environment.api_key
-        )
         updated_at = self.request.environment.updated_at
-        return Response(
-            environment_document,
-            headers={FLAGSMITH_UPDATED_AT_HEADER: updated_at.timestamp()},
+        headers = {FLAGSMITH_UPDATED_AT_HEADER: updated_at.timestamp()}
+
+        if settings.ENABLE_SDK_ETAGS:
+            etag = get_environment_etag(
+                request, request.environment, RequestOrigin.SERVER
+            )
+            if is_not_modified(request, etag):
+                return get_not_modified_response(etag, headers=headers)
+            headers["ETag"] = etag
+
+        environment_document = Environment.get_environment_document(
+            request.environment.api_key, updated_at=updated_at
         )
+        return Response(environment_document, headers=headers)
@@ -8,6 +8,7 @@ from environments.models import (
     environment_v2_wrapper,
     environment_wrapper,
 )
+from features.sdk_flags_service import rebuild_environment_flags_response_cache
 from sse import (
     send_environment_update_message_for_environment,
     send_environment_update_message_for_project,
@@ -30,6 +31,13 @@ def process_environment_update(audit_log_id: int):
 
     # Send environment document to dynamodb
     Environment.write_environments_to_dynamodb(
+        environment_id=audit_log.environment_id,
+        project_id=audit_log.project_id,
+        audit_log=audit_log,
+    )
+
+    # Eagerly rebuild the rendered flags responses for the SDK flags endpoint
+    rebuild_environment_flags_response_cache(
         environment_id=audit_log.environment_id, project_id=audit_log.project_id
     )
 
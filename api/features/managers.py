@@ -3,6 +3,7 @@ from __future__ import unicode_literals
 import typing
 
 from core.models import UUIDNaturalKeyManagerMixin
+from django.conf import settings
 from django.db.models import Q, QuerySet
 from django.utils import timezone
 from ordered_model.models import OrderedModelManager
@@ -32,7 +33,16 @@ class FeatureStateManager(UUIDNaturalKeyManagerMixin, SoftDeleteManager):
         now = timezone.now()
 
         qs_filter = Q(environment=environment, deleted_at__isnull=True)
-        if environment.use_v2_feature_versioning:
+        if settings.USE_LIVE_FEATURE_STATES:
+            # Identity overrides aren't part of the versioning system, so aren't
+            # recorded in the live feature states (see `LiveFeatureState`). Note
+            # that the replaced versions of feature states whose scheduled version
+            # has just gone live can still be returned, so callers must resolve
+            # them (see `get_highest_priority_feature_states`).
+            qs_filter &= Q(
+                Q(live_feature_state__live_from__lte=now) | Q(identity__isnull=False)
+            )
+        elif environment.use_v2_feature_versioning:
             latest_versions = EnvironmentFeatureVersion.objects.get_latest_versions(
                 environment
             )
@@ -45,7 +55,8 @@ class FeatureStateManager(UUIDNaturalKeyManagerMixin, SoftDeleteManager):
                 Q(environment_feature_version__uuid__in=latest_version_uuids)
                 | Q(identity__isnull=False)
             )
-        else:
+
+        if not environment.use_v2_feature_versioning:
             qs_filter &= Q(
                 live_from__isnull=False,
                 live_from__lte=now,
@@ -509,6 +509,54 @@ class FeatureState(
         # it has a feature_segment or an identity
         return not (other.feature_segment_id or other.identity_id)
 
+    def get_priority_key(
+        self,
+        use_v2_feature_versioning: bool = None,
+        now: datetime.datetime = None,
+    ) -> tuple:
+        """
+        Get a key which orders the feature states of a feature in the same way as
+        `__gt__`, i.e. identity overrides, then segment overrides by segment
+        priority, then environment defaults, and then by the most recent live
+        version. Ties are broken by id.
+
+        Resolving priorities by comparing these keys avoids the repeated
+        validation, liveness checks and related object lookups in `__gt__`. See
+        `features.priority.get_highest_priority_feature_states`.
+        """
+        if use_v2_feature_versioning is None:
+            use_v2_feature_versioning = self.environment.use_v2_feature_versioning
+        now = now or timezone.now()
+
+        if self.identity_id:
+            type_key = (2, 0)
+        elif self.feature_segment_id:
+            # priority 1 is the highest priority segment override.
+            type_key = (1, -self.feature_segment.priority)
+        else:
+            type_key = (0, 0)
+
+        if use_v2_feature_versioning:
+            environment_feature_version = self.environment_feature_version
+            if (
+                environment_feature_version is not None
+                and environment_feature_version.published_at is not None
+                and environment_feature_version.live_from <= now
+            ):
+                version_key = (1, environment_feature_version.live_from, None)
+            else:
+                version_key = (0, None, None)
+        elif (
+            self.version is not None
+            and self.live_from is not None
+            and self.live_from <= now
+        ):
+            version_key = (1, self.live_from, self.version)
+        else:
+            version_key = (0, None, None)
+
+        return (*type_key, *version_key, self.id or 0)
+
     def __str__(self):
         s = f"Feature {self.feature.name} - Enabled: {self.enabled}"
         if self.environment is not None:
@@ -0,0 +1,38 @@
+import typing
+
+from django.utils import timezone
+
+if typing.TYPE_CHECKING:
+    from features.models import FeatureState
+
+KeyT = typing.TypeVar("KeyT", bound=typing.Hashable)
+
+
+def get_highest_priority_feature_states(
+    feature_states: typing.Iterable["FeatureState"],
+    key_function: typing.Callable[["FeatureState"], KeyT],
+    use_v2_feature_versioning: bool = None,
+) -> dict[KeyT, "FeatureState"]:
+    """
+    Get the highest priority feature state for each of the keys given by
+    `key_function`, e.g. the feature id, in a single pass.
+
+    The priority key of each feature state (see `FeatureState.get_priority_key`)
+    is computed once, rather than comparing each pair of feature states with
+    `FeatureState.__gt__`. Pass `use_v2_feature_versioning` if all the feature
+    states belong to the same environment, to avoid looking it up for each one.
+    """
+    now = timezone.now()
+
+    highest_priority_feature_states = {}
+    for feature_state in feature_states:
+        key = key_function(feature_state)
+        priority_key = feature_state.get_priority_key(use_v2_feature_versioning, now)
+        current = highest_priority_feature_states.get(key)
+        if current is None or priority_key > current[0]:
+            highest_priority_feature_states[key] = (priority_key, feature_state)
+
+    return {
+        key: feature_state
+        for key, (_, feature_state) in highest_priority_feature_states.items()
+    }
@@ -0,0 +1,111 @@
+import typing
+
+from core.cache_coalescing import get_or_set_coalesced, set_coalesced
+from core.request_origin import RequestOrigin
+from django.conf import settings
+from django.core.cache import caches
+from django.db.models import Q
+from rest_framework.renderers import JSONRenderer
+
+from features.versioning.versioning_service import get_environment_flags_list
+
+if typing.TYPE_CHECKING:
+    from environments.models import Environment
+
+flags_response_cache = caches[settings.FLAGS_RESPONSE_CACHE_NAME]
+
+
+def get_sdk_flags_filters(environment: "Environment", origin: RequestOrigin) -> Q:
+    """
+    Get the filters applied to an environment's feature states when they are
+    returned to the SDK from the flags endpoint.
+    """
+    filters = Q(feature_segment=None, identity=None)
+
+    if environment.get_hide_disabled_flags() is True:
+        return filters & Q(enabled=True)
+
+    if origin is RequestOrigin.CLIENT:
+        return filters & Q(feature__is_server_key_only=False)
+
+    return filters
+
+
+def get_flags_response_cache_key(
+    environment: "Environment", origin: RequestOrigin
+) -> str:
+    """
+    Build the cache key for the rendered flags response of an environment.
+
+    Since the environment's `updated_at` is part of the key, any change to the
+    environment document results in a new key. Note that the environment is
+    usually retrieved from the environment cache, which is cleared when its
+    `updated_at` changes (see `AuditLog.process_environment_update`). If the
+    environment cache is local to each process, other processes may keep serving
+    the previous response for up to ENVIRONMENT_CACHE_SECONDS.
+    """
+    return ":".join(
+        (
+            environment.api_key,
+            str(environment.updated_at.timestamp()),
+            origin.value,
+            str(environment.get_hide_disabled_flags()),
+        )
+    )
+
+
+def render_environment_flags(
+    environment: "Environment", origin: RequestOrigin
+) -> bytes:
+    from features.serializers import SDKFeatureStateSerializer
+
+    feature_states = get_environment_flags_list(
+        environment=environment,
+        additional_filters=get_sdk_flags_filters(environment, origin),
+    )
+    data = SDKFeatureStateSerializer(
+        feature_states, many=True, context={"environment": environment}
+    ).data
+    return JSONRenderer().render(data)
+
+
+def get_environment_flags_response_content(
+    environment: "Environment", origin: RequestOrigin
+) -> bytes:
+    """
+    Get the rendered JSON content of the flags response for the given
+    environment, rendering (and caching) it if it is not already cached.
+    """
+    return get_or_set_coalesced(
+        flags_response_cache,
+        get_flags_response_cache_key(environment, origin),
+        lambda: render_environment_flags(environment, origin),
+        timeout=settings.CACHE_FLAGS_RESPONSE_SECONDS,
+    )
+
+
+def rebuild_environment_flags_response_cache(
+    environment_id: int | None = None, project_id: int | None = None
+) -> None:
+    """
+    Eagerly render the flags responses for the given environment (or every
+    environment in the given project) and write them to the cache.
+    """
+    from environments.models import Environment
+
+    if not settings.CACHE_FLAGS_RESPONSE_SECONDS > 0:
+        return
+
+    environments_filter = (
+        Q(id=environment_id) if environment_id else Q(project_id=project_id)
+    )
+    for environment in Environment.objects.filter(environments_filter).select_related(
+        "project"
+    ):
+        for origin in RequestOrigin:
+            set_coalesced(
+                flags_response_cache,
+                get_flags_response_cache_key(environment, origin),
+                render_environment_flags(environment, origin),
+                timeout=settings.CACHE_FLAGS_RESPONSE_SECONDS,
+            )
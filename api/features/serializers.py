@@ -412,6 +412,26 @@ class SDKFeatureStateSerializer(
     )
 
 
+class SDKEvaluatedFeatureStateSerializer(
+    HideSensitiveFieldsSerializerMixin, serializers.Serializer
+):
+    """
+    Serializes the feature states evaluated in memory for an identity (see
+    `environments.identities.evaluation`) in the same way as
+    `SDKFeatureStateSerializer`.
+    """
+
+    id = serializers.IntegerField()
+    feature = SDKFeatureSerializer()
+    feature_state_value = serializers.ReadOnlyField()
+    environment = serializers.IntegerField()
+    identity = serializers.IntegerField(allow_null=True)
+    feature_segment = serializers.IntegerField(allow_null=True)
+    enabled = serializers.BooleanField()
+
+    sensitive_fields = SDKFeatureStateSerializer.sensitive_fields
+
+
 class FeatureStateSerializerBasic(WritableNestedModelSerializer):
     feature_state_value = serializers.SerializerMethodField()
     multivariate_feature_state_values = MultivariateFeatureStateValueSerializer(
@@ -0,0 +1,31 @@
+from django.core.management.base import BaseCommand
+
+from environments.models import Environment
+from features.versioning.versioning_service import refresh_live_feature_states
+
+
+class Command(BaseCommand):
+    help = (
+        "Populate the live feature states table, used when USE_LIVE_FEATURE_STATES "
+        "is enabled, for all environments or the given environments."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--environment",
+            type=int,
+            action="append",
+            dest="environment_ids",
+            help="Id of an environment to refresh. Can be given multiple times.",
+        )
+
+    def handle(self, *args, environment_ids: list[int] | None, **options):
+        environments = Environment.objects.order_by("id")
+        if environment_ids:
+            environments = environments.filter(id__in=environment_ids)
+
+        for environment in environments.iterator():
+            refresh_live_feature_states(environment)
+            self.stdout.write(
+                f"Refreshed the live feature states of environment {environment.id}"
+            )
@@ -0,0 +1,35 @@
+# Generated by Django 3.2.25 on 2026-10-17 07:56
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('features', '0064_fix_feature_help_text_typo'),
+        ('environments', '0034_alter_environment_project'),
+        ('feature_versioning', '0001_add_environment_feature_state_version_logic'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='LiveFeatureState',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('live_from', models.DateTimeField()),
+                ('is_scheduled', models.BooleanField(default=False)),
+                ('environment', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='live_feature_states', to='environments.environment')),
+                ('feature', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='live_feature_states', to='features.feature')),
+                ('feature_state', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='live_feature_state', to='features.featurestate')),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='livefeaturestate',
+            index=models.Index(fields=['environment', 'feature'], name='feature_ver_environ_c88765_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='livefeaturestate',
+            index=models.Index(fields=['is_scheduled', 'live_from'], name='feature_ver_is_sche_d44cc5_idx'),
+        ),
+    ]
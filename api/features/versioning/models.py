@@ -128,3 +128,43 @@ class EnvironmentFeatureVersion(
         if persist:
             self.save()
             environment_feature_version_published.send(self.__class__, instance=self)
+
+
+class LiveFeatureState(models.Model):
+    """
+    A denormalised record of the environment default and segment override feature
+    states which are live in an environment, maintained by
+    `versioning_service.refresh_live_feature_states` when feature states are
+    published, so that reads don't have to work out which versions are live.
+
+    Feature states which are scheduled to go live in the future are recorded as
+    well, with `is_scheduled` set, so that reads can pick them up as soon as their
+    `live_from` has passed. Until they are refreshed, by the
+    `activate_scheduled_live_feature_states` recurring task, the version they
+    replace is also recorded, so readers must still pick the latest live version
+    of each feature state.
+    """
+
+    environment = models.ForeignKey(
+        "environments.Environment",
+        related_name="live_feature_states",
+        on_delete=models.CASCADE,
+    )
+    feature = models.ForeignKey(
+        "features.Feature",
+        related_name="live_feature_states",
+        on_delete=models.CASCADE,
+    )
+    feature_state = models.OneToOneField(
+        "features.FeatureState",
+        related_name="live_feature_state",
+        on_delete=models.CASCADE,
+    )
+    live_from = models.DateTimeField()
+    is_scheduled = models.BooleanField(default=False)
+
+    class Meta:
+        indexes = [
+            Index(fields=("environment", "feature")),
+            Index(fields=("is_scheduled", "live_from")),
+        ]
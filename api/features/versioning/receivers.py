@@ -1,11 +1,19 @@
-from django.db.models.signals import post_init, post_save, pre_save
+from django.conf import settings
+from django.db.models.signals import (
+    post_delete,
+    post_init,
+    post_save,
+    pre_save,
+)
 from django.dispatch import receiver
 from django.utils import timezone
 
 from environments.tasks import rebuild_environment_document
+from features.models import FeatureState
 from features.versioning.models import EnvironmentFeatureVersion
 from features.versioning.signals import environment_feature_version_published
 from features.versioning.tasks import trigger_update_version_webhooks
+from features.versioning.versioning_service import refresh_live_feature_states
 
 
 @receiver(post_save, sender=EnvironmentFeatureVersion)
@@ -50,3 +58,28 @@ def trigger_webhooks(instance: EnvironmentFeatureVersion, **kwargs) -> None:
         kwargs={"environment_feature_version_uuid": str(instance.uuid)},
         delay_until=instance.live_from,
     )
+
+
+@receiver(environment_feature_version_published, sender=EnvironmentFeatureVersion)
+def refresh_published_live_feature_states(
+    instance: EnvironmentFeatureVersion, **kwargs
+) -> None:
+    if not settings.USE_LIVE_FEATURE_STATES:
+        return
+
+    refresh_live_feature_states(instance.environment, [instance.feature_id])
+
+
+@receiver(post_save, sender=FeatureState)
+@receiver(post_delete, sender=FeatureState)
+def refresh_feature_state_live_feature_states(instance: FeatureState, **kwargs) -> None:
+    # Identity overrides aren't versioned, so aren't recorded in the live
+    # feature states.
+    if (
+        not settings.USE_LIVE_FEATURE_STATES
+        or instance.identity_id
+        or not instance.environment_id
+    ):
+        return
+
+    refresh_live_feature_states(instance.environment, [instance.feature_id])
@@ -1,16 +1,24 @@
 import logging
 import typing
 
+from django.conf import settings
 from django.utils import timezone
 
-from features.versioning.models import EnvironmentFeatureVersion
+from features.versioning.models import (
+    EnvironmentFeatureVersion,
+    LiveFeatureState,
+)
 from features.versioning.schemas import (
     EnvironmentFeatureVersionWebhookDataSerializer,
 )
 from features.versioning.versioning_service import (
     get_environment_flags_queryset,
+    refresh_live_feature_states,
+)
+from task_processor.decorators import (
+    register_recurring_task,
+    register_task_handler,
 )
-from task_processor.decorators import register_task_handler
 from webhooks.webhooks import WebhookEventType, call_environment_webhooks
 
 if typing.TYPE_CHECKING:
@@ -34,6 +42,9 @@ def enable_v2_versioning(environment_id: int) -> None:
     environment.use_v2_feature_versioning = True
     environment.save()
 
+    if settings.USE_LIVE_FEATURE_STATES:
+        refresh_live_feature_states(environment)
+
 
 @register_task_handler()
 def disable_v2_versioning(environment_id: int) -> None:
@@ -68,6 +79,9 @@ def disable_v2_versioning(environment_id: int) -> None:
     environment.use_v2_feature_versioning = False
     environment.save()
 
+    if settings.USE_LIVE_FEATURE_STATES:
+        refresh_live_feature_states(environment)
+
 
 def _create_initial_feature_versions(environment: "Environment"):
     from features.models import Feature, FeatureSegment
@@ -108,3 +122,32 @@ def trigger_update_version_webhooks(environment_feature_version_uuid: str) -> No
         data=data,
         event_type=WebhookEventType.NEW_VERSION_PUBLISHED,
     )
+
+
+@register_recurring_task(
+    run_every=settings.LIVE_FEATURE_STATES_ACTIVATION_RUN_EVERY,
+)
+def activate_scheduled_live_feature_states() -> None:
+    """
+    Refresh the live feature states of the features which have a scheduled
+    version that has gone live, so that the versions it replaces are removed.
+    """
+    if not settings.USE_LIVE_FEATURE_STATES:
+        return
+
+    from environments.models import Environment
+
+    feature_ids_by_environment_id = {}
+    for environment_id, feature_id in (
+        LiveFeatureState.objects.filter(
+            is_scheduled=True, live_from__lte=timezone.now()
+        )
+        .values_list("environment_id", "feature_id")
+        .distinct()
+    ):
+        feature_ids_by_environment_id.setdefault(environment_id, set()).add(feature_id)
+
+    for environment in Environment.objects.filter(id__in=feature_ids_by_environment_id):
+        refresh_live_feature_states(
+            environment, feature_ids_by_environment_id[environment.id]
+        )
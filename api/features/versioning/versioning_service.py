@@ -1,11 +1,17 @@
+import datetime
 import typing
 
-from django.db.models import Prefetch, Q, QuerySet
+from django.db import connection, transaction
+from django.db.models import F, Prefetch, Q, QuerySet
 from django.utils import timezone
 
 from environments.models import Environment
 from features.models import FeatureState
-from features.versioning.models import EnvironmentFeatureVersion
+from features.priority import get_highest_priority_feature_states
+from features.versioning.models import (
+    EnvironmentFeatureVersion,
+    LiveFeatureState,
+)
 
 
 def get_environment_flags_queryset(
@@ -14,6 +20,13 @@ def get_environment_flags_queryset(
     """
     Get a queryset of the latest live versions of an environments' feature states
     """
+    if _can_resolve_latest_versions_in_db():
+        return FeatureState.objects.filter(
+            id__in=_get_feature_states_queryset(
+                environment, feature_name, latest_versions_only=True
+            ).values("id")
+        )
+
     feature_states_list = get_environment_flags_list(environment, feature_name)
     return FeatureState.objects.filter(id__in=[fs.id for fs in feature_states_list])
 
@@ -32,9 +45,9 @@ def get_environment_flags_list(
     associated with the given environment. Can be filtered to remove segment /
     identity overrides using additional_filters argument.
 
-    Note: uses a single query to get all valid versions of a given environment's
-    feature states. The logic to grab the latest version is then handled in python
-    by building a dictionary. Returns a list of FeatureState objects.
+    Note: uses a single query to get the latest versions of a given environment's
+    feature states (see `get_environment_flags_dict`). Returns a list of FeatureState
+    objects.
     """
     return list(
         get_environment_flags_dict(
@@ -57,6 +70,16 @@ def get_environment_flags_dict(
     ] = None,
     key_function: typing.Callable[[FeatureState], tuple] = None,
 ) -> dict[tuple | str | int, FeatureState]:
+    """
+    Get the highest priority live feature state for each of the keys given by
+    `key_function`, which defaults to (feature id, segment id, identity id). Any
+    other key function should group feature states by a subset of these, e.g. by
+    feature.
+
+    On Postgres, only the latest version of the feature states for each (feature
+    id, segment id, identity id) is retrieved from the database. Otherwise, all of
+    their live versions are, and the latest ones are picked in python.
+    """
     key_function = key_function or _get_distinct_key
 
     feature_states = _get_feature_states_queryset(
@@ -65,19 +88,17 @@ def get_environment_flags_dict(
         additional_filters,
         additional_select_related_args,
         additional_prefetch_related_args,
+        latest_versions_only=_can_resolve_latest_versions_in_db(),
     )
 
     # Build up a dictionary keyed off the relevant unique attributes as defined
     # by the provided key function and only keep the highest priority feature state
     # for each feature.
-    feature_states_dict = {}
-    for feature_state in feature_states:
-        key = key_function(feature_state)
-        current_feature_state = feature_states_dict.get(key)
-        if not current_feature_state or feature_state > current_feature_state:
-            feature_states_dict[key] = feature_state
-
-    return feature_states_dict
+    return get_highest_priority_feature_states(
+        feature_states,
+        key_function,
+        use_v2_feature_versioning=environment.use_v2_feature_versioning,
+    )
 
 
 def get_current_live_environment_feature_version(
@@ -95,6 +116,151 @@ def get_current_live_environment_feature_version(
     )
 
 
+def refresh_live_feature_states(
+    environment: Environment, feature_ids: typing.Iterable[int] = None
+) -> None:
+    """
+    Rebuild the `LiveFeatureState` records of the environment's features (or only
+    of the given features), i.e. the latest live version of each environment
+    default and segment override, and any versions scheduled to go live later.
+    """
+    if feature_ids is not None:
+        feature_ids = list(feature_ids)
+
+    with transaction.atomic():
+        now = timezone.now()
+        if environment.use_v2_feature_versioning:
+            live_feature_states = _get_v2_live_feature_states(
+                environment, feature_ids, now
+            )
+        else:
+            live_feature_states = _get_v1_live_feature_states(
+                environment, feature_ids, now
+            )
+
+        existing_live_feature_states = LiveFeatureState.objects.filter(
+            environment=environment
+        )
+        if feature_ids is not None:
+            existing_live_feature_states = existing_live_feature_states.filter(
+                feature_id__in=feature_ids
+            )
+        existing_live_feature_states.delete()
+
+        LiveFeatureState.objects.bulk_create(live_feature_states, ignore_conflicts=True)
+
+
+def _get_v1_live_feature_states(
+    environment: Environment,
+    feature_ids: list[int] | None,
+    now: datetime.datetime,
+) -> list[LiveFeatureState]:
+    feature_states = FeatureState.objects.filter(
+        environment=environment,
+        identity__isnull=True,
+        live_from__isnull=False,
+        version__isnull=False,
+    )
+    if feature_ids is not None:
+        feature_states = feature_states.filter(feature_id__in=feature_ids)
+
+    # Keep the feature states scheduled to go live later, and the latest live
+    # version of each (feature, segment), in the same order as
+    # `FeatureState.__gt__`.
+    live_feature_states = []
+    latest_versions = {}
+    for (
+        id_,
+        feature_id,
+        feature_segment_id,
+        live_from,
+        version,
+    ) in feature_states.values_list(
+        "id", "feature_id", "feature_segment_id", "live_from", "version"
+    ):
+        if live_from > now:
+            live_feature_states.append(
+                LiveFeatureState(
+                    environment=environment,
+                    feature_id=feature_id,
+                    feature_state_id=id_,
+                    live_from=live_from,
+                    is_scheduled=True,
+                )
+            )
+            continue
+
+        key = (feature_id, feature_segment_id)
+        latest_version = latest_versions.get(key)
+        if not latest_version or (live_from, version, id_) > latest_version:
+            latest_versions[key] = (live_from, version, id_)
+
+    live_feature_states.extend(
+        LiveFeatureState(
+            environment=environment,
+            feature_id=feature_id,
+            feature_state_id=id_,
+            live_from=live_from,
+        )
+        for (feature_id, _), (live_from, _, id_) in latest_versions.items()
+    )
+    return live_feature_states
+
+
+def _get_v2_live_feature_states(
+    environment: Environment,
+    feature_ids: list[int] | None,
+    now: datetime.datetime,
+) -> list[LiveFeatureState]:
+    environment_feature_versions = EnvironmentFeatureVersion.objects.filter(
+        environment=environment, published_at__isnull=False
+    )
+    if feature_ids is not None:
+        environment_feature_versions = environment_feature_versions.filter(
+            feature_id__in=feature_ids
+        )
+
+    # Keep the versions scheduled to go live later, and the latest live version
+    # of each feature.
+    live_from_by_version_uuid = {}
+    latest_versions = {}
+    for uuid, feature_id, live_from in environment_feature_versions.values_list(
+        "uuid", "feature_id", "live_from"
+    ):
+        if live_from > now:
+            live_from_by_version_uuid[uuid] = live_from
+            continue
+
+        latest_version = latest_versions.get(feature_id)
+        if not latest_version or live_from > latest_version[0]:
+            latest_versions[feature_id] = (live_from, uuid)
+
+    live_from_by_version_uuid.update(
+        (uuid, live_from) for live_from, uuid in latest_versions.values()
+    )
+
+    feature_states = FeatureState.objects.filter(
+        environment_feature_version__in=list(live_from_by_version_uuid),
+        identity__isnull=True,
+    )
+
+    live_feature_states = []
+    for id_, feature_id, environment_feature_version_id in feature_states.values_list(
+        "id", "feature_id", "environment_feature_version_id"
+    ):
+        live_from = live_from_by_version_uuid[environment_feature_version_id]
+        live_feature_states.append(
+            LiveFeatureState(
+                environment=environment,
+                feature_id=feature_id,
+                feature_state_id=id_,
+                live_from=live_from,
+                is_scheduled=live_from > now,
+            )
+        )
+    return live_feature_states
+
+
 def _get_feature_states_queryset(
     environment: "Environment",
     feature_name: str = None,
@@ -103,6 +269,7 @@ def _get_feature_states_queryset(
     additional_prefetch_related_args: typing.Iterable[
         typing.Union[str, Prefetch]
     ] = None,
+    latest_versions_only: bool = False,
 ) -> QuerySet[FeatureState]:
     additional_select_related_args = additional_select_related_args or tuple()
     additional_prefetch_related_args = additional_prefetch_related_args or tuple()
@@ -125,9 +292,31 @@ def _get_feature_states_queryset(
     if feature_name:
         queryset = queryset.filter(feature__name__iexact=feature_name)
 
+    if latest_versions_only:
+        # Pick the first row of each (feature, segment, identity), in the
+        # same order as `FeatureState.__gt__`, using `DISTINCT ON`.
+        distinct_fields = ("feature_id", "feature_segment__segment_id", "identity_id")
+        if environment.use_v2_feature_versioning:
+            version_ordering = (
+                F("environment_feature_version__live_from").desc(nulls_last=True),
+            )
+        else:
+            version_ordering = (
+                F("live_from").desc(nulls_last=True),
+                F("version").desc(nulls_last=True),
+            )
+        queryset = queryset.order_by(
+            *distinct_fields, *version_ordering, "-id"
+        ).distinct(*distinct_fields)
+
     return queryset
 
 
+def _can_resolve_latest_versions_in_db() -> bool:
+    # `DISTINCT ON` is only supported by Postgres.
+    return connection.vendor == "postgresql"
+
+
 def _get_distinct_key(
     feature_state: FeatureState,
 ) -> tuple[int, int | None, int | None]:
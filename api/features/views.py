@@ -4,11 +4,12 @@ from functools import reduce
 
 from app_analytics.analytics_db_service import get_feature_evaluation_data
 from app_analytics.influxdb_wrapper import get_multiple_event_list_for_feature
+from core.cache_coalescing import get_or_set_coalesced
 from core.constants import FLAGSMITH_UPDATED_AT_HEADER
-from core.request_origin import RequestOrigin
 from django.conf import settings
 from django.core.cache import caches
 from django.db.models import Max, Q, QuerySet
+from django.http import HttpResponse
 from django.utils.decorators import method_decorator
 from django.views.decorators.cache import cache_page
 from drf_yasg import openapi
@@ -34,6 +35,11 @@ from environments.permissions.permissions import (
     EnvironmentKeyPermissions,
     NestedEnvironmentPermissions,
 )
+from environments.sdk.etags import (
+    get_environment_etag,
+    get_not_modified_response,
+    is_not_modified,
+)
 from features.value_types import BOOLEAN, INTEGER, STRING
 from projects.models import Project
 from projects.permissions import VIEW_PROJECT
@@ -50,6 +56,11 @@ from .permissions import (
     FeatureStatePermissions,
     IdentityFeatureStatePermissions,
 )
+from .priority import get_highest_priority_feature_states
+from .sdk_flags_service import (
+    get_environment_flags_response_content,
+    get_sdk_flags_filters,
+)
 from .serializers import (
     CreateFeatureSerializer,
     CreateSegmentOverrideFeatureStateSerializer,
@@ -171,9 +182,17 @@ class FeatureViewSet(viewsets.ModelViewSet):
             feature_states = FeatureState.objects.get_live_feature_states(
                 self.environment,
                 additional_filters=q,
-            ).select_related("feature_state_value", "feature")
+            ).select_related(
+                "feature_state_value", "feature", "environment_feature_version"
+            )
 
-            self._feature_states = {fs.feature_id: fs for fs in feature_states}
+            # More than one live version of a feature state can be returned, e.g.
+            # while a scheduled version is waiting to replace the previous one.
+            self._feature_states = get_highest_priority_feature_states(
+                feature_states,
+                key_function=lambda fs: fs.feature_id,
+                use_v2_feature_versioning=self.environment.use_v2_feature_versioning,
+            )
 
         return queryset
 
@@ -795,6 +814,26 @@ class SDKFeatureStates(GenericAPIView):
 
             return Response(self.get_serializer(feature_states[0]).data)
 
+        updated_at = self.request.environment.updated_at
+        headers = {FLAGSMITH_UPDATED_AT_HEADER: updated_at.timestamp()}
+
+        if settings.ENABLE_SDK_ETAGS:
+            etag = get_environment_etag(
+                request, request.environment, request.originated_from
+            )
+            if is_not_modified(request, etag):
+                return get_not_modified_response(etag, headers=headers)
+            headers["ETag"] = etag
+
+        if settings.CACHE_FLAGS_RESPONSE_SECONDS > 0:
+            return HttpResponse(
+                get_environment_flags_response_content(
+                    request.environment, request.originated_from
+                ),
+                content_type="application/json",
+                headers=headers,
+            )
+
         if settings.CACHE_FLAGS_SECONDS > 0:
             data = self._get_flags_from_cache(request.environment)
         else:
@@ -806,37 +845,27 @@ class SDKFeatureStates(GenericAPIView):
                 many=True,
             ).data
 
-        updated_at = self.request.environment.updated_at
-        return Response(
-            data,
-            headers={FLAGSMITH_UPDATED_AT_HEADER: updated_at.timestamp()},
-        )
+        return Response(data, headers=headers)
 
     @property
     def _additional_filters(self) -> Q:
-        filters = Q(feature_segment=None, identity=None)
-
-        if self.request.environment.get_hide_disabled_flags() is True:
-            return filters & Q(enabled=True)
-
-        if self.request.originated_from is RequestOrigin.CLIENT:
-            return filters & Q(feature__is_server_key_only=False)
-
-        return filters
+        return get_sdk_flags_filters(
+            self.request.environment, self.request.originated_from
+        )
 
     def _get_flags_from_cache(self, environment):
-        data = flags_cache.get(environment.api_key)
-        if not data:
-            data = self.get_serializer(
+        return get_or_set_coalesced(
+            flags_cache,
+            environment.api_key,
+            lambda: self.get_serializer(
                 get_environment_flags_list(
                     environment=environment,
                     additional_filters=self._additional_filters,
                 ),
                 many=True,
-            ).data
-            flags_cache.set(environment.api_key, data, settings.CACHE_FLAGS_SECONDS)
-
-        return data
+            ).data,
+            timeout=settings.CACHE_FLAGS_SECONDS,
+        )
 
     def _get_flags_response_with_identifier(self, request, identifier):
         identity, _ = Identity.objects.get_or_create(
@@ -39,6 +39,7 @@ from environments.tasks import rebuild_environment_document
 from features.models import FeatureState
 from features.versioning.models import EnvironmentFeatureVersion
 from features.versioning.tasks import trigger_update_version_webhooks
+from features.versioning.versioning_service import refresh_live_feature_states
 from features.workflows.core.exceptions import (
     CannotApproveOwnChangeRequest,
     ChangeRequestDeletionError,
@@ -111,6 +112,9 @@ class ChangeRequest(
         self._publish_feature_states()
         self._publish_environment_feature_versions(committed_by)
 
+        if settings.USE_LIVE_FEATURE_STATES:
+            self._refresh_live_feature_states()
+
         self.committed_at = timezone.now()
         self.committed_by = committed_by
         self.save()
@@ -170,6 +174,16 @@ class ChangeRequest(
                     delay_until=environment_feature_version.live_from,
                 )
 
+    def _refresh_live_feature_states(self) -> None:
+        # The feature states and versions are published with `bulk_update`, which
+        # doesn't send the signals that would otherwise refresh them.
+        feature_ids = {
+            *self.feature_states.values_list("feature_id", flat=True),
+            *self.environment_feature_versions.values_list("feature_id", flat=True),
+        }
+        if feature_ids:
+            refresh_live_feature_states(self.environment, feature_ids)
+
     def get_create_log_message(self, history_instance) -> typing.Optional[str]:
         return CHANGE_REQUEST_CREATED_MESSAGE % self.title
 
@@ -47,6 +47,7 @@ from organisations.models import (
 from projects.models import Project
 from projects.tags.models import Tag
 from segments.models import Condition, Segment, SegmentRule
+from util.queryset import iterator_with_prefetch
 
 logger = logging.getLogger(__name__)
 
@@ -151,11 +152,14 @@ def export_identities(organisation_id: int) -> typing.List[dict]:
         _EntityExportConfig(
             Trait,
             Q(identity__environment__project__organisation__id=organisation_id),
+            select_related=["identity__environment"],
         ),
     )
     identities = _export_entities(
         _EntityExportConfig(
-            Identity, Q(environment__project__organisation__id=organisation_id)
+            Identity,
+            Q(environment__project__organisation__id=organisation_id),
+            select_related=["environment"],
         ),
     )
 
@@ -223,6 +227,8 @@ class _EntityExportConfig:
     model_class: type(Model)
     qs_filter: Q
     exclude_fields: typing.List[str] = None
+    # related objects used by the natural keys of the entities
+    select_related: typing.List[str] = None
 
 
 def _export_entities(
@@ -230,7 +236,11 @@ def _export_entities(
 ) -> typing.List[dict]:
     entities = []
     for config in export_configs:
-        args = ("python", config.model_class.objects.filter(config.qs_filter))
+        queryset = config.model_class.objects.filter(config.qs_filter)
+        if config.select_related:
+            queryset = queryset.select_related(*config.select_related)
+        # stream the entities in chunks, rather than loading them all at once
+        args = ("python", iterator_with_prefetch(queryset))
         kwargs = {}
         if config.exclude_fields:
             kwargs["fields"] = [
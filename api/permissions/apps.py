@@ -0,0 +1,8 @@
+from django.apps import AppConfig
+
+
+class PermissionsConfig(AppConfig):
+    name = "permissions"
+
+    def ready(self):
+        from . import receivers  # noqa
@@ -1,11 +1,13 @@
 from typing import TYPE_CHECKING, List, Union
 
+from django.conf import settings
 from django.db.models import Q, QuerySet
 
 from environments.models import Environment
 from organisations.models import Organisation, OrganisationRole
 from projects.models import Project
 
+from .permissions_cache import get_or_resolve_permissions
 from .rbac_wrapper import (
     get_permitted_environments_for_master_api_key_using_roles,
     get_permitted_projects_for_master_api_key_using_roles,
@@ -85,7 +87,17 @@ def get_permitted_projects_for_user(
         organisation__userorganisation__role=OrganisationRole.ADMIN.name,
     )
     filter_ = base_filter | organisation_filter
-    return Project.objects.filter(filter_).distinct()
+    queryset = Project.objects.filter(filter_).distinct()
+
+    if settings.CACHE_PERMISSIONS_SECONDS:
+        project_ids = get_or_resolve_permissions(
+            user.id,
+            ("permitted-projects", permission_key, tag_ids),
+            lambda: list(queryset.values_list("id", flat=True)),
+        )
+        return Project.objects.filter(id__in=project_ids)
+
+    return queryset
 
 
 def get_permitted_projects_for_master_api_key(
@@ -134,6 +146,18 @@ def get_permitted_environments_for_user(
     )
     filter_ = base_filter & Q(project=project)
 
+    if settings.CACHE_PERMISSIONS_SECONDS:
+        environment_ids = get_or_resolve_permissions(
+            user.id,
+            ("permitted-environments", project.id, permission_key, tag_ids),
+            lambda: list(
+                Environment.objects.filter(filter_)
+                .distinct()
+                .values_list("id", flat=True)
+            ),
+        )
+        filter_ = Q(id__in=environment_ids)
+
     queryset = Environment.objects.filter(filter_)
     if prefetch_metadata:
         queryset = queryset.prefetch_related("metadata")
@@ -180,7 +204,11 @@ def user_has_organisation_permission(
     )
     filter_ = base_filter & Q(id=organisation.id)
 
-    return Organisation.objects.filter(filter_).exists()
+    return get_or_resolve_permissions(
+        user.id,
+        ("organisation-permission", organisation.id, permission_key),
+        Organisation.objects.filter(filter_).exists,
+    )
 
 
 def master_api_key_has_organisation_permission(
@@ -200,7 +228,11 @@ def _is_user_object_admin(
     ModelClass = type(object_)
     base_filter = get_base_permission_filter(user, ModelClass)
     filter_ = base_filter & Q(id=object_.id)
-    return ModelClass.objects.filter(filter_).exists()
+    return get_or_resolve_permissions(
+        user.id,
+        ("object-admin", ModelClass._meta.label_lower, object_.id),
+        ModelClass.objects.filter(filter_).exists,
+    )
 
 
 def get_base_permission_filter(
@@ -0,0 +1,82 @@
+"""
+Caching of the permissions resolved for users by `permission_service` and
+`permissions_calculator`, which would otherwise query the user, group and role
+permission tables several times for each admin API request.
+
+Every entry is stored under the current version stamp. The stamp is replaced by
+`invalidate_permissions_cache` whenever a change is made which could affect any
+user's permissions (see `permissions.receivers`), so that stale entries are no
+longer read and expire on their own.
+"""
+
+import typing
+import uuid
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+
+permissions_cache = caches[settings.PERMISSIONS_CACHE_NAME]
+
+VERSION_CACHE_KEY = "permissions-version"
+
+T = typing.TypeVar("T")
+
+_MISSING = object()
+
+
+def get_or_resolve_permissions(
+    user_id: int,
+    key_parts: typing.Iterable[typing.Any],
+    resolve: typing.Callable[[], T],
+) -> T:
+    """
+    Get the result of `resolve` for the given user and key parts (e.g. the name of
+    the check and its arguments) from the cache, resolving and caching it if it
+    isn't cached yet. The result must be picklable.
+    """
+    if not settings.CACHE_PERMISSIONS_SECONDS:
+        return resolve()
+
+    cache_key = _get_cache_key(user_id, key_parts)
+    result = permissions_cache.get(cache_key, _MISSING)
+    if result is _MISSING:
+        result = resolve()
+        permissions_cache.set(
+            cache_key, result, timeout=settings.CACHE_PERMISSIONS_SECONDS
+        )
+    return result
+
+
+def invalidate_permissions_cache() -> None:
+    if not settings.CACHE_PERMISSIONS_SECONDS:
+        return
+
+    _set_new_version()
+    # The permissions may be resolved and cached again by another request before
+    # the change is committed, so the version is replaced once it is as well.
+    transaction.on_commit(_set_new_version)
+
+
+def _set_new_version() -> None:
+    permissions_cache.set(VERSION_CACHE_KEY, uuid.uuid4().hex, timeout=None)
+
+
+def _get_version() -> str:
+    version = uuid.uuid4().hex
+    if permissions_cache.add(VERSION_CACHE_KEY, version, timeout=None):
+        return version
+    return permissions_cache.get(VERSION_CACHE_KEY, version)
+
+
+def _get_cache_key(user_id: int, key_parts: typing.Iterable[typing.Any]) -> str:
+    return ":".join(
+        [_get_version(), str(user_id), *map(_get_cache_key_part, key_parts)]
+    )
+
+
+def _get_cache_key_part(key_part: typing.Any) -> str:
+    if isinstance(key_part, (list, tuple, set)):
+        # e.g. tag ids, whose order doesn't matter.
+        return ",".join(map(str, sorted(key_part)))
+    return str(key_part)
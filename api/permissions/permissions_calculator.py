@@ -18,6 +18,7 @@ from projects.models import (
 )
 
 from .permission_service import is_user_project_admin
+from .permissions_cache import get_or_resolve_permissions
 from .rbac_wrapper import (
     RolePermissionData,
     get_roles_permission_data_for_environment,
@@ -114,6 +115,34 @@ class PermissionData:
 
 
 def get_project_permission_data(project_id: int, user_id: int) -> PermissionData:
+    return get_or_resolve_permissions(
+        user_id,
+        ("project-permission-data", project_id),
+        lambda: _get_project_permission_data(project_id, user_id),
+    )
+
+
+def get_organisation_permission_data(
+    organisation_id: int, user: "FFAdminUser"
+) -> PermissionData:
+    return get_or_resolve_permissions(
+        user.id,
+        ("organisation-permission-data", organisation_id),
+        lambda: _get_organisation_permission_data(organisation_id, user),
+    )
+
+
+def get_environment_permission_data(
+    environment: "Environment", user: "FFAdminUser"
+) -> PermissionData:
+    return get_or_resolve_permissions(
+        user.id,
+        ("environment-permission-data", environment.id),
+        lambda: _get_environment_permission_data(environment, user),
+    )
+
+
+def _get_project_permission_data(project_id: int, user_id: int) -> PermissionData:
     project_permission_svc = _ProjectPermissionService(project_id, user_id)
     return PermissionData(
         groups=get_groups_permission_data(project_permission_svc.group_qs),
@@ -122,7 +151,7 @@ def get_project_permission_data(project_id: int, user_id: int) -> PermissionData
     )
 
 
-def get_organisation_permission_data(
+def _get_organisation_permission_data(
     organisation_id: int, user: "FFAdminUser"
 ) -> PermissionData:
     org_permission_svc = _OrganisationPermissionService(organisation_id, user.id)
@@ -134,7 +163,7 @@ def get_organisation_permission_data(
     )
 
 
-def get_environment_permission_data(
+def _get_environment_permission_data(
     environment: "Environment", user: "FFAdminUser"
 ) -> PermissionData:
     environment_permission_svc = _EnvironmentPermissionService(environment.id, user.id)
@@ -0,0 +1,64 @@
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from environments.models import Environment
+from environments.permissions.models import (
+    UserEnvironmentPermission,
+    UserPermissionGroupEnvironmentPermission,
+)
+from organisations.models import UserOrganisation
+from organisations.permissions.models import (
+    UserOrganisationPermission,
+    UserPermissionGroupOrganisationPermission,
+)
+from projects.models import (
+    Project,
+    UserPermissionGroupProjectPermission,
+    UserProjectPermission,
+)
+from users.models import UserPermissionGroup, UserPermissionGroupMembership
+
+from .permissions_cache import invalidate_permissions_cache
+
+PERMISSION_MODELS = (
+    UserProjectPermission,
+    UserPermissionGroupProjectPermission,
+    UserEnvironmentPermission,
+    UserPermissionGroupEnvironmentPermission,
+    UserOrganisationPermission,
+    UserPermissionGroupOrganisationPermission,
+)
+
+
+@receiver(post_save, sender=UserOrganisation)
+@receiver(post_delete, sender=UserOrganisation)
+@receiver(post_save, sender=UserPermissionGroupMembership)
+@receiver(post_delete, sender=UserPermissionGroupMembership)
+@receiver(post_delete, sender=UserPermissionGroup)
+@receiver(m2m_changed, sender=UserPermissionGroup.users.through)
+def invalidate_permissions_cache_on_membership_change(**kwargs) -> None:
+    invalidate_permissions_cache()
+
+
+@receiver(post_save, sender=Project)
+@receiver(post_save, sender=Environment)
+def invalidate_permissions_cache_on_object_created(created: bool, **kwargs) -> None:
+    # Organisation and project admins are permitted to access new projects and
+    # environments.
+    if created:
+        invalidate_permissions_cache()
+
+
+def invalidate_permissions_cache_on_permission_change(**kwargs) -> None:
+    invalidate_permissions_cache()
+
+
+for permission_model in PERMISSION_MODELS:
+    for signal in (post_save, post_delete):
+        signal.connect(
+            invalidate_permissions_cache_on_permission_change, sender=permission_model
+        )
+    m2m_changed.connect(
+        invalidate_permissions_cache_on_permission_change,
+        sender=permission_model.permissions.through,
+    )
@@ -118,22 +118,25 @@ class Project(LifecycleModelMixin, SoftDeleteExportableModel):
         segments = project_segments_cache.get(self.id)
 
         if not segments:
-            # This is optimised to account for rules nested one levels deep (since we
-            # don't support anything above that from the UI at the moment). Anything
-            # past that will require additional queries / thought on how to optimise.
-            segments = self.segments.all().prefetch_related(
-                "rules",
-                "rules__conditions",
-                "rules__rules",
-                "rules__rules__conditions",
-                "rules__rules__rules",
-            )
+            segments = self.get_segments_from_db()
             project_segments_cache.set(
                 self.id, segments, timeout=settings.CACHE_PROJECT_SEGMENTS_SECONDS
             )
 
         return segments
 
+    def get_segments_from_db(self):
+        # This is optimised to account for rules nested one levels deep (since we
+        # don't support anything above that from the UI at the moment). Anything
+        # past that will require additional queries / thought on how to optimise.
+        return self.segments.all().prefetch_related(
+            "rules",
+            "rules__conditions",
+            "rules__rules",
+            "rules__rules__conditions",
+            "rules__rules__rules",
+        )
+
     @hook(BEFORE_CREATE)
     def set_enable_dynamo_db(self):
         self.enable_dynamo_db = self.enable_dynamo_db or settings.EDGE_ENABLED
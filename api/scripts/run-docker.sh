@@ -35,9 +35,11 @@ function run_task_processor() {
         python manage.py waitfordb --waitfor 30 --migrations --database analytics
     fi
     RUN_BY_PROCESSOR=1 exec python manage.py runprocessor \
+      --mode ${TASK_PROCESSOR_MODE:-thread} \
       --sleepintervalms ${TASK_PROCESSOR_SLEEP_INTERVAL:-500} \
       --graceperiodms ${TASK_PROCESSOR_GRACE_PERIOD_MS:-20000} \
       --numthreads ${TASK_PROCESSOR_NUM_THREADS:-5} \
+      ${TASK_PROCESSOR_NUM_PROCESSES:+--numprocesses $TASK_PROCESSOR_NUM_PROCESSES} \
       --queuepopsize ${TASK_PROCESSOR_QUEUE_POP_SIZE:-10}
 }
 function migrate_identities(){
@@ -0,0 +1,56 @@
+import typing
+
+from core.local_cache import VersionedLocalCache
+from django.conf import settings
+from flag_engine.segments.models import SegmentModel
+
+from segments.models import Segment
+from util.mappers.engine import map_segment_to_engine
+
+if typing.TYPE_CHECKING:
+    from environments.models import Environment
+
+EngineSegments = list[tuple[Segment, SegmentModel]]
+
+# Any change to a segment (or its rules and conditions) updates the environments
+# of its project, so the cached engine segments are rebuilt as soon as the
+# environment's `updated_at` changes.
+engine_segments_cache: VersionedLocalCache[EngineSegments] = VersionedLocalCache(
+    lambda: settings.ENGINE_SEGMENTS_CACHE_MAX_ENTRIES,
+)
+
+
+def get_engine_segments(
+    environment: "Environment",
+    overrides_only: bool = False,
+) -> EngineSegments:
+    """
+    Get the segments of the environment's project along with their flag engine
+    models, ready to be evaluated.
+
+    :param overrides_only: only retrieve the segments which have an override in
+        the environment
+    """
+    if not settings.CACHE_ENGINE_SEGMENTS:
+        segments = (
+            environment.get_segments_from_cache()
+            if overrides_only
+            else environment.project.get_segments_from_cache()
+        )
+        return _map_segments_to_engine(segments)
+
+    # Since the engine segments are versioned, they are built from the
+    # database rather than the (unversioned) segment caches.
+    return engine_segments_cache.get_or_build(
+        (environment.id, overrides_only),
+        version=environment.updated_at,
+        build=lambda: _map_segments_to_engine(
+            environment.get_segments_from_db()
+            if overrides_only
+            else environment.project.get_segments_from_db()
+        ),
+    )
+
+
+def _map_segments_to_engine(segments: typing.Iterable[Segment]) -> EngineSegments:
+    return [(segment, map_segment_to_engine(segment)) for segment in segments]
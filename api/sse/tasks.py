@@ -2,9 +2,9 @@ import logging
 from datetime import timedelta
 
 import requests
-from app_analytics.influxdb_wrapper import influxdb_client
+from app_analytics.influxdb_wrapper import get_write_api
 from django.conf import settings
-from influxdb_client import Point, WriteOptions
+from influxdb_client import Point
 
 from environments.models import Environment
 from projects.models import Project
@@ -52,35 +52,33 @@ if settings.AWS_SSE_LOGS_BUCKET_NAME:
             agg_request_count[log.api_key] = agg_request_count.get(log.api_key, 0) + 1
             agg_last_event_generated_at[log.api_key] = log.generated_at
 
-        with influxdb_client.write_api(
-            write_options=WriteOptions(batch_size=100, flush_interval=1000)
-        ) as write_api:
-            environments = Environment.objects.filter(
-                api_key__in=agg_request_count.keys()
-            ).values(
-                "api_key",
-                "id",
-                "project_id",
-                "project__name",
-                "project__organisation_id",
-                "project__organisation__name",
+        write_api = get_write_api()
+        environments = Environment.objects.filter(
+            api_key__in=agg_request_count.keys()
+        ).values(
+            "api_key",
+            "id",
+            "project_id",
+            "project__name",
+            "project__organisation_id",
+            "project__organisation__name",
+        )
+
+        for environment in environments:
+            time = agg_last_event_generated_at[environment["api_key"]]
+            count = agg_request_count[environment["api_key"]]
+            record = (
+                Point("sse_call")
+                .field("request_count", count)
+                .tag("environment_id", environment["id"])
+                .tag("project_id", environment["project_id"])
+                .tag("project", environment["project__name"])
+                .tag("organisation_id", environment["project__organisation_id"])
+                .tag("organisation", environment["project__organisation__name"])
+                .time(time)
             )
 
-            for environment in environments:
-                time = agg_last_event_generated_at[environment["api_key"]]
-                count = agg_request_count[environment["api_key"]]
-                record = (
-                    Point("sse_call")
-                    .field("request_count", count)
-                    .tag("environment_id", environment["id"])
-                    .tag("project_id", environment["project_id"])
-                    .tag("project", environment["project__name"])
-                    .tag("organisation_id", environment["project__organisation_id"])
-                    .tag("organisation", environment["project__organisation__name"])
-                    .time(time)
-                )
-
-                write_api.write(bucket=settings.INFLUXDB_BUCKET, record=record)
+            write_api.write(bucket=settings.INFLUXDB_BUCKET, record=record)
 
 
 def get_auth_header():
@@ -0,0 +1,326 @@
+"""
+A benchmark of the task processor's throughput and latency, used to size task
+processor deployments and to catch regressions. See the `benchmarktaskprocessor`
+management command.
+
+Since the benchmark's runners process any task in the queue, it must be run
+against a database which isn't used by a live task processor.
+"""
+
+import functools
+import logging
+import math
+import random
+import threading
+import time
+import typing
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+
+from django.conf import settings
+from django.db import connection
+
+from task_processor.decorators import TaskHandler, register_task_handler
+from task_processor.models import Task, TaskPriority, TaskRun
+from task_processor.processor import run_tasks
+from task_processor.task_run_method import TaskRunMethod
+
+logger = logging.getLogger(__name__)
+
+PERCENTILES = (50, 90, 99)
+
+
+def _benchmark_task(duration_ms: int = 0) -> None:
+    if duration_ms:
+        time.sleep(duration_ms / 1000)
+
+
+# A task handler for each priority, since the priority of a task is given by its
+# handler.
+benchmark_tasks: dict[TaskPriority, TaskHandler] = {
+    priority: register_task_handler(
+        task_name=f"benchmark_task_{priority.name.lower()}",
+        priority=priority,
+    )(_benchmark_task)
+    for priority in TaskPriority
+}
+
+
+class BenchmarkError(Exception):
+    pass
+
+
+@dataclass
+class RunnerStats:
+    num_polls: int = 0
+    num_empty_polls: int = 0
+    # polls which returned some tasks, but fewer than the queue pop size, e.g.
+    # because other runners had locked the remaining ones
+    num_partial_polls: int = 0
+    get_tasks_to_process_durations_ms: list[float] = field(default_factory=list)
+
+    def record_query(self, execute, sql, params, many, context):
+        if "get_tasks_to_process" not in sql:
+            return execute(sql, params, many, context)
+
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.get_tasks_to_process_durations_ms.append(
+                (time.perf_counter() - start) * 1000
+            )
+
+
+@dataclass
+class BenchmarkResult:
+    num_tasks: int
+    num_processed_tasks: int
+    num_runners: int
+    enqueue_seconds: float
+    process_seconds: float
+    # time between a task being scheduled and its run starting, by priority
+    pickup_latencies_ms: dict[TaskPriority, list[float]]
+    runner_stats: list[RunnerStats]
+
+    @property
+    def enqueued_tasks_per_second(self) -> float:
+        return self.num_tasks / self.enqueue_seconds if self.enqueue_seconds else 0
+
+    @property
+    def processed_tasks_per_second(self) -> float:
+        return (
+            self.num_processed_tasks / self.process_seconds
+            if self.process_seconds
+            else 0
+        )
+
+    @property
+    def num_polls(self) -> int:
+        return sum(stats.num_polls for stats in self.runner_stats)
+
+    @property
+    def num_empty_polls(self) -> int:
+        return sum(stats.num_empty_polls for stats in self.runner_stats)
+
+    @property
+    def num_partial_polls(self) -> int:
+        return sum(stats.num_partial_polls for stats in self.runner_stats)
+
+    @property
+    def get_tasks_to_process_durations_ms(self) -> list[float]:
+        return [
+            duration
+            for stats in self.runner_stats
+            for duration in stats.get_tasks_to_process_durations_ms
+        ]
+
+    def get_report(self) -> str:
+        lines = [
+            f"Tasks: {self.num_processed_tasks}/{self.num_tasks} processed "
+            f"by {self.num_runners} runners",
+            f"Enqueue: {self.enqueued_tasks_per_second:.1f} tasks/s "
+            f"({self.enqueue_seconds:.2f}s)",
+            f"Process: {self.processed_tasks_per_second:.1f} tasks/s "
+            f"({self.process_seconds:.2f}s)",
+            f"Polls: {self.num_polls} "
+            f"({self.num_empty_polls} empty, {self.num_partial_polls} partial)",
+            "get_tasks_to_process (ms): "
+            + _format_percentiles(self.get_tasks_to_process_durations_ms),
+        ]
+        for priority, latencies_ms in sorted(self.pickup_latencies_ms.items()):
+            lines.append(
+                f"Pickup latency {priority.name} (ms): "
+                + _format_percentiles(latencies_ms)
+            )
+        return "\n".join(lines)
+
+
+def run_benchmark(
+    *,
+    num_tasks: int,
+    num_runners: int,
+    priority_weights: dict[TaskPriority, int],
+    queue_pop_size: int = 10,
+    task_duration_ms: int = 0,
+    enqueue_rate: float = 0,
+    poll_interval_ms: int = 10,
+    timeout_seconds: float = 600,
+    seed: int | None = None,
+) -> BenchmarkResult:
+    """
+    Enqueue `num_tasks` benchmark tasks with `TaskHandler.delay`, with priorities
+    picked at random using `priority_weights`, and process them with `num_runners`
+    threads calling `run_tasks`, as the task processor does.
+
+    :param enqueue_rate: enqueue the tasks at this rate (tasks per second) while
+        the runners are processing them, rather than all of them up front
+    :param poll_interval_ms: time runners wait after finding no tasks to process
+    :param timeout_seconds: stop processing tasks after this time
+    """
+    if settings.TASK_RUN_METHOD != TaskRunMethod.TASK_PROCESSOR:
+        raise BenchmarkError("TASK_RUN_METHOD must be TASK_PROCESSOR.")
+
+    benchmark_task_identifiers = [
+        task_handler.task_identifier for task_handler in benchmark_tasks.values()
+    ]
+    if (
+        Task.objects.filter(completed=False, num_failures__lt=3)
+        .exclude(task_identifier__in=benchmark_task_identifiers)
+        .exists()
+    ):
+        raise BenchmarkError(
+            "The task queue must be empty, otherwise the benchmark would run "
+            "the queued tasks."
+        )
+
+    priorities = random.Random(seed).choices(
+        list(priority_weights), weights=list(priority_weights.values()), k=num_tasks
+    )
+
+    def enqueue() -> float:
+        start = time.perf_counter()
+        for i, priority in enumerate(priorities):
+            if enqueue_rate:
+                _sleep_until(start + i / enqueue_rate)
+            benchmark_tasks[priority].delay(kwargs={"duration_ms": task_duration_ms})
+        return time.perf_counter() - start
+
+    process_tasks = functools.partial(
+        _process_tasks,
+        num_tasks=num_tasks,
+        num_runners=num_runners,
+        queue_pop_size=queue_pop_size,
+        poll_interval_ms=poll_interval_ms,
+        timeout_seconds=timeout_seconds,
+    )
+
+    try:
+        if enqueue_rate:
+            enqueue_seconds, (process_seconds, runner_stats) = _run_concurrently(
+                enqueue, process_tasks
+            )
+        else:
+            enqueue_seconds = enqueue()
+            process_seconds, runner_stats = process_tasks()
+
+        pickup_latencies_ms = {}
+        for priority, scheduled_for, started_at in TaskRun.objects.filter(
+            task__task_identifier__in=benchmark_task_identifiers
+        ).values_list("task__priority", "task__scheduled_for", "started_at"):
+            pickup_latencies_ms.setdefault(TaskPriority(priority), []).append(
+                (started_at - scheduled_for).total_seconds() * 1000
+            )
+    finally:
+        # the task runs are deleted along with the tasks
+        Task.objects.filter(task_identifier__in=benchmark_task_identifiers).delete()
+
+    return BenchmarkResult(
+        num_tasks=num_tasks,
+        num_processed_tasks=sum(map(len, pickup_latencies_ms.values())),
+        num_runners=num_runners,
+        enqueue_seconds=enqueue_seconds,
+        process_seconds=process_seconds,
+        pickup_latencies_ms=pickup_latencies_ms,
+        runner_stats=runner_stats,
+    )
+
+
+def _process_tasks(
+    *,
+    num_tasks: int,
+    num_runners: int,
+    queue_pop_size: int,
+    poll_interval_ms: int,
+    timeout_seconds: float,
+) -> tuple[float, list[RunnerStats]]:
+    runner_stats = [RunnerStats() for _ in range(num_runners)]
+    remaining_tasks = _Countdown(num_tasks)
+    deadline = time.monotonic() + timeout_seconds
+
+    def run_runner(stats: RunnerStats) -> None:
+        try:
+            with connection.execute_wrapper(stats.record_query):
+                while remaining_tasks.value > 0 and time.monotonic() < deadline:
+                    task_runs = run_tasks(queue_pop_size)
+                    stats.num_polls += 1
+                    if not task_runs:
+                        stats.num_empty_polls += 1
+                        time.sleep(poll_interval_ms / 1000)
+                        continue
+                    if len(task_runs) < queue_pop_size:
+                        stats.num_partial_polls += 1
+                    remaining_tasks.decrement(len(task_runs))
+        finally:
+            connection.close()
+
+    runners = [
+        threading.Thread(target=run_runner, args=(stats,), daemon=True)
+        for stats in runner_stats
+    ]
+
+    start = time.perf_counter()
+    for runner in runners:
+        runner.start()
+    for runner in runners:
+        runner.join()
+    process_seconds = time.perf_counter() - start
+
+    if remaining_tasks.value > 0:
+        logger.warning(
+            "Benchmark timed out with %d tasks left to process.", remaining_tasks.value
+        )
+
+    return process_seconds, runner_stats
+
+
+T = typing.TypeVar("T")
+U = typing.TypeVar("U")
+
+
+def _run_concurrently(
+    f: typing.Callable[[], T], g: typing.Callable[[], U]
+) -> tuple[T, U]:
+    def run_f() -> T:
+        try:
+            return f()
+        finally:
+            connection.close()
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        future = executor.submit(run_f)
+        g_result = g()
+        return future.result(), g_result
+
+
+class _Countdown:
+    def __init__(self, value: int) -> None:
+        self.value = value
+        self._lock = threading.Lock()
+
+    def decrement(self, amount: int) -> None:
+        with self._lock:
+            self.value -= amount
+
+
+def _sleep_until(perf_counter: float) -> None:
+    if (delay := perf_counter - time.perf_counter()) > 0:
+        time.sleep(delay)
+
+
+def get_percentile(values: list[float], percentile: float) -> float:
+    """
+    Get the given percentile of the values, using the nearest-rank method.
+    """
+    sorted_values = sorted(values)
+    rank = max(math.ceil(percentile / 100 * len(sorted_values)), 1)
+    return sorted_values[rank - 1]
+
+
+def _format_percentiles(values: list[float]) -> str:
+    if not values:
+        return "n/a"
+    return ", ".join(
+        f"p{percentile}={get_percentile(values, percentile):.1f}"
+        for percentile in PERCENTILES
+    )
@@ -11,6 +11,7 @@ from django.utils import timezone
 
 from task_processor.exceptions import InvalidArgumentsError, TaskQueueFullError
 from task_processor.models import RecurringTask, Task, TaskPriority
+from task_processor.notifications import notify_task_created
 from task_processor.task_registry import register_task
 from task_processor.task_run_method import TaskRunMethod
 
@@ -94,6 +95,8 @@ class TaskHandler(typing.Generic[P]):
                 return
 
             task.save()
+            if not delay_until:
+                notify_task_created(self.task_identifier)
             return task
 
     def run_in_thread(
@@ -0,0 +1,105 @@
+from argparse import ArgumentParser, ArgumentTypeError
+
+from django.core.management import BaseCommand, CommandError
+
+from task_processor.benchmark import BenchmarkError, run_benchmark
+from task_processor.models import TaskPriority
+
+
+def priority_weights(value: str) -> dict[TaskPriority, int]:
+    try:
+        return {
+            TaskPriority[priority.strip().upper()]: int(weight)
+            for priority, weight in (item.split("=") for item in value.split(","))
+        }
+    except (KeyError, ValueError) as e:
+        raise ArgumentTypeError(
+            "Expected comma separated <priority>=<weight> pairs, e.g. NORMAL=9,HIGH=1"
+        ) from e
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark the throughput and latency of the task processor. Must be run "
+        "against a database which isn't used by a live task processor."
+    )
+
+    def add_arguments(self, parser: ArgumentParser):
+        parser.add_argument(
+            "--numtasks",
+            type=int,
+            help="Number of tasks to enqueue and process.",
+            default=1000,
+        )
+        parser.add_argument(
+            "--numrunners",
+            type=int,
+            help="Number of task runner threads processing the tasks.",
+            default=5,
+        )
+        parser.add_argument(
+            "--queuepopsize",
+            type=int,
+            help="Number of tasks each runner will pop from the queue on each cycle.",
+            default=10,
+        )
+        parser.add_argument(
+            "--priorities",
+            type=priority_weights,
+            help=(
+                "Relative weights of the task priorities, as comma separated "
+                "<priority>=<weight> pairs, e.g. NORMAL=9,HIGH=1."
+            ),
+            default={TaskPriority.NORMAL: 1},
+        )
+        parser.add_argument(
+            "--taskdurationms",
+            type=int,
+            help="Number of millis each task takes to run.",
+            default=0,
+        )
+        parser.add_argument(
+            "--enqueuerate",
+            type=float,
+            help=(
+                "Number of tasks to enqueue per second while they're processed. "
+                "By default, all the tasks are enqueued before they're processed."
+            ),
+            default=0,
+        )
+        parser.add_argument(
+            "--sleepintervalms",
+            type=int,
+            help="Number of millis each runner waits after finding no tasks.",
+            default=10,
+        )
+        parser.add_argument(
+            "--timeoutseconds",
+            type=float,
+            help="Number of seconds after which the runners stop.",
+            default=600,
+        )
+        parser.add_argument(
+            "--seed",
+            type=int,
+            help="Seed used to pick the priority of each task.",
+            default=None,
+        )
+
+    def handle(self, *args, **options):
+        try:
+            result = run_benchmark(
+                num_tasks=options["numtasks"],
+                num_runners=options["numrunners"],
+                priority_weights=options["priorities"],
+                queue_pop_size=options["queuepopsize"],
+                task_duration_ms=options["taskdurationms"],
+                enqueue_rate=options["enqueuerate"],
+                poll_interval_ms=options["sleepintervalms"],
+                timeout_seconds=options["timeoutseconds"],
+                seed=options["seed"],
+            )
+        except BenchmarkError as e:
+            raise CommandError(str(e)) from e
+
+        self.stdout.write(result.get_report())
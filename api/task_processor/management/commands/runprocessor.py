@@ -1,4 +1,5 @@
 import logging
+import os
 import signal
 import time
 import typing
@@ -8,15 +9,20 @@ from datetime import timedelta
 from django.core.management import BaseCommand
 from django.utils import timezone
 
+from task_processor.processes import TaskRunnerProcess
 from task_processor.task_registry import registered_tasks
 from task_processor.thread_monitoring import (
     clear_unhealthy_threads,
     write_unhealthy_threads,
 )
-from task_processor.threads import TaskRunner
+from task_processor.threads import AsyncTaskRunner, TaskRunner
 
 logger = logging.getLogger(__name__)
 
+MODE_THREAD = "thread"
+MODE_PROCESS = "process"
+MODE_ASYNC = "async"
+
 
 class Command(BaseCommand):
     def __init__(self, *args, **kwargs):
@@ -25,16 +31,36 @@ class Command(BaseCommand):
         signal.signal(signal.SIGINT, self._exit_gracefully)
         signal.signal(signal.SIGTERM, self._exit_gracefully)
 
-        self._threads: typing.List[TaskRunner] = []
+        self._threads: typing.List[TaskRunner | TaskRunnerProcess] = []
         self._monitor_threads = True
 
     def add_arguments(self, parser: ArgumentParser):
+        parser.add_argument(
+            "--mode",
+            choices=[MODE_THREAD, MODE_PROCESS, MODE_ASYNC],
+            help=(
+                "How to run tasks. 'thread' runs worker threads in this process, "
+                "'process' runs worker threads in each of a number of supervised "
+                "processes, and 'async' runs tasks concurrently on an asyncio "
+                "event loop."
+            ),
+            default=MODE_THREAD,
+        )
         parser.add_argument(
             "--numthreads",
             type=int,
-            help="Number of worker threads to run.",
+            help=(
+                "Number of worker threads to run (per process in 'process' mode). "
+                "In 'async' mode, the number of tasks to run concurrently."
+            ),
             default=5,
         )
+        parser.add_argument(
+            "--numprocesses",
+            type=int,
+            help="Number of worker processes to run in 'process' mode.",
+            default=os.cpu_count(),
+        )
         parser.add_argument(
             "--sleepintervalms",
             type=int,
@@ -55,7 +81,9 @@ class Command(BaseCommand):
         )
 
     def handle(self, *args, **options):
+        mode = options["mode"]
         num_threads = options["numthreads"]
+        num_processes = options["numprocesses"]
         sleep_interval_ms = options["sleepintervalms"]
         grace_period_ms = options["graceperiodms"]
         queue_pop_size = options["queuepopsize"]
@@ -65,15 +93,37 @@ class Command(BaseCommand):
             ",".join([f"{k}={v}" for k, v in options.items()]),
         )
 
-        self._threads.extend(
-            [
-                TaskRunner(
+        if mode == MODE_PROCESS:
+
+            def create_task_runner(index: int) -> TaskRunnerProcess:
+                return TaskRunnerProcess(
+                    name=f"TaskRunnerProcess-{index}",
+                    num_threads=num_threads,
                     sleep_interval_millis=sleep_interval_ms,
                     queue_pop_size=queue_pop_size,
                 )
-                for _ in range(num_threads)
-            ]
-        )
+
+            self._threads.extend(
+                [create_task_runner(i) for i in range(1, num_processes + 1)]
+            )
+        elif mode == MODE_ASYNC:
+            self._threads.append(
+                AsyncTaskRunner(
+                    sleep_interval_millis=sleep_interval_ms,
+                    queue_pop_size=queue_pop_size,
+                    concurrency=num_threads,
+                )
+            )
+        else:
+            self._threads.extend(
+                [
+                    TaskRunner(
+                        sleep_interval_millis=sleep_interval_ms,
+                        queue_pop_size=queue_pop_size,
+                    )
+                    for _ in range(num_threads)
+                ]
+            )
 
         logger.info(
             "Processor starting. Registered tasks are: %s",
@@ -86,6 +136,11 @@ class Command(BaseCommand):
         clear_unhealthy_threads()
         while self._monitor_threads:
             time.sleep(1)
+            if not self._monitor_threads:
+                # Don't report runners which are stopping as unhealthy.
+                break
+            if mode == MODE_PROCESS:
+                self._restart_dead_processes(create_task_runner)
             unhealthy_threads = self._get_unhealthy_threads(
                 ms_before_unhealthy=grace_period_ms + sleep_interval_ms
             )
@@ -94,6 +149,21 @@ class Command(BaseCommand):
 
         [t.join() for t in self._threads]
 
+    def _restart_dead_processes(
+        self, create_task_runner: typing.Callable[[int], TaskRunnerProcess]
+    ) -> None:
+        for i, process in enumerate(self._threads):
+            if not self._monitor_threads or process.is_alive():
+                continue
+
+            logger.warning(
+                "Task processor process %s exited with code %s. Restarting.",
+                process.name,
+                process.exitcode,
+            )
+            self._threads[i] = create_task_runner(i + 1)
+            self._threads[i].start()
+
     def _exit_gracefully(self, *args):
         self._monitor_threads = False
         for t in self._threads:
@@ -101,7 +171,7 @@ class Command(BaseCommand):
 
     def _get_unhealthy_threads(
         self, ms_before_unhealthy: int
-    ) -> typing.List[TaskRunner]:
+    ) -> typing.List[TaskRunner | TaskRunnerProcess]:
         unhealthy_threads = []
         healthy_threshold = timezone.now() - timedelta(milliseconds=ms_before_unhealthy)
 
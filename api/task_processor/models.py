@@ -1,8 +1,11 @@
+import asyncio
+import inspect
 import typing
 import uuid
 from datetime import datetime
 
 import simplejson as json
+from asgiref.sync import async_to_sync
 from django.core.serializers.json import DjangoJSONEncoder
 from django.db import models
 from django.utils import timezone
@@ -63,8 +66,15 @@ class AbstractBaseTask(models.Model):
         self.is_locked = False
 
     def run(self):
+        if inspect.iscoroutinefunction(self.callable):
+            return async_to_sync(self.callable)(*self.args, **self.kwargs)
         return self.callable(*self.args, **self.kwargs)
 
+    async def run_async(self):
+        if inspect.iscoroutinefunction(self.callable):
+            return await self.callable(*self.args, **self.kwargs)
+        return await asyncio.get_running_loop().run_in_executor(None, self.run)
+
     @property
     def callable(self) -> typing.Callable:
         try:
@@ -0,0 +1,74 @@
+"""
+Postgres LISTEN / NOTIFY support for the task processor.
+
+When a task is created, a notification is sent on `TASK_CREATED_CHANNEL` so
+that idle task runners, which listen on the channel between iterations, can
+pick it up immediately rather than waiting for their next poll. Since the
+notification is only delivered when the transaction creating the task commits,
+runners never wake up before the task is visible to them.
+
+Runners still poll every `sleep_interval_millis`, so scheduled tasks,
+recurring tasks, and any notifications that are missed are still processed.
+"""
+
+import logging
+import select
+
+from django.conf import settings
+from django.db import connection
+
+logger = logging.getLogger(__name__)
+
+TASK_CREATED_CHANNEL = "task_processor_task_created"
+
+
+def is_listen_notify_enabled() -> bool:
+    return (
+        settings.TASK_PROCESSOR_ENABLE_LISTEN_NOTIFY
+        and connection.vendor == "postgresql"
+    )
+
+
+def notify_task_created(task_identifier: str) -> None:
+    if not is_listen_notify_enabled():
+        return
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT pg_notify(%s, %s)", [TASK_CREATED_CHANNEL, task_identifier]
+        )
+
+
+class TaskCreatedListener:
+    """
+    Listens for task creation notifications on the current thread's database
+    connection.
+    """
+
+    def __init__(self) -> None:
+        self._listening_connection = None
+
+    def wait(self, timeout_seconds: float) -> bool:
+        """
+        Block until a task is created or the timeout expires. Returns True if a
+        notification was received.
+        """
+        connection.ensure_connection()
+        db_connection = connection.connection
+
+        if db_connection is not self._listening_connection:
+            # Either this is the first wait or the connection was re-established
+            # (e.g. after an error), so we need to (re-)subscribe.
+            with connection.cursor() as cursor:
+                cursor.execute(f"LISTEN {TASK_CREATED_CHANNEL}")
+            self._listening_connection = db_connection
+
+        # Notifications may already have been received while running tasks.
+        if not db_connection.notifies:
+            readable, _, _ = select.select([db_connection], [], [], timeout_seconds)
+            if readable:
+                db_connection.poll()
+
+        notified = bool(db_connection.notifies)
+        db_connection.notifies.clear()
+        return notified
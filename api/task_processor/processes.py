@@ -0,0 +1,133 @@
+import logging
+import multiprocessing
+import os
+import signal
+import time
+import typing
+from datetime import datetime, timezone
+
+from django.db import connections
+
+from task_processor.threads import TaskRunner
+
+logger = logging.getLogger(__name__)
+
+HEARTBEAT_INTERVAL_SECONDS = 1
+
+# Django's settings and task registry are inherited by forked processes, so they
+# don't need to set up Django (or import every task handler) again.
+_mp_context = multiprocessing.get_context("fork")
+
+
+class TaskRunnerProcess:
+    """
+    Runs a number of `TaskRunner` threads in a separate process, so that tasks
+    aren't limited to a single core by the GIL.
+
+    Exposes the same interface as `TaskRunner` for the purposes of health
+    monitoring: the process reports the least recent time that any of its
+    runners checked for tasks through a heartbeat shared with the parent.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        num_threads: int = 5,
+        sleep_interval_millis: int = 2000,
+        queue_pop_size: int = 1,
+    ) -> None:
+        self._heartbeat = _mp_context.Value("d", time.time())
+        # Note that we don't use a multiprocessing.Event here since setting it
+        # blocks until every waiting process has woken up.
+        self._stopped = _mp_context.Value("b", False)
+        self._process = _mp_context.Process(
+            target=run_task_runners,
+            name=name,
+            kwargs={
+                "heartbeat": self._heartbeat,
+                "stopped": self._stopped,
+                "parent_pid": os.getpid(),
+                "num_threads": num_threads,
+                "sleep_interval_millis": sleep_interval_millis,
+                "queue_pop_size": queue_pop_size,
+            },
+        )
+
+    @property
+    def name(self) -> str:
+        return self._process.name
+
+    @property
+    def exitcode(self) -> int | None:
+        return self._process.exitcode
+
+    @property
+    def last_checked_for_tasks(self) -> datetime | None:
+        if heartbeat := self._heartbeat.value:
+            return datetime.fromtimestamp(heartbeat, tz=timezone.utc)
+        return None
+
+    def start(self) -> None:
+        # Database connections must not be shared with the child process.
+        connections.close_all()
+        self._process.start()
+
+    def stop(self) -> None:
+        self._stopped.value = True
+
+    def join(self, timeout: float | None = None) -> None:
+        self._process.join(timeout)
+
+    def is_alive(self) -> bool:
+        return self._process.is_alive()
+
+
+def run_task_runners(
+    heartbeat: typing.Any,
+    stopped: typing.Any,
+    parent_pid: int,
+    num_threads: int,
+    sleep_interval_millis: int,
+    queue_pop_size: int,
+) -> None:
+    # The parent process is responsible for stopping its children, including
+    # on SIGINT (e.g. Ctrl+C, which is sent to the whole process group).
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    signal.signal(signal.SIGTERM, signal.SIG_IGN)
+
+    task_runners = [
+        TaskRunner(
+            sleep_interval_millis=sleep_interval_millis,
+            queue_pop_size=queue_pop_size,
+        )
+        for _ in range(num_threads)
+    ]
+    for task_runner in task_runners:
+        task_runner.start()
+
+    # Stop if the parent process has gone away without stopping us.
+    while not stopped.value and os.getppid() == parent_pid:
+        last_checked_for_tasks = _get_last_checked_for_tasks(task_runners)
+        if last_checked_for_tasks is not None:
+            heartbeat.value = last_checked_for_tasks
+        time.sleep(HEARTBEAT_INTERVAL_SECONDS)
+
+    for task_runner in task_runners:
+        task_runner.stop()
+    for task_runner in task_runners:
+        task_runner.join()
+
+
+def _get_last_checked_for_tasks(task_runners: list[TaskRunner]) -> float | None:
+    """
+    Get the timestamp of the least recent check for tasks by any of the given
+    runners, or 0 if any of them has died. Returns None while runners are still
+    starting up.
+    """
+    timestamps = []
+    for task_runner in task_runners:
+        if not task_runner.is_alive():
+            return 0
+        if task_runner.last_checked_for_tasks:
+            timestamps.append(task_runner.last_checked_for_tasks.timestamp())
+    return min(timestamps) if len(timestamps) == len(task_runners) else None
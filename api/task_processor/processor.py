@@ -1,3 +1,4 @@
+import asyncio
 import logging
 import traceback
 import typing
@@ -34,13 +35,40 @@ def run_tasks(num_tasks: int = 1) -> typing.List[TaskRun]:
             executed_tasks.append(task)
             task_runs.append(task_run)
 
-        if executed_tasks:
-            Task.objects.bulk_update(
-                executed_tasks, fields=["completed", "num_failures", "is_locked"]
-            )
+        _save_task_runs(executed_tasks, task_runs)
 
-        if task_runs:
-            TaskRun.objects.bulk_create(task_runs)
+        return task_runs
+
+    logger.debug("No tasks to process.")
+    return []
+
+
+async def run_tasks_async(num_tasks: int = 1) -> typing.List[TaskRun]:
+    """
+    Run up to `num_tasks` tasks concurrently on the running event loop.
+
+    Coroutine task handlers are awaited directly, while any other task handler,
+    as well as any database access, runs in the loop's default executor.
+    """
+    if num_tasks < 1:
+        raise ValueError("Number of tasks to process must be at least one")
+
+    loop = asyncio.get_running_loop()
+    tasks = await loop.run_in_executor(
+        None, lambda: list(Task.objects.get_tasks_to_process(num_tasks))
+    )
+
+    if tasks:
+        executed_tasks = []
+        task_runs = []
+
+        for task, task_run in await asyncio.gather(
+            *(_run_task_async(task) for task in tasks)
+        ):
+            executed_tasks.append(task)
+            task_runs.append(task_run)
+
+        await loop.run_in_executor(None, _save_task_runs, executed_tasks, task_runs)
 
         return task_runs
 
@@ -48,6 +76,16 @@ def run_tasks(num_tasks: int = 1) -> typing.List[TaskRun]:
     return []
 
 
+def _save_task_runs(executed_tasks: typing.List[Task], task_runs: typing.List[TaskRun]):
+    if executed_tasks:
+        Task.objects.bulk_update(
+            executed_tasks, fields=["completed", "num_failures", "is_locked"]
+        )
+
+    if task_runs:
+        TaskRun.objects.bulk_create(task_runs)
+
+
 def run_recurring_tasks(num_tasks: int = 1) -> typing.List[RecurringTaskRun]:
     if num_tasks < 1:
         raise ValueError("Number of tasks to process must be at least one")
@@ -94,15 +132,42 @@ def _run_task(task: typing.Union[Task, RecurringTask]) -> typing.Tuple[Task, Tas
 
     try:
         task.run()
-        task_run.result = TaskResult.SUCCESS
-
-        task_run.finished_at = timezone.now()
-        task.mark_success()
+        _mark_success(task, task_run)
     except Exception as e:
-        logger.warning(e)
-        task.mark_failure()
+        _mark_failure(task, task_run, e)
+
+    return task, task_run
+
+
+async def _run_task_async(task: Task) -> typing.Tuple[Task, TaskRun]:
+    task_run = task.task_runs.model(started_at=timezone.now(), task=task)
 
-        task_run.result = TaskResult.FAILURE
-        task_run.error_details = str(traceback.format_exc())
+    try:
+        await task.run_async()
+        _mark_success(task, task_run)
+    except Exception as e:
+        _mark_failure(task, task_run, e)
 
     return task, task_run
+
+
+def _mark_success(
+    task: typing.Union[Task, RecurringTask],
+    task_run: typing.Union[TaskRun, RecurringTaskRun],
+) -> None:
+    task_run.result = TaskResult.SUCCESS
+
+    task_run.finished_at = timezone.now()
+    task.mark_success()
+
+
+def _mark_failure(
+    task: typing.Union[Task, RecurringTask],
+    task_run: typing.Union[TaskRun, RecurringTaskRun],
+    e: Exception,
+) -> None:
+    logger.warning(e)
+    task.mark_failure()
+
+    task_run.result = TaskResult.FAILURE
+    task_run.error_details = str(traceback.format_exc())
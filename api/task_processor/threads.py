@@ -1,11 +1,21 @@
+import asyncio
 import logging
 import time
 import traceback
+from concurrent.futures import ThreadPoolExecutor
 from threading import Thread
 
 from django.utils import timezone
 
-from task_processor.processor import run_recurring_tasks, run_tasks
+from task_processor.notifications import (
+    TaskCreatedListener,
+    is_listen_notify_enabled,
+)
+from task_processor.processor import (
+    run_recurring_tasks,
+    run_tasks,
+    run_tasks_async,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -24,12 +34,27 @@ class TaskRunner(Thread):
         self.last_checked_for_tasks = None
 
         self._stopped = False
+        self._listener = TaskCreatedListener()
 
     def run(self) -> None:
         while not self._stopped:
             self.last_checked_for_tasks = timezone.now()
             self.run_iteration()
-            time.sleep(self.sleep_interval_millis / 1000)
+            self.wait_for_tasks()
+
+    def wait_for_tasks(self) -> None:
+        timeout_seconds = self.sleep_interval_millis / 1000
+
+        if not is_listen_notify_enabled():
+            time.sleep(timeout_seconds)
+            return
+
+        try:
+            self._listener.wait(timeout_seconds)
+        except Exception as e:
+            logger.error("Received error waiting for tasks: %s.", e)
+            logger.debug(traceback.format_exc())
+            time.sleep(timeout_seconds)
 
     def run_iteration(self) -> None:
         try:
@@ -47,3 +72,50 @@ class TaskRunner(Thread):
 
     def stop(self):
         self._stopped = True
+
+
+class AsyncTaskRunner(TaskRunner):
+    """
+    Runs the tasks retrieved on each iteration concurrently on an asyncio event
+    loop, suited to I/O-bound task handlers (e.g. webhooks). Synchronous task
+    handlers run on a pool of up to `concurrency` threads.
+    """
+
+    def __init__(self, *args, concurrency: int = 10, **kwargs):
+        super(AsyncTaskRunner, self).__init__(*args, **kwargs)
+        self.concurrency = concurrency
+
+    def run(self) -> None:
+        asyncio.run(self._run())
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        loop.set_default_executor(
+            ThreadPoolExecutor(
+                max_workers=self.concurrency, thread_name_prefix=self.name
+            )
+        )
+
+        # Waiting for tasks keeps a database connection listening for
+        # notifications, so it needs a thread of its own.
+        with ThreadPoolExecutor(max_workers=1) as listener_executor:
+            while not self._stopped:
+                self.last_checked_for_tasks = timezone.now()
+                if await self.run_iteration_async() < self.queue_pop_size:
+                    await loop.run_in_executor(listener_executor, self.wait_for_tasks)
+
+    async def run_iteration_async(self) -> int:
+        """
+        Returns the number of tasks run, so that the runner can check for
+        more tasks straight away if the queue wasn't emptied.
+        """
+        try:
+            task_runs = await run_tasks_async(self.queue_pop_size)
+            await asyncio.get_running_loop().run_in_executor(
+                None, run_recurring_tasks, self.queue_pop_size
+            )
+            return len(task_runs)
+        except Exception as e:
+            logger.error("Received error retrieving tasks: %s.", e)
+            logger.debug(traceback.format_exc())
+            return 0
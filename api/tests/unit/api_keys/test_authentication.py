@@ -1,8 +1,14 @@
+import typing
+
 import pytest
+from django.test import RequestFactory
 from django.utils import timezone
+from pytest_django.fixtures import SettingsWrapper
+from pytest_mock import MockerFixture
 from rest_framework.exceptions import AuthenticationFailed
 
 from api_keys.authentication import MasterAPIKeyAuthentication
+from api_keys.models import MasterAPIKey
 
 
 def test_authenticate_returns_api_key_user_for_valid_key(master_api_key, rf):
@@ -64,3 +70,56 @@ def test_authenticate_raises_error_for_revoked_key(rf, master_api_key):
         MasterAPIKeyAuthentication().authenticate(request)
 
     # Then - exception was raised
+
+
+def test_authenticate_only_verifies_key_once_when_cached(
+    rf: RequestFactory,
+    master_api_key: tuple[MasterAPIKey, str],
+    settings: SettingsWrapper,
+    mocker: MockerFixture,
+) -> None:
+    # Given
+    settings.CACHE_MASTER_API_KEYS_SECONDS = 30
+    master_api_key, key = master_api_key
+    get_from_key_spy = mocker.spy(MasterAPIKey.objects, "get_from_key")
+
+    request = rf.get("/some-endpoint", HTTP_AUTHORIZATION="Api-Key " + key)
+
+    # When
+    first_user, _ = MasterAPIKeyAuthentication().authenticate(request)
+    second_user, _ = MasterAPIKeyAuthentication().authenticate(request)
+
+    # Then
+    assert first_user.key == second_user.key == master_api_key
+    get_from_key_spy.assert_called_once_with(key)
+
+
+@pytest.mark.parametrize(
+    "invalidate_key",
+    (
+        lambda master_api_key: MasterAPIKey.objects.filter(pk=master_api_key.pk).update(
+            revoked=True
+        ),
+        lambda master_api_key: master_api_key.delete(),
+    ),
+)
+def test_authenticate_raises_error_for_cached_key_revoked_or_deleted(
+    rf: RequestFactory,
+    master_api_key: tuple[MasterAPIKey, str],
+    settings: SettingsWrapper,
+    invalidate_key: typing.Callable[[MasterAPIKey], None],
+) -> None:
+    # Given
+    settings.CACHE_MASTER_API_KEYS_SECONDS = 30
+    master_api_key, key = master_api_key
+
+    request = rf.get("/some-endpoint", HTTP_AUTHORIZATION="Api-Key " + key)
+    MasterAPIKeyAuthentication().authenticate(request)
+
+    invalidate_key(master_api_key)
+
+    # When
+    with pytest.raises(AuthenticationFailed):
+        MasterAPIKeyAuthentication().authenticate(request)
+
+    # Then - exception was raised
@@ -57,3 +57,28 @@ def test_APIUsageMiddleware_avoids_calling_track_request_if_resoure_is_not_track
 
     # Then
     mocked_track_request.delay.assert_not_called()
+
+
+def test_APIUsageMiddleware_tracks_request_in_cache_if_enabled(rf, mocker, settings):
+    # Given
+    settings.API_USAGE_CACHE_SECONDS = 60
+    environment_key = "test"
+    headers = {"HTTP_X-Environment-Key": environment_key}
+    request = rf.get("/api/v1/flags", **headers)
+
+    mocked_track_request = mocker.patch("app_analytics.middleware.track_request")
+    mocked_api_usage_cache = mocker.patch("app_analytics.middleware.APIUsageCache")
+
+    mocked_get_response = mocker.MagicMock()
+    middleware = APIUsageMiddleware(mocked_get_response)
+
+    # When
+    middleware(request)
+
+    # Then
+    mocked_api_usage_cache.return_value.track_request.assert_called_once_with(
+        resource=Resource.FLAGS,
+        environment_key=environment_key,
+        host="testserver",
+    )
+    mocked_track_request.delay.assert_not_called()
@@ -14,6 +14,7 @@ from app_analytics.tasks import (
     populate_feature_evaluation_bucket,
     track_feature_evaluation,
     track_request,
+    track_requests,
 )
 from django.conf import settings
 from django.utils import timezone
@@ -165,6 +166,37 @@ def test_track_request(environment):
     )
 
 
+@pytest.mark.django_db(databases=["analytics", "default"])
+def test_track_requests(environment):
+    # Given
+    created_at = timezone.now().replace(second=0, microsecond=0)
+    api_usage = [
+        {
+            "environment_key": environment.api_key,
+            "resource": Resource.FLAGS,
+            "host": "testserver",
+            "count": 10,
+            "created_at": created_at.isoformat(),
+        },
+        {
+            "environment_key": "unknown-key",
+            "resource": Resource.FLAGS,
+            "host": "testserver",
+            "count": 5,
+            "created_at": created_at.isoformat(),
+        },
+    ]
+
+    # When
+    track_requests(api_usage)
+
+    # Then
+    api_usage_raw = APIUsageRaw.objects.get()
+    assert api_usage_raw.environment_id == environment.id
+    assert api_usage_raw.count == 10
+    assert api_usage_raw.created_at == created_at
+
+
 @pytest.mark.django_db(databases=["analytics"])
 def test_track_feature_evaluation():
     # Given
@@ -0,0 +1,112 @@
+from app_analytics.cache import APIUsageCache
+from app_analytics.models import Resource
+from pytest_django.fixtures import SettingsWrapper
+from pytest_mock import MockerFixture
+
+
+def test_api_usage_cache__aggregates_requests_and_flushes_after_interval(
+    mocker: MockerFixture,
+    settings: SettingsWrapper,
+    freezer,
+) -> None:
+    # Given
+    settings.API_USAGE_CACHE_SECONDS = 60
+    freezer.move_to("2024-06-10T09:09:47+00:00")
+    mocked_track_requests = mocker.patch("app_analytics.cache.track_requests")
+    cache = APIUsageCache()
+
+    # When
+    for _ in range(3):
+        cache.track_request(Resource.FLAGS, "testserver", "env-key-1")
+    cache.track_request(Resource.IDENTITIES, "testserver", "env-key-1")
+    cache.track_request(Resource.FLAGS, "testserver", "env-key-2")
+
+    # Then
+    mocked_track_requests.delay.assert_not_called()
+
+    # When
+    freezer.move_to("2024-06-10T09:10:48+00:00")
+    cache.track_request(Resource.FLAGS, "testserver", "env-key-1")
+
+    # Then
+    mocked_track_requests.delay.assert_called_once_with(
+        kwargs={
+            "api_usage": [
+                {
+                    "environment_key": "env-key-1",
+                    "resource": Resource.FLAGS,
+                    "host": "testserver",
+                    "count": 3,
+                    "created_at": "2024-06-10T09:09:00+00:00",
+                },
+                {
+                    "environment_key": "env-key-1",
+                    "resource": Resource.IDENTITIES,
+                    "host": "testserver",
+                    "count": 1,
+                    "created_at": "2024-06-10T09:09:00+00:00",
+                },
+                {
+                    "environment_key": "env-key-2",
+                    "resource": Resource.FLAGS,
+                    "host": "testserver",
+                    "count": 1,
+                    "created_at": "2024-06-10T09:09:00+00:00",
+                },
+                {
+                    "environment_key": "env-key-1",
+                    "resource": Resource.FLAGS,
+                    "host": "testserver",
+                    "count": 1,
+                    "created_at": "2024-06-10T09:10:00+00:00",
+                },
+            ]
+        }
+    )
+
+
+def test_api_usage_cache__flush__writes_pending_requests(
+    mocker: MockerFixture,
+    settings: SettingsWrapper,
+) -> None:
+    # Given
+    settings.API_USAGE_CACHE_SECONDS = 60
+    mocked_track_requests = mocker.patch("app_analytics.cache.track_requests")
+    cache = APIUsageCache()
+    cache.track_request(Resource.FLAGS, "testserver", "env-key")
+
+    # When
+    cache.flush()
+    cache.flush()
+
+    # Then
+    mocked_track_requests.delay.assert_called_once()
+    (api_usage,) = mocked_track_requests.delay.call_args.kwargs["kwargs"]["api_usage"]
+    assert api_usage["count"] == 1
+
+
+def test_api_usage_cache__schedules_flush_of_pending_requests(
+    mocker: MockerFixture,
+    settings: SettingsWrapper,
+) -> None:
+    # Given
+    settings.API_USAGE_CACHE_SECONDS = 60
+    mocked_timer = mocker.patch("app_analytics.cache.threading.Timer")
+    mocked_atexit = mocker.patch("app_analytics.cache.atexit")
+    mocker.patch("app_analytics.cache.track_requests")
+
+    # When
+    cache = APIUsageCache()
+    cache.track_request(Resource.FLAGS, "testserver", "env-key")
+    cache.track_request(Resource.FLAGS, "testserver", "env-key")
+
+    # Then
+    mocked_atexit.register.assert_called_once_with(cache.flush)
+    mocked_timer.assert_called_once_with(60, cache.flush)
+    mocked_timer.return_value.start.assert_called_once_with()
+
+    # When
+    cache.flush()
+
+    # Then
+    mocked_timer.return_value.cancel.assert_called_once_with()
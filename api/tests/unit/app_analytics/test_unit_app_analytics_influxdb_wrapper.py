@@ -9,16 +9,20 @@ from _pytest.monkeypatch import MonkeyPatch
 from app_analytics.influxdb_wrapper import (
     InfluxDBWrapper,
     build_filter_string,
+    close_write_api,
     get_event_list_for_organisation,
     get_events_for_organisation,
     get_feature_evaluation_data,
     get_multiple_event_list_for_feature,
     get_multiple_event_list_for_organisation,
     get_usage_data,
+    get_write_api,
 )
 from django.conf import settings
 from influxdb_client.client.exceptions import InfluxDBError
+from influxdb_client.client.write_api import SYNCHRONOUS, WriteType
 from influxdb_client.rest import ApiException
+from pytest_django.fixtures import SettingsWrapper
 from urllib3.exceptions import HTTPError
 
 # Given
@@ -36,6 +40,7 @@ def mock_influxdb_client(monkeypatch: Generator[MonkeyPatch, None, None]) -> Mag
     monkeypatch.setattr(
         app_analytics.influxdb_wrapper, "influxdb_client", mock_influxdb_client
     )
+    monkeypatch.setattr(app_analytics.influxdb_wrapper, "_write_api", None)
     return mock_influxdb_client
 
 
@@ -58,6 +63,55 @@ def test_write(mock_write_api: MagicMock) -> None:
     mock_write_api.write.assert_called()
 
 
+def test_get_write_api__batch_size_set__returns_shared_batching_write_api(
+    mock_influxdb_client: MagicMock,
+    settings: SettingsWrapper,
+) -> None:
+    # Given
+    settings.INFLUXDB_WRITE_BATCH_SIZE = 500
+    settings.INFLUXDB_WRITE_FLUSH_INTERVAL_MS = 2000
+
+    # When
+    write_apis = [get_write_api(), get_write_api()]
+
+    # Then
+    assert write_apis == [mock_influxdb_client.write_api.return_value] * 2
+    mock_influxdb_client.write_api.assert_called_once()
+    write_options = mock_influxdb_client.write_api.call_args.kwargs["write_options"]
+    assert write_options.write_type == WriteType.batching
+    assert write_options.batch_size == 500
+    assert write_options.flush_interval == 2000
+
+
+def test_get_write_api__batch_size_zero__returns_synchronous_write_api(
+    mock_influxdb_client: MagicMock,
+    settings: SettingsWrapper,
+) -> None:
+    # Given
+    settings.INFLUXDB_WRITE_BATCH_SIZE = 0
+
+    # When
+    get_write_api()
+
+    # Then
+    mock_influxdb_client.write_api.assert_called_once_with(write_options=SYNCHRONOUS)
+
+
+def test_close_write_api__flushes_and_closes_shared_write_api(
+    mock_write_api: MagicMock,
+) -> None:
+    # Given
+    get_write_api()
+
+    # When
+    close_write_api()
+
+    # Then
+    mock_write_api.close.assert_called_once_with()
+    assert get_write_api() == mock_write_api
+    assert mock_write_api.close.call_count == 1
+
+
 @pytest.mark.parametrize("exception_class", [HTTPError, InfluxDBError, ApiException])
 def test_write_handles_errors(
     mock_write_api: MagicMock,
@@ -3,6 +3,7 @@ from pytest_mock import MockerFixture
 from audit.models import AuditLog
 from audit.related_object_type import RelatedObjectType
 from audit.serializers import AuditLogListSerializer
+from environments.models import Environment, EnvironmentAPIKey
 from integrations.datadog.models import DataDogConfiguration
 from organisations.models import Organisation, OrganisationWebhook
 from projects.models import Project
@@ -228,3 +229,24 @@ def test_creating_audit_logs_for_change_request_does_not_trigger_process_environ
     # Then
     process_environment_update.delay.assert_not_called()
     assert audit_log.created_date != environment.updated_at
+
+
+def test_creating_audit_logs_clears_cached_environment(
+    environment: Environment,
+    environment_api_key: EnvironmentAPIKey,
+    reset_cache: None,
+    mocker: MockerFixture,
+) -> None:
+    # Given
+    mocker.patch("environments.tasks.process_environment_update")
+
+    Environment.get_from_cache(environment.api_key)
+    Environment.get_from_cache(environment_api_key.key)
+
+    # When
+    audit_log = AuditLog.objects.create(environment=environment)
+
+    # Then
+    for api_key in (environment.api_key, environment_api_key.key):
+        cached_environment = Environment.get_from_cache(api_key)
+        assert cached_environment.updated_at == audit_log.created_date
@@ -0,0 +1,129 @@
+import pytest
+from core.cache import CompressedValue, TieredCache
+from django.core.cache import caches
+from pytest_django.fixtures import SettingsWrapper
+from pytest_mock import MockerFixture
+
+SHARED_CACHE_NAME = "test-shared-cache"
+
+
+@pytest.fixture()
+def shared_cache(settings: SettingsWrapper):
+    settings.CACHES = {
+        **settings.CACHES,
+        SHARED_CACHE_NAME: {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": SHARED_CACHE_NAME,
+        },
+    }
+    shared_cache = caches[SHARED_CACHE_NAME]
+    yield shared_cache
+    shared_cache.clear()
+
+
+def _get_tiered_cache(location: str, **options) -> TieredCache:
+    tiered_cache = TieredCache(
+        location,
+        {"TIMEOUT": 60, "OPTIONS": {"SHARED_CACHE": SHARED_CACHE_NAME, **options}},
+    )
+    tiered_cache.clear()
+    return tiered_cache
+
+
+def test_tiered_cache__get__serves_from_local_tier(
+    shared_cache, mocker: MockerFixture
+) -> None:
+    # Given
+    tiered_cache = _get_tiered_cache("test-local-tier")
+    tiered_cache.set("key", {"foo": "bar"})
+
+    shared_cache_get = mocker.spy(shared_cache, "get")
+
+    # When
+    value = tiered_cache.get("key")
+
+    # Then
+    assert value == {"foo": "bar"}
+    shared_cache_get.assert_not_called()
+
+
+def test_tiered_cache__get__falls_back_to_shared_tier(shared_cache) -> None:
+    # Given
+    tiered_cache = _get_tiered_cache("test-shared-tier")
+
+    # a value set by another process
+    shared_cache.set("key", "value")
+
+    # When
+    value = tiered_cache.get("key")
+
+    # Then
+    assert value == "value"
+    assert tiered_cache._get_local(tiered_cache.make_key("key")) == "value"
+
+
+def test_tiered_cache__local_tier_is_bounded(shared_cache) -> None:
+    # Given
+    tiered_cache = _get_tiered_cache("test-bounded", LOCAL_MAX_ENTRIES=2)
+
+    # When
+    tiered_cache.set("key_1", 1)
+    tiered_cache.set("key_2", 2)
+    tiered_cache.get("key_1")
+    tiered_cache.set("key_3", 3)
+
+    # Then
+    # the least recently used key has been evicted from the local tier
+    assert list(tiered_cache._local_cache) == [
+        tiered_cache.make_key("key_1"),
+        tiered_cache.make_key("key_3"),
+    ]
+    # but is still available in the shared tier
+    assert tiered_cache.get("key_2") == 2
+
+
+def test_tiered_cache__local_tier_expires(shared_cache, mocker: MockerFixture) -> None:
+    # Given
+    tiered_cache = _get_tiered_cache("test-expiry", LOCAL_TIMEOUT=10)
+    mocked_time = mocker.patch("core.cache.time")
+    mocked_time.monotonic.return_value = 100
+
+    tiered_cache.set("key", "value")
+    shared_cache.set("key", "updated value")
+
+    # When
+    mocked_time.monotonic.return_value = 111
+    value = tiered_cache.get("key")
+
+    # Then
+    assert value == "updated value"
+
+
+def test_tiered_cache__delete__removes_from_both_tiers(shared_cache) -> None:
+    # Given
+    tiered_cache = _get_tiered_cache("test-delete")
+    tiered_cache.set("key", "value")
+
+    # When
+    tiered_cache.delete("key")
+
+    # Then
+    assert tiered_cache.get("key") is None
+    assert shared_cache.get("key") is None
+
+
+def test_tiered_cache__compress__stores_compressed_value_in_shared_tier(
+    shared_cache,
+) -> None:
+    # Given
+    tiered_cache = _get_tiered_cache("test-compress", COMPRESS=True)
+    value = {"feature_states": ["feature_state"] * 100}
+
+    # When
+    tiered_cache.set("key", value)
+
+    # Then
+    assert isinstance(shared_cache.get("key"), CompressedValue)
+
+    tiered_cache._local_cache.clear()
+    assert tiered_cache.get("key") == value
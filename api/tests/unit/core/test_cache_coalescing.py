@@ -0,0 +1,199 @@
+import threading
+from unittest.mock import Mock
+
+import pytest
+from core.cache_coalescing import get_or_set_coalesced, set_coalesced
+from django.core.cache.backends.locmem import LocMemCache
+from pytest_django.fixtures import SettingsWrapper
+
+
+@pytest.fixture()
+def cache() -> LocMemCache:
+    cache = LocMemCache("test-cache-coalescing", {})
+    cache.clear()
+    yield cache
+    cache.clear()
+
+
+def test_get_or_set_coalesced__value_in_cache__returns_cached_value(
+    cache: LocMemCache,
+) -> None:
+    # Given
+    cache.set("key", "cached")
+    default = Mock()
+
+    # When
+    value = get_or_set_coalesced(cache, "key", default, timeout=60)
+
+    # Then
+    assert value == "cached"
+    default.assert_not_called()
+
+
+def test_get_or_set_coalesced__value_not_in_cache__builds_and_sets_value(
+    cache: LocMemCache,
+) -> None:
+    # When
+    value = get_or_set_coalesced(cache, "key", lambda: "built", timeout=60)
+
+    # Then
+    assert value == "built"
+    assert cache.get("key") == "built"
+
+
+def test_get_or_set_coalesced__caching_disabled__does_not_set_value(
+    cache: LocMemCache,
+) -> None:
+    # When
+    value = get_or_set_coalesced(cache, "key", lambda: "built", timeout=0)
+
+    # Then
+    assert value == "built"
+    assert cache.get("key") is None
+
+
+def test_get_or_set_coalesced__concurrent_misses__builds_value_once(
+    cache: LocMemCache,
+) -> None:
+    # Given
+    build_started = threading.Event()
+    release_build = threading.Event()
+    build_count = 0
+
+    def default() -> str:
+        nonlocal build_count
+        build_count += 1
+        build_started.set()
+        release_build.wait(timeout=5)
+        return "built"
+
+    results = []
+
+    def get() -> None:
+        results.append(get_or_set_coalesced(cache, "key", default, timeout=60))
+
+    first_thread = threading.Thread(target=get)
+    first_thread.start()
+    build_started.wait(timeout=5)
+
+    waiting_threads = [threading.Thread(target=get) for _ in range(5)]
+    for thread in waiting_threads:
+        thread.start()
+
+    # When
+    release_build.set()
+    for thread in [first_thread, *waiting_threads]:
+        thread.join(timeout=5)
+
+    # Then
+    assert build_count == 1
+    assert results == ["built"] * 6
+
+
+def test_get_or_set_coalesced__stale_value__revalidates_value(
+    cache: LocMemCache,
+    settings: SettingsWrapper,
+) -> None:
+    # Given
+    settings.CACHE_STALE_WHILE_REVALIDATE_SECONDS = 30
+    cache.set("key", "stale")
+
+    # When
+    value = get_or_set_coalesced(cache, "key", lambda: "revalidated", timeout=60)
+
+    # Then
+    assert value == "revalidated"
+    assert cache.get("key") == "revalidated"
+    assert cache.get("key:fresh") is True
+
+
+def test_get_or_set_coalesced__stale_value_being_revalidated__serves_stale_value(
+    cache: LocMemCache,
+    settings: SettingsWrapper,
+) -> None:
+    # Given
+    settings.CACHE_STALE_WHILE_REVALIDATE_SECONDS = 30
+    cache.set("key", "stale")
+
+    # another caller has claimed the revalidation, but not finished it yet
+    cache.add("key:fresh", True)
+    default = Mock()
+
+    # When
+    value = get_or_set_coalesced(cache, "key", default, timeout=60)
+
+    # Then
+    assert value == "stale"
+    default.assert_not_called()
+
+
+def test_get_or_set_coalesced__revalidation_fails__serves_stale_value(
+    cache: LocMemCache,
+    settings: SettingsWrapper,
+) -> None:
+    # Given
+    settings.CACHE_STALE_WHILE_REVALIDATE_SECONDS = 30
+    cache.set("key", "stale")
+    default = Mock(side_effect=Exception("Database is down"))
+
+    # When
+    value = get_or_set_coalesced(cache, "key", default, timeout=60)
+
+    # Then
+    assert value == "stale"
+    assert cache.get("key:fresh") is None
+
+
+def test_set_coalesced__stale_while_revalidate__value_is_served_as_fresh(
+    cache: LocMemCache,
+    settings: SettingsWrapper,
+) -> None:
+    # Given
+    settings.CACHE_STALE_WHILE_REVALIDATE_SECONDS = 30
+    default = Mock()
+
+    # When
+    set_coalesced(cache, "key", "prebuilt", timeout=60)
+    value = get_or_set_coalesced(cache, "key", default, timeout=60)
+
+    # Then
+    assert value == "prebuilt"
+    assert cache.get("key:fresh") is True
+    default.assert_not_called()
+
+
+def test_get_or_set_coalesced__distributed_lock_held__waits_for_value(
+    cache: LocMemCache,
+    settings: SettingsWrapper,
+) -> None:
+    # Given
+    settings.CACHE_COALESCING_USE_DISTRIBUTED_LOCK = True
+
+    # another process is building the value
+    cache.add("key:lock", True)
+    threading.Timer(0.1, lambda: cache.set("key", "built elsewhere")).start()
+    default = Mock()
+
+    # When
+    value = get_or_set_coalesced(cache, "key", default, timeout=60)
+
+    # Then
+    assert value == "built elsewhere"
+    default.assert_not_called()
+
+
+def test_get_or_set_coalesced__distributed_lock_not_released__builds_value(
+    cache: LocMemCache,
+    settings: SettingsWrapper,
+) -> None:
+    # Given
+    settings.CACHE_COALESCING_USE_DISTRIBUTED_LOCK = True
+    settings.CACHE_COALESCING_LOCK_TIMEOUT_SECONDS = 0.1
+    cache.add("key:lock", True)
+
+    # When
+    value = get_or_set_coalesced(cache, "key", lambda: "built", timeout=60)
+
+    # Then
+    assert value == "built"
+    assert cache.get("key") == "built"
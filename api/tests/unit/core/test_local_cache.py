@@ -0,0 +1,60 @@
+from unittest.mock import Mock
+
+from core.local_cache import VersionedLocalCache
+
+
+def test_versioned_local_cache__same_version__returns_cached_value() -> None:
+    # Given
+    cache = VersionedLocalCache(lambda: 10)
+    value = object()
+    cache.get_or_build("key", version=1, build=lambda: value)
+    build = Mock()
+
+    # When
+    result = cache.get_or_build("key", version=1, build=build)
+
+    # Then
+    assert result is value
+    build.assert_not_called()
+
+
+def test_versioned_local_cache__new_version__rebuilds_value() -> None:
+    # Given
+    cache = VersionedLocalCache(lambda: 10)
+    cache.get_or_build("key", version=1, build=lambda: "old")
+
+    # When
+    result = cache.get_or_build("key", version=2, build=lambda: "new")
+
+    # Then
+    assert result == "new"
+    assert cache.get_or_build("key", version=2, build=Mock()) == "new"
+
+
+def test_versioned_local_cache__old_version__does_not_replace_newer_value() -> None:
+    # Given
+    cache = VersionedLocalCache(lambda: 10)
+    cache.get_or_build("key", version=2, build=lambda: "new")
+
+    # When
+    result = cache.get_or_build("key", version=1, build=lambda: "old")
+
+    # Then
+    assert result == "old"
+    assert cache.get_or_build("key", version=2, build=Mock()) == "new"
+
+
+def test_versioned_local_cache__max_entries__evicts_least_recently_used() -> None:
+    # Given
+    cache = VersionedLocalCache(lambda: 2)
+    cache.get_or_build("a", version=1, build=lambda: "a")
+    cache.get_or_build("b", version=1, build=lambda: "b")
+    cache.get_or_build("a", version=1, build=Mock())
+
+    # When
+    cache.get_or_build("c", version=1, build=lambda: "c")
+
+    # Then
+    build = Mock(return_value="rebuilt")
+    assert cache.get_or_build("a", version=1, build=build) == "a"
+    assert cache.get_or_build("b", version=1, build=build) == "rebuilt"
@@ -1,4 +1,5 @@
 import pytest
+import requests
 
 from edge_api.identities.models import EdgeIdentity
 from environments.models import Environment
@@ -15,12 +16,13 @@ def forwarder_mocked_migrator(mocker):
 
 
 @pytest.fixture()
-def forwarder_mocked_requests(mocker):
-    return mocker.patch(
-        "edge_api.identities.edge_request_forwarder.requests",
-        autospec=True,
-        spec_set=True,
+def forwarder_mocked_session(mocker):
+    session = mocker.MagicMock(spec=requests.Session)
+    mocker.patch(
+        "edge_api.identities.edge_request_forwarder.get_session",
+        return_value=session,
     )
+    return session
 
 
 @pytest.fixture()
@@ -1,21 +1,39 @@
 import json
+from unittest.mock import MagicMock
 
 import pytest
+import requests
 from core.constants import FLAGSMITH_SIGNATURE_HEADER
+from pytest_django.fixtures import SettingsWrapper
+from pytest_mock import MockerFixture
 
+from edge_api.identities import edge_request_forwarder
 from edge_api.identities.edge_request_forwarder import (
+    EdgeRequestBuffer,
     forward_identity_request,
+    forward_identity_request_async,
+    forward_requests,
     forward_trait_request,
+    forward_trait_request_async,
     forward_trait_request_sync,
     forward_trait_requests,
+    forward_trait_requests_async,
+    get_session,
 )
 
 
+@pytest.fixture(autouse=True)
+def clear_migrated_project_ids() -> None:
+    edge_request_forwarder._migrated_project_ids.clear()
+    yield
+    edge_request_forwarder._migrated_project_ids.clear()
+
+
 @pytest.mark.parametrize(
     "forwarder_function", [forward_identity_request, forward_trait_request_sync]
 )
 def test_forwarder_function_makes_no_request_if_migration_is_not_yet_done(
-    mocker, forwarder_mocked_requests, forwarder_mocked_migrator, forwarder_function
+    mocker, forwarder_mocked_session, forwarder_mocked_migrator, forwarder_function
 ):
     # Given
     project_id = 1
@@ -28,7 +46,7 @@ def test_forwarder_function_makes_no_request_if_migration_is_not_yet_done(
     # When
     forwarder_function("GET", {}, project_id, None)
     # Then
-    assert forwarder_mocked_requests.mock_calls == []
+    assert forwarder_mocked_session.mock_calls == []
 
     forwarder_mocked_migrator.assert_called_with(project_id)
 
@@ -37,7 +55,7 @@ def test_forward_identity_request_makes_correct_get_request(
     mocker,
     forward_enable_settings,
     forwarder_mocked_migrator,
-    forwarder_mocked_requests,
+    forwarder_mocked_session,
 ):
     # Given
     project_id = 1
@@ -55,7 +73,7 @@ def test_forward_identity_request_makes_correct_get_request(
     forward_identity_request("GET", headers, project_id, query_params)
 
     # Then
-    args, kwargs = forwarder_mocked_requests.get.call_args
+    args, kwargs = forwarder_mocked_session.get.call_args
     assert args[0] == forward_enable_settings.EDGE_API_URL + "identities/"
     assert kwargs["params"] == query_params
     assert kwargs["headers"]["X-Environment-Key"] == api_key
@@ -68,7 +86,7 @@ def test_forward_identity_request_makes_correct_post_request(
     mocker,
     forward_enable_settings,
     forwarder_mocked_migrator,
-    forwarder_mocked_requests,
+    forwarder_mocked_session,
 ):
     # Given
     project_id = 1
@@ -86,7 +104,7 @@ def test_forward_identity_request_makes_correct_post_request(
     forward_identity_request("POST", headers, project_id, request_data=request_data)
 
     # Then
-    args, kwargs = forwarder_mocked_requests.post.call_args
+    args, kwargs = forwarder_mocked_session.post.call_args
     assert args[0] == forward_enable_settings.EDGE_API_URL + "identities/"
 
     assert kwargs["data"] == json.dumps(request_data)
@@ -100,7 +118,7 @@ def test_forward_trait_request_sync_makes_correct_post_request(
     mocker,
     forward_enable_settings,
     forwarder_mocked_migrator,
-    forwarder_mocked_requests,
+    forwarder_mocked_session,
 ):
     # Given
     project_id = 1
@@ -121,7 +139,7 @@ def test_forward_trait_request_sync_makes_correct_post_request(
     forward_trait_request_sync("POST", headers, project_id, payload=request_data)
 
     # Then
-    args, kwargs = forwarder_mocked_requests.post.call_args
+    args, kwargs = forwarder_mocked_session.post.call_args
     assert args[0] == forward_enable_settings.EDGE_API_URL + "traits/"
 
     assert kwargs["data"] == json.dumps(request_data)
@@ -175,3 +193,220 @@ def test_forward_trait_requests_calls_sync_function_correctly(mocker):
             mocker.call(request_method, headers, project_id, payload[1]),
         ]
     )
+
+
+def test_should_forward__migration_done__is_cached(
+    mocker: MockerFixture,
+    forward_enable_settings: SettingsWrapper,
+    forwarder_mocked_migrator: MagicMock,
+    forwarder_mocked_session: MagicMock,
+) -> None:
+    # Given
+    type(forwarder_mocked_migrator.return_value).is_migration_done = (
+        mocker.PropertyMock(return_value=True)
+    )
+
+    # When
+    forward_identity_request("GET", {}, 1, {"identifier": "identity_1"})
+    forward_identity_request("GET", {}, 1, {"identifier": "identity_2"})
+
+    # Then
+    forwarder_mocked_migrator.assert_called_once_with(1)
+    assert forwarder_mocked_session.get.call_count == 2
+
+
+def test_get_session__returns_shared_session_per_process(
+    mocker: MockerFixture,
+) -> None:
+    # Given
+    session = get_session()
+
+    # When
+    same_process_session = get_session()
+    mocker.patch(
+        "edge_api.identities.edge_request_forwarder.os.getpid", return_value=-1
+    )
+    forked_process_session = get_session()
+
+    # Then
+    assert same_process_session is session
+    assert forked_process_session is not session
+    assert isinstance(forked_process_session, requests.Session)
+
+
+def test_forward_requests__sends_each_request(
+    mocker: MockerFixture,
+    forward_enable_settings: SettingsWrapper,
+    forwarder_mocked_migrator: MagicMock,
+    forwarder_mocked_session: MagicMock,
+) -> None:
+    # Given
+    type(forwarder_mocked_migrator.return_value).is_migration_done = (
+        mocker.PropertyMock(return_value=True)
+    )
+    headers = {"X-Environment-Key": "test_api_key", "Content-Length": ""}
+    trait_data = {"identity": {"identifier": "identity_2"}, "trait_key": "key"}
+    requests_to_forward = [
+        edge_request_forwarder._build_identity_request(
+            "GET", headers, query_params={"identifier": "identity_1"}
+        ),
+        edge_request_forwarder._build_trait_request(headers, trait_data),
+    ]
+
+    # a failure which doesn't prevent the rest of the batch being forwarded
+    forwarder_mocked_session.get.side_effect = requests.ConnectionError()
+
+    # When
+    forward_requests(1, requests_to_forward)
+
+    # Then
+    args, kwargs = forwarder_mocked_session.get.call_args
+    assert args[0] == forward_enable_settings.EDGE_API_URL + "identities/"
+    assert kwargs["params"] == {"identifier": "identity_1"}
+    assert "Content-Length" not in kwargs["headers"]
+
+    args, kwargs = forwarder_mocked_session.post.call_args
+    assert args[0] == forward_enable_settings.EDGE_API_URL + "traits/"
+    assert kwargs["data"] == json.dumps(trait_data)
+    assert kwargs["headers"][FLAGSMITH_SIGNATURE_HEADER]
+
+
+def test_forward_requests__migration_not_done__makes_no_request(
+    mocker: MockerFixture,
+    forwarder_mocked_migrator: MagicMock,
+    forwarder_mocked_session: MagicMock,
+) -> None:
+    # Given
+    type(forwarder_mocked_migrator.return_value).is_migration_done = (
+        mocker.PropertyMock(return_value=False)
+    )
+
+    # When
+    forward_requests(
+        1, [edge_request_forwarder._build_trait_request({}, {"trait_key": "key"})]
+    )
+
+    # Then
+    assert forwarder_mocked_session.mock_calls == []
+
+
+def test_forward_async__buffering_disabled__creates_task_per_request(
+    mocker: MockerFixture,
+    settings: SettingsWrapper,
+) -> None:
+    # Given
+    settings.EDGE_REQUEST_FORWARDING_BUFFER_SECONDS = 0
+    mocked_forward_identity_request = mocker.patch.object(
+        edge_request_forwarder, "forward_identity_request"
+    )
+    mocked_forward_trait_request = mocker.patch.object(
+        edge_request_forwarder, "forward_trait_request"
+    )
+    mocked_forward_trait_requests = mocker.patch.object(
+        edge_request_forwarder, "forward_trait_requests"
+    )
+    headers = {"X-Environment-Key": "test_api_key"}
+    trait_data = {"identity": {"identifier": "identity_1"}, "trait_key": "key"}
+
+    # When
+    forward_identity_request_async("POST", headers, 1, request_data={"a": "b"})
+    forward_trait_request_async("POST", headers, 1, trait_data)
+    forward_trait_requests_async("PUT", headers, 1, [trait_data])
+
+    # Then
+    mocked_forward_identity_request.delay.assert_called_once_with(
+        args=("POST", headers, 1),
+        kwargs={"query_params": None, "request_data": {"a": "b"}},
+    )
+    mocked_forward_trait_request.delay.assert_called_once_with(
+        args=("POST", headers, 1, trait_data)
+    )
+    mocked_forward_trait_requests.delay.assert_called_once_with(
+        args=("PUT", headers, 1, [trait_data])
+    )
+
+
+def test_forward_async__buffering_enabled__buffers_requests(
+    mocker: MockerFixture,
+    settings: SettingsWrapper,
+) -> None:
+    # Given
+    settings.EDGE_REQUEST_FORWARDING_BUFFER_SECONDS = 5
+    mocked_buffer = mocker.patch.object(edge_request_forwarder, "edge_request_buffer")
+    headers = {"X-Environment-Key": "test_api_key"}
+    trait_data = {"identity": {"identifier": "identity_1"}, "trait_key": "key"}
+
+    # When
+    forward_identity_request_async("GET", headers, 1, query_params={"a": "b"})
+    forward_trait_request_async("POST", headers, 1, trait_data)
+    forward_trait_requests_async("PUT", headers, 2, [trait_data, trait_data])
+
+    # Then
+    identity_request = edge_request_forwarder._build_identity_request(
+        "GET", headers, query_params={"a": "b"}
+    )
+    trait_request = edge_request_forwarder._build_trait_request(headers, trait_data)
+    assert mocked_buffer.add.call_args_list == [
+        mocker.call(1, identity_request),
+        mocker.call(1, trait_request),
+        mocker.call(2, trait_request),
+        mocker.call(2, trait_request),
+    ]
+
+
+def test_edge_request_buffer__batch_size_reached__flushes_project(
+    mocker: MockerFixture,
+    settings: SettingsWrapper,
+) -> None:
+    # Given
+    settings.EDGE_REQUEST_FORWARDING_BUFFER_SECONDS = 60
+    settings.EDGE_REQUEST_FORWARDING_BATCH_SIZE = 2
+    mocked_forward_requests = mocker.patch.object(
+        edge_request_forwarder, "forward_requests"
+    )
+    buffer = EdgeRequestBuffer()
+
+    # When
+    buffer.add(1, {"request": 1})
+    buffer.add(2, {"request": 2})
+    buffer.add(1, {"request": 3})
+
+    # Then
+    mocked_forward_requests.delay.assert_called_once_with(
+        args=(1, [{"request": 1}, {"request": 3}])
+    )
+
+    # and the other project is forwarded when the buffer is flushed
+    mocked_forward_requests.reset_mock()
+    buffer.flush()
+    mocked_forward_requests.delay.assert_called_once_with(args=(2, [{"request": 2}]))
+
+
+def test_edge_request_buffer__buffer_seconds_elapsed__flushes_all_projects(
+    mocker: MockerFixture,
+    settings: SettingsWrapper,
+) -> None:
+    # Given
+    settings.EDGE_REQUEST_FORWARDING_BUFFER_SECONDS = 60
+    mocked_forward_requests = mocker.patch.object(
+        edge_request_forwarder, "forward_requests"
+    )
+    mocked_timer = mocker.patch(
+        "edge_api.identities.edge_request_forwarder.threading.Timer"
+    )
+    buffer = EdgeRequestBuffer()
+
+    buffer.add(1, {"request": 1})
+    buffer.add(2, {"request": 2})
+
+    # When
+    # a single timer is started for the buffer
+    mocked_timer.assert_called_once_with(60, buffer.flush)
+    buffer.flush()
+
+    # Then
+    assert mocked_forward_requests.delay.call_args_list == [
+        mocker.call(args=(1, [{"request": 1}])),
+        mocker.call(args=(2, [{"request": 2}])),
+    ]
+    mocked_timer.return_value.cancel.assert_called_once_with()
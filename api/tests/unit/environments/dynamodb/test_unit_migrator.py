@@ -1,4 +1,9 @@
+from decimal import Decimal
+
+import pytest
 from pytest_django.asserts import assertQuerysetEqual as assert_queryset_equal
+from pytest_django.fixtures import SettingsWrapper
+from pytest_mock import MockerFixture
 
 from environments.dynamodb.migrator import IdentityMigrator
 from environments.dynamodb.types import (
@@ -7,6 +12,7 @@ from environments.dynamodb.types import (
 )
 from environments.identities.models import Identity
 from environments.models import Environment, EnvironmentAPIKey
+from projects.models import Project
 
 
 def test_migrate_calls_internal_methods_with_correct_arguments(
@@ -14,6 +20,7 @@ def test_migrate_calls_internal_methods_with_correct_arguments(
 ):
     # Given
     settings.EDGE_RELEASE_DATETIME = None
+    settings.IDENTITY_MIGRATION_MAX_WORKERS = 1
 
     assert project.enable_dynamo_db is False
     mocked_project_metadata = mocker.patch(
@@ -26,7 +33,11 @@ def test_migrate_calls_internal_methods_with_correct_arguments(
         "environments.dynamodb.migrator.DynamoEnvironmentAPIKeyWrapper", autospec=True
     )
     mocked_project_metadata_instance = mocker.MagicMock(
-        spec=DynamoProjectMetadata, id=project.id
+        spec=DynamoProjectMetadata,
+        id=project.id,
+        identity_migration_status=ProjectIdentityMigrationStatus.MIGRATION_SCHEDULED,
+        migrated_until_identity_id=None,
+        migrated_identities_count=0,
     )
     mocked_project_metadata.get_or_new.return_value = mocked_project_metadata_instance
 
@@ -64,6 +75,10 @@ def test_migrate_calls_internal_methods_with_correct_arguments(
 
     # and, Make sure that Project Metadata Wrapper was called correctly
     mocked_project_metadata.get_or_new.assert_called_with(project.id)
+    mocked_project_metadata_instance.start_identity_migration.assert_called_once_with()
+    mocked_project_metadata_instance.checkpoint_identity_migration.assert_called_once_with(
+        migrated_until_identity_id=identity.id, migrated_identities_count=1
+    )
     mocked_project_metadata_instance.finish_identity_migration.assert_called_once_with()
     project.refresh_from_db()
 
@@ -71,6 +86,152 @@ def test_migrate_calls_internal_methods_with_correct_arguments(
     assert project.enable_dynamo_db is True
 
 
+def test_migrate__migration_in_progress__resumes_from_last_checkpoint(
+    mocker: MockerFixture,
+    project: Project,
+    environment: Environment,
+    identity: Identity,
+    settings: SettingsWrapper,
+) -> None:
+    # Given
+    settings.IDENTITY_MIGRATION_MAX_WORKERS = 1
+    identity_to_migrate = Identity.objects.create(
+        identifier="identity_to_migrate", environment=environment
+    )
+
+    mocked_project_metadata = mocker.patch(
+        "environments.dynamodb.migrator.DynamoProjectMetadata", autospec=True
+    )
+    mocker.patch("environments.dynamodb.migrator.DynamoEnvironmentWrapper")
+    mocker.patch("environments.dynamodb.migrator.DynamoEnvironmentAPIKeyWrapper")
+    mocked_identity_wrapper = mocker.patch(
+        "environments.dynamodb.migrator.DynamoIdentityWrapper", autospec=True
+    )
+    mocked_project_metadata_instance = mocker.MagicMock(
+        spec=DynamoProjectMetadata,
+        id=project.id,
+        identity_migration_status=ProjectIdentityMigrationStatus.MIGRATION_IN_PROGRESS,
+        migrated_until_identity_id=Decimal(identity.id),
+        migrated_identities_count=Decimal(1),
+    )
+    mocked_project_metadata.get_or_new.return_value = mocked_project_metadata_instance
+
+    identity_migrator = IdentityMigrator(project.id)
+
+    # When
+    identity_migrator.migrate()
+
+    # Then
+    mocked_project_metadata_instance.start_identity_migration.assert_not_called()
+
+    args, _ = mocked_identity_wrapper.return_value.write_identities.call_args
+    assert list(args[0]) == [identity_to_migrate]
+
+    mocked_project_metadata_instance.checkpoint_identity_migration.assert_called_once_with(
+        migrated_until_identity_id=identity_to_migrate.id,
+        migrated_identities_count=2,
+    )
+    mocked_project_metadata_instance.finish_identity_migration.assert_called_once_with()
+
+
+def test_migrate__multiple_workers__writes_chunks_and_checkpoints_in_order(
+    mocker: MockerFixture,
+    project: Project,
+    environment: Environment,
+    settings: SettingsWrapper,
+) -> None:
+    # Given
+    settings.IDENTITY_MIGRATION_CHUNK_SIZE = 2
+    settings.IDENTITY_MIGRATION_MAX_WORKERS = 2
+    identity_ids = [
+        Identity.objects.create(identifier=f"identity_{i}", environment=environment).id
+        for i in range(5)
+    ]
+
+    mocked_project_metadata = mocker.patch(
+        "environments.dynamodb.migrator.DynamoProjectMetadata", autospec=True
+    )
+    mocker.patch("environments.dynamodb.migrator.DynamoEnvironmentWrapper")
+    mocker.patch("environments.dynamodb.migrator.DynamoEnvironmentAPIKeyWrapper")
+    mocked_write_identities = mocker.patch.object(
+        IdentityMigrator, "_write_identities", autospec=True
+    )
+    mocked_project_metadata_instance = mocker.MagicMock(
+        spec=DynamoProjectMetadata,
+        id=project.id,
+        identity_migration_status=ProjectIdentityMigrationStatus.MIGRATION_SCHEDULED,
+        migrated_until_identity_id=None,
+        migrated_identities_count=0,
+    )
+    mocked_project_metadata.get_or_new.return_value = mocked_project_metadata_instance
+
+    identity_migrator = IdentityMigrator(project.id)
+
+    # When
+    identity_migrator.migrate()
+
+    # Then
+    expected_chunks = [identity_ids[0:2], identity_ids[2:4], identity_ids[4:]]
+    assert sorted(
+        call.args[1] for call in mocked_write_identities.call_args_list
+    ) == sorted(expected_chunks)
+
+    assert (
+        mocked_project_metadata_instance.checkpoint_identity_migration.call_args_list
+        == [
+            mocker.call(
+                migrated_until_identity_id=identity_ids[1], migrated_identities_count=2
+            ),
+            mocker.call(
+                migrated_until_identity_id=identity_ids[3], migrated_identities_count=4
+            ),
+            mocker.call(
+                migrated_until_identity_id=identity_ids[4], migrated_identities_count=5
+            ),
+        ]
+    )
+    mocked_project_metadata_instance.finish_identity_migration.assert_called_once_with()
+
+
+def test_migrate__write_fails__does_not_checkpoint_or_finish_migration(
+    mocker: MockerFixture,
+    project: Project,
+    identity: Identity,
+    settings: SettingsWrapper,
+) -> None:
+    # Given
+    settings.IDENTITY_MIGRATION_MAX_WORKERS = 2
+    mocked_project_metadata = mocker.patch(
+        "environments.dynamodb.migrator.DynamoProjectMetadata", autospec=True
+    )
+    mocker.patch("environments.dynamodb.migrator.DynamoEnvironmentWrapper")
+    mocker.patch("environments.dynamodb.migrator.DynamoEnvironmentAPIKeyWrapper")
+    mocker.patch.object(
+        IdentityMigrator,
+        "_write_identities",
+        autospec=True,
+        side_effect=RuntimeError("write failed"),
+    )
+    mocked_project_metadata_instance = mocker.MagicMock(
+        spec=DynamoProjectMetadata,
+        id=project.id,
+        identity_migration_status=ProjectIdentityMigrationStatus.MIGRATION_SCHEDULED,
+        migrated_until_identity_id=None,
+        migrated_identities_count=0,
+    )
+    mocked_project_metadata.get_or_new.return_value = mocked_project_metadata_instance
+
+    identity_migrator = IdentityMigrator(project.id)
+
+    # When
+    with pytest.raises(RuntimeError):
+        identity_migrator.migrate()
+
+    # Then
+    mocked_project_metadata_instance.checkpoint_identity_migration.assert_not_called()
+    mocked_project_metadata_instance.finish_identity_migration.assert_not_called()
+
+
 def test_trigger_migration_calls_internal_methods_with_correct_arguments(
     mocker, project
 ):
@@ -166,3 +327,31 @@ def test_get_migration_status_returns_correct_migraion_status_for_in_progress_mi
     # Then
     assert status == ProjectIdentityMigrationStatus.MIGRATION_IN_PROGRESS
     mocked_project_metadata.get_or_new.assert_called_with(project_id)
+
+
+@pytest.mark.parametrize(
+    "migration_status, expected_can_resume",
+    (
+        (ProjectIdentityMigrationStatus.MIGRATION_NOT_STARTED, False),
+        (ProjectIdentityMigrationStatus.MIGRATION_SCHEDULED, False),
+        (ProjectIdentityMigrationStatus.MIGRATION_IN_PROGRESS, True),
+        (ProjectIdentityMigrationStatus.MIGRATION_COMPLETED, False),
+    ),
+)
+def test_can_resume(
+    mocker: MockerFixture,
+    migration_status: ProjectIdentityMigrationStatus,
+    expected_can_resume: bool,
+) -> None:
+    # Given
+    mocked_project_metadata = mocker.patch(
+        "environments.dynamodb.migrator.DynamoProjectMetadata"
+    )
+    mocked_project_metadata.get_or_new.return_value = mocker.MagicMock(
+        spec=DynamoProjectMetadata, identity_migration_status=migration_status
+    )
+
+    identity_migrator = IdentityMigrator(1)
+
+    # Then
+    assert identity_migrator.can_resume is expected_can_resume
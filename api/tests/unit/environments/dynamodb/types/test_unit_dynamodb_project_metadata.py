@@ -1,16 +1,26 @@
+import typing
 from datetime import datetime
 from decimal import Decimal
 
 import pytest
 from mypy_boto3_dynamodb.service_resource import Table
+from pytest_django.fixtures import SettingsWrapper
 from pytest_mock import MockerFixture
 
 from environments.dynamodb.types import (
     DynamoProjectMetadata,
     ProjectIdentityMigrationStatus,
+    project_metadata_cache,
 )
 
 
+@pytest.fixture()
+def clear_project_metadata_cache() -> None:
+    project_metadata_cache.clear()
+    yield
+    project_metadata_cache.clear()
+
+
 def test_get_or_new_returns_instance_with_default_values_if_document_does_not_exists(
     mocker,
 ):
@@ -83,6 +93,8 @@ def test_start_identity_migration_calls_put_item_with_correct_arguments(mocker):
             "migration_end_time": None,
             "migration_start_time": migration_start_time.isoformat(),
             "triggered_at": None,
+            "migrated_until_identity_id": None,
+            "migrated_identities_count": 0,
         }
     )
 
@@ -146,10 +158,73 @@ def test_finish_identity_migration_calls_put_item_with_correct_arguments(
             "migration_start_time": migration_start_time,
             "migration_end_time": migration_end_time.isoformat(),
             "triggered_at": None,
+            "migrated_until_identity_id": None,
+            "migrated_identities_count": 0,
         }
     )
 
 
+def test_checkpoint_identity_migration_calls_put_item_with_correct_arguments(
+    mocker: MockerFixture,
+) -> None:
+    # Given
+    project_id = 1
+    migration_start_time = datetime.now().isoformat()
+    mocked_dynamo_table = mocker.patch(
+        "environments.dynamodb.types.project_metadata_table"
+    )
+
+    project_metadata = DynamoProjectMetadata(
+        id=project_id, migration_start_time=migration_start_time
+    )
+
+    # When
+    project_metadata.checkpoint_identity_migration(
+        migrated_until_identity_id=100, migrated_identities_count=50
+    )
+
+    # Then
+    mocked_dynamo_table.put_item.assert_called_with(
+        Item={
+            "id": project_id,
+            "migration_start_time": migration_start_time,
+            "migration_end_time": None,
+            "triggered_at": None,
+            "migrated_until_identity_id": 100,
+            "migrated_identities_count": 50,
+        }
+    )
+
+
+@pytest.mark.parametrize(
+    "instance",
+    (
+        DynamoProjectMetadata(id=1),
+        DynamoProjectMetadata(
+            id=1,
+            migration_start_time=datetime.now().isoformat(),
+            migration_end_time=datetime.now().isoformat(),
+        ),
+    ),
+)
+def test_checkpoint_identity_migration_raises_error_if_migration_is_not_in_progress(
+    mocker: MockerFixture, instance: DynamoProjectMetadata
+) -> None:
+    # Given
+    mocked_dynamo_table = mocker.patch(
+        "environments.dynamodb.types.project_metadata_table"
+    )
+
+    # When
+    with pytest.raises(AttributeError):
+        instance.checkpoint_identity_migration(
+            migrated_until_identity_id=100, migrated_identities_count=50
+        )
+
+    # Then
+    mocked_dynamo_table.put_item.assert_not_called()
+
+
 def test_delete__removes_project_metadata_document_from_dynamodb(
     flagsmith_project_metadata_table: Table, mocker: MockerFixture
 ):
@@ -174,3 +249,103 @@ def test_delete__removes_project_metadata_document_from_dynamodb(
     assert (
         flagsmith_project_metadata_table.scan()["Items"][0]["id"] == second_project_id
     )
+
+
+@pytest.mark.parametrize(
+    "change_migration_state",
+    (
+        DynamoProjectMetadata.trigger_identity_migration,
+        DynamoProjectMetadata.start_identity_migration,
+        DynamoProjectMetadata.delete,
+    ),
+)
+def test_get_or_new__cache_enabled__reads_document_until_migration_state_changes(
+    clear_project_metadata_cache: None,
+    settings: SettingsWrapper,
+    mocker: MockerFixture,
+    change_migration_state: typing.Callable[[DynamoProjectMetadata], None],
+) -> None:
+    # Given
+    settings.CACHE_PROJECT_METADATA_SECONDS = 60
+    project_id = 1
+    mocked_dynamo_table = mocker.patch(
+        "environments.dynamodb.types.project_metadata_table"
+    )
+    mocked_dynamo_table.get_item.return_value = {"Item": {"id": Decimal(project_id)}}
+
+    project_metadata = DynamoProjectMetadata.get_or_new(project_id)
+    assert DynamoProjectMetadata.get_or_new(project_id) == project_metadata
+    mocked_dynamo_table.get_item.assert_called_once_with(Key={"id": project_id})
+
+    # When
+    change_migration_state(project_metadata)
+    DynamoProjectMetadata.get_or_new(project_id)
+
+    # Then
+    assert mocked_dynamo_table.get_item.call_count == 2
+
+
+def test_get_or_new__cache_enabled__caches_missing_document(
+    clear_project_metadata_cache: None,
+    settings: SettingsWrapper,
+    mocker: MockerFixture,
+) -> None:
+    # Given
+    settings.CACHE_PROJECT_METADATA_SECONDS = 60
+    mocked_dynamo_table = mocker.patch(
+        "environments.dynamodb.types.project_metadata_table"
+    )
+    mocked_dynamo_table.get_item.return_value = {}
+
+    # When
+    first_project_metadata = DynamoProjectMetadata.get_or_new(1)
+    second_project_metadata = DynamoProjectMetadata.get_or_new(1)
+
+    # Then
+    assert first_project_metadata == second_project_metadata == DynamoProjectMetadata(1)
+    mocked_dynamo_table.get_item.assert_called_once_with(Key={"id": 1})
+
+
+def test_get_or_new__cache_disabled__reads_document_every_time(
+    clear_project_metadata_cache: None,
+    mocker: MockerFixture,
+) -> None:
+    # Given
+    mocked_dynamo_table = mocker.patch(
+        "environments.dynamodb.types.project_metadata_table"
+    )
+    mocked_dynamo_table.get_item.return_value = {}
+
+    # When
+    DynamoProjectMetadata.get_or_new(1)
+    DynamoProjectMetadata.get_or_new(1)
+
+    # Then
+    assert mocked_dynamo_table.get_item.call_count == 2
+
+
+def test_start_identity_migration__cache_enabled__read_during_write_is_not_kept(
+    clear_project_metadata_cache: None,
+    settings: SettingsWrapper,
+    mocker: MockerFixture,
+) -> None:
+    # Given
+    settings.CACHE_PROJECT_METADATA_SECONDS = 60
+    project_id = 1
+    mocked_dynamo_table = mocker.patch(
+        "environments.dynamodb.types.project_metadata_table"
+    )
+    mocked_dynamo_table.get_item.return_value = {"Item": {"id": Decimal(project_id)}}
+    # a concurrent request reads, and caches, the document while it's written
+    mocked_dynamo_table.put_item.side_effect = (
+        lambda **kwargs: DynamoProjectMetadata.get_or_new(project_id)
+    )
+
+    project_metadata = DynamoProjectMetadata(id=project_id)
+
+    # When
+    project_metadata.start_identity_migration()
+    DynamoProjectMetadata.get_or_new(project_id)
+
+    # Then
+    assert mocked_dynamo_table.get_item.call_count == 2
@@ -0,0 +1,110 @@
+import pytest
+from mypy_boto3_dynamodb.service_resource import Table
+from pytest_mock import MockerFixture
+
+from environments.dynamodb.constants import DYNAMODB_MAX_BATCH_WRITE_ATTEMPTS
+from environments.dynamodb.exceptions import UnprocessedItemsError
+from environments.dynamodb.wrappers.base import BaseDynamoWrapper
+
+
+@pytest.fixture()
+def dynamo_wrapper(mocker: MockerFixture) -> BaseDynamoWrapper:
+    wrapper = BaseDynamoWrapper()
+    wrapper._table = mocker.MagicMock()
+    wrapper._table.name = "table"
+    return wrapper
+
+
+@pytest.fixture()
+def mocked_sleep(mocker: MockerFixture):
+    return mocker.patch("environments.dynamodb.wrappers.base.time.sleep")
+
+
+def test_batch_delete_items__deletes_items_from_table(
+    flagsmith_identities_table: Table,
+) -> None:
+    # Given
+    wrapper = BaseDynamoWrapper()
+    wrapper._table = flagsmith_identities_table
+    for i in range(30):
+        flagsmith_identities_table.put_item(Item={"composite_key": f"key_{i}"})
+
+    # When
+    deleted_count = wrapper.batch_delete_items(
+        ({"composite_key": f"key_{i}"} for i in range(20)),
+        max_workers=2,
+    )
+
+    # Then
+    assert deleted_count == 20
+    assert flagsmith_identities_table.scan()["Count"] == 10
+
+
+def test_batch_delete_items__unprocessed_items__retries_them(
+    dynamo_wrapper: BaseDynamoWrapper,
+    mocked_sleep,
+) -> None:
+    # Given
+    keys = [{"id": 1}, {"id": 2}]
+    unprocessed_items = {"table": [{"DeleteRequest": {"Key": {"id": 2}}}]}
+    mocked_batch_write_item = dynamo_wrapper.table.meta.client.batch_write_item
+    mocked_batch_write_item.side_effect = [
+        {"UnprocessedItems": unprocessed_items},
+        {"UnprocessedItems": {}},
+    ]
+
+    # When
+    deleted_count = dynamo_wrapper.batch_delete_items(keys)
+
+    # Then
+    assert deleted_count == 2
+    assert [
+        call.kwargs["RequestItems"] for call in mocked_batch_write_item.call_args_list
+    ] == [
+        {
+            "table": [
+                {"DeleteRequest": {"Key": {"id": 1}}},
+                {"DeleteRequest": {"Key": {"id": 2}}},
+            ]
+        },
+        unprocessed_items,
+    ]
+    mocked_sleep.assert_called_once()
+
+
+def test_batch_delete_items__items_remain_unprocessed__raises_error(
+    dynamo_wrapper: BaseDynamoWrapper,
+    mocked_sleep,
+) -> None:
+    # Given
+    mocked_batch_write_item = dynamo_wrapper.table.meta.client.batch_write_item
+    mocked_batch_write_item.return_value = {
+        "UnprocessedItems": {"table": [{"DeleteRequest": {"Key": {"id": 1}}}]}
+    }
+
+    # When
+    with pytest.raises(UnprocessedItemsError):
+        dynamo_wrapper.batch_delete_items([{"id": 1}], max_workers=2)
+
+    # Then
+    assert mocked_batch_write_item.call_count == DYNAMODB_MAX_BATCH_WRITE_ATTEMPTS
+
+
+def test_batch_delete_items__max_items_per_second__throttles_deletes(
+    dynamo_wrapper: BaseDynamoWrapper,
+    mocker: MockerFixture,
+    mocked_sleep,
+) -> None:
+    # Given
+    mocker.patch("environments.dynamodb.wrappers.base.time.monotonic", return_value=100)
+    dynamo_wrapper.table.meta.client.batch_write_item.return_value = {}
+
+    # When
+    dynamo_wrapper.batch_delete_items(
+        [{"id": i} for i in range(50)], max_items_per_second=25
+    )
+
+    # Then
+    # the first batch of 25 items is deleted straight away, the second one
+    # a second later
+    mocked_sleep.assert_called_once_with(1)
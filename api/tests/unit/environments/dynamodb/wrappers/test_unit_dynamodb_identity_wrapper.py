@@ -7,6 +7,7 @@ from django.core.exceptions import ObjectDoesNotExist
 from flag_engine.identities.models import IdentityModel
 from flag_engine.segments.constants import IN
 from mypy_boto3_dynamodb.service_resource import Table
+from pytest_django.fixtures import SettingsWrapper
 from pytest_mock import MockerFixture
 from rest_framework.exceptions import NotFound
 
@@ -494,3 +495,30 @@ def test_delete_all_identities__deletes_all_identities_documents_from_dynamodb(
     # Then
     assert flagsmith_identities_table.scan()["Count"] == 1
     assert flagsmith_identities_table.scan()["Items"][0] == identity_three
+
+
+@pytest.mark.parametrize("max_workers", (1, 3))
+def test_delete_all_identities__many_identities__deletes_them_in_batches(
+    flagsmith_identities_table: Table,
+    dynamodb_identity_wrapper: DynamoIdentityWrapper,
+    settings: SettingsWrapper,
+    max_workers: int,
+) -> None:
+    # Given
+    settings.DYNAMO_IDENTITIES_DELETION_MAX_WORKERS = max_workers
+    environment_api_key = "environment_one"
+    with flagsmith_identities_table.batch_writer() as writer:
+        for i in range(110):
+            writer.put_item(
+                Item={
+                    "composite_key": f"{environment_api_key}_identity_{i}",
+                    "environment_api_key": environment_api_key,
+                    "identifier": f"identity_{i}",
+                }
+            )
+
+    # When
+    dynamodb_identity_wrapper.delete_all_identities(environment_api_key)
+
+    # Then
+    assert flagsmith_identities_table.scan()["Count"] == 0
@@ -0,0 +1,226 @@
+import json
+
+import pytest
+from core.constants import STRING
+from django.urls import reverse
+from pytest_django.fixtures import SettingsWrapper
+from pytest_mock import MockerFixture
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from environments.identities.evaluation import environment_evaluation_contexts
+from environments.identities.models import Identity
+from environments.identities.traits.models import Trait
+from environments.models import Environment
+from features.models import Feature, FeatureState
+
+
+@pytest.fixture(autouse=True)
+def clear_evaluation_contexts() -> None:
+    environment_evaluation_contexts.clear()
+    yield
+    environment_evaluation_contexts.clear()
+
+
+def _post_bulk(api_client: APIClient, data: list[dict]):
+    return api_client.post(
+        reverse("api-v1:sdk-identities-bulk"),
+        data=json.dumps(data),
+        content_type="application/json",
+    )
+
+
+def _read_streamed_json(response) -> list[dict]:
+    return json.loads(b"".join(response.streaming_content))
+
+
+def _sort_flags(response_json: dict) -> list[dict]:
+    return sorted(response_json["flags"], key=lambda flag: flag["feature"]["id"])
+
+
+@pytest.mark.parametrize("in_memory", (True, False))
+def test_sdk_identities_bulk__returns_same_response_as_identify(
+    environment: Environment,
+    identity: Identity,
+    trait: Trait,
+    feature: Feature,
+    api_client: APIClient,
+    settings: SettingsWrapper,
+    in_memory: bool,
+) -> None:
+    # Given
+    settings.USE_IN_MEMORY_IDENTITY_EVALUATION = in_memory
+    api_client.credentials(HTTP_X_ENVIRONMENT_KEY=environment.api_key)
+
+    identity_override = FeatureState.objects.create(
+        feature=feature, identity=identity, environment=environment, enabled=True
+    )
+    identity_override.feature_state_value.string_value = "identity override"
+    identity_override.feature_state_value.save()
+
+    data = [
+        {
+            "identifier": identity.identifier,
+            "traits": [{"trait_key": "new_trait", "trait_value": 1}],
+        },
+        {
+            "identifier": "new_identity",
+            "traits": [{"trait_key": "trait_key", "trait_value": "value"}],
+        },
+    ]
+
+    # When
+    response = _post_bulk(api_client, data)
+
+    # Then
+    assert response.status_code == status.HTTP_200_OK
+    assert response["Content-Type"] == "application/json"
+    response_json = _read_streamed_json(response)
+    assert [item["identifier"] for item in response_json] == [
+        identity.identifier,
+        "new_identity",
+    ]
+
+    for item, request_data in zip(response_json, data):
+        expected_response = api_client.post(
+            reverse("api-v1:sdk-identities"),
+            data=json.dumps(request_data),
+            content_type="application/json",
+        ).json()
+        assert item["traits"] == expected_response["traits"]
+        assert _sort_flags(item) == _sort_flags(expected_response)
+
+    assert response_json[0]["flags"][0]["feature_state_value"] == "identity override"
+    assert {(t.trait_key, t.trait_value) for t in identity.identity_traits.all()} == {
+        (trait.trait_key, trait.trait_value),
+        ("new_trait", 1),
+    }
+    assert Identity.objects.filter(
+        identifier="new_identity", environment=environment
+    ).exists()
+
+
+def test_sdk_identities_bulk__transient_traits__not_persisted(
+    environment: Environment,
+    identity: Identity,
+    api_client: APIClient,
+) -> None:
+    # Given
+    api_client.credentials(HTTP_X_ENVIRONMENT_KEY=environment.api_key)
+    data = [
+        {
+            "identifier": identity.identifier,
+            "traits": [{"trait_key": "nulled", "trait_value": None}],
+        },
+    ]
+
+    # When
+    response = _post_bulk(api_client, data)
+
+    # Then
+    assert response.status_code == status.HTTP_200_OK
+    assert _read_streamed_json(response)[0]["traits"] == []
+    assert not identity.identity_traits.filter(trait_key="nulled").exists()
+
+
+def test_sdk_identities_bulk__identity_created_concurrently__upserts_traits(
+    environment: Environment,
+    api_client: APIClient,
+    mocker: MockerFixture,
+) -> None:
+    # Given
+    # the identity and its trait are created by a concurrent request, after
+    # the existing identities are read
+    identity = Identity.objects.create(identifier="new", environment=environment)
+    Trait.objects.create(
+        identity=identity,
+        trait_key="plan",
+        value_type=STRING,
+        string_value="free",
+    )
+    mocker.patch.object(
+        Identity.objects,
+        "get_or_create_many_for_sdk",
+        return_value=[(identity, True)],
+    )
+
+    api_client.credentials(HTTP_X_ENVIRONMENT_KEY=environment.api_key)
+    data = [
+        {
+            "identifier": identity.identifier,
+            "traits": [{"trait_key": "plan", "trait_value": "paid"}],
+        },
+    ]
+
+    # When
+    response = _post_bulk(api_client, data)
+
+    # Then
+    assert response.status_code == status.HTTP_200_OK
+    assert identity.identity_traits.get(trait_key="plan").trait_value == "paid"
+
+
+def test_sdk_identities_bulk__too_many_identities__returns_400(
+    environment: Environment,
+    api_client: APIClient,
+    settings: SettingsWrapper,
+) -> None:
+    # Given
+    settings.BULK_IDENTIFY_MAX_IDENTITIES = 1
+    api_client.credentials(HTTP_X_ENVIRONMENT_KEY=environment.api_key)
+    data = [{"identifier": "identity_1"}, {"identifier": "identity_2"}]
+
+    # When
+    response = _post_bulk(api_client, data)
+
+    # Then
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert response.json() == {
+        "non_field_errors": [
+            "Cannot identify more than 1 identities in a single request."
+        ]
+    }
+    assert not Identity.objects.filter(environment=environment).exists()
+
+
+def test_sdk_identities_bulk__duplicate_identifiers__returns_400(
+    environment: Environment,
+    api_client: APIClient,
+) -> None:
+    # Given
+    api_client.credentials(HTTP_X_ENVIRONMENT_KEY=environment.api_key)
+    data = [{"identifier": "identity_1"}, {"identifier": "identity_1"}]
+
+    # When
+    response = _post_bulk(api_client, data)
+
+    # Then
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert response.json() == {"non_field_errors": ["Identifiers must be unique."]}
+
+
+def test_sdk_identities_bulk__edge_enabled__forwards_each_identity(
+    environment: Environment,
+    api_client: APIClient,
+    settings: SettingsWrapper,
+    mocker: MockerFixture,
+) -> None:
+    # Given
+    settings.EDGE_API_URL = "http://localhost"
+    environment.project.enable_dynamo_db = True
+    environment.project.save()
+    forward_identity_request_async = mocker.patch(
+        "environments.identities.views.forward_identity_request_async"
+    )
+
+    api_client.credentials(HTTP_X_ENVIRONMENT_KEY=environment.api_key)
+    data = [{"identifier": "identity_1"}, {"identifier": "identity_2"}]
+
+    # When
+    response = _post_bulk(api_client, data)
+
+    # Then
+    assert response.status_code == status.HTTP_200_OK
+    assert [call.kwargs for call in forward_identity_request_async.call_args_list] == [
+        {"request_data": item} for item in data
+    ]
@@ -0,0 +1,291 @@
+import json
+
+import pytest
+from core.request_origin import RequestOrigin
+from django.urls import reverse
+from django.utils import timezone
+from pytest_django import DjangoAssertNumQueries
+from pytest_django.fixtures import SettingsWrapper
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from environments.identities.evaluation import (
+    can_evaluate_identities_in_memory,
+    environment_evaluation_contexts,
+    get_environment_evaluation_context,
+    get_identity_evaluated_feature_states,
+)
+from environments.identities.models import Identity
+from environments.identities.traits.models import Trait
+from environments.models import Environment, EnvironmentAPIKey
+from features.models import Feature, FeatureSegment, FeatureState
+from integrations.amplitude.models import AmplitudeConfiguration
+from segments.models import Segment
+
+
+@pytest.fixture(autouse=True)
+def clear_evaluation_contexts() -> None:
+    environment_evaluation_contexts.clear()
+    yield
+    environment_evaluation_contexts.clear()
+
+
+@pytest.fixture()
+def in_memory_identity_evaluation(settings: SettingsWrapper) -> None:
+    settings.USE_IN_MEMORY_IDENTITY_EVALUATION = True
+
+
+@pytest.fixture()
+def identity_feature_states(
+    environment: Environment,
+    identity: Identity,
+    trait: Trait,
+    identity_matching_segment: Segment,
+    feature: Feature,
+    multivariate_feature: Feature,
+) -> None:
+    """
+    Environment defaults, a segment override, an identity override and a
+    server key only feature for the identity.
+    """
+    segment_override_feature = Feature.objects.create(
+        name="segment_override_feature", project=environment.project
+    )
+    feature_segment = FeatureSegment.objects.create(
+        feature=segment_override_feature,
+        segment=identity_matching_segment,
+        environment=environment,
+    )
+    segment_override = FeatureState.objects.create(
+        feature=segment_override_feature,
+        feature_segment=feature_segment,
+        environment=environment,
+        enabled=True,
+    )
+    segment_override.feature_state_value.string_value = "segment override"
+    segment_override.feature_state_value.save()
+
+    identity_override = FeatureState.objects.create(
+        feature=feature, identity=identity, environment=environment, enabled=True
+    )
+    identity_override.feature_state_value.string_value = "identity override"
+    identity_override.feature_state_value.save()
+
+    Feature.objects.create(
+        name="server_key_only_feature",
+        project=environment.project,
+        is_server_key_only=True,
+    )
+
+
+def _sort_flags(response_json: dict) -> list[dict]:
+    return sorted(response_json["flags"], key=lambda flag: flag["feature"]["id"])
+
+
+@pytest.mark.parametrize("server_side", (True, False))
+def test_sdk_identities_get__in_memory_evaluation__returns_same_response(
+    identity_feature_states: None,
+    environment: Environment,
+    identity: Identity,
+    api_client: APIClient,
+    settings: SettingsWrapper,
+    server_side: bool,
+) -> None:
+    # Given
+    api_key = (
+        EnvironmentAPIKey.objects.create(environment=environment).key
+        if server_side
+        else environment.api_key
+    )
+    api_client.credentials(HTTP_X_ENVIRONMENT_KEY=api_key)
+    url = f"{reverse('api-v1:sdk-identities')}?identifier={identity.identifier}"
+
+    expected_response = api_client.get(url).json()
+
+    settings.USE_IN_MEMORY_IDENTITY_EVALUATION = True
+
+    # When
+    response = api_client.get(url)
+
+    # Then
+    assert response.status_code == status.HTTP_200_OK
+    response_json = response.json()
+    assert response_json["traits"] == expected_response["traits"]
+    assert _sort_flags(response_json) == _sort_flags(expected_response)
+    assert len(response_json["flags"]) == (4 if server_side else 3)
+
+
+def test_sdk_identities_post__in_memory_evaluation__returns_same_response(
+    identity_feature_states: None,
+    environment: Environment,
+    identity: Identity,
+    api_client: APIClient,
+    settings: SettingsWrapper,
+) -> None:
+    # Given
+    api_client.credentials(HTTP_X_ENVIRONMENT_KEY=environment.api_key)
+    url = reverse("api-v1:sdk-identities")
+    data = json.dumps(
+        {
+            "identifier": identity.identifier,
+            "traits": [{"trait_key": "new_trait", "trait_value": 1}],
+        }
+    )
+
+    expected_response = api_client.post(
+        url, data=data, content_type="application/json"
+    ).json()
+
+    settings.USE_IN_MEMORY_IDENTITY_EVALUATION = True
+
+    # When
+    response = api_client.post(url, data=data, content_type="application/json")
+
+    # Then
+    assert response.status_code == status.HTTP_200_OK
+    response_json = response.json()
+    assert response_json["traits"] == expected_response["traits"]
+    assert _sort_flags(response_json) == _sort_flags(expected_response)
+
+
+def test_sdk_identities_get__in_memory_evaluation_for_feature__returns_flag(
+    identity_feature_states: None,
+    in_memory_identity_evaluation: None,
+    environment: Environment,
+    identity: Identity,
+    feature: Feature,
+    api_client: APIClient,
+) -> None:
+    # Given
+    api_client.credentials(HTTP_X_ENVIRONMENT_KEY=environment.api_key)
+    url = (
+        f"{reverse('api-v1:sdk-identities')}"
+        f"?identifier={identity.identifier}&feature={feature.name}"
+    )
+
+    # When
+    response = api_client.get(url)
+
+    # Then
+    assert response.status_code == status.HTTP_200_OK
+    response_json = response.json()
+    assert response_json["feature"]["id"] == feature.id
+    assert response_json["feature_state_value"] == "identity override"
+    assert response_json["identity"] == identity.id
+
+
+def test_get_identity_evaluated_feature_states__context_built__reads_identity_only(
+    identity_feature_states: None,
+    environment: Environment,
+    identity: Identity,
+    django_assert_num_queries: DjangoAssertNumQueries,
+) -> None:
+    # Given
+    identity = Identity.objects.get_or_create_for_sdk(
+        identifier=identity.identifier, environment=environment, integrations=[]
+    )[0]
+    get_environment_evaluation_context(environment)
+
+    # When
+    # the identity's traits are prefetched, so we only read its overrides and
+    # their multivariate values
+    with django_assert_num_queries(2):
+        feature_states = get_identity_evaluated_feature_states(
+            identity, environment=environment, origin=RequestOrigin.SERVER
+        )
+
+    # Then
+    assert len(feature_states) == 4
+
+
+def test_get_identity_evaluated_feature_states__feature_deleted__skips_feature(
+    environment: Environment,
+    identity: Identity,
+    feature: Feature,
+) -> None:
+    # Given
+    # the environment document still contains the feature, which has been
+    # deleted since it was built
+    context = get_environment_evaluation_context(environment)
+    del context.features_by_id[feature.id]
+
+    # When
+    feature_states = get_identity_evaluated_feature_states(
+        identity, environment=environment, origin=RequestOrigin.SERVER
+    )
+
+    # Then
+    assert feature.id not in {
+        feature_state.feature.id for feature_state in feature_states
+    }
+
+
+def test_get_environment_evaluation_context__environment_updated__rebuilds_context(
+    environment: Environment,
+    feature: Feature,
+) -> None:
+    # Given
+    context = get_environment_evaluation_context(environment)
+
+    # When
+    new_feature = Feature.objects.create(name="new_feature", project=feature.project)
+    environment.updated_at = timezone.now()
+    environment.save()
+    new_context = get_environment_evaluation_context(environment)
+
+    # Then
+    assert get_environment_evaluation_context(environment) is new_context
+    assert new_context is not context
+    assert new_feature.id in new_context.features_by_id
+    assert new_feature.id not in context.features_by_id
+
+
+def test_get_environment_evaluation_context__max_environments__evicts_least_recent(
+    environment: Environment,
+    environment_two: Environment,
+    settings: SettingsWrapper,
+) -> None:
+    # Given
+    settings.IN_MEMORY_IDENTITY_EVALUATION_MAX_ENVIRONMENTS = 1
+    context = get_environment_evaluation_context(environment)
+
+    # When
+    get_environment_evaluation_context(environment_two)
+
+    # Then
+    assert get_environment_evaluation_context(environment) is not context
+
+
+def test_can_evaluate_identities_in_memory__identity_integration__returns_false(
+    in_memory_identity_evaluation: None,
+    environment: Environment,
+) -> None:
+    # Given
+    AmplitudeConfiguration.objects.create(api_key="abc-123", environment=environment)
+
+    # When
+    result = can_evaluate_identities_in_memory(environment)
+
+    # Then
+    assert result is False
+
+
+def test_can_evaluate_identities_in_memory__enabled__returns_true(
+    in_memory_identity_evaluation: None,
+    environment: Environment,
+) -> None:
+    # When
+    result = can_evaluate_identities_in_memory(environment)
+
+    # Then
+    assert result is True
+
+
+def test_can_evaluate_identities_in_memory__disabled__returns_false(
+    environment: Environment,
+) -> None:
+    # When
+    result = can_evaluate_identities_in_memory(environment)
+
+    # Then
+    assert result is False
@@ -9,6 +9,7 @@ from flag_engine.segments.constants import (
     NOT_EQUAL,
 )
 from pytest_django import DjangoAssertNumQueries
+from pytest_mock import MockerFixture
 
 from environments.identities.models import Identity
 from environments.identities.traits.models import Trait
@@ -726,6 +727,77 @@ def test_update_traits_deletes_when_nulled_out(environment: Environment) -> None
     assert updated_traits[0].trait_value == trait_2_value
 
 
+def test_bulk_update_traits(
+    environment: Environment,
+    django_assert_num_queries: DjangoAssertNumQueries,
+) -> None:
+    # Given
+    identity_1 = Identity.objects.create(
+        identifier="identity_1", environment=environment
+    )
+    identity_2 = Identity.objects.create(
+        identifier="identity_2", environment=environment
+    )
+    create_trait_for_identity(identity_1, "trait_1", 1)
+    create_trait_for_identity(identity_1, "trait_2", 2)
+    create_trait_for_identity(identity_2, "trait_1", 1)
+
+    trait_data_items_by_identity = {
+        identity_1: [
+            generate_trait_data_item(trait_key="trait_1", trait_value=5),
+            generate_trait_data_item(trait_key="trait_2", trait_value=None),
+        ],
+        identity_2: [
+            generate_trait_data_item(trait_key="trait_1", trait_value=1),
+            generate_trait_data_item(trait_key="trait_3", trait_value="three"),
+        ],
+    }
+
+    # When
+    # read, delete and upsert
+    with django_assert_num_queries(3):
+        traits_by_identity = Identity.bulk_update_traits(trait_data_items_by_identity)
+
+    # Then
+    assert {
+        trait.trait_key: trait.trait_value
+        for trait in traits_by_identity[identity_1.id]
+    } == {"trait_1": 5}
+    assert {
+        trait.trait_key: trait.trait_value
+        for trait in traits_by_identity[identity_2.id]
+    } == {"trait_1": 1, "trait_3": "three"}
+
+    for identity, traits in traits_by_identity.items():
+        assert {
+            trait.trait_key: trait.trait_value
+            for trait in Trait.objects.filter(identity_id=identity)
+        } == {trait.trait_key: trait.trait_value for trait in traits}
+
+
+def test_get_or_create_many_for_sdk(
+    environment: Environment,
+    identity: Identity,
+) -> None:
+    # Given
+    identifiers = ["new_identity", identity.identifier]
+
+    # When
+    result = Identity.objects.get_or_create_many_for_sdk(
+        identifiers, environment=environment, integrations=[]
+    )
+
+    # Then
+    assert [(identity.identifier, created) for identity, created in result] == [
+        ("new_identity", True),
+        (identity.identifier, False),
+    ]
+    assert result[1][0] == identity
+    assert Identity.objects.filter(
+        identifier="new_identity", environment=environment
+    ).exists()
+
+
 def test_get_identity_segments(
     django_assert_num_queries: DjangoAssertNumQueries,
     environment: Environment,
@@ -1003,3 +1075,31 @@ def test_identity_get_all_feature_states__returns_identity_override__when_v2_fea
     # Then
     assert len(all_feature_states) == 1
     assert all_feature_states[0] == identity_override
+
+
+def test_get_all_feature_states__v2_versioning__does_not_query_each_version(
+    environment_v2_versioning: Environment,
+    project: Project,
+    mocker: MockerFixture,
+    django_assert_num_queries: DjangoAssertNumQueries,
+) -> None:
+    # Given
+    for i in range(3):
+        Feature.objects.create(name=f"feature_{i}", project=project)
+
+    identity = Identity.objects.create(
+        identifier="test-identity", environment=environment_v2_versioning
+    )
+    mocker.patch.object(Identity, "get_segments", return_value=[])
+
+    # the project is needed to check whether disabled flags are hidden
+    assert environment_v2_versioning.project
+
+    # When
+    # feature states and their multivariate values
+    with django_assert_num_queries(2):
+        feature_states = identity.get_all_feature_states()
+
+    # Then
+    assert len(feature_states) == 3
+    assert all(fs.environment_feature_version_id for fs in feature_states)
@@ -8,6 +8,7 @@ from django.urls import reverse
 from django.utils import timezone
 from flag_engine.segments.constants import PERCENTAGE_SPLIT
 from pytest_django import DjangoAssertNumQueries
+from pytest_django.fixtures import SettingsWrapper
 from rest_framework import status
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.test import APIClient
@@ -764,7 +765,7 @@ def test_post_identify_without_persistence(
 
 
 @override_settings(EDGE_API_URL="http://localhost")
-@mock.patch("environments.identities.views.forward_identity_request")
+@mock.patch("environments.identities.views.forward_identity_request_async")
 def test_post_identities_calls_forward_identity_request_with_correct_arguments(
     mocked_forward_identity_request: mock.MagicMock,
     identity: Identity,
@@ -791,17 +792,16 @@ def test_post_identities_calls_forward_identity_request_with_correct_arguments(
     api_client.post(url, data=json.dumps(data), content_type="application/json")
 
     # Then
-    args, kwargs = mocked_forward_identity_request.delay.call_args_list[0]
-    assert args == ()
-    assert kwargs["args"][0] == "POST"
-    assert kwargs["args"][1].get("X-Environment-Key") == environment.api_key
-    assert kwargs["args"][2] == environment.project.id
+    args, kwargs = mocked_forward_identity_request.call_args_list[0]
+    assert args[0] == "POST"
+    assert args[1].get("X-Environment-Key") == environment.api_key
+    assert args[2] == environment.project.id
 
-    assert kwargs["kwargs"]["request_data"] == data
+    assert kwargs["request_data"] == data
 
 
 @override_settings(EDGE_API_URL="http://localhost")
-@mock.patch("environments.identities.views.forward_identity_request")
+@mock.patch("environments.identities.views.forward_identity_request_async")
 def test_get_identities_calls_forward_identity_request_with_correct_arguments(
     mocked_forward_identity_request: mock.MagicMock,
     identity: Identity,
@@ -821,13 +821,12 @@ def test_get_identities_calls_forward_identity_request_with_correct_arguments(
     api_client.get(url)
 
     # Then
-    args, kwargs = mocked_forward_identity_request.delay.call_args_list[0]
-    assert args == ()
-    assert kwargs["args"][0] == "GET"
-    assert kwargs["args"][1].get("X-Environment-Key") == environment.api_key
-    assert kwargs["args"][2] == project.id
+    args, kwargs = mocked_forward_identity_request.call_args_list[0]
+    assert args[0] == "GET"
+    assert args[1].get("X-Environment-Key") == environment.api_key
+    assert args[2] == project.id
 
-    assert kwargs["kwargs"]["query_params"] == {"identifier": identity.identifier}
+    assert kwargs["query_params"] == {"identifier": identity.identifier}
 
 
 def test_post_identities_with_traits_fails_if_client_cannot_set_traits(
@@ -933,6 +932,42 @@ def test_get_identities_request_includes_updated_at_header(
     )
 
 
+def test_get_identities__etags_enabled__returns_304_if_not_modified(
+    identity: Identity,
+    environment: Environment,
+    feature: Feature,
+    api_client: APIClient,
+    settings: SettingsWrapper,
+) -> None:
+    # Given
+    settings.ENABLE_SDK_ETAGS = True
+
+    url = "%s?identifier=%s" % (
+        reverse("api-v1:sdk-identities"),
+        identity.identifier,
+    )
+    api_client.credentials(HTTP_X_ENVIRONMENT_KEY=environment.api_key)
+
+    first_response = api_client.get(url)
+    etag = first_response.headers["ETag"]
+
+    # When
+    second_response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+    # and the identity is then overridden
+    FeatureState.objects.create(
+        feature=feature, environment=environment, identity=identity
+    )
+    third_response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+    # Then
+    assert first_response.status_code == status.HTTP_200_OK
+    assert second_response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert second_response.headers["ETag"] == etag
+    assert third_response.status_code == status.HTTP_200_OK
+    assert third_response.headers["ETag"] != etag
+
+
 def test_get_identities_nplus1(
     identity: Identity,
     environment: Environment,
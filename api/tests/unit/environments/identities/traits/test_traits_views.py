@@ -601,7 +601,7 @@ def test_bulk_create_traits_when_float_value_sent_then_trait_value_correct(
 
 
 @override_settings(EDGE_API_URL="http://localhost")
-@mock.patch("environments.identities.traits.views.forward_trait_request")
+@mock.patch("environments.identities.traits.views.forward_trait_request_async")
 def test_post_trait_calls_forward_trait_request_with_correct_arguments(
     mocked_forward_trait_request: mock.MagicMock,
     identity: Identity,
@@ -627,16 +627,16 @@ def test_post_trait_calls_forward_trait_request_with_correct_arguments(
     api_client.post(url, data=json.dumps(data), content_type="application/json")
 
     # Then
-    args, kwargs = mocked_forward_trait_request.delay.call_args_list[0]
-    assert args == ()
-    assert kwargs["args"][0] == "POST"
-    assert kwargs["args"][1].get("X-Environment-Key") == environment.api_key
-    assert kwargs["args"][2] == environment.project.id
-    assert kwargs["args"][3] == data
+    args, kwargs = mocked_forward_trait_request.call_args_list[0]
+    assert kwargs == {}
+    assert args[0] == "POST"
+    assert args[1].get("X-Environment-Key") == environment.api_key
+    assert args[2] == environment.project.id
+    assert args[3] == data
 
 
 @override_settings(EDGE_API_URL="http://localhost")
-@mock.patch("environments.identities.traits.views.forward_trait_request")
+@mock.patch("environments.identities.traits.views.forward_trait_request_async")
 def test_increment_value_calls_forward_trait_request_with_correct_arguments(
     mocked_forward_trait_request: mock.MagicMock,
     identity: Identity,
@@ -661,20 +661,20 @@ def test_increment_value_calls_forward_trait_request_with_correct_arguments(
     api_client.post(url, data=data)
 
     # Then
-    args, kwargs = mocked_forward_trait_request.delay.call_args_list[0]
-    assert args == ()
-    assert kwargs["args"][0] == "POST"
-    assert kwargs["args"][1].get("X-Environment-Key") == environment.api_key
-    assert kwargs["args"][2] == project.id
+    args, kwargs = mocked_forward_trait_request.call_args_list[0]
+    assert kwargs == {}
+    assert args[0] == "POST"
+    assert args[1].get("X-Environment-Key") == environment.api_key
+    assert args[2] == project.id
 
     # And the structure of payload was correct.
-    assert kwargs["args"][3]["identity"]["identifier"] == data["identifier"]
-    assert kwargs["args"][3]["trait_key"] == data["trait_key"]
-    assert kwargs["args"][3]["trait_value"]
+    assert args[3]["identity"]["identifier"] == data["identifier"]
+    assert args[3]["trait_key"] == data["trait_key"]
+    assert args[3]["trait_value"]
 
 
 @override_settings(EDGE_API_URL="http://localhost")
-@mock.patch("environments.identities.traits.views.forward_trait_requests")
+@mock.patch("environments.identities.traits.views.forward_trait_requests_async")
 def test_bulk_create_traits_calls_forward_trait_request_with_correct_arguments(
     mocked_forward_trait_requests: mock.MagicMock,
     api_client: APIClient,
@@ -704,12 +704,12 @@ def test_bulk_create_traits_calls_forward_trait_request_with_correct_arguments(
     api_client.put(url, data=json.dumps(data), content_type="application/json")
 
     # Then
-    args, kwargs = mocked_forward_trait_requests.delay.call_args_list[0]
-    assert args == ()
-    assert kwargs["args"][0] == "PUT"
-    assert kwargs["args"][1].get("X-Environment-Key") == environment.api_key
-    assert kwargs["args"][2] == project.id
-    assert kwargs["args"][3] == data
+    args, kwargs = mocked_forward_trait_requests.call_args_list[0]
+    assert kwargs == {}
+    assert args[0] == "PUT"
+    assert args[1].get("X-Environment-Key") == environment.api_key
+    assert args[2] == project.id
+    assert args[3] == data
 
 
 def test_create_trait_returns_403_if_client_cannot_set_traits(
@@ -1,5 +1,9 @@
 import pytest
+from django.db import connection
+from pytest_django import DjangoAssertNumQueries
+from pytest_mock import MockerFixture
 
+from environments.identities.models import Identity
 from environments.identities.traits.models import Trait
 
 
@@ -67,3 +71,60 @@ def test_trait_bulk_delete_deletes_objects(trait):
 
     # Then
     Trait.objects.filter(identity=trait.identity).count() == 0
+
+
+@pytest.mark.parametrize("vendor", ("postgresql", "sqlite"))
+def test_trait_bulk_upsert__creates_and_updates_traits(
+    identity: Identity,
+    trait: Trait,
+    mocker: MockerFixture,
+    vendor: str,
+) -> None:
+    # Given
+    mocker.patch.object(connection, "vendor", vendor)
+    mocker.patch("environments.identities.traits.managers.UPSERT_BATCH_SIZE", 1)
+
+    # a trait which exists, but hasn't been read
+    updated_trait = Trait(
+        identity=identity,
+        trait_key=trait.trait_key,
+        **Trait.generate_trait_value_data(42),
+    )
+    new_trait = Trait(
+        identity=identity,
+        trait_key="new_trait",
+        **Trait.generate_trait_value_data("value"),
+    )
+
+    # When
+    Trait.objects.bulk_upsert([updated_trait, new_trait])
+
+    # Then
+    assert updated_trait.pk == trait.pk
+    assert new_trait.pk is not None
+    assert {
+        t.pk: (t.trait_key, t.trait_value) for t in identity.identity_traits.all()
+    } == {trait.pk: (trait.trait_key, 42), new_trait.pk: ("new_trait", "value")}
+
+
+def test_trait_bulk_upsert__postgres__single_query(
+    identity: Identity,
+    trait: Trait,
+    django_assert_num_queries: DjangoAssertNumQueries,
+) -> None:
+    # Given
+    traits = [
+        Trait(
+            identity=identity,
+            trait_key=f"trait_{i}",
+            **Trait.generate_trait_value_data(i),
+        )
+        for i in range(10)
+    ]
+
+    # When
+    with django_assert_num_queries(1):
+        Trait.objects.bulk_upsert(traits)
+
+    # Then
+    assert identity.identity_traits.count() == 11
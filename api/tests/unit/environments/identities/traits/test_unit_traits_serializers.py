@@ -48,7 +48,9 @@ def test_bulk_create_update_serializer_save_many(
     mocked_request = mocker.MagicMock(environment=identity.environment)
 
     # When
-    with django_assert_num_queries(6):
+    # we read the identities and their traits, delete the nulled trait and
+    # upsert the rest
+    with django_assert_num_queries(4):
         serializer = SDKBulkCreateUpdateTraitSerializer(
             data=data,
             many=True,
@@ -42,3 +42,42 @@ def test_calling_migrate_to_edge_raises_command_error_if_identities_are_already_
     # Then
     mocked_identity_migrator.assert_called_with(project_id)
     mocked_identity_migrator.return_value.migrate.assert_not_called()
+
+
+def test_calling_migrate_to_edge_with_resume_resumes_migration_in_progress(
+    mocker,
+):
+    # Given
+    project_id = 1
+    mocked_identity_migrator = mocker.patch(
+        "environments.management.commands.migrate_to_edge.IdentityMigrator",
+        spec=IdentityMigrator,
+    )
+    mocked_identity_migrator.return_value.can_migrate = False
+    mocked_identity_migrator.return_value.can_resume = True
+
+    # When
+    call_command("migrate_to_edge", project_id, "--resume")
+
+    # Then
+    mocked_identity_migrator.assert_called_with(project_id)
+    mocked_identity_migrator.return_value.migrate.assert_called_with()
+
+
+def test_calling_migrate_to_edge_with_resume_raises_command_error_if_migration_is_not_in_progress(
+    mocker,
+):
+    # Given
+    project_id = 1
+    mocked_identity_migrator = mocker.patch(
+        "environments.management.commands.migrate_to_edge.IdentityMigrator",
+        spec=IdentityMigrator,
+    )
+    mocked_identity_migrator.return_value.can_resume = False
+
+    # When
+    with pytest.raises(CommandError):
+        call_command("migrate_to_edge", project_id, "--resume")
+
+    # Then
+    mocked_identity_migrator.return_value.migrate.assert_not_called()
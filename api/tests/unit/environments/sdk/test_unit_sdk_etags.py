@@ -0,0 +1,77 @@
+import pytest
+from core.request_origin import RequestOrigin
+from django.test import RequestFactory
+
+from environments.identities.models import Identity
+from environments.identities.traits.models import Trait
+from environments.models import Environment
+from environments.sdk.etags import (
+    get_environment_etag,
+    get_identity_etag,
+    is_not_modified,
+)
+from features.models import Feature, FeatureState
+
+
+def test_get_environment_etag__changes_with_updated_at_and_origin(
+    environment: Environment, rf: RequestFactory
+) -> None:
+    # Given
+    request = rf.get("/api/v1/flags/")
+    etag = get_environment_etag(request, environment, RequestOrigin.CLIENT)
+
+    # When
+    server_etag = get_environment_etag(request, environment, RequestOrigin.SERVER)
+    environment.updated_at = environment.updated_at.replace(year=2100)
+    updated_etag = get_environment_etag(request, environment, RequestOrigin.CLIENT)
+
+    # Then
+    assert etag.startswith('"') and etag.endswith('"')
+    assert len({etag, server_etag, updated_etag}) == 3
+
+
+def test_get_identity_etag__changes_with_traits_and_overrides(
+    identity: Identity, feature: Feature, rf: RequestFactory
+) -> None:
+    # Given
+    request = rf.get("/api/v1/identities/", {"identifier": identity.identifier})
+    etag = get_identity_etag(request, identity, RequestOrigin.CLIENT)
+
+    # When
+    Trait.objects.create(identity=identity, trait_key="foo", string_value="bar")
+    etag_with_trait = get_identity_etag(request, identity, RequestOrigin.CLIENT)
+
+    FeatureState.objects.create(
+        feature=feature, environment=identity.environment, identity=identity
+    )
+    etag_with_override = get_identity_etag(request, identity, RequestOrigin.CLIENT)
+
+    # Then
+    assert len({etag, etag_with_trait, etag_with_override}) == 3
+    assert get_identity_etag(request, identity, RequestOrigin.CLIENT) == (
+        etag_with_override
+    )
+
+
+@pytest.mark.parametrize(
+    "if_none_match, expected_result",
+    (
+        ('"abc"', True),
+        ('W/"abc"', True),
+        ('"xyz", "abc"', True),
+        ("*", True),
+        ('"xyz"', False),
+        ("", False),
+    ),
+)
+def test_is_not_modified(
+    if_none_match: str, expected_result: bool, rf: RequestFactory
+) -> None:
+    # Given
+    request = rf.get("/api/v1/flags/", HTTP_IF_NONE_MATCH=if_none_match)
+
+    # When
+    result = is_not_modified(request, '"abc"')
+
+    # Then
+    assert result is expected_result
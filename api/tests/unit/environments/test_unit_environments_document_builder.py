@@ -0,0 +1,317 @@
+import pytest
+from flag_engine.environments.models import EnvironmentModel
+from flag_engine.segments.constants import EQUAL
+from pytest_django.fixtures import SettingsWrapper
+from pytest_mock import MockerFixture
+
+from audit.models import AuditLog
+from audit.related_object_type import RelatedObjectType
+from environments import document_builder
+from environments.document_builder import build_environment_model
+from environments.identities.models import Identity
+from environments.models import Environment
+from features.models import Feature, FeatureSegment, FeatureState
+from segments.models import Condition, Segment, SegmentRule
+from util.mappers.engine import map_environment_to_engine
+
+
+@pytest.fixture(autouse=True)
+def enable_environment_model_cache(settings: SettingsWrapper) -> None:
+    settings.CACHE_ENVIRONMENT_MODEL_SECONDS = 60
+
+
+def _build_environment_model(
+    environment: Environment, audit_log: AuditLog
+) -> EnvironmentModel:
+    return build_environment_model(
+        Environment.objects.filter_for_incremental_document_builder(
+            id=environment.id
+        ).get(),
+        audit_log,
+    )
+
+
+def _build_full_environment_model(environment: Environment) -> EnvironmentModel:
+    return map_environment_to_engine(
+        Environment.objects.filter_for_document_builder(id=environment.id).get()
+    )
+
+
+def _create_audit_log(
+    environment: Environment,
+    related_object_type: RelatedObjectType,
+    related_object_id: int,
+) -> AuditLog:
+    return AuditLog.objects.create(
+        environment=environment,
+        project=environment.project,
+        related_object_type=related_object_type.name,
+        related_object_id=related_object_id,
+        log="test",
+    )
+
+
+def test_build_environment_model__no_cached_model__builds_full_model(
+    environment: Environment,
+    feature_state: FeatureState,
+    reset_cache: None,
+    mocker: MockerFixture,
+) -> None:
+    # Given
+    build_full_environment_model_spy = mocker.spy(
+        document_builder, "_build_full_environment_model"
+    )
+    audit_log = _create_audit_log(
+        environment, RelatedObjectType.FEATURE_STATE, feature_state.id
+    )
+
+    # When
+    environment_model = _build_environment_model(environment, audit_log)
+
+    # Then
+    build_full_environment_model_spy.assert_called_once()
+    assert environment_model == _build_full_environment_model(environment)
+
+
+def test_build_environment_model__feature_state_updated__patches_cached_model(
+    environment: Environment,
+    feature: Feature,
+    feature_state: FeatureState,
+    segment_featurestate: FeatureState,
+    reset_cache: None,
+    mocker: MockerFixture,
+) -> None:
+    # Given
+    _build_environment_model(
+        environment,
+        _create_audit_log(environment, RelatedObjectType.FEATURE, feature.id),
+    )
+    build_full_environment_model_spy = mocker.spy(
+        document_builder, "_build_full_environment_model"
+    )
+
+    feature_state.enabled = not feature_state.enabled
+    feature_state.save()
+    feature_state.feature_state_value.string_value = "updated"
+    feature_state.feature_state_value.save()
+
+    audit_log = _create_audit_log(
+        environment, RelatedObjectType.FEATURE_STATE, feature_state.id
+    )
+
+    # When
+    environment_model = _build_environment_model(environment, audit_log)
+
+    # Then
+    build_full_environment_model_spy.assert_not_called()
+    assert environment_model == _build_full_environment_model(environment)
+    assert environment_model.feature_states[0].enabled is feature_state.enabled
+
+
+def test_build_environment_model__segment_override_created__patches_cached_model(
+    environment: Environment,
+    feature: Feature,
+    feature_state: FeatureState,
+    segment: Segment,
+    reset_cache: None,
+    mocker: MockerFixture,
+) -> None:
+    # Given
+    _build_environment_model(
+        environment,
+        _create_audit_log(environment, RelatedObjectType.SEGMENT, segment.id),
+    )
+    build_full_environment_model_spy = mocker.spy(
+        document_builder, "_build_full_environment_model"
+    )
+
+    feature_segment = FeatureSegment.objects.create(
+        feature=feature, segment=segment, environment=environment
+    )
+    segment_override = FeatureState.objects.create(
+        feature=feature,
+        feature_segment=feature_segment,
+        environment=environment,
+        enabled=True,
+    )
+    audit_log = _create_audit_log(
+        environment, RelatedObjectType.FEATURE_STATE, segment_override.id
+    )
+
+    # When
+    environment_model = _build_environment_model(environment, audit_log)
+
+    # Then
+    build_full_environment_model_spy.assert_not_called()
+    assert environment_model == _build_full_environment_model(environment)
+    assert environment_model.project.segments[0].feature_states[0].django_id == (
+        segment_override.id
+    )
+
+
+def test_build_environment_model__identity_override_created__does_not_rebuild(
+    environment: Environment,
+    feature: Feature,
+    feature_state: FeatureState,
+    identity: Identity,
+    reset_cache: None,
+    mocker: MockerFixture,
+) -> None:
+    # Given
+    _build_environment_model(
+        environment,
+        _create_audit_log(environment, RelatedObjectType.FEATURE, feature.id),
+    )
+    build_full_environment_model_spy = mocker.spy(
+        document_builder, "_build_full_environment_model"
+    )
+
+    identity_override = FeatureState.objects.create(
+        feature=feature, identity=identity, environment=environment
+    )
+    audit_log = _create_audit_log(
+        environment, RelatedObjectType.FEATURE_STATE, identity_override.id
+    )
+
+    # When
+    environment_model = _build_environment_model(environment, audit_log)
+
+    # Then
+    build_full_environment_model_spy.assert_not_called()
+    assert environment_model == _build_full_environment_model(environment)
+
+
+def test_build_environment_model__segment_created_and_updated__patches_cached_model(
+    environment: Environment,
+    feature: Feature,
+    segment: Segment,
+    segment_featurestate: FeatureState,
+    reset_cache: None,
+    mocker: MockerFixture,
+) -> None:
+    # Given
+    _build_environment_model(
+        environment,
+        _create_audit_log(environment, RelatedObjectType.SEGMENT, segment.id),
+    )
+    build_full_environment_model_spy = mocker.spy(
+        document_builder, "_build_full_environment_model"
+    )
+
+    new_segment = Segment.objects.create(name="new_segment", project=segment.project)
+    new_segment_audit_log = _create_audit_log(
+        environment, RelatedObjectType.SEGMENT, new_segment.id
+    )
+    _build_environment_model(environment, new_segment_audit_log)
+
+    rule = SegmentRule.objects.create(segment=segment, type=SegmentRule.ALL_RULE)
+    Condition.objects.create(
+        rule=rule,
+        property="foo",
+        operator=EQUAL,
+        value="bar",
+        created_with_segment=True,
+    )
+    audit_log = _create_audit_log(environment, RelatedObjectType.SEGMENT, segment.id)
+
+    # When
+    environment_model = _build_environment_model(environment, audit_log)
+
+    # Then
+    build_full_environment_model_spy.assert_not_called()
+    assert environment_model == _build_full_environment_model(environment)
+    assert [
+        segment_model.id for segment_model in environment_model.project.segments
+    ] == [
+        segment.id,
+        new_segment.id,
+    ]
+
+
+def test_build_environment_model__segment_deleted__patches_cached_model(
+    environment: Environment,
+    segment: Segment,
+    segment_featurestate: FeatureState,
+    reset_cache: None,
+    mocker: MockerFixture,
+) -> None:
+    # Given
+    _build_environment_model(
+        environment,
+        _create_audit_log(environment, RelatedObjectType.SEGMENT, segment.id),
+    )
+    build_full_environment_model_spy = mocker.spy(
+        document_builder, "_build_full_environment_model"
+    )
+
+    segment_id = segment.id
+    segment.delete()
+    audit_log = _create_audit_log(environment, RelatedObjectType.SEGMENT, segment_id)
+
+    # When
+    environment_model = _build_environment_model(environment, audit_log)
+
+    # Then
+    build_full_environment_model_spy.assert_not_called()
+    assert environment_model == _build_full_environment_model(environment)
+    assert environment_model.project.segments == []
+
+
+def test_build_environment_model__missed_audit_log__builds_full_model(
+    environment: Environment,
+    feature: Feature,
+    feature_state: FeatureState,
+    reset_cache: None,
+    mocker: MockerFixture,
+) -> None:
+    # Given
+    _build_environment_model(
+        environment,
+        _create_audit_log(environment, RelatedObjectType.FEATURE, feature.id),
+    )
+    build_full_environment_model_spy = mocker.spy(
+        document_builder, "_build_full_environment_model"
+    )
+
+    # an audit log which was never processed by the builder
+    _create_audit_log(environment, RelatedObjectType.FEATURE, feature.id)
+
+    feature_state.enabled = not feature_state.enabled
+    feature_state.save()
+    audit_log = _create_audit_log(
+        environment, RelatedObjectType.FEATURE_STATE, feature_state.id
+    )
+
+    # When
+    environment_model = _build_environment_model(environment, audit_log)
+
+    # Then
+    build_full_environment_model_spy.assert_called_once()
+    assert environment_model == _build_full_environment_model(environment)
+
+
+def test_build_environment_model__unsupported_related_object_type__builds_full_model(
+    environment: Environment,
+    feature: Feature,
+    reset_cache: None,
+    mocker: MockerFixture,
+) -> None:
+    # Given
+    _build_environment_model(
+        environment,
+        _create_audit_log(environment, RelatedObjectType.FEATURE, feature.id),
+    )
+    build_full_environment_model_spy = mocker.spy(
+        document_builder, "_build_full_environment_model"
+    )
+
+    audit_log = _create_audit_log(
+        environment, RelatedObjectType.ENVIRONMENT, environment.id
+    )
+
+    # When
+    environment_model = _build_environment_model(environment, audit_log)
+
+    # Then
+    build_full_environment_model_spy.assert_called_once()
+    assert environment_model == _build_full_environment_model(environment)
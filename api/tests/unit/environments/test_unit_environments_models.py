@@ -12,6 +12,7 @@ from django.utils import timezone
 from mypy_boto3_dynamodb.service_resource import Table
 from pytest_django import DjangoAssertNumQueries
 from pytest_django.asserts import assertQuerysetEqual as assert_queryset_equal
+from pytest_django.fixtures import SettingsWrapper
 from pytest_mock import MockerFixture
 
 from audit.models import AuditLog
@@ -568,6 +569,40 @@ def test_write_environments_to_dynamodb__project_environments_v2_not_migrated__w
     mock_dynamo_env_v2_wrapper.write_environments.assert_not_called()
 
 
+def test_write_environments_to_dynamodb__audit_log_and_model_cache_enabled__writes_built_models(
+    dynamo_enabled_project: Project,
+    dynamo_enabled_project_environment_one: Environment,
+    mock_dynamo_env_wrapper: Mock,
+    settings: SettingsWrapper,
+    mocker: MockerFixture,
+) -> None:
+    # Given
+    settings.CACHE_ENVIRONMENT_MODEL_SECONDS = 60
+    audit_log = AuditLog.objects.create(
+        environment=dynamo_enabled_project_environment_one,
+        project=dynamo_enabled_project,
+    )
+    mock_dynamo_env_wrapper.reset_mock()
+    mock_build_environment_model = mocker.patch(
+        "environments.models.build_environment_model", autospec=True
+    )
+
+    # When
+    Environment.write_environments_to_dynamodb(
+        environment_id=dynamo_enabled_project_environment_one.id,
+        audit_log=audit_log,
+    )
+
+    # Then
+    mock_build_environment_model.assert_called_once_with(
+        dynamo_enabled_project_environment_one, audit_log
+    )
+    mock_dynamo_env_wrapper.write_engine_environments.assert_called_once_with(
+        [mock_build_environment_model.return_value]
+    )
+    mock_dynamo_env_wrapper.write_environments.assert_not_called()
+
+
 @pytest.mark.parametrize(
     "value, identity_id, identifier",
     (
@@ -700,7 +735,33 @@ def test_environment_get_environment_document_with_caching_when_document_not_in_
     assert environment_document["api_key"] == environment.api_key
 
     mocked_environment_document_cache.set.assert_called_once_with(
-        environment.api_key, environment_document
+        environment.api_key, environment_document, timeout=60
+    )
+
+
+def test_environment_get_environment_document_with_caching_uses_updated_at_in_cache_key(
+    environment: Environment,
+    settings: SettingsWrapper,
+    mocker: MockerFixture,
+) -> None:
+    # Given
+    settings.CACHE_ENVIRONMENT_DOCUMENT_SECONDS = 60
+
+    mocked_environment_document_cache = mocker.patch(
+        "environments.models.environment_document_cache"
+    )
+    mocked_environment_document_cache.get.return_value = None
+
+    # When
+    environment_document = Environment.get_environment_document(
+        environment.api_key, updated_at=environment.updated_at
+    )
+
+    # Then
+    expected_cache_key = f"{environment.api_key}:{environment.updated_at.timestamp()}"
+    mocked_environment_document_cache.get.assert_called_once_with(expected_cache_key)
+    mocked_environment_document_cache.set.assert_called_once_with(
+        expected_cache_key, environment_document, timeout=60
     )
 
 
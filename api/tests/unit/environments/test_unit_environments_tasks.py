@@ -39,11 +39,21 @@ def test_process_environment_update_with_environment_audit_log(environment, mock
         autospec=True,
     )
 
+    mock_rebuild_environment_flags_response_cache = mocker.patch(
+        "environments.tasks.rebuild_environment_flags_response_cache",
+        autospec=True,
+    )
+
     # When
     process_environment_update(audit_log_id=audit_log.id)
 
     # Then
     mock_environment_model_class.write_environments_to_dynamodb.assert_called_once_with(
+        environment_id=environment.id,
+        project_id=environment.project.id,
+        audit_log=audit_log,
+    )
+    mock_rebuild_environment_flags_response_cache.assert_called_once_with(
         environment_id=environment.id, project_id=environment.project.id
     )
     mock_send_environment_update_message_for_environment.assert_called_once_with(
@@ -72,7 +82,7 @@ def test_process_environment_update_with_project_audit_log(environment, mocker):
 
     # Then
     mock_environment_model_class.write_environments_to_dynamodb.assert_called_once_with(
-        environment_id=None, project_id=environment.project.id
+        environment_id=None, project_id=environment.project.id, audit_log=audit_log
     )
     mock_send_environment_update_message_for_environment.assert_not_called()
     mock_send_environment_update_message_for_project.assert_called_once_with(
@@ -1,6 +1,8 @@
 from core.constants import FLAGSMITH_UPDATED_AT_HEADER
 from django.urls import reverse
 from flag_engine.segments.constants import EQUAL
+from pytest_django import DjangoAssertNumQueries
+from pytest_django.fixtures import SettingsWrapper
 from rest_framework import status
 from rest_framework.test import APIClient
 
@@ -110,3 +112,29 @@ def test_get_environment_document_fails_with_invalid_key(
     # We get a 403 since only the server side API keys are able to access the
     # environment document
     assert response.status_code == status.HTTP_403_FORBIDDEN
+
+
+def test_get_environment_document__etags_enabled__returns_304_if_not_modified(
+    environment: Environment,
+    environment_api_key: EnvironmentAPIKey,
+    settings: SettingsWrapper,
+    django_assert_num_queries: DjangoAssertNumQueries,
+) -> None:
+    # Given
+    settings.ENABLE_SDK_ETAGS = True
+
+    client = APIClient()
+    client.credentials(HTTP_X_ENVIRONMENT_KEY=environment_api_key.key)
+    url = reverse("api-v1:environment-document")
+
+    first_response = client.get(url)
+    etag = first_response.headers["ETag"]
+
+    # When
+    with django_assert_num_queries(0):
+        second_response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+    # Then
+    assert first_response.status_code == status.HTTP_200_OK
+    assert second_response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert second_response.headers["ETag"] == etag
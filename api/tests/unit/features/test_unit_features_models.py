@@ -596,6 +596,82 @@ def test_feature_state_gt_operator(feature_state_version_generator):
     assert (first > second) is expected_result
 
 
+@pytest.mark.parametrize(
+    "feature_state_version_generator",
+    (
+        (None, None, None, None, False),
+        (2, now, None, None, True),
+        (None, None, 2, now, False),
+        (2, now, 3, now, False),
+        (3, now, 2, now, True),
+        (3, now, 2, yesterday, True),
+        (3, yesterday, 2, now, False),
+        (2, tomorrow, 1, yesterday, False),
+    ),
+    indirect=True,
+)
+def test_feature_state_get_priority_key_orders_versions(
+    feature_state_version_generator,
+):
+    first, second, expected_result = feature_state_version_generator
+    assert (first.get_priority_key() > second.get_priority_key()) is expected_result
+
+
+def test_feature_state_get_priority_key_order(
+    identity: Identity,
+    feature: Feature,
+    environment: Environment,
+    project: Project,
+) -> None:
+    # Given
+    segment_1 = Segment.objects.create(name="Test Segment 1", project=project)
+    segment_2 = Segment.objects.create(name="Test Segment 2", project=project)
+    feature_segment_p1 = FeatureSegment.objects.create(
+        segment=segment_1,
+        feature=feature,
+        environment=environment,
+        priority=1,
+    )
+    feature_segment_p2 = FeatureSegment.objects.create(
+        segment=segment_2,
+        feature=feature,
+        environment=environment,
+        priority=2,
+    )
+
+    identity_state = FeatureState.objects.create(
+        identity=identity, feature=feature, environment=environment
+    )
+    segment_1_state = FeatureState.objects.create(
+        feature_segment=feature_segment_p1,
+        feature=feature,
+        environment=environment,
+    )
+    segment_2_state = FeatureState.objects.create(
+        feature_segment=feature_segment_p2,
+        feature=feature,
+        environment=environment,
+    )
+    default_env_state = FeatureState.objects.get(
+        environment=environment, identity=None, feature_segment=None
+    )
+
+    # When
+    feature_states = sorted(
+        [default_env_state, segment_2_state, identity_state, segment_1_state],
+        key=FeatureState.get_priority_key,
+        reverse=True,
+    )
+
+    # Then
+    assert feature_states == [
+        identity_state,
+        segment_1_state,
+        segment_2_state,
+        default_env_state,
+    ]
+
+
 @pytest.mark.parametrize(
     "version, live_from, expected_is_live",
     (
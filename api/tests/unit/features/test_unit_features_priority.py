@@ -0,0 +1,90 @@
+from datetime import timedelta
+
+from django.utils import timezone
+
+from environments.identities.models import Identity
+from environments.models import Environment
+from features.constants import ENVIRONMENT, FEATURE_SEGMENT, IDENTITY
+from features.models import Feature, FeatureSegment, FeatureState
+from features.priority import get_highest_priority_feature_states
+from features.versioning.models import EnvironmentFeatureVersion
+from users.models import FFAdminUser
+
+
+def test_get_highest_priority_feature_states(
+    feature: Feature,
+    environment: Environment,
+    identity: Identity,
+    feature_segment: FeatureSegment,
+    segment_featurestate: FeatureState,
+) -> None:
+    # Given
+    now = timezone.now()
+    environment_default_v1 = FeatureState.objects.get(
+        feature=feature, environment=environment, feature_segment=None, identity=None
+    )
+    environment_default_v1.live_from = now - timedelta(minutes=3)
+    environment_default_v1.save()
+
+    environment_default_v2 = environment_default_v1.clone(
+        env=environment, live_from=now - timedelta(minutes=1), version=2
+    )
+    environment_default_v1.clone(
+        env=environment, live_from=now + timedelta(days=1), version=3
+    )
+    identity_override = FeatureState.objects.create(
+        feature=feature, environment=environment, identity=identity
+    )
+
+    feature_states = FeatureState.objects.filter(feature=feature)
+
+    # When
+    by_type = get_highest_priority_feature_states(
+        feature_states,
+        key_function=lambda fs: fs.type,
+        use_v2_feature_versioning=False,
+    )
+    by_feature = get_highest_priority_feature_states(
+        feature_states, key_function=lambda fs: fs.feature_id
+    )
+
+    # Then
+    assert by_type == {
+        ENVIRONMENT: environment_default_v2,
+        FEATURE_SEGMENT: segment_featurestate,
+        IDENTITY: identity_override,
+    }
+    assert by_feature == {feature.id: identity_override}
+
+
+def test_get_highest_priority_feature_states_v2_versioning(
+    feature: Feature,
+    environment_v2_versioning: Environment,
+    staff_user: FFAdminUser,
+) -> None:
+    # Given
+    version_2 = EnvironmentFeatureVersion.objects.create(
+        environment=environment_v2_versioning, feature=feature
+    )
+    version_2.publish(staff_user)
+
+    scheduled_version = EnvironmentFeatureVersion.objects.create(
+        environment=environment_v2_versioning, feature=feature
+    )
+    scheduled_version.publish(staff_user, live_from=timezone.now() + timedelta(days=1))
+
+    EnvironmentFeatureVersion.objects.create(
+        environment=environment_v2_versioning, feature=feature
+    )
+
+    # When
+    feature_states = get_highest_priority_feature_states(
+        FeatureState.objects.filter(
+            environment=environment_v2_versioning, feature=feature
+        ),
+        key_function=lambda fs: fs.feature_id,
+        use_v2_feature_versioning=True,
+    )
+
+    # Then
+    assert feature_states == {feature.id: version_2.feature_states.get()}
@@ -0,0 +1,132 @@
+import json
+
+import pytest
+from core.request_origin import RequestOrigin
+from pytest_django.fixtures import SettingsWrapper
+from pytest_mock import MockerFixture
+
+from environments.models import Environment
+from features.models import Feature, FeatureState
+from features.sdk_flags_service import (
+    flags_response_cache,
+    get_environment_flags_response_content,
+    get_flags_response_cache_key,
+    rebuild_environment_flags_response_cache,
+)
+
+
+@pytest.mark.parametrize(
+    "origin, expected_feature_names",
+    (
+        (RequestOrigin.CLIENT, {"client_feature"}),
+        (RequestOrigin.SERVER, {"client_feature", "server_feature"}),
+    ),
+)
+def test_get_environment_flags_response_content__renders_and_caches_flags(
+    environment: Environment,
+    settings: SettingsWrapper,
+    reset_cache: None,
+    origin: RequestOrigin,
+    expected_feature_names: set[str],
+) -> None:
+    # Given
+    settings.CACHE_FLAGS_RESPONSE_SECONDS = 60
+
+    Feature.objects.create(name="client_feature", project=environment.project)
+    Feature.objects.create(
+        name="server_feature", project=environment.project, is_server_key_only=True
+    )
+
+    # When
+    content = get_environment_flags_response_content(environment, origin)
+
+    # Then
+    assert {flag["feature"]["name"] for flag in json.loads(content)} == (
+        expected_feature_names
+    )
+    assert (
+        flags_response_cache.get(get_flags_response_cache_key(environment, origin))
+        == content
+    )
+
+
+def test_get_flags_response_cache_key__changes_with_updated_at(
+    environment: Environment,
+) -> None:
+    # Given
+    cache_key = get_flags_response_cache_key(environment, RequestOrigin.CLIENT)
+
+    # When
+    environment.updated_at = environment.updated_at.replace(year=2100)
+
+    # Then
+    assert get_flags_response_cache_key(environment, RequestOrigin.CLIENT) != cache_key
+
+
+def test_rebuild_environment_flags_response_cache__writes_content_for_all_origins(
+    environment: Environment,
+    feature: Feature,
+    settings: SettingsWrapper,
+    reset_cache: None,
+) -> None:
+    # Given
+    settings.CACHE_FLAGS_RESPONSE_SECONDS = 60
+
+    feature_state = FeatureState.objects.get(
+        feature=feature, environment=environment, identity=None
+    )
+
+    # When
+    rebuild_environment_flags_response_cache(project_id=environment.project_id)
+
+    # Then
+    for origin in RequestOrigin:
+        content = flags_response_cache.get(
+            get_flags_response_cache_key(environment, origin)
+        )
+        assert [flag["id"] for flag in json.loads(content)] == [feature_state.id]
+
+
+def test_rebuild_environment_flags_response_cache__content_is_served_as_fresh(
+    environment: Environment,
+    feature: Feature,
+    settings: SettingsWrapper,
+    reset_cache: None,
+    mocker: MockerFixture,
+) -> None:
+    # Given
+    settings.CACHE_FLAGS_RESPONSE_SECONDS = 60
+    settings.CACHE_STALE_WHILE_REVALIDATE_SECONDS = 30
+
+    rebuild_environment_flags_response_cache(environment_id=environment.id)
+    environment.refresh_from_db()
+    render_environment_flags = mocker.patch(
+        "features.sdk_flags_service.render_environment_flags"
+    )
+
+    # When
+    content = get_environment_flags_response_content(environment, RequestOrigin.SERVER)
+
+    # Then
+    assert len(json.loads(content)) == 1
+    render_environment_flags.assert_not_called()
+
+
+def test_rebuild_environment_flags_response_cache__does_nothing_if_disabled(
+    environment: Environment,
+    feature: Feature,
+    settings: SettingsWrapper,
+    reset_cache: None,
+) -> None:
+    # Given
+    settings.CACHE_FLAGS_RESPONSE_SECONDS = 0
+
+    # When
+    rebuild_environment_flags_response_cache(environment_id=environment.id)
+
+    # Then
+    for origin in RequestOrigin:
+        assert (
+            flags_response_cache.get(get_flags_response_cache_key(environment, origin))
+            is None
+        )
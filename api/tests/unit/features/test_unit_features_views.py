@@ -35,7 +35,10 @@ from features.feature_types import MULTIVARIATE
 from features.models import Feature, FeatureSegment, FeatureState
 from features.multivariate.models import MultivariateFeatureOption
 from features.value_types import BOOLEAN, INTEGER, STRING
-from features.versioning.models import EnvironmentFeatureVersion
+from features.versioning.models import (
+    EnvironmentFeatureVersion,
+    LiveFeatureState,
+)
 from organisations.models import Organisation, OrganisationRole
 from projects.models import Project, UserProjectPermission
 from projects.permissions import CREATE_FEATURE, VIEW_PROJECT
@@ -662,6 +665,116 @@ def test_get_flags_hide_disabled_flags(
     assert len(response.json()) == (2 if disabled_flag_returned else 1)
 
 
+def test_get_flags__cache_flags_response__returns_cached_content(
+    api_client: APIClient,
+    environment: Environment,
+    feature: Feature,
+    settings: SettingsWrapper,
+    reset_cache: None,
+    django_assert_num_queries: DjangoAssertNumQueries,
+) -> None:
+    # Given
+    settings.CACHE_FLAGS_RESPONSE_SECONDS = 60
+
+    url = reverse("api-v1:flags")
+    api_client.credentials(HTTP_X_ENVIRONMENT_KEY=environment.api_key)
+
+    first_response = api_client.get(url)
+
+    # When
+    with django_assert_num_queries(0):
+        second_response = api_client.get(url)
+
+    # Then
+    assert first_response.status_code == second_response.status_code == 200
+    assert second_response.content == first_response.content
+    assert second_response.headers["Content-Type"] == "application/json"
+    assert second_response.headers[FLAGSMITH_UPDATED_AT_HEADER] == str(
+        environment.updated_at.timestamp()
+    )
+
+    response_json = second_response.json()
+    assert len(response_json) == 1
+    assert response_json[0]["feature"]["id"] == feature.id
+
+
+def test_get_flags__etags_enabled__returns_304_if_not_modified(
+    api_client: APIClient,
+    environment: Environment,
+    feature: Feature,
+    settings: SettingsWrapper,
+    django_assert_num_queries: DjangoAssertNumQueries,
+) -> None:
+    # Given
+    settings.ENABLE_SDK_ETAGS = True
+
+    url = reverse("api-v1:flags")
+    api_client.credentials(HTTP_X_ENVIRONMENT_KEY=environment.api_key)
+
+    first_response = api_client.get(url)
+    etag = first_response.headers["ETag"]
+
+    # When
+    with django_assert_num_queries(0):
+        second_response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+    # Then
+    assert first_response.status_code == status.HTTP_200_OK
+    assert second_response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert not second_response.content
+    assert second_response.headers["ETag"] == etag
+    assert second_response.headers[FLAGSMITH_UPDATED_AT_HEADER] == str(
+        environment.updated_at.timestamp()
+    )
+
+
+def test_get_flags__etags_enabled__returns_200_once_environment_updated(
+    api_client: APIClient,
+    environment: Environment,
+    feature: Feature,
+    settings: SettingsWrapper,
+    reset_cache: None,
+    mocker: MockerFixture,
+) -> None:
+    # Given
+    settings.ENABLE_SDK_ETAGS = True
+    mocker.patch("environments.tasks.process_environment_update")
+
+    url = reverse("api-v1:flags")
+    api_client.credentials(HTTP_X_ENVIRONMENT_KEY=environment.api_key)
+
+    etag = api_client.get(url).headers["ETag"]
+
+    # When
+    AuditLog.objects.create(environment=environment)
+    response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+    # Then
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["ETag"] != etag
+
+
+def test_get_flags__etags_enabled__returns_200_if_etag_does_not_match(
+    api_client: APIClient,
+    environment: Environment,
+    feature: Feature,
+    settings: SettingsWrapper,
+) -> None:
+    # Given
+    settings.ENABLE_SDK_ETAGS = True
+
+    url = reverse("api-v1:flags")
+    api_client.credentials(HTTP_X_ENVIRONMENT_KEY=environment.api_key)
+
+    # When
+    response = api_client.get(url, HTTP_IF_NONE_MATCH='"outdated"')
+
+    # Then
+    assert response.status_code == status.HTTP_200_OK
+    assert len(response.json()) == 1
+    assert response.headers["ETag"] != '"outdated"'
+
+
 def test_get_flags_hide_sensitive_data(
     api_client: APIClient,
     environment: Environment,
@@ -981,7 +1094,7 @@ def test_list_feature_states_from_simple_view_set(
     )
 
     # When
-    with django_assert_num_queries(9):
+    with django_assert_num_queries(8):
         response = admin_client_new.get(url)
 
     # Then
@@ -1028,7 +1141,7 @@ def test_list_feature_states_nested_environment_view_set(
     v2_feature_state.clone(env=environment, version=3, live_from=timezone.now())
 
     # When
-    with django_assert_num_queries(8):
+    with django_assert_num_queries(7):
         response = admin_client_new.get(base_url)
 
     # Then
@@ -3118,3 +3231,49 @@ def test_filter_features_with_owners_and_group_owners_together(
     assert len(response.data["results"]) == 2
     assert response.data["results"][0]["id"] == feature.id
     assert response.data["results"][1]["id"] == feature2.id
+
+
+def test_list_features_with_environment__live_feature_states__returns_latest_version(
+    admin_client_new: APIClient,
+    project: Project,
+    environment: Environment,
+    feature: Feature,
+    settings: SettingsWrapper,
+) -> None:
+    # Given
+    settings.USE_LIVE_FEATURE_STATES = True
+
+    # the scheduled version is created first, so that the version it replaces
+    # isn't simply the last one returned by the database
+    feature_state_v2 = FeatureState.objects.get(
+        feature=feature, environment=environment, feature_segment=None, identity=None
+    )
+    feature_state_v2.live_from = timezone.now() + timedelta(minutes=1)
+    feature_state_v2.version = 2
+    feature_state_v2.save()
+
+    feature_state_v1 = feature_state_v2.clone(
+        env=environment, live_from=timezone.now() - timedelta(minutes=3), version=1
+    )
+    feature_state_v1.enabled = not feature_state_v2.enabled
+    feature_state_v1.save()
+
+    # the scheduled feature state goes live, but the live feature states haven't
+    # been activated yet
+    live_from = timezone.now() - timedelta(seconds=1)
+    FeatureState.objects.filter(id=feature_state_v2.id).update(live_from=live_from)
+    LiveFeatureState.objects.filter(feature_state=feature_state_v2).update(
+        live_from=live_from
+    )
+
+    base_url = reverse("api-v1:projects:project-features-list", args=[project.id])
+    url = f"{base_url}?environment={environment.id}"
+
+    # When
+    response = admin_client_new.get(url)
+
+    # Then
+    assert response.status_code == status.HTTP_200_OK
+    [result] = response.json()["results"]
+    assert result["environment_feature_state"]["id"] == feature_state_v2.id
+    assert result["environment_feature_state"]["enabled"] is feature_state_v2.enabled
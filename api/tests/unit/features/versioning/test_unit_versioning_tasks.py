@@ -1,16 +1,25 @@
+from datetime import timedelta
+
+from django.utils import timezone
+from pytest_django.fixtures import SettingsWrapper
 from pytest_mock import MockerFixture
 
 from environments.identities.models import Identity
 from environments.models import Environment
 from features.models import Feature, FeatureSegment, FeatureState
-from features.versioning.models import EnvironmentFeatureVersion
+from features.versioning.models import (
+    EnvironmentFeatureVersion,
+    LiveFeatureState,
+)
 from features.versioning.tasks import (
+    activate_scheduled_live_feature_states,
     disable_v2_versioning,
     enable_v2_versioning,
     trigger_update_version_webhooks,
 )
 from features.versioning.versioning_service import (
     get_environment_flags_queryset,
+    refresh_live_feature_states,
 )
 from segments.models import Segment
 from users.models import FFAdminUser
@@ -35,6 +44,28 @@ def test_enable_v2_versioning(
     assert environment.use_v2_feature_versioning is True
 
 
+def test_enable_v2_versioning_refreshes_live_feature_states(
+    environment: Environment, feature: Feature, settings: SettingsWrapper
+) -> None:
+    # Given
+    settings.USE_LIVE_FEATURE_STATES = True
+    refresh_live_feature_states(environment)
+
+    # When
+    enable_v2_versioning(environment.id)
+
+    # Then
+    version = EnvironmentFeatureVersion.objects.get(
+        environment=environment, feature=feature
+    )
+    assert (
+        LiveFeatureState.objects.get(
+            environment=environment, feature=feature
+        ).feature_state
+        == version.feature_states.get()
+    )
+
+
 def test_disable_v2_versioning(
     environment_v2_versioning: Environment,
     feature: Feature,
@@ -147,3 +178,36 @@ def test_trigger_update_version_webhooks(
         },
         event_type=WebhookEventType.NEW_VERSION_PUBLISHED,
     )
+
+
+def test_activate_scheduled_live_feature_states(
+    environment: Environment, feature: Feature, settings: SettingsWrapper
+) -> None:
+    # Given
+    settings.USE_LIVE_FEATURE_STATES = True
+
+    feature_state_v1 = FeatureState.objects.get(
+        feature=feature, environment=environment, feature_segment=None, identity=None
+    )
+    feature_state_v1.live_from = timezone.now() - timedelta(minutes=3)
+    feature_state_v1.save()
+
+    feature_state_v2 = feature_state_v1.clone(
+        env=environment, live_from=timezone.now() + timedelta(minutes=1), version=2
+    )
+    assert LiveFeatureState.objects.filter(environment=environment).count() == 2
+
+    # the scheduled feature state goes live
+    live_from = timezone.now() - timedelta(seconds=1)
+    FeatureState.objects.filter(id=feature_state_v2.id).update(live_from=live_from)
+    LiveFeatureState.objects.filter(feature_state=feature_state_v2).update(
+        live_from=live_from
+    )
+
+    # When
+    activate_scheduled_live_feature_states()
+
+    # Then
+    live_feature_state = LiveFeatureState.objects.get(environment=environment)
+    assert live_feature_state.feature_state == feature_state_v2
+    assert live_feature_state.is_scheduled is False
@@ -1,17 +1,24 @@
 from datetime import timedelta
 
+import pytest
 from django.db.models import Q
 from django.utils import timezone
 from pytest_django import DjangoAssertNumQueries
+from pytest_django.fixtures import SettingsWrapper
+from pytest_mock import MockerFixture
 
 from environments.identities.models import Identity
 from environments.models import Environment
-from features.models import Feature, FeatureState
-from features.versioning.models import EnvironmentFeatureVersion
+from features.models import Feature, FeatureSegment, FeatureState
+from features.versioning.models import (
+    EnvironmentFeatureVersion,
+    LiveFeatureState,
+)
 from features.versioning.versioning_service import (
     get_current_live_environment_feature_version,
     get_environment_flags_list,
     get_environment_flags_queryset,
+    refresh_live_feature_states,
 )
 from projects.models import Project
 from segments.models import Segment
@@ -34,7 +41,7 @@ def test_get_environment_flags_queryset_returns_only_latest_versions(
     feature_state_v1.clone(env=environment, as_draft=True)  # draft feature state
 
     # When
-    with django_assert_num_queries(2):
+    with django_assert_num_queries(1):
         feature_states = get_environment_flags_queryset(environment=environment)
 
         # trigger the queryset to execute and ensure the number of queries is correct
@@ -117,6 +124,63 @@ def test_get_environment_flags_returns_latest_live_versions_of_feature_states(
     }
 
 
+@pytest.mark.parametrize("resolve_latest_versions_in_db", (True, False))
+def test_get_environment_flags_list_returns_latest_version_of_each_override(
+    environment: Environment,
+    feature: Feature,
+    feature_segment: FeatureSegment,
+    segment_featurestate: FeatureState,
+    identity: Identity,
+    identity_featurestate: FeatureState,
+    mocker: MockerFixture,
+    resolve_latest_versions_in_db: bool,
+) -> None:
+    # Given
+    mocker.patch(
+        "features.versioning.versioning_service._can_resolve_latest_versions_in_db",
+        return_value=resolve_latest_versions_in_db,
+    )
+    now = timezone.now()
+    environment_feature_state = FeatureState.objects.get(
+        feature=feature, environment=environment, feature_segment=None, identity=None
+    )
+    environment_feature_state.live_from = now - timedelta(minutes=3)
+    environment_feature_state.save()
+
+    # a number of versions of the environment default, the most recent of which
+    # has the lowest version number
+    latest_environment_feature_state = environment_feature_state.clone(
+        env=environment, live_from=now - timedelta(minutes=1), version=2
+    )
+    environment_feature_state.clone(
+        env=environment, live_from=now - timedelta(minutes=2), version=3
+    )
+    # and versions that aren't live
+    environment_feature_state.clone(
+        env=environment, live_from=now + timedelta(days=1), version=4
+    )
+    environment_feature_state.clone(env=environment, as_draft=True)
+
+    # and versions of the segment override with the same live from
+    segment_featurestate.live_from = now - timedelta(minutes=1)
+    segment_featurestate.version = 1
+    segment_featurestate.save()
+    latest_segment_featurestate = segment_featurestate.clone(
+        env=environment, live_from=now - timedelta(minutes=1), version=2
+    )
+
+    # When
+    feature_states = get_environment_flags_list(environment=environment)
+
+    # Then
+    assert len(feature_states) == 3
+    assert set(feature_states) == {
+        identity_featurestate,
+        latest_environment_feature_state,
+        latest_segment_featurestate,
+    }
+
+
 def test_get_environment_flags_v2_versioning_returns_latest_live_versions_of_feature_states(
     project: Project,
     environment_v2_versioning: Environment,
@@ -228,3 +292,110 @@ def test_get_current_live_environment_feature_version(
 
     # Then
     assert latest_version == version_1
+
+
+def test_refresh_live_feature_states_v1_versioning(
+    feature: Feature,
+    environment: Environment,
+    segment: Segment,
+    feature_segment: FeatureSegment,
+    segment_featurestate: FeatureState,
+) -> None:
+    # Given
+    now = timezone.now()
+    environment_default_v1 = FeatureState.objects.get(
+        feature=feature, environment=environment, feature_segment=None, identity=None
+    )
+    environment_default_v1.live_from = now - timedelta(minutes=3)
+    environment_default_v1.save()
+
+    environment_default_v2 = environment_default_v1.clone(
+        env=environment, live_from=now - timedelta(minutes=1), version=2
+    )
+    scheduled_environment_default = environment_default_v1.clone(
+        env=environment, live_from=now + timedelta(days=1), version=3
+    )
+    environment_default_v1.clone(env=environment, as_draft=True)
+
+    # When
+    refresh_live_feature_states(environment)
+
+    # Then
+    assert set(
+        LiveFeatureState.objects.filter(environment=environment).values_list(
+            "feature_state_id", "is_scheduled"
+        )
+    ) == {
+        (environment_default_v2.id, False),
+        (scheduled_environment_default.id, True),
+        (segment_featurestate.id, False),
+    }
+
+
+def test_refresh_live_feature_states_v2_versioning(
+    feature: Feature,
+    environment_v2_versioning: Environment,
+    staff_user: FFAdminUser,
+) -> None:
+    # Given
+    version_2 = EnvironmentFeatureVersion.objects.create(
+        environment=environment_v2_versioning, feature=feature
+    )
+    version_2.publish(staff_user)
+
+    scheduled_version = EnvironmentFeatureVersion.objects.create(
+        environment=environment_v2_versioning, feature=feature
+    )
+    scheduled_version.publish(staff_user, live_from=timezone.now() + timedelta(days=1))
+
+    EnvironmentFeatureVersion.objects.create(
+        environment=environment_v2_versioning, feature=feature
+    )
+
+    # When
+    refresh_live_feature_states(environment_v2_versioning, [feature.id])
+
+    # Then
+    assert set(
+        LiveFeatureState.objects.filter(
+            environment=environment_v2_versioning
+        ).values_list("feature_state__environment_feature_version", "is_scheduled")
+    ) == {(version_2.uuid, False), (scheduled_version.uuid, True)}
+
+
+def test_get_environment_flags_list_uses_live_feature_states(
+    feature: Feature,
+    environment: Environment,
+    identity: Identity,
+    settings: SettingsWrapper,
+) -> None:
+    # Given
+    settings.USE_LIVE_FEATURE_STATES = True
+    now = timezone.now()
+
+    environment_default_v1 = FeatureState.objects.get(
+        feature=feature, environment=environment, feature_segment=None, identity=None
+    )
+    environment_default_v1.live_from = now - timedelta(minutes=3)
+    environment_default_v1.save()
+
+    # the live feature states are refreshed as the feature states are saved
+    environment_default_v2 = environment_default_v1.clone(
+        env=environment, live_from=now - timedelta(minutes=1), version=2
+    )
+    environment_default_v1.clone(
+        env=environment, live_from=now + timedelta(days=1), version=3
+    )
+    identity_override = FeatureState.objects.create(
+        feature=feature, environment=environment, identity=identity
+    )
+
+    # When
+    environment_feature_states = get_environment_flags_list(environment=environment)
+
+    # Then
+    assert set(environment_feature_states) == {
+        environment_default_v2,
+        identity_override,
+    }
+    assert not LiveFeatureState.objects.filter(feature_state=identity_override).exists()
@@ -3,6 +3,7 @@ from datetime import timedelta
 import pytest
 from django.contrib.sites.models import Site
 from django.utils import timezone
+from pytest_django.fixtures import SettingsWrapper
 from pytest_mock import MockerFixture
 
 from audit.constants import (
@@ -15,7 +16,10 @@ from audit.models import AuditLog
 from audit.related_object_type import RelatedObjectType
 from environments.models import Environment
 from features.models import Feature, FeatureState
-from features.versioning.models import EnvironmentFeatureVersion
+from features.versioning.models import (
+    EnvironmentFeatureVersion,
+    LiveFeatureState,
+)
 from features.versioning.versioning_service import get_environment_flags_list
 from features.workflows.core.exceptions import (
     CannotApproveOwnChangeRequest,
@@ -156,6 +160,28 @@ def test_change_request_commit_not_scheduled(
     assert change_request_no_required_approvals.feature_states.first().live_from == now
 
 
+def test_change_request_commit_refreshes_live_feature_states(
+    change_request_no_required_approvals: ChangeRequest,
+    settings: SettingsWrapper,
+) -> None:
+    # Given
+    settings.USE_LIVE_FEATURE_STATES = True
+    user = FFAdminUser.objects.create(email="approver@example.com")
+
+    # When
+    change_request_no_required_approvals.commit(committed_by=user)
+
+    # Then
+    feature_state = change_request_no_required_approvals.feature_states.get()
+    assert (
+        LiveFeatureState.objects.get(
+            environment=change_request_no_required_approvals.environment,
+            feature=feature_state.feature,
+        ).feature_state
+        == feature_state
+    )
+
+
 def test_creating_a_change_request_creates_audit_log(environment, admin_user):
     # When
     change_request = ChangeRequest.objects.create(
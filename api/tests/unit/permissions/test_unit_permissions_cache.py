@@ -0,0 +1,129 @@
+import pytest
+from pytest_django import DjangoAssertNumQueries
+from pytest_django.fixtures import SettingsWrapper
+
+from environments.models import Environment
+from organisations.models import Organisation
+from permissions.permission_service import get_permitted_projects_for_user
+from permissions.permissions_cache import (
+    get_or_resolve_permissions,
+    invalidate_permissions_cache,
+    permissions_cache,
+)
+from projects.models import Project, UserPermissionGroupProjectPermission
+from projects.permissions import VIEW_PROJECT
+from tests.types import WithProjectPermissionsCallable
+from users.models import FFAdminUser, UserPermissionGroup
+
+
+@pytest.fixture()
+def cache_permissions(settings: SettingsWrapper) -> None:
+    settings.CACHE_PERMISSIONS_SECONDS = 60
+    permissions_cache.clear()
+
+
+def test_get_or_resolve_permissions_caches_result_until_invalidated(
+    cache_permissions: None,
+) -> None:
+    # Given
+    results = iter([False, True])
+
+    def resolve() -> bool:
+        return next(results)
+
+    # When
+    first_result = get_or_resolve_permissions(1, ("check", [2, 1]), resolve)
+    cached_result = get_or_resolve_permissions(1, ("check", [1, 2]), resolve)
+    invalidate_permissions_cache()
+    resolved_result = get_or_resolve_permissions(1, ("check", [1, 2]), resolve)
+
+    # Then
+    assert first_result is False
+    assert cached_result is False
+    assert resolved_result is True
+
+
+def test_get_or_resolve_permissions_does_not_cache_if_disabled(
+    settings: SettingsWrapper,
+) -> None:
+    # Given
+    settings.CACHE_PERMISSIONS_SECONDS = 0
+    results = iter([False, True])
+
+    def resolve() -> bool:
+        return next(results)
+
+    # When
+    first_result = get_or_resolve_permissions(1, ("check",), resolve)
+    second_result = get_or_resolve_permissions(1, ("check",), resolve)
+
+    # Then
+    assert first_result is False
+    assert second_result is True
+
+
+def test_get_permitted_projects_for_user_is_cached_until_permissions_change(
+    cache_permissions: None,
+    staff_user: FFAdminUser,
+    project: Project,
+    with_project_permissions: WithProjectPermissionsCallable,
+    django_assert_num_queries: DjangoAssertNumQueries,
+) -> None:
+    # Given
+    user_project_permission = with_project_permissions([VIEW_PROJECT])
+    assert list(get_permitted_projects_for_user(staff_user, VIEW_PROJECT)) == [project]
+
+    # When
+    with django_assert_num_queries(1):
+        permitted_projects = list(
+            get_permitted_projects_for_user(staff_user, VIEW_PROJECT)
+        )
+
+    user_project_permission.delete()
+
+    # Then
+    assert permitted_projects == [project]
+    assert list(get_permitted_projects_for_user(staff_user, VIEW_PROJECT)) == []
+
+
+def test_get_permitted_projects_for_user_is_invalidated_when_group_members_change(
+    cache_permissions: None,
+    staff_user: FFAdminUser,
+    organisation: Organisation,
+    project: Project,
+) -> None:
+    # Given
+    group = UserPermissionGroup.objects.create(
+        organisation=organisation, name="Test group"
+    )
+    group_permission = UserPermissionGroupProjectPermission.objects.create(
+        group=group, project=project
+    )
+    group_permission.add_permission(VIEW_PROJECT)
+
+    assert list(get_permitted_projects_for_user(staff_user, VIEW_PROJECT)) == []
+
+    # When
+    group.users.add(staff_user)
+
+    # Then
+    assert list(get_permitted_projects_for_user(staff_user, VIEW_PROJECT)) == [project]
+
+
+def test_permissions_cache_is_invalidated_when_environment_created(
+    cache_permissions: None,
+    project: Project,
+) -> None:
+    # Given
+    results = iter([False, True])
+
+    def resolve() -> bool:
+        return next(results)
+
+    assert get_or_resolve_permissions(1, ("check",), resolve) is False
+
+    # When
+    Environment.objects.create(name="New environment", project=project)
+
+    # Then
+    assert get_or_resolve_permissions(1, ("check",), resolve) is True
@@ -0,0 +1,98 @@
+import pytest
+from django.utils import timezone
+from pytest_django import DjangoAssertNumQueries
+from pytest_django.fixtures import SettingsWrapper
+
+from environments.models import Environment
+from features.models import FeatureSegment, FeatureState
+from segments.models import Condition, Segment, SegmentRule
+from segments.services import engine_segments_cache, get_engine_segments
+
+
+@pytest.fixture(autouse=True)
+def clear_engine_segments_cache() -> None:
+    engine_segments_cache.clear()
+    yield
+    engine_segments_cache.clear()
+
+
+@pytest.fixture()
+def cache_engine_segments(settings: SettingsWrapper) -> None:
+    settings.CACHE_ENGINE_SEGMENTS = True
+
+
+@pytest.fixture()
+def segment_with_condition(segment: Segment) -> Segment:
+    rule = SegmentRule.objects.create(segment=segment, type=SegmentRule.ALL_RULE)
+    Condition.objects.create(
+        rule=rule, property="plan", operator="EQUAL", value="enterprise"
+    )
+    return segment
+
+
+def test_get_engine_segments__returns_segments_with_engine_models(
+    segment_with_condition: Segment,
+    environment: Environment,
+) -> None:
+    # When
+    engine_segments = get_engine_segments(environment)
+
+    # Then
+    assert len(engine_segments) == 1
+    segment, engine_segment = engine_segments[0]
+    assert segment == segment_with_condition
+    assert engine_segment.id == segment_with_condition.id
+    assert engine_segment.rules[0].conditions[0].value == "enterprise"
+
+
+def test_get_engine_segments__overrides_only__returns_overridden_segments(
+    segment_with_condition: Segment,
+    feature_segment: FeatureSegment,
+    segment_featurestate: FeatureState,
+    environment: Environment,
+) -> None:
+    # Given
+    Segment.objects.create(name="not overridden", project=environment.project)
+
+    # When
+    engine_segments = get_engine_segments(environment, overrides_only=True)
+
+    # Then
+    assert [segment for segment, _ in engine_segments] == [segment_with_condition]
+
+
+def test_get_engine_segments__cached__does_not_hit_db(
+    cache_engine_segments: None,
+    segment_with_condition: Segment,
+    environment: Environment,
+    django_assert_num_queries: DjangoAssertNumQueries,
+) -> None:
+    # Given
+    engine_segments = get_engine_segments(environment)
+
+    # When
+    with django_assert_num_queries(0):
+        cached_engine_segments = get_engine_segments(environment)
+
+    # Then
+    assert cached_engine_segments is engine_segments
+
+
+def test_get_engine_segments__environment_updated__rebuilds_engine_segments(
+    cache_engine_segments: None,
+    segment_with_condition: Segment,
+    environment: Environment,
+) -> None:
+    # Given
+    get_engine_segments(environment)
+    condition = Condition.objects.get(rule__segment=segment_with_condition)
+    condition.value = "startup"
+    condition.save()
+
+    # When
+    environment.updated_at = timezone.now()
+    engine_segments = get_engine_segments(environment)
+
+    # Then
+    _, engine_segment = engine_segments[0]
+    assert engine_segment.rules[0].conditions[0].value == "startup"
@@ -111,7 +111,7 @@ def test_track_sse_usage(
     influxdb_bucket = "test_bucket"
     settings.INFLUXDB_BUCKET = influxdb_bucket
 
-    mocked_influx_db_client = mocker.patch("sse.tasks.influxdb_client")
+    mocked_get_write_api = mocker.patch("sse.tasks.get_write_api")
     mocked_influx_point = mocker.patch("sse.tasks.Point")
 
     # When
@@ -152,9 +152,7 @@ def test_track_sse_usage(
     )
 
     # Only valid logs were written to InfluxDB
-    write_method = (
-        mocked_influx_db_client.write_api.return_value.__enter__.return_value.write
-    )
+    write_method = mocked_get_write_api.return_value.write
 
     assert write_method.call_count == 1
     write_method.assert_called_once_with(
@@ -0,0 +1,136 @@
+import pytest
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from pytest_django.fixtures import SettingsWrapper
+from pytest_mock import MockerFixture
+
+from task_processor.benchmark import (
+    BenchmarkError,
+    BenchmarkResult,
+    RunnerStats,
+    get_percentile,
+    run_benchmark,
+)
+from task_processor.models import Task, TaskPriority
+from task_processor.task_run_method import TaskRunMethod
+
+
+@pytest.mark.parametrize("enqueue_rate", (0, 1000))
+@pytest.mark.django_db(transaction=True)
+def test_run_benchmark__processes_all_tasks_and_reports_stats(
+    settings: SettingsWrapper,
+    enqueue_rate: float,
+) -> None:
+    # Given
+    settings.TASK_RUN_METHOD = TaskRunMethod.TASK_PROCESSOR
+
+    # When
+    result = run_benchmark(
+        num_tasks=20,
+        num_runners=2,
+        priority_weights={TaskPriority.HIGH: 1, TaskPriority.LOW: 1},
+        queue_pop_size=5,
+        enqueue_rate=enqueue_rate,
+        timeout_seconds=30,
+        seed=1,
+    )
+
+    # Then
+    assert result.num_processed_tasks == 20
+    assert set(result.pickup_latencies_ms) == {TaskPriority.HIGH, TaskPriority.LOW}
+    assert result.num_polls >= 4
+    assert len(result.get_tasks_to_process_durations_ms) == result.num_polls
+    assert result.processed_tasks_per_second > 0
+    assert result.enqueued_tasks_per_second > 0
+    assert "Pickup latency HIGH (ms): p50=" in result.get_report()
+
+    # and the benchmark tasks were deleted
+    assert not Task.objects.exists()
+
+
+def test_run_benchmark__task_run_method_is_not_task_processor__raises_error(
+    settings: SettingsWrapper,
+) -> None:
+    # Given
+    settings.TASK_RUN_METHOD = TaskRunMethod.SYNCHRONOUSLY
+
+    # When
+    with pytest.raises(BenchmarkError):
+        run_benchmark(
+            num_tasks=1, num_runners=1, priority_weights={TaskPriority.NORMAL: 1}
+        )
+
+
+def test_run_benchmark__tasks_queued__raises_error(
+    db: None,
+    settings: SettingsWrapper,
+) -> None:
+    # Given
+    settings.TASK_RUN_METHOD = TaskRunMethod.TASK_PROCESSOR
+    Task.create("some_module.some_task", scheduled_for=None).save()
+
+    # When
+    with pytest.raises(BenchmarkError):
+        run_benchmark(
+            num_tasks=1, num_runners=1, priority_weights={TaskPriority.NORMAL: 1}
+        )
+
+    # Then
+    assert Task.objects.count() == 1
+
+
+@pytest.mark.parametrize(
+    "percentile, expected_value",
+    ((0, 1), (50, 5), (90, 9), (99, 10), (100, 10)),
+)
+def test_get_percentile(percentile: float, expected_value: float) -> None:
+    assert get_percentile(list(range(10, 0, -1)), percentile) == expected_value
+
+
+def test_benchmarktaskprocessor__runs_benchmark_with_options(
+    mocker: MockerFixture,
+) -> None:
+    # Given
+    mocked_run_benchmark = mocker.patch(
+        "task_processor.management.commands.benchmarktaskprocessor.run_benchmark",
+        return_value=BenchmarkResult(
+            num_tasks=10,
+            num_processed_tasks=10,
+            num_runners=2,
+            enqueue_seconds=1,
+            process_seconds=2,
+            pickup_latencies_ms={TaskPriority.NORMAL: [1.0, 2.0]},
+            runner_stats=[RunnerStats(num_polls=3)],
+        ),
+    )
+    mocked_stdout = mocker.patch("sys.stdout")
+
+    # When
+    call_command(
+        "benchmarktaskprocessor",
+        "--numtasks=10",
+        "--numrunners=2",
+        "--priorities=normal=9,HIGHEST=1",
+        "--taskdurationms=5",
+    )
+
+    # Then
+    mocked_run_benchmark.assert_called_once_with(
+        num_tasks=10,
+        num_runners=2,
+        priority_weights={TaskPriority.NORMAL: 9, TaskPriority.HIGHEST: 1},
+        queue_pop_size=10,
+        task_duration_ms=5,
+        enqueue_rate=0,
+        poll_interval_ms=10,
+        timeout_seconds=600,
+        seed=None,
+    )
+    output = "".join(call.args[0] for call in mocked_stdout.write.call_args_list)
+    assert "Process: 5.0 tasks/s (2.00s)" in output
+
+
+def test_benchmarktaskprocessor__invalid_priorities__raises_error() -> None:
+    # When
+    with pytest.raises(CommandError):
+        call_command("benchmarktaskprocessor", "--priorities=URGENT=1")
@@ -3,6 +3,7 @@ from datetime import timedelta
 from unittest.mock import MagicMock
 
 import pytest
+from django.utils import timezone
 from django_capture_on_commit_callbacks import capture_on_commit_callbacks
 from pytest_django.fixtures import SettingsWrapper
 from pytest_mock import MockerFixture
@@ -212,3 +213,49 @@ def test_can_create_task_with_priority(settings, db):
 
     # Then
     assert task.priority == TaskPriority.HIGH
+
+
+def test_delay__task_processor__notifies_task_created(
+    settings: SettingsWrapper,
+    db: None,
+    mocker: MockerFixture,
+) -> None:
+    # Given
+    settings.TASK_RUN_METHOD = TaskRunMethod.TASK_PROCESSOR
+    mocked_notify_task_created = mocker.patch(
+        "task_processor.decorators.notify_task_created"
+    )
+
+    @register_task_handler()
+    def my_function(*args, **kwargs):
+        pass
+
+    # When
+    my_function.delay()
+
+    # Then
+    mocked_notify_task_created.assert_called_once_with(
+        "test_unit_task_processor_decorators.my_function"
+    )
+
+
+def test_delay__task_processor_with_delay_until__does_not_notify_task_created(
+    settings: SettingsWrapper,
+    db: None,
+    mocker: MockerFixture,
+) -> None:
+    # Given
+    settings.TASK_RUN_METHOD = TaskRunMethod.TASK_PROCESSOR
+    mocked_notify_task_created = mocker.patch(
+        "task_processor.decorators.notify_task_created"
+    )
+
+    @register_task_handler()
+    def my_function(*args, **kwargs):
+        pass
+
+    # When
+    my_function.delay(delay_until=timezone.now() + timedelta(minutes=5))
+
+    # Then
+    mocked_notify_task_created.assert_not_called()
@@ -0,0 +1,38 @@
+import pytest
+from pytest_django.fixtures import SettingsWrapper
+from pytest_mock import MockerFixture
+
+from task_processor.notifications import (
+    TaskCreatedListener,
+    notify_task_created,
+)
+
+
+@pytest.mark.django_db(transaction=True)
+def test_task_created_listener__task_created__returns_true() -> None:
+    # Given
+    listener = TaskCreatedListener()
+    assert listener.wait(timeout_seconds=0.01) is False
+
+    # When
+    notify_task_created("test_task")
+
+    # Then
+    assert listener.wait(timeout_seconds=1) is True
+    assert listener.wait(timeout_seconds=0.01) is False
+
+
+def test_notify_task_created__disabled__does_not_notify(
+    settings: SettingsWrapper,
+    mocker: MockerFixture,
+) -> None:
+    # Given
+    settings.TASK_PROCESSOR_ENABLE_LISTEN_NOTIFY = False
+    mocked_connection = mocker.patch("task_processor.notifications.connection")
+    mocked_connection.vendor = "postgresql"
+
+    # When
+    notify_task_created("test_task")
+
+    # Then
+    mocked_connection.cursor.assert_not_called()
@@ -0,0 +1,60 @@
+import time
+from datetime import datetime
+
+import pytest
+from django.utils import timezone
+from pytest_mock import MockerFixture
+
+from task_processor.processes import TaskRunnerProcess
+
+
+class FakeTaskRunner:
+    def __init__(self, *args, **kwargs) -> None:
+        self.last_checked_for_tasks: datetime | None = None
+        self._stopped = False
+
+    def start(self) -> None:
+        self.last_checked_for_tasks = timezone.now()
+
+    def stop(self) -> None:
+        self._stopped = True
+
+    def join(self) -> None:
+        pass
+
+    def is_alive(self) -> bool:
+        return not self._stopped
+
+
+@pytest.fixture()
+def fake_task_runner(mocker: MockerFixture) -> None:
+    # The patched class is inherited by the forked process.
+    mocker.patch("task_processor.processes.TaskRunner", FakeTaskRunner)
+    mocker.patch("task_processor.processes.HEARTBEAT_INTERVAL_SECONDS", 0.01)
+
+
+def test_task_runner_process__reports_heartbeat_and_stops(
+    fake_task_runner: None,
+) -> None:
+    # Given
+    started_at = timezone.now()
+    task_runner_process = TaskRunnerProcess(name="TaskRunnerProcess-1")
+
+    # When
+    task_runner_process.start()
+    deadline = time.monotonic() + 5
+    while task_runner_process.last_checked_for_tasks <= started_at:
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+    # Then
+    assert task_runner_process.is_alive()
+    assert task_runner_process.name == "TaskRunnerProcess-1"
+
+    # When
+    task_runner_process.stop()
+    task_runner_process.join(timeout=5)
+
+    # Then
+    assert not task_runner_process.is_alive()
+    assert task_runner_process.exitcode == 0
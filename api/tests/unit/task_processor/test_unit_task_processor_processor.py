@@ -1,3 +1,4 @@
+import asyncio
 import logging
 import time
 import uuid
@@ -25,6 +26,7 @@ from task_processor.processor import (
     UNREGISTERED_RECURRING_TASK_GRACE_PERIOD,
     run_recurring_tasks,
     run_tasks,
+    run_tasks_async,
 )
 from task_processor.task_registry import registered_tasks
 
@@ -431,6 +433,51 @@ def test_recurring_tasks_are_unlocked_if_picked_up_but_not_executed(
     assert recurring_task.is_locked is False
 
 
+@pytest.mark.django_db(transaction=True)
+def test_run_tasks_async__runs_tasks_concurrently() -> None:
+    # Given
+    tasks = [
+        Task.create(_sleep.task_identifier, scheduled_for=timezone.now(), args=(1,))
+        for _ in range(3)
+    ]
+    tasks.append(
+        Task.create(
+            _async_sleep.task_identifier, scheduled_for=timezone.now(), args=(1,)
+        )
+    )
+    Task.objects.bulk_create(tasks)
+
+    # When
+    started_at = time.monotonic()
+    task_runs = asyncio.run(run_tasks_async(4))
+    duration = time.monotonic() - started_at
+
+    # Then
+    assert duration < 2
+    assert len(task_runs) == TaskRun.objects.count() == 4
+    assert all(task_run.result == TaskResult.SUCCESS for task_run in task_runs)
+    assert Task.objects.filter(completed=True).count() == 4
+
+
+@pytest.mark.django_db(transaction=True)
+def test_run_tasks_async__task_fails__creates_failed_task_run() -> None:
+    # Given
+    task = Task.create(_raise_exception.task_identifier, scheduled_for=timezone.now())
+    task.save()
+
+    # When
+    task_runs = asyncio.run(run_tasks_async())
+
+    # Then
+    assert len(task_runs) == 1
+    assert task_runs[0].result == TaskResult.FAILURE
+    assert task_runs[0].error_details
+
+    task.refresh_from_db()
+    assert not task.completed
+    assert task.num_failures == 1
+
+
 @register_task_handler()
 def _create_organisation(name: str):
     """function used to test that task is being run successfully"""
@@ -445,3 +492,8 @@ def _raise_exception():
 @register_task_handler()
 def _sleep(seconds: int):
     time.sleep(seconds)
+
+
+@register_task_handler()
+async def _async_sleep(seconds: int):
+    await asyncio.sleep(seconds)
@@ -1,11 +1,13 @@
 import logging
+import time
 from typing import Type
 
 import pytest
 from django.db import DatabaseError
+from pytest_django.fixtures import SettingsWrapper
 from pytest_mock import MockerFixture
 
-from task_processor.threads import TaskRunner
+from task_processor.threads import AsyncTaskRunner, TaskRunner
 from tests.unit.task_processor.conftest import GetTaskProcessorCaplog
 
 
@@ -43,3 +45,94 @@ def test_task_runner_is_resilient_to_errors(
 
     assert caplog.records[1].levelno == logging.DEBUG
     assert caplog.records[1].message.startswith("Traceback")
+
+
+def test_task_runner_wait_for_tasks__listen_notify_disabled__sleeps(
+    settings: SettingsWrapper,
+    mocker: MockerFixture,
+) -> None:
+    # Given
+    settings.TASK_PROCESSOR_ENABLE_LISTEN_NOTIFY = False
+    mocked_sleep = mocker.patch("task_processor.threads.time.sleep")
+    task_runner = TaskRunner(sleep_interval_millis=500)
+
+    # When
+    task_runner.wait_for_tasks()
+
+    # Then
+    mocked_sleep.assert_called_once_with(0.5)
+
+
+def test_task_runner_wait_for_tasks__listen_notify_enabled__waits_for_notification(
+    db: None,
+    settings: SettingsWrapper,
+    mocker: MockerFixture,
+) -> None:
+    # Given
+    settings.TASK_PROCESSOR_ENABLE_LISTEN_NOTIFY = True
+    mocked_sleep = mocker.patch("task_processor.threads.time.sleep")
+    mocked_listener = mocker.patch(
+        "task_processor.threads.TaskCreatedListener"
+    ).return_value
+    task_runner = TaskRunner(sleep_interval_millis=500)
+
+    # When
+    task_runner.wait_for_tasks()
+
+    # Then
+    mocked_listener.wait.assert_called_once_with(0.5)
+    mocked_sleep.assert_not_called()
+
+
+def test_task_runner_wait_for_tasks__listener_error__sleeps(
+    db: None,
+    settings: SettingsWrapper,
+    mocker: MockerFixture,
+    get_task_processor_caplog: GetTaskProcessorCaplog,
+) -> None:
+    # Given
+    caplog = get_task_processor_caplog(logging.ERROR)
+    settings.TASK_PROCESSOR_ENABLE_LISTEN_NOTIFY = True
+    mocked_sleep = mocker.patch("task_processor.threads.time.sleep")
+    mocked_listener = mocker.patch(
+        "task_processor.threads.TaskCreatedListener"
+    ).return_value
+    mocked_listener.wait.side_effect = DatabaseError("Database error")
+    task_runner = TaskRunner(sleep_interval_millis=500)
+
+    # When
+    task_runner.wait_for_tasks()
+
+    # Then
+    mocked_sleep.assert_called_once_with(0.5)
+    assert caplog.records[0].message == (
+        "Received error waiting for tasks: Database error."
+    )
+
+
+@pytest.mark.django_db(transaction=True)
+def test_async_task_runner__runs_tasks_and_stops(
+    settings: SettingsWrapper,
+    mocker: MockerFixture,
+) -> None:
+    # Given
+    settings.TASK_PROCESSOR_ENABLE_LISTEN_NOTIFY = False
+    mocked_run_tasks_async = mocker.patch(
+        "task_processor.threads.run_tasks_async", return_value=[]
+    )
+    mocked_run_recurring_tasks = mocker.patch(
+        "task_processor.threads.run_recurring_tasks"
+    )
+    task_runner = AsyncTaskRunner(sleep_interval_millis=10, queue_pop_size=5)
+
+    # When
+    task_runner.start()
+    time.sleep(0.1)
+    task_runner.stop()
+    task_runner.join(timeout=5)
+
+    # Then
+    assert not task_runner.is_alive()
+    assert task_runner.last_checked_for_tasks
+    mocked_run_tasks_async.assert_called_with(5)
+    mocked_run_recurring_tasks.assert_called_with(5)
@@ -0,0 +1,178 @@
+import logging
+import threading
+
+import pytest
+from pytest_mock import MockerFixture
+
+from util.executor import BoundedExecutor, QueueFullPolicy
+
+
+def _block_workers(executor: BoundedExecutor) -> threading.Event:
+    """
+    Occupy every worker of the executor until the returned event is set.
+    """
+    release = threading.Event()
+    started = threading.Barrier(executor.max_workers + 1)
+
+    def block() -> None:
+        started.wait(timeout=5)
+        release.wait(timeout=5)
+
+    for _ in range(executor.max_workers):
+        executor.submit(block)
+    started.wait(timeout=5)
+    return release
+
+
+def test_bounded_executor__submit__runs_work_in_worker_thread() -> None:
+    # Given
+    executor = BoundedExecutor(max_workers=2, max_queue_size=10)
+    thread_names = []
+
+    # When
+    submitted = executor.submit(
+        lambda: thread_names.append(threading.current_thread().name)
+    )
+    executor.join()
+
+    # Then
+    assert submitted is True
+    assert thread_names == ["bounded-executor-1"]
+    assert executor.get_metrics().submitted_count == 1
+
+
+def test_bounded_executor__submit__does_not_exceed_max_workers() -> None:
+    # Given
+    executor = BoundedExecutor(max_workers=2, max_queue_size=100)
+    release = _block_workers(executor)
+
+    # When
+    for _ in range(10):
+        executor.submit(lambda: None)
+
+    # Then
+    metrics = executor.get_metrics()
+    assert metrics.worker_count == 2
+    assert metrics.queue_depth == 10
+
+    release.set()
+    executor.join()
+    assert executor.get_metrics().queue_depth == 0
+
+
+def test_bounded_executor__queue_full_drop_policy__drops_work(
+    mocker: MockerFixture,
+) -> None:
+    # Given
+    executor = BoundedExecutor(
+        max_workers=1, max_queue_size=1, queue_full_policy=QueueFullPolicy.DROP
+    )
+    release = _block_workers(executor)
+    executor.submit(lambda: None)
+    work = mocker.MagicMock()
+
+    # When
+    submitted = executor.submit(work)
+
+    # Then
+    assert submitted is False
+    release.set()
+    executor.join()
+    work.assert_not_called()
+    assert executor.get_metrics().dropped_count == 1
+
+
+def test_bounded_executor__queue_full_block_policy__drops_work_after_timeout(
+    mocker: MockerFixture,
+) -> None:
+    # Given
+    executor = BoundedExecutor(
+        max_workers=1,
+        max_queue_size=1,
+        queue_full_policy=QueueFullPolicy.BLOCK,
+        block_timeout_seconds=0.01,
+    )
+    release = _block_workers(executor)
+    executor.submit(lambda: None)
+    work = mocker.MagicMock()
+
+    # When
+    submitted = executor.submit(work)
+
+    # Then
+    assert submitted is False
+    release.set()
+    executor.join()
+    work.assert_not_called()
+    assert executor.get_metrics().dropped_count == 1
+
+
+def test_bounded_executor__queue_full_caller_runs_policy__runs_work_in_caller() -> None:
+    # Given
+    executor = BoundedExecutor(
+        max_workers=1,
+        max_queue_size=1,
+        queue_full_policy=QueueFullPolicy.CALLER_RUNS,
+    )
+    release = _block_workers(executor)
+    executor.submit(lambda: None)
+    thread_names = []
+
+    # When
+    submitted = executor.submit(
+        lambda: thread_names.append(threading.current_thread().name)
+    )
+
+    # Then
+    assert submitted is True
+    assert thread_names == [threading.current_thread().name]
+    assert executor.get_metrics().caller_runs_count == 1
+    release.set()
+    executor.join()
+
+
+def test_bounded_executor__work_raises__worker_keeps_running() -> None:
+    # Given
+    executor = BoundedExecutor(max_workers=1, max_queue_size=10)
+    results = []
+
+    def fail() -> None:
+        raise Exception("oops")
+
+    # When
+    executor.submit(fail)
+    executor.submit(results.append, "done")
+    executor.join()
+
+    # Then
+    assert results == ["done"]
+
+
+def test_bounded_executor__metrics_log_interval_elapsed__logs_metrics(
+    freezer,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    # Given
+    executor = BoundedExecutor(
+        max_workers=1,
+        max_queue_size=10,
+        name="test-executor",
+        metrics_log_interval_seconds=60,
+    )
+    caplog.set_level(logging.INFO, logger="util.executor")
+
+    # When
+    freezer.tick(30)
+    executor.submit(lambda: None)
+    executor.join()
+    assert not caplog.records
+
+    freezer.tick(31)
+    executor.submit(lambda: None)
+    executor.join()
+
+    # Then
+    assert [record.getMessage() for record in caplog.records] == [
+        "test-executor: 0/10 items queued, 1 workers, 1 submitted, 0 dropped, "
+        "0 run by caller."
+    ]
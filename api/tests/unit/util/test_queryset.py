@@ -1,21 +1,21 @@
 from environments.identities.models import Identity
 from environments.identities.traits.models import Trait
-from util.queryset import iterator_with_prefetch
+from util.queryset import iter_pk_chunks, iterator_with_prefetch
 
 
-def test_iterator_with_prefetch_adds_order_by_to_queryset_if_not_present(
-    mocker, identity
-):
+def test_iterator_with_prefetch_iterates_in_primary_key_order(environment):
     # Given
-    queryset = Identity.objects.all()
-    mocked_paginator = mocker.patch("util.queryset.Paginator")
+    identities = [
+        Identity.objects.create(identifier=f"test_user_{i}", environment=environment)
+        for i in range(5)
+    ]
+    queryset = Identity.objects.order_by("-identifier")
 
     # When
-    list(iterator_with_prefetch(queryset, chunk_size=1))
+    result = list(iterator_with_prefetch(queryset, chunk_size=2))
 
     # Then
-    args, _ = mocked_paginator.call_args
-    assert args[0].query.order_by == ("pk",)
+    assert result == identities
 
 
 def test_iterator_with_prefetch_make_correct_number_of_queries(
@@ -38,12 +38,59 @@ def test_iterator_with_prefetch_make_correct_number_of_queries(
     iterator = iterator_with_prefetch(queryset, chunk_size=10)
 
     # Then, test, that we only make 5 queries
-    # first one to fetch the count
-    # second one to fetch first page of identities
-    # third one to fetch traits for the first page of identities
-    # fourth one to fetch identities for the second page
-    # and the last one to fetch traits for the last page of identities
+    # first one to fetch first page of identities
+    # second one to fetch traits for the first page of identities
+    # third one to fetch identities for the second page
+    # fourth one to fetch traits for the second page of identities
+    # and the last one to find that there are no more identities
     with django_assert_num_queries(5):
         for identity in iterator:
             assert identity.environment.name
             assert identity.identity_traits.all().first().trait_key
+
+
+def test_iterator_with_prefetch_does_not_query_past_a_partial_chunk(
+    environment, django_assert_num_queries
+):
+    # Given
+    for i in range(3):
+        Identity.objects.create(identifier=f"test_user_{i}", environment=environment)
+
+    queryset = Identity.objects.filter(environment=environment)
+
+    # When
+    with django_assert_num_queries(2):
+        result = list(iterator_with_prefetch(queryset, chunk_size=2))
+
+    # Then
+    assert len(result) == 3
+
+
+def test_iter_pk_chunks_yields_primary_keys_in_chunks(environment):
+    # Given
+    identity_ids = [
+        Identity.objects.create(identifier=f"test_user_{i}", environment=environment).id
+        for i in range(5)
+    ]
+    queryset = Identity.objects.filter(environment=environment)
+
+    # When
+    chunks = list(iter_pk_chunks(queryset, chunk_size=2))
+
+    # Then
+    assert chunks == [identity_ids[0:2], identity_ids[2:4], identity_ids[4:]]
+
+
+def test_iter_pk_chunks_only_yields_primary_keys_after_the_given_one(environment):
+    # Given
+    identity_ids = [
+        Identity.objects.create(identifier=f"test_user_{i}", environment=environment).id
+        for i in range(5)
+    ]
+    queryset = Identity.objects.filter(environment=environment)
+
+    # When
+    chunks = list(iter_pk_chunks(queryset, chunk_size=2, after_pk=identity_ids[2]))
+
+    # Then
+    assert chunks == [identity_ids[3:]]
@@ -1,4 +1,19 @@
-from util.util import iter_paired_chunks
+from pytest_mock import MockerFixture
+
+from util.util import (
+    get_postpone_executor,
+    iter_chunks,
+    iter_paired_chunks,
+    postpone,
+)
+
+
+def test__iter_chunks__yields_chunks_of_up_to_chunk_size():
+    assert list(iter_chunks(iter(range(5)), chunk_size=2)) == [[0, 1], [2, 3], [4]]
+
+
+def test__iter_chunks__empty():
+    assert list(iter_chunks([], chunk_size=2)) == []
 
 
 def test__iter_paired_chunks__empty():
@@ -42,3 +57,16 @@ def test__iter_pair_chunks__same_length():
         ([1, 2], [4]),
         ([3], [5, 6]),
     ]
+
+
+def test__postpone__runs_function_in_shared_executor(mocker: MockerFixture) -> None:
+    # Given
+    function = mocker.MagicMock(__name__="function")
+    postponed_function = postpone(function)
+
+    # When
+    postponed_function(1, foo="bar")
+    get_postpone_executor().join()
+
+    # Then
+    function.assert_called_once_with(1, foo="bar")
@@ -0,0 +1,204 @@
+"""
+A bounded pool of worker threads for fire-and-forget work (see
+`util.util.postpone`).
+
+Unlike starting a new thread for every call, the number of threads and the
+amount of pending work are both capped, so that a burst of requests can't
+exhaust the memory of the process. When the queue is full, the configured
+`QueueFullPolicy` decides what happens to new work. The queue depth and the
+number of dropped items can be logged periodically (see
+`metrics_log_interval_seconds`).
+"""
+
+import logging
+import os
+import queue
+import threading
+import time
+import typing
+from dataclasses import dataclass
+from enum import Enum
+
+logger = logging.getLogger(__name__)
+
+DROPPED_WORK_LOG_INTERVAL_SECONDS = 60
+
+
+class QueueFullPolicy(Enum):
+    # discard the new work
+    DROP = "DROP"
+    # wait for space in the queue, discarding the work if none frees up in time
+    BLOCK = "BLOCK"
+    # run the work in the calling thread
+    CALLER_RUNS = "CALLER_RUNS"
+
+
+@dataclass
+class ExecutorMetrics:
+    queue_depth: int
+    worker_count: int
+    submitted_count: int
+    dropped_count: int
+    caller_runs_count: int
+
+
+class BoundedExecutor:
+    def __init__(
+        self,
+        max_workers: int,
+        max_queue_size: int,
+        queue_full_policy: QueueFullPolicy = QueueFullPolicy.DROP,
+        block_timeout_seconds: float | None = None,
+        name: str = "bounded-executor",
+        metrics_log_interval_seconds: float | None = None,
+    ) -> None:
+        self.max_workers = max_workers
+        self.max_queue_size = max_queue_size
+        self.queue_full_policy = queue_full_policy
+        self.block_timeout_seconds = block_timeout_seconds
+        self.name = name
+        self.metrics_log_interval_seconds = metrics_log_interval_seconds
+
+        self._lock = threading.Lock()
+        self._reset()
+
+    def submit(
+        self,
+        fn: typing.Callable[..., typing.Any],
+        *args: typing.Any,
+        **kwargs: typing.Any,
+    ) -> bool:
+        """
+        Schedule `fn` to be called with the given arguments in a worker thread.
+
+        Returns False if the work was dropped because the queue was full.
+        """
+        self._ensure_workers()
+        self._log_metrics_if_due()
+
+        work = (fn, args, kwargs)
+        try:
+            if self.queue_full_policy == QueueFullPolicy.BLOCK:
+                self._queue.put(work, timeout=self.block_timeout_seconds)
+            else:
+                self._queue.put_nowait(work)
+        except queue.Full:
+            if self.queue_full_policy == QueueFullPolicy.CALLER_RUNS:
+                with self._lock:
+                    self._caller_runs_count += 1
+                self._run(fn, args, kwargs)
+                return True
+
+            self._on_dropped()
+            return False
+
+        with self._lock:
+            self._submitted_count += 1
+        return True
+
+    def get_metrics(self) -> ExecutorMetrics:
+        with self._lock:
+            return ExecutorMetrics(
+                queue_depth=self._queue.qsize(),
+                worker_count=len(self._workers),
+                submitted_count=self._submitted_count,
+                dropped_count=self._dropped_count,
+                caller_runs_count=self._caller_runs_count,
+            )
+
+    def join(self) -> None:
+        """
+        Wait until all submitted work has been processed.
+        """
+        self._queue.join()
+
+    def _reset(self) -> None:
+        self._pid = os.getpid()
+        self._queue: queue.Queue = queue.Queue(maxsize=self.max_queue_size)
+        self._workers: list[threading.Thread] = []
+        self._submitted_count = 0
+        self._dropped_count = 0
+        self._caller_runs_count = 0
+        self._last_dropped_logged_at: float | None = None
+        self._last_metrics_logged_at = time.monotonic()
+
+    def _ensure_workers(self) -> None:
+        with self._lock:
+            if self._pid != os.getpid():
+                # The process has been forked (e.g. by gunicorn with
+                # --preload) so the worker threads don't exist in this process.
+                self._reset()
+
+            if len(self._workers) >= self.max_workers:
+                return
+
+            # Workers are started lazily so idle processes don't hold threads.
+            worker = threading.Thread(
+                target=self._work,
+                name=f"{self.name}-{len(self._workers) + 1}",
+                daemon=True,
+            )
+            worker.start()
+            self._workers.append(worker)
+
+    def _work(self) -> None:
+        while True:
+            fn, args, kwargs = self._queue.get()
+            try:
+                self._run(fn, args, kwargs)
+            finally:
+                self._queue.task_done()
+
+    def _run(
+        self,
+        fn: typing.Callable[..., typing.Any],
+        args: tuple[typing.Any, ...],
+        kwargs: dict[str, typing.Any],
+    ) -> None:
+        try:
+            fn(*args, **kwargs)
+        except Exception:
+            logger.exception("%s: error running %r.", self.name, fn)
+
+    def _log_metrics_if_due(self) -> None:
+        if not self.metrics_log_interval_seconds:
+            return
+
+        now = time.monotonic()
+        with self._lock:
+            if now - self._last_metrics_logged_at < self.metrics_log_interval_seconds:
+                return
+            self._last_metrics_logged_at = now
+
+        metrics = self.get_metrics()
+        logger.info(
+            "%s: %d/%d items queued, %d workers, %d submitted, %d dropped, "
+            "%d run by caller.",
+            self.name,
+            metrics.queue_depth,
+            self.max_queue_size,
+            metrics.worker_count,
+            metrics.submitted_count,
+            metrics.dropped_count,
+            metrics.caller_runs_count,
+        )
+
+    def _on_dropped(self) -> None:
+        with self._lock:
+            self._dropped_count += 1
+            now = time.monotonic()
+            if (
+                self._last_dropped_logged_at is not None
+                and now - self._last_dropped_logged_at
+                < DROPPED_WORK_LOG_INTERVAL_SECONDS
+            ):
+                return
+            self._last_dropped_logged_at = now
+            dropped_count = self._dropped_count
+
+        logger.warning(
+            "%s: queue is full (%d items), dropping work. %d items dropped so far.",
+            self.name,
+            self.max_queue_size,
+            dropped_count,
+        )
@@ -1,4 +1,6 @@
 from util.mappers.dynamodb import (
+    map_engine_environment_to_environment_document,
+    map_engine_environment_to_environment_v2_document,
     map_engine_feature_state_to_identity_override,
     map_engine_identity_to_identity_document,
     map_environment_api_key_to_environment_api_key_document,
@@ -16,6 +18,8 @@ from util.mappers.engine import (
 )
 
 __all__ = (
+    "map_engine_environment_to_environment_document",
+    "map_engine_environment_to_environment_v2_document",
     "map_engine_feature_state_to_identity_override",
     "map_engine_identity_to_identity_document",
     "map_environment_api_key_to_environment_api_key_document",
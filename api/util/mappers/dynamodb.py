@@ -23,6 +23,7 @@ from util.mappers.engine import (
 )
 
 if TYPE_CHECKING:
+    from flag_engine.environments.models import EnvironmentModel
     from flag_engine.identities.models import IdentityModel
 
     from environments.identities.models import Identity
@@ -30,6 +31,8 @@ if TYPE_CHECKING:
 
 
 __all__ = (
+    "map_engine_environment_to_environment_document",
+    "map_engine_environment_to_environment_v2_document",
     "map_engine_identity_to_identity_document",
     "map_environment_api_key_to_environment_api_key_document",
     "map_environment_to_environment_document",
@@ -43,25 +46,41 @@ Document: TypeAlias = Dict[str, DocumentValue]
 
 def map_environment_to_environment_document(
     environment: "Environment",
+) -> Document:
+    return map_engine_environment_to_environment_document(
+        map_environment_to_engine(environment),
+    )
+
+
+def map_engine_environment_to_environment_document(
+    engine_environment: "EnvironmentModel",
 ) -> Document:
     return {
         field_name: _map_value_to_document_value(value)
-        for field_name, value in map_environment_to_engine(
-            environment,
-        )
+        for field_name, value in engine_environment
     }
 
 
 def map_environment_to_environment_v2_document(
     environment: "Environment",
 ) -> Document:
-    environment_document = map_environment_to_environment_document(environment)
+    return map_engine_environment_to_environment_v2_document(
+        map_environment_to_engine(environment),
+    )
+
+
+def map_engine_environment_to_environment_v2_document(
+    engine_environment: "EnvironmentModel",
+) -> Document:
+    environment_document = map_engine_environment_to_environment_document(
+        engine_environment
+    )
     environment_api_key = environment_document.pop("api_key")
     return {
         **environment_document,
         "document_key": ENVIRONMENTS_V2_ENVIRONMENT_META_DOCUMENT_KEY,
         "environment_api_key": environment_api_key,
-        "environment_id": str(environment.id),
+        "environment_id": str(engine_environment.id),
     }
 
 
@@ -24,6 +24,8 @@ from flag_engine.segments.models import (
     SegmentRuleModel,
 )
 
+from features.priority import get_highest_priority_feature_states
+
 if TYPE_CHECKING:
     from environments.identities.models import Identity, Trait
     from environments.models import Environment, EnvironmentAPIKey
@@ -41,10 +43,14 @@ if TYPE_CHECKING:
 
 __all__ = (
     "map_environment_api_key_to_engine",
+    "map_environment_feature_states_to_engine",
+    "map_environment_integrations_to_engine",
+    "map_environment_segment_to_engine",
     "map_environment_to_engine",
     "map_feature_to_engine",
     "map_identity_to_engine",
     "map_mv_option_to_engine",
+    "map_organisation_to_engine",
     "map_segment_to_engine",
     "map_traits_to_engine",
 )
@@ -215,33 +221,12 @@ def map_environment_to_engine(
     }
 
     # Read integrations.
-    integration_configs: dict[str, Optional["EnvironmentIntegrationModel"]] = {}
-    for attr_name in (
-        "amplitude_config",
-        "dynatrace_config",
-        "heap_config",
-        "mixpanel_config",
-        "rudderstack_config",
-        "segment_config",
-    ):
-        integration_config = getattr(environment, attr_name, None)
-        if integration_config and not integration_config.deleted:
-            integration_configs[attr_name] = integration_config
-
-    webhook_config: Optional["WebhookConfiguration"] = getattr(
-        environment, "webhook_config", None
-    )
+    integration_models = map_environment_integrations_to_engine(environment)
 
     # No reading from ORM past this point!
 
     # Prepare relationships.
-    organisation_model = OrganisationModel(
-        id=organisation.pk,
-        name=organisation.name,
-        feature_analytics=organisation.feature_analytics,
-        stop_serving_flags=organisation.stop_serving_flags,
-        persist_trait_data=organisation.persist_trait_data,
-    )
+    organisation_model = map_organisation_to_engine(organisation)
     project_segment_models = [
         SegmentModel(
             id=segment.pk,
@@ -287,34 +272,6 @@ def map_environment_to_engine(
         for feature_state in environment_feature_states
     ]
 
-    # Prepare integrations.
-    amplitude_config_model = map_integration_to_engine(
-        integration_configs.pop("amplitude_config", None),
-    )
-    dynatrace_config_model = map_integration_to_engine(
-        integration_configs.pop("dynatrace_config", None),
-    )
-    heap_config_model = map_integration_to_engine(
-        integration_configs.pop("heap_config", None),
-    )
-    mixpanel_config_model = map_integration_to_engine(
-        integration_configs.pop("mixpanel_config", None),
-    )
-    rudderstack_config_model = map_integration_to_engine(
-        integration_configs.pop("rudderstack_config", None),
-    )
-    segment_config_model = map_integration_to_engine(
-        integration_configs.pop("segment_config", None),
-    )
-
-    webhook_config_model = (
-        map_webhook_config_to_engine(
-            webhook_config,
-        )
-        if webhook_config and not webhook_config.deleted
-        else None
-    )
-
     return EnvironmentModel(
         #
         # Attributes:
@@ -332,13 +289,129 @@ def map_environment_to_engine(
         feature_states=feature_state_models,
         #
         # Integrations:
-        amplitude_config=amplitude_config_model,
-        dynatrace_config=dynatrace_config_model,
-        heap_config=heap_config_model,
-        mixpanel_config=mixpanel_config_model,
-        rudderstack_config=rudderstack_config_model,
-        segment_config=segment_config_model,
-        webhook_config=webhook_config_model,
+        **integration_models,
+    )
+
+
+def map_organisation_to_engine(organisation: "Organisation") -> OrganisationModel:
+    return OrganisationModel(
+        id=organisation.pk,
+        name=organisation.name,
+        feature_analytics=organisation.feature_analytics,
+        stop_serving_flags=organisation.stop_serving_flags,
+        persist_trait_data=organisation.persist_trait_data,
+    )
+
+
+def map_environment_integrations_to_engine(
+    environment: "Environment",
+) -> Dict[str, Optional[IntegrationModel | WebhookModel]]:
+    """
+    Maps the integration and webhook configurations of an environment to their
+    flag_engine models, keyed by the name of the `EnvironmentModel` attribute.
+    """
+    integration_models: Dict[str, Optional[IntegrationModel | WebhookModel]] = {}
+    for attr_name in (
+        "amplitude_config",
+        "dynatrace_config",
+        "heap_config",
+        "mixpanel_config",
+        "rudderstack_config",
+        "segment_config",
+    ):
+        integration_config: Optional["EnvironmentIntegrationModel"] = getattr(
+            environment, attr_name, None
+        )
+        integration_models[attr_name] = map_integration_to_engine(
+            (
+                integration_config
+                if integration_config and not integration_config.deleted
+                else None
+            ),
+        )
+
+    webhook_config: Optional["WebhookConfiguration"] = getattr(
+        environment, "webhook_config", None
+    )
+    integration_models["webhook_config"] = (
+        map_webhook_config_to_engine(
+            webhook_config,
+        )
+        if webhook_config and not webhook_config.deleted
+        else None
+    )
+    return integration_models
+
+
+def map_environment_feature_states_to_engine(
+    feature_states: Iterable["FeatureState"],
+) -> List[FeatureStateModel]:
+    """
+    Maps the environment default feature states from the given feature states
+    (e.g. all feature states for a single feature in an environment), resolving
+    their priority and versions.
+    """
+    environment_feature_states = _get_prioritised_feature_states(
+        [
+            feature_state
+            for feature_state in feature_states
+            if feature_state.feature_segment_id is None
+            and feature_state.identity_id is None
+        ]
+    )
+    multivariate_feature_state_values_by_feature_state_id = {
+        feature_state.pk: feature_state.multivariate_feature_state_values.all()
+        for feature_state in environment_feature_states
+    }
+
+    # No reading from ORM past this point!
+
+    return [
+        map_feature_state_to_engine(
+            feature_state,
+            mv_fs_values=multivariate_feature_state_values_by_feature_state_id.pop(
+                feature_state.pk,
+            ),
+        )
+        for feature_state in environment_feature_states
+    ]
+
+
+def map_environment_segment_to_engine(
+    segment: "Segment",
+    environment_id: int,
+) -> SegmentModel:
+    """
+    Maps a segment to the flag_engine segment model as it appears in the
+    document of the given environment, i.e. including its overrides.
+    """
+    segment_rules = segment.rules.all()
+    segment_feature_states = _get_segment_feature_states(
+        [segment],
+        environment_id,
+    )[segment.pk]
+    multivariate_feature_state_values_by_feature_state_id = {
+        feature_state.pk: feature_state.multivariate_feature_state_values.all()
+        for feature_state in segment_feature_states
+    }
+
+    # No reading from ORM past this point!
+
+    return SegmentModel(
+        id=segment.pk,
+        name=segment.name,
+        rules=[
+            map_segment_rule_to_engine(segment_rule) for segment_rule in segment_rules
+        ],
+        feature_states=[
+            map_feature_state_to_engine(
+                feature_state,
+                mv_fs_values=multivariate_feature_state_values_by_feature_state_id.pop(
+                    feature_state.pk,
+                ),
+            )
+            for feature_state in segment_feature_states
+        ],
     )
 
 
@@ -411,22 +484,15 @@ def map_identity_to_engine(
 def _get_prioritised_feature_states(
     feature_states: Iterable["FeatureState"],
 ) -> List["FeatureState"]:
-    prioritised_feature_state_by_feature_id = {}
-    for feature_state in feature_states:
-        # TODO: this call to is_live was causing an N+1 issue.
-        #  For now, we have solved it with an extra select_related, but
-        #  there is probably a neater solution here.
-        if not feature_state.is_live:
-            continue
-        if existing_feature_state := prioritised_feature_state_by_feature_id.get(
-            feature_state.feature_id
-        ):
-            if existing_feature_state > feature_state:
-                continue
-        prioritised_feature_state_by_feature_id[feature_state.feature_id] = (
-            feature_state
-        )
-    return list(prioritised_feature_state_by_feature_id.values())
+    # TODO: this call to is_live was causing an N+1 issue.
+    #  For now, we have solved it with an extra select_related, but
+    #  there is probably a neater solution here.
+    return list(
+        get_highest_priority_feature_states(
+            filter(lambda feature_state: feature_state.is_live, feature_states),
+            key_function=lambda feature_state: feature_state.feature_id,
+        ).values()
+    )
 
 
 def _get_segment_feature_states(
@@ -1,16 +1,51 @@
-from django.core.paginator import Paginator
+import typing
 
+from django.db.models import Model, QuerySet
 
-def iterator_with_prefetch(queryset, chunk_size=2000):
+ModelType = typing.TypeVar("ModelType", bound=Model)
+
+
+def iterator_with_prefetch(
+    queryset: QuerySet[ModelType], chunk_size: int = 2000
+) -> typing.Iterator[ModelType]:
     """
-    Since queryset.iterator() does not support prefetch_related.
-    Using Paginator() we can mimic the (somewhat)same behavior
+    Since queryset.iterator() does not support prefetch_related, iterate over
+    the queryset in chunks of `chunk_size` objects, each of which is evaluated
+    (along with its prefetches) separately.
     https://docs.djangoproject.com/en/3.2/ref/models/querysets/#iterator
+
+    Chunks are fetched by primary key (i.e. `WHERE pk > <last pk> LIMIT n`)
+    rather than by offset, so the cost of fetching a chunk doesn't grow as we
+    walk the table. As a result, the objects are always yielded in primary key
+    order, regardless of the ordering of the queryset.
+    """
+    queryset = queryset.order_by("pk")
+    chunk = list(queryset[:chunk_size])
+    while chunk:
+        yield from chunk
+        if len(chunk) < chunk_size:
+            break
+        chunk = list(queryset.filter(pk__gt=chunk[-1].pk)[:chunk_size])
+
+
+def iter_pk_chunks(
+    queryset: QuerySet, chunk_size: int = 2000, after_pk: typing.Any = None
+) -> typing.Iterator[list]:
+    """
+    Iterate over the primary keys of the queryset in ascending order, in
+    lists of up to `chunk_size` primary keys, fetched the same way as
+    `iterator_with_prefetch`. This is useful to split the processing of a large
+    queryset, e.g. between threads.
+
+    :param after_pk: only include primary keys greater than this one
     """
-    if not queryset.query.order_by:
-        # Paginator() throws a warning if there is no sorting attached to the queryset
-        queryset = queryset.order_by("pk")
+    pks = queryset.order_by("pk").values_list("pk", flat=True)
+    if after_pk is not None:
+        pks = pks.filter(pk__gt=after_pk)
 
-    paginator = Paginator(queryset, chunk_size)
-    for index in range(paginator.num_pages):
-        yield from paginator.get_page(index + 1)
+    chunk = list(pks[:chunk_size])
+    while chunk:
+        yield chunk
+        if len(chunk) < chunk_size:
+            break
+        chunk = list(pks.filter(pk__gt=chunk[-1])[:chunk_size])
@@ -1,20 +1,58 @@
+from functools import wraps
 from itertools import islice
 from math import ceil
-from threading import Thread
+from threading import Lock
 from typing import Generator, Iterable, TypeVar
 
+from django.conf import settings
+
+from util.executor import BoundedExecutor
+
 T = TypeVar("T")
 
+_postpone_executor: BoundedExecutor | None = None
+_postpone_executor_lock = Lock()
+
+
+def get_postpone_executor() -> BoundedExecutor:
+    global _postpone_executor
+
+    with _postpone_executor_lock:
+        if _postpone_executor is None:
+            _postpone_executor = BoundedExecutor(
+                max_workers=settings.POSTPONE_MAX_WORKERS,
+                max_queue_size=settings.POSTPONE_MAX_QUEUE_SIZE,
+                queue_full_policy=settings.POSTPONE_QUEUE_FULL_POLICY,
+                block_timeout_seconds=settings.POSTPONE_BLOCK_TIMEOUT_SECONDS,
+                name="postpone",
+                metrics_log_interval_seconds=(
+                    settings.POSTPONE_METRICS_LOG_INTERVAL_SECONDS
+                ),
+            )
+        return _postpone_executor
+
 
 def postpone(function):
+    @wraps(function)
     def decorator(*args, **kwargs):
-        t = Thread(target=function, args=args, kwargs=kwargs)
-        t.daemon = True
-        t.start()
+        get_postpone_executor().submit(function, *args, **kwargs)
 
     return decorator
 
 
+def iter_chunks(
+    iterable: Iterable[T],
+    *,
+    chunk_size: int,
+) -> Generator[list[T], None, None]:
+    """
+    Iterate over an iterable, yielding lists of up to `chunk_size` items.
+    """
+    iterator = iter(iterable)
+    while chunk := list(islice(iterator, chunk_size)):
+        yield chunk
+
+
 def iter_paired_chunks(
     iterable_1: Iterable[T],
     iterable_2: Iterable[T],